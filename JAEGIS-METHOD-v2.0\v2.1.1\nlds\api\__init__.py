@@ -49,11 +49,7 @@ def create_nlds_api(config: Optional[Dict[str, Any]] = None) -> FastAPI:
     if config.get("monitoring_enabled", True):
         metrics_collector, performance_monitor, alert_manager, analytics_dashboard = create_monitoring_system()
         
-        # Add monitoring middleware
-        from .monitoring import monitoring_middleware
-        app.middleware("http")(monitoring_middleware(metrics_collector, performance_monitor, analytics_dashboard))
-        
-        # Store monitoring components in app state
+        # Store monitoring components in app state; RequestPipelineMiddleware records into them
         app.state.metrics_collector = metrics_collector
         app.state.performance_monitor = performance_monitor
         app.state.alert_manager = alert_manager
@@ -133,6 +129,7 @@ def get_api_info() -> Dict[str, Any]:
             "health": "/health",
             "status": "/status",
             "metrics": "/metrics",
+            "prometheus_metrics": "/metrics/prometheus",
             "documentation": "/docs"
         }
     }
@@ -295,6 +292,13 @@ def setup_logging_middleware(app: FastAPI):
     app.add_middleware(RequestLoggingMiddleware)
 
 
+def setup_request_pipeline(app: FastAPI, origins: list = None, default_limit: int = 100):
+    """Setup the single-pass logging, rate limiting, security, CORS and metrics middleware."""
+    from .middleware import RequestPipelineMiddleware
+    
+    app.add_middleware(RequestPipelineMiddleware, allowed_origins=origins, default_limit=default_limit)
+
+
 # ============================================================================
 # TESTING UTILITIES
 # ============================================================================
@@ -373,7 +377,8 @@ __all__ = [
     # Middleware
     "setup_cors_middleware",
     "setup_security_middleware",
-    "setup_logging_middleware"
+    "setup_logging_middleware",
+    "setup_request_pipeline"
 ]
 
 
@@ -8,9 +8,8 @@ system interaction, and integration with JAEGIS ecosystem.
 
 from fastapi import FastAPI, HTTPException, Depends, Security, status, Request, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 import asyncio
@@ -24,7 +23,7 @@ from contextlib import asynccontextmanager
 # Local imports
 from .models import *
 from .dependencies import get_current_user, get_rate_limiter, verify_api_key
-from .middleware import RequestLoggingMiddleware, RateLimitMiddleware
+from .middleware import RequestPipelineMiddleware
 from ..integration import NLDSIntegrationOrchestrator, get_default_integration_config
 from ..translation import TranslationOrchestrator
 from ..processing import ProcessingOrchestrator
@@ -112,24 +111,17 @@ security = HTTPBearer()
 # MIDDLEWARE
 # ============================================================================
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 # Trusted host middleware
 app.add_middleware(
     TrustedHostMiddleware,
     allowed_hosts=["localhost", "127.0.0.1", "*.jaegis.ai"]
 )
 
-# Custom middleware
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(RateLimitMiddleware)
+# Logging, rate limiting, security headers, CORS and metrics in a single pass
+app.add_middleware(
+    RequestPipelineMiddleware,
+    allowed_origins=["*"]  # Configure appropriately for production
+)
 
 
 # ============================================================================
@@ -518,6 +510,19 @@ async def get_system_metrics(current_user: dict = Depends(get_current_user)):
         logger.error(f"Metrics retrieval failed: {e}")
         raise HTTPException(status_code=500, detail="Metrics retrieval failed")
 
+
+@app.get("/metrics/prometheus", response_class=PlainTextResponse, tags=["System"])
+async def get_prometheus_metrics(request: Request, current_user: dict = Depends(get_current_user)):
+    """Get collected metrics in the Prometheus text exposition format."""
+    metrics_collector = getattr(request.app.state, "metrics_collector", None)
+    if metrics_collector is None:
+        raise HTTPException(status_code=503, detail="Monitoring is not enabled")
+    
+    return PlainTextResponse(
+        metrics_collector.export_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
 @app.post("/admin/cache/clear", tags=["Admin"])
 async def clear_cache(
     cache_type: Optional[str] = None,
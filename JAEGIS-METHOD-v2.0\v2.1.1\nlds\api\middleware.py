@@ -3,20 +3,27 @@ N.L.D.S. API Middleware
 JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
 
 Custom middleware for request logging, rate limiting, security, and monitoring.
+
+RequestPipelineMiddleware performs all of these in a single pure ASGI pass and
+is what the API installs; the BaseHTTPMiddleware classes are kept for callers
+that compose them individually.
 """
 
 import time
 import uuid
 import json
 import logging
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
 from datetime import datetime
 import asyncio
 
+from .monitoring import StreamingHistogram
+from .rate_limiting import get_rate_limit_headers
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -136,58 +143,63 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     
     async def _update_metrics(self, path: str, status_code: int, response_time: float):
         """Update request metrics."""
-        global request_metrics
+        _record_request_metrics(path, status_code, response_time)
+
+
+def _record_request_metrics(path: str, status_code: int, response_time: float):
+    """Update the global request metrics for one completed request."""
+    global request_metrics
+    
+    try:
+        # Update total requests
+        request_metrics["total_requests"] += 1
         
-        try:
-            # Update total requests
-            request_metrics["total_requests"] += 1
-            
-            # Update success/failure counts
-            if 200 <= status_code < 400:
-                request_metrics["successful_requests"] += 1
-            else:
-                request_metrics["failed_requests"] += 1
-            
-            # Update average response time
-            total_requests = request_metrics["total_requests"]
-            current_avg = request_metrics["average_response_time"]
-            request_metrics["average_response_time"] = (
-                (current_avg * (total_requests - 1) + response_time) / total_requests
-            )
-            
-            # Update endpoint metrics
-            if path not in request_metrics["requests_by_endpoint"]:
-                request_metrics["requests_by_endpoint"][path] = {
-                    "count": 0,
-                    "average_time": 0.0,
-                    "success_count": 0,
-                    "error_count": 0
-                }
-            
-            endpoint_metrics = request_metrics["requests_by_endpoint"][path]
-            endpoint_metrics["count"] += 1
-            
-            # Update endpoint average time
-            endpoint_avg = endpoint_metrics["average_time"]
-            endpoint_count = endpoint_metrics["count"]
-            endpoint_metrics["average_time"] = (
-                (endpoint_avg * (endpoint_count - 1) + response_time) / endpoint_count
-            )
-            
-            # Update endpoint success/error counts
-            if 200 <= status_code < 400:
-                endpoint_metrics["success_count"] += 1
-            else:
-                endpoint_metrics["error_count"] += 1
-            
-            # Update status code metrics
-            status_key = f"{status_code // 100}xx"
-            if status_key not in request_metrics["requests_by_status"]:
-                request_metrics["requests_by_status"][status_key] = 0
-            request_metrics["requests_by_status"][status_key] += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to update metrics: {e}")
+        # Update success/failure counts
+        if 200 <= status_code < 400:
+            request_metrics["successful_requests"] += 1
+        else:
+            request_metrics["failed_requests"] += 1
+        
+        # Update average response time
+        total_requests = request_metrics["total_requests"]
+        current_avg = request_metrics["average_response_time"]
+        request_metrics["average_response_time"] = (
+            (current_avg * (total_requests - 1) + response_time) / total_requests
+        )
+        
+        # Update endpoint metrics
+        if path not in request_metrics["requests_by_endpoint"]:
+            request_metrics["requests_by_endpoint"][path] = {
+                "count": 0,
+                "average_time": 0.0,
+                "success_count": 0,
+                "error_count": 0
+            }
+        
+        endpoint_metrics = request_metrics["requests_by_endpoint"][path]
+        endpoint_metrics["count"] += 1
+        
+        # Update endpoint average time
+        endpoint_avg = endpoint_metrics["average_time"]
+        endpoint_count = endpoint_metrics["count"]
+        endpoint_metrics["average_time"] = (
+            (endpoint_avg * (endpoint_count - 1) + response_time) / endpoint_count
+        )
+        
+        # Update endpoint success/error counts
+        if 200 <= status_code < 400:
+            endpoint_metrics["success_count"] += 1
+        else:
+            endpoint_metrics["error_count"] += 1
+        
+        # Update status code metrics
+        status_key = f"{status_code // 100}xx"
+        if status_key not in request_metrics["requests_by_status"]:
+            request_metrics["requests_by_status"][status_key] = 0
+        request_metrics["requests_by_status"][status_key] += 1
+        
+    except Exception as e:
+        logger.error(f"Failed to update metrics: {e}")
 
 
 # ============================================================================
@@ -288,42 +300,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Tuple of (is_allowed, rate_info)
         """
-        current_time = int(time.time())
-        window_start = current_time - (current_time % self.window_seconds)
-        
-        # Get or create rate limit entry
-        if client_id not in self.rate_limit_store:
-            self.rate_limit_store[client_id] = {
-                "count": 0,
-                "window_start": window_start,
-                "limit": self.default_limit
-            }
-        
-        rate_entry = self.rate_limit_store[client_id]
-        
-        # Reset count if new window
-        if rate_entry["window_start"] < window_start:
-            rate_entry["count"] = 0
-            rate_entry["window_start"] = window_start
-        
-        # Check if limit exceeded
-        if rate_entry["count"] >= rate_entry["limit"]:
-            return False, {
-                "limit": rate_entry["limit"],
-                "remaining": 0,
-                "reset_time": window_start + self.window_seconds,
-                "retry_after": (window_start + self.window_seconds) - current_time
-            }
-        
-        # Increment count
-        rate_entry["count"] += 1
-        
-        return True, {
-            "limit": rate_entry["limit"],
-            "remaining": rate_entry["limit"] - rate_entry["count"],
-            "reset_time": window_start + self.window_seconds,
-            "retry_after": 0
-        }
+        return _check_fixed_window(self.rate_limit_store, client_id, self.default_limit, self.window_seconds)
     
     async def _cleanup_expired_entries(self):
         """Clean up expired rate limit entries."""
@@ -347,6 +324,58 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 await asyncio.sleep(60)
 
 
+def _check_fixed_window(rate_limit_store: Dict[str, Dict[str, Any]], client_id: str,
+                        limit: int, window_seconds: int) -> tuple[bool, Dict[str, Any]]:
+    """
+    Count a request against a client's fixed rate limit window.
+    
+    Args:
+        rate_limit_store: Per-client window state
+        client_id: Client identifier
+        limit: Requests allowed per window
+        window_seconds: Window size in seconds
+        
+    Returns:
+        Tuple of (is_allowed, rate_info)
+    """
+    current_time = int(time.time())
+    window_start = current_time - (current_time % window_seconds)
+    
+    # Get or create rate limit entry
+    if client_id not in rate_limit_store:
+        rate_limit_store[client_id] = {
+            "count": 0,
+            "window_start": window_start,
+            "limit": limit
+        }
+    
+    rate_entry = rate_limit_store[client_id]
+    
+    # Reset count if new window
+    if rate_entry["window_start"] < window_start:
+        rate_entry["count"] = 0
+        rate_entry["window_start"] = window_start
+    
+    # Check if limit exceeded
+    if rate_entry["count"] >= rate_entry["limit"]:
+        return False, {
+            "limit": rate_entry["limit"],
+            "remaining": 0,
+            "reset_time": window_start + window_seconds,
+            "retry_after": (window_start + window_seconds) - current_time
+        }
+    
+    # Increment count
+    rate_entry["count"] += 1
+    
+    return True, {
+        "limit": rate_entry["limit"],
+        "remaining": rate_entry["limit"] - rate_entry["count"],
+        "reset_time": window_start + window_seconds,
+        "retry_after": 0
+    }
+
+
 # ============================================================================
 # SECURITY MIDDLEWARE
 # ============================================================================
@@ -521,6 +550,345 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         }
 
 
+# ============================================================================
+# SINGLE-PASS REQUEST PIPELINE
+# ============================================================================
+
+SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", b"default-src 'self'")
+]
+
+CORS_HEADERS = [
+    (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+    (b"access-control-allow-headers", b"Authorization, Content-Type, X-Request-ID"),
+    (b"access-control-expose-headers", b"X-Request-ID, X-Response-Time, X-RateLimit-Remaining"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"86400")
+]
+
+# Request headers the pipeline reads; everything else is skipped in one scan
+PIPELINE_REQUEST_HEADERS = frozenset([
+    b"x-request-id", b"origin", b"authorization", b"content-length", b"access-control-request-method"
+])
+
+
+class RequestPipelineMiddleware:
+    """
+    Single-pass pure ASGI middleware for logging, rate limiting, security
+    headers, CORS and metrics.
+    
+    The endpoint runs in the caller's task and the response is not wrapped:
+    headers are appended to the ``http.response.start`` message as it passes
+    through and body messages are forwarded unchanged, so each request is
+    timed, counted and rate-limited exactly once.
+    
+    A ``rate_limiter`` (RateLimitingEngine), ``metrics_collector``,
+    ``performance_monitor`` and ``analytics_dashboard`` found on ``app.state``
+    are used when present; otherwise a per-client fixed window limits requests.
+    Failed requests (exceptions and 5xx responses) are counted as
+    ``request_errors``.
+    """
+    
+    def __init__(self, app: ASGIApp, allowed_origins: list = None, default_limit: int = 100,
+                 window_seconds: int = 60, rate_limit_exempt_paths: list = None, log_level: str = "INFO"):
+        """
+        Initialize request pipeline middleware.
+        
+        Args:
+            app: ASGI application
+            allowed_origins: List of allowed CORS origins
+            default_limit: Requests per window for the built-in limiter
+            window_seconds: Window size in seconds for the built-in limiter
+            rate_limit_exempt_paths: Paths that are never rate limited
+            log_level: Logging level
+        """
+        self.app = app
+        self.allowed_origins = allowed_origins or ["*"]
+        self.default_limit = default_limit
+        self.window_seconds = window_seconds
+        self.rate_limit_exempt_paths = frozenset(
+            rate_limit_exempt_paths or ["/health", "/docs", "/redoc", "/openapi.json"]
+        )
+        self.rate_limit_store = {}
+        self.next_cleanup = time.time() + window_seconds
+        
+        self.logger = logging.getLogger("nlds.api.requests")
+        self.logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+        
+        self.metrics = {
+            "requests_total": 0,
+            "active_requests": 0,
+            "request_bytes_total": 0,
+            "response_bytes_total": 0,
+            "rate_limited_requests": 0,
+            "request_errors": 0
+        }
+        self.durations = StreamingHistogram()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run one request through the pipeline."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        
+        # Extract request information in one pass over the headers
+        headers = {}
+        for key, value in scope["headers"]:
+            if key in PIPELINE_REQUEST_HEADERS:
+                headers[key] = value
+        
+        request_id = headers[b"x-request-id"].decode("latin-1") if b"x-request-id" in headers else str(uuid.uuid4())[:12]
+        method = scope["method"]
+        path = scope["path"]
+        client_ip = scope["client"][0] if scope.get("client") else "unknown"
+        state = getattr(scope.get("app"), "state", None)
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        
+        if log_info:
+            self.logger.info(
+                f"Request started - ID: {request_id}, Method: {method}, "
+                f"Path: {path}, IP: {client_ip}"
+            )
+        
+        response_headers = [(b"x-request-id", request_id.encode("latin-1")), (b"x-api-version", b"2.2.0")]
+        response_headers.extend(SECURITY_HEADERS)
+        response_headers.extend(self._cors_headers(headers.get(b"origin")))
+        
+        # Answer CORS preflight requests without reaching the endpoint
+        if method == "OPTIONS" and b"origin" in headers and b"access-control-request-method" in headers:
+            await self._send_response(send, 200, b"", response_headers, start_time)
+            self._finish(path, 200, start_time, headers, 0, request_id, log_info)
+            return
+        
+        # Rate limiting
+        if path not in self.rate_limit_exempt_paths:
+            allowed, rate_headers, error_body = await self._check_rate_limit(scope, state, headers, client_ip)
+            response_headers.extend(rate_headers)
+            if not allowed:
+                self.metrics["rate_limited_requests"] += 1
+                body = json.dumps(error_body).encode()
+                response_headers.append((b"content-type", b"application/json"))
+                await self._send_response(send, 429, body, response_headers, start_time)
+                self._finish(path, 429, start_time, headers, len(body), request_id, log_info)
+                return
+        
+        performance_monitor = getattr(state, "performance_monitor", None)
+        if performance_monitor is not None:
+            performance_monitor.record_request_start()
+        
+        status_code = 500
+        response_bytes = 0
+        response_started = False
+        failed = False
+        
+        async def send_with_headers(message: Message):
+            nonlocal status_code, response_bytes, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                response_time = (time.perf_counter() - start_time) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *response_headers,
+                    (b"x-response-time", f"{response_time:.2f}ms".encode())
+                ]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+        
+        self.metrics["active_requests"] += 1
+        try:
+            await self.app(scope, receive, send_with_headers)
+            
+        except Exception as e:
+            failed = True
+            self.logger.error(
+                f"Request failed - ID: {request_id}, Error: {str(e)}, "
+                f"Time: {(time.perf_counter() - start_time) * 1000:.2f}ms"
+            )
+            if response_started:
+                raise
+            
+            # Return error response
+            status_code = 500
+            body = json.dumps({
+                "error": {
+                    "code": 500,
+                    "message": "Internal server error",
+                    "request_id": request_id,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            }).encode()
+            response_bytes = len(body)
+            response_headers.append((b"content-type", b"application/json"))
+            await self._send_response(send, 500, body, response_headers, start_time)
+            
+        finally:
+            self.metrics["active_requests"] -= 1
+            response_time = self._finish(path, status_code, start_time, headers, response_bytes, request_id, log_info)
+            
+            if failed or status_code >= 500:
+                self.metrics["request_errors"] += 1
+                metrics_collector = getattr(state, "metrics_collector", None)
+                if metrics_collector is not None:
+                    metrics_collector.record_counter("request_errors")
+            
+            success = 200 <= status_code < 400
+            if performance_monitor is not None:
+                performance_monitor.record_request_end(response_time, success)
+            
+            analytics_dashboard = getattr(state, "analytics_dashboard", None)
+            if analytics_dashboard is not None:
+                analytics_dashboard.record_user_activity(
+                    user_id=scope.get("state", {}).get("user_id", "anonymous"),
+                    endpoint=path,
+                    success=success,
+                    response_time=response_time
+                )
+    
+    def _cors_headers(self, origin: Optional[bytes]) -> List[Tuple[bytes, bytes]]:
+        """CORS response headers for a request origin."""
+        if "*" not in self.allowed_origins and (
+            origin is None or origin.decode("latin-1") not in self.allowed_origins
+        ):
+            return []
+        
+        if origin is None:
+            return [(b"access-control-allow-origin", b"*"), *CORS_HEADERS]
+        return [(b"access-control-allow-origin", origin), (b"vary", b"Origin"), *CORS_HEADERS]
+    
+    async def _check_rate_limit(self, scope: Scope, state: Any, headers: Dict[bytes, bytes],
+                                client_ip: str) -> Tuple[bool, List[Tuple[bytes, bytes]], Dict[str, Any]]:
+        """
+        Check the request against the configured rate limiter.
+        
+        Returns:
+            Tuple of (is_allowed, rate limit headers, error body when limited)
+        """
+        rate_limiter = getattr(state, "rate_limiter", None)
+        if rate_limiter is not None:
+            throttle_result = await rate_limiter.check_rate_limits(Request(scope))
+            status_info = throttle_result.rate_limit_status
+            rate_headers = [
+                (key.lower().encode(), value.encode())
+                for key, value in get_rate_limit_headers(status_info).items()
+            ]
+            if throttle_result.allowed:
+                return True, rate_headers, {}
+            
+            rate_headers.append((b"retry-after", str(status_info.retry_after_seconds or 1).encode()))
+            return False, rate_headers, {
+                "error": {
+                    "code": 429,
+                    "message": throttle_result.throttle_reason or "Rate limit exceeded",
+                    "rate_limit": status_info.requests_made + status_info.requests_remaining,
+                    "remaining": status_info.requests_remaining,
+                    "reset_time": int(status_info.window_reset_time.timestamp()),
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            }
+        
+        # Built-in fixed window, keyed like RateLimitMiddleware
+        authorization = headers.get(b"authorization")
+        client_id = f"user:{authorization.decode('latin-1')[:20]}" if authorization else f"ip:{client_ip}"
+        
+        now = time.time()
+        if now >= self.next_cleanup:
+            self._cleanup_expired_entries(now)
+        
+        is_allowed, rate_info = _check_fixed_window(
+            self.rate_limit_store, client_id, self.default_limit, self.window_seconds
+        )
+        rate_headers = [
+            (b"x-ratelimit-limit", str(rate_info["limit"]).encode()),
+            (b"x-ratelimit-remaining", str(rate_info["remaining"]).encode()),
+            (b"x-ratelimit-reset", str(rate_info["reset_time"]).encode())
+        ]
+        if is_allowed:
+            return True, rate_headers, {}
+        
+        rate_headers.append((b"retry-after", str(rate_info["retry_after"]).encode()))
+        return False, rate_headers, {
+            "error": {
+                "code": 429,
+                "message": "Rate limit exceeded",
+                "rate_limit": rate_info["limit"],
+                "remaining": 0,
+                "reset_time": rate_info["reset_time"],
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        }
+    
+    def _cleanup_expired_entries(self, now: float):
+        """Drop fixed-window entries whose window has passed; runs inline once per window."""
+        expired_clients = [
+            client_id for client_id, rate_entry in self.rate_limit_store.items()
+            if rate_entry["window_start"] + self.window_seconds < now
+        ]
+        for client_id in expired_clients:
+            del self.rate_limit_store[client_id]
+        
+        self.next_cleanup = now + self.window_seconds
+    
+    async def _send_response(self, send: Send, status_code: int, body: bytes,
+                             headers: List[Tuple[bytes, bytes]], start_time: float):
+        """Send a complete response generated by the pipeline itself."""
+        response_time = (time.perf_counter() - start_time) * 1000
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                *headers,
+                (b"content-length", str(len(body)).encode()),
+                (b"x-response-time", f"{response_time:.2f}ms".encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+    
+    def _finish(self, path: str, status_code: int, start_time: float, headers: Dict[bytes, bytes],
+                response_bytes: int, request_id: str, log_info: bool) -> float:
+        """Record metrics and log completion; returns the response time in milliseconds."""
+        response_time = (time.perf_counter() - start_time) * 1000
+        
+        _record_request_metrics(path, status_code, response_time)
+        self.metrics["requests_total"] += 1
+        self.metrics["response_bytes_total"] += response_bytes
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit():
+            self.metrics["request_bytes_total"] += int(content_length)
+        self.durations.record(response_time / 1000)
+        
+        if log_info:
+            self.logger.info(
+                f"Request completed - ID: {request_id}, Status: {status_code}, "
+                f"Time: {response_time:.2f}ms"
+            )
+        
+        return response_time
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get current metrics."""
+        requests_total = self.metrics["requests_total"]
+        
+        return {
+            "requests_total": requests_total,
+            "active_requests": self.metrics["active_requests"],
+            "rate_limited_requests": self.metrics["rate_limited_requests"],
+            "average_duration_seconds": self.durations.total / requests_total if requests_total else 0,
+            "average_request_size_bytes": self.metrics["request_bytes_total"] / requests_total if requests_total else 0,
+            "average_response_size_bytes": self.metrics["response_bytes_total"] / requests_total if requests_total else 0,
+            "p95_duration_seconds": self.durations.percentile(95),
+            "p99_duration_seconds": self.durations.percentile(99)
+        }
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
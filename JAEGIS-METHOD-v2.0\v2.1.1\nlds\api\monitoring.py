@@ -14,7 +14,10 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
+from array import array
 import logging
+import math
+import re
 import statistics
 import psutil
 import threading
@@ -116,6 +119,219 @@ class APIMetrics:
 # METRICS COLLECTOR
 # ============================================================================
 
+# Histogram bucket layout: each power of two is split into HISTOGRAM_SUB_BUCKETS
+# linear sub-buckets, so a bucket midpoint is within 1/128 of any value in it
+HISTOGRAM_SUB_BUCKETS = 64
+HISTOGRAM_MIN_EXPONENT = -20  # ~1e-6
+HISTOGRAM_MAX_EXPONENT = 44   # ~1.7e13
+
+PROMETHEUS_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _bucket_index(value: float) -> int:
+    """Map a value to its histogram bucket (0 holds zero, negative and underflowing values)."""
+    if value <= 0.0:
+        return 0
+    
+    mantissa, exponent = math.frexp(value)
+    if exponent < HISTOGRAM_MIN_EXPONENT:
+        return 0
+    if exponent > HISTOGRAM_MAX_EXPONENT:
+        exponent, mantissa = HISTOGRAM_MAX_EXPONENT, 0.9999999
+    
+    sub_bucket = int((mantissa - 0.5) * 2 * HISTOGRAM_SUB_BUCKETS)
+    return (exponent - HISTOGRAM_MIN_EXPONENT) * HISTOGRAM_SUB_BUCKETS + sub_bucket + 1
+
+
+def _bucket_midpoint(index: int) -> float:
+    """Representative value of a histogram bucket."""
+    if index == 0:
+        return 0.0
+    
+    exponent, sub_bucket = divmod(index - 1, HISTOGRAM_SUB_BUCKETS)
+    return math.ldexp(
+        0.5 + (sub_bucket + 0.5) / (2 * HISTOGRAM_SUB_BUCKETS),
+        exponent + HISTOGRAM_MIN_EXPONENT
+    )
+
+
+class StreamingHistogram:
+    """
+    Log-linear fixed-bucket histogram.
+    
+    Recording is O(1) and memory is bounded by the bucket layout rather than
+    the number of samples. Histograms recorded on different threads or in
+    different time buckets merge by adding bucket counts.
+    """
+    
+    __slots__ = ("counts", "count", "total", "min", "max")
+    
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def record(self, value: float):
+        """Record one value."""
+        index = _bucket_index(value)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def merge(self, other: "StreamingHistogram"):
+        """Add another histogram's samples to this one."""
+        counts = self.counts
+        for index, bucket_count in list(other.counts.items()):
+            counts[index] = counts.get(index, 0) + bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def percentile(self, percentile: float) -> float:
+        """Estimate a percentile from the bucket counts."""
+        if not self.count:
+            return 0.0
+        
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(_bucket_midpoint(index), self.min), self.max)
+        
+        return self.max
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get summary statistics, or an empty dict when nothing was recorded."""
+        if not self.count:
+            return {}
+        
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count,
+            "median": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99)
+        }
+
+
+class WindowedHistogram:
+    """Ring of per-interval histograms covering a sliding time window."""
+    
+    __slots__ = ("slot_seconds", "slot_ids", "slots")
+    
+    def __init__(self, window_seconds: float, num_slots: int):
+        self.slot_seconds = window_seconds / num_slots
+        self.slot_ids = [-1] * num_slots
+        self.slots: List[Optional[StreamingHistogram]] = [None] * num_slots
+    
+    def record(self, value: float, now: float):
+        """Record a value into the slot for the current interval."""
+        slot_id = int(now // self.slot_seconds)
+        position = slot_id % len(self.slots)
+        if self.slot_ids[position] != slot_id:
+            self.slots[position] = StreamingHistogram()
+            self.slot_ids[position] = slot_id
+        self.slots[position].record(value)
+    
+    def merge_into(self, target: StreamingHistogram, now: float):
+        """Merge the slots still inside the window into target."""
+        oldest_slot = int(now // self.slot_seconds) - len(self.slots) + 1
+        for slot_id, histogram in zip(list(self.slot_ids), list(self.slots)):
+            if histogram is not None and slot_id >= oldest_slot:
+                target.merge(histogram)
+
+
+class TimeBucketedSeries:
+    """
+    Fixed-size ring buffer of per-interval count/sum/min/max aggregates.
+    
+    The current interval is accumulated in plain attributes and written into
+    the ring only when the interval rolls over, keeping the record path cheap.
+    """
+    
+    __slots__ = (
+        "bucket_seconds", "slot_ids", "counts", "sums", "mins", "maxs",
+        "current_slot", "current_count", "current_sum", "current_min", "current_max"
+    )
+    
+    def __init__(self, bucket_seconds: float, num_buckets: int):
+        self.bucket_seconds = bucket_seconds
+        self.slot_ids = array("q", [-1]) * num_buckets
+        self.counts = array("q", [0]) * num_buckets
+        self.sums = array("d", [0.0]) * num_buckets
+        self.mins = array("d", [0.0]) * num_buckets
+        self.maxs = array("d", [0.0]) * num_buckets
+        self.current_slot = -1
+        self.current_count = 0
+        self.current_sum = 0.0
+        self.current_min = 0.0
+        self.current_max = 0.0
+    
+    def record(self, value: float, now: float):
+        """Aggregate a value into the bucket for the current interval."""
+        slot_id = int(now // self.bucket_seconds)
+        if slot_id != self.current_slot:
+            self._roll_over(slot_id, value)
+            return
+        
+        self.current_count += 1
+        self.current_sum += value
+        if value < self.current_min:
+            self.current_min = value
+        if value > self.current_max:
+            self.current_max = value
+    
+    def _roll_over(self, slot_id: int, value: float):
+        """Write the finished interval into the ring and start a new one."""
+        if self.current_slot >= 0:
+            position = self.current_slot % len(self.slot_ids)
+            self.slot_ids[position] = self.current_slot
+            self.counts[position] = self.current_count
+            self.sums[position] = self.current_sum
+            self.mins[position] = self.current_min
+            self.maxs[position] = self.current_max
+        
+        self.current_slot = slot_id
+        self.current_count = 1
+        self.current_sum = value
+        self.current_min = value
+        self.current_max = value
+    
+    def iter_buckets(self, oldest_slot: int):
+        """Yield (slot_id, count, sum, min, max) for buckets at or after oldest_slot."""
+        current_slot = self.current_slot
+        for position, slot_id in enumerate(self.slot_ids):
+            if slot_id >= oldest_slot and slot_id != current_slot:
+                yield (slot_id, self.counts[position], self.sums[position],
+                       self.mins[position], self.maxs[position])
+        
+        if current_slot >= oldest_slot:
+            yield (current_slot, self.current_count, self.current_sum,
+                   self.current_min, self.current_max)
+
+
+class _MetricShard:
+    """Per-thread metric state; only the owning thread writes to it."""
+    
+    __slots__ = ("counters", "histograms", "trends")
+    
+    def __init__(self):
+        self.counters: Dict[Tuple[str, tuple], float] = {}
+        self.histograms: Dict[Tuple[str, tuple], Tuple[StreamingHistogram, WindowedHistogram]] = {}
+        self.trends: Dict[str, TimeBucketedSeries] = {}
+
+
 class MetricsCollector:
     """
     Comprehensive metrics collection system.
@@ -123,143 +339,242 @@ class MetricsCollector:
     Features:
     - Real-time metric collection
     - Multiple metric types (counter, gauge, histogram, timer)
-    - Automatic aggregation and rollup
-    - Memory-efficient storage with TTL
-    - Label-based filtering and grouping
+    - Per-thread counters and histograms, merged on read, so recording takes no locks
+    - Fixed-bucket histograms with O(1) record and mergeable percentiles
+    - Interned label sets with bounded cardinality
+    - Time-bucketed ring buffers for trends, bounded by retention
+    - Prometheus text exposition
     """
     
-    def __init__(self, retention_hours: int = 24, max_metrics: int = 100000):
+    def __init__(self, retention_hours: int = 24, max_metrics: int = 100000,
+                 trend_bucket_seconds: int = 60, stats_window_seconds: int = 300):
         """
         Initialize metrics collector.
         
         Args:
-            retention_hours: How long to retain metrics
-            max_metrics: Maximum number of metrics to store
+            retention_hours: How long trend buckets are retained
+            max_metrics: Maximum number of distinct label sets to intern
+            trend_bucket_seconds: Width of each trend bucket
+            stats_window_seconds: Sliding window covered by histogram and timer stats
         """
         self.retention_hours = retention_hours
         self.max_metrics = max_metrics
+        self.trend_bucket_seconds = trend_bucket_seconds
+        self.trend_buckets = max(1, retention_hours * 3600 // trend_bucket_seconds)
+        self.stats_window_seconds = stats_window_seconds
+        self.stats_window_slots = 10
         
-        # Metric storage
-        self.metrics = defaultdict(deque)
-        self.counters = defaultdict(float)
-        self.gauges = defaultdict(float)
-        self.histograms = defaultdict(list)
-        self.timers = defaultdict(list)
+        # Gauges are last-write-wins, so a shared dict is enough
+        self.gauges: Dict[str, float] = {}
+        self.labeled_gauges: Dict[Tuple[str, tuple], float] = {}
+        self.metric_types: Dict[str, MetricType] = {}
         
-        # Aggregated metrics
-        self.aggregated_metrics = {}
+        # Per-thread shards, registered once per thread
+        self._local = threading.local()
+        self._shards: List[_MetricShard] = []
+        self._lock = threading.Lock()
         
-        # Cleanup thread
-        self.cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
-        self.cleanup_thread.start()
+        # Interned label sets and their rendered Prometheus label text
+        self._label_sets: Dict[tuple, tuple] = {}
+        self._label_text: Dict[tuple, str] = {(): ""}
+        self.dropped_label_sets = 0
     
     def record_counter(self, name: str, value: float = 1.0, labels: Optional[Dict[str, str]] = None):
         """Record counter metric."""
-        metric = Metric(
-            name=name,
-            value=value,
-            metric_type=MetricType.COUNTER,
-            timestamp=datetime.utcnow(),
-            labels=labels or {}
-        )
-        
-        self._store_metric(metric)
-        self.counters[name] += value
+        shard = self._get_shard()
+        key = (name, self._intern_labels(labels) if labels else ())
+        counters = shard.counters
+        counters[key] = counters.get(key, 0.0) + value
+        self._record_trend(shard, name, value, MetricType.COUNTER, time.time())
     
     def record_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Record gauge metric."""
-        metric = Metric(
-            name=name,
-            value=value,
-            metric_type=MetricType.GAUGE,
-            timestamp=datetime.utcnow(),
-            labels=labels or {}
-        )
-        
-        self._store_metric(metric)
         self.gauges[name] = value
+        self.labeled_gauges[(name, self._intern_labels(labels) if labels else ())] = value
+        self._record_trend(self._get_shard(), name, value, MetricType.GAUGE, time.time())
     
     def record_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Record histogram metric."""
-        metric = Metric(
-            name=name,
-            value=value,
-            metric_type=MetricType.HISTOGRAM,
-            timestamp=datetime.utcnow(),
-            labels=labels or {}
-        )
-        
-        self._store_metric(metric)
-        self.histograms[name].append(value)
-        
-        # Keep only recent values
-        if len(self.histograms[name]) > 1000:
-            self.histograms[name] = self.histograms[name][-1000:]
+        self._record_distribution(name, value, labels, MetricType.HISTOGRAM)
     
     def record_timer(self, name: str, duration_ms: float, labels: Optional[Dict[str, str]] = None):
         """Record timer metric."""
-        metric = Metric(
-            name=name,
-            value=duration_ms,
-            metric_type=MetricType.TIMER,
-            timestamp=datetime.utcnow(),
-            labels=labels or {}
-        )
-        
-        self._store_metric(metric)
-        self.timers[name].append(duration_ms)
+        self._record_distribution(name, duration_ms, labels, MetricType.TIMER)
+    
+    def _record_distribution(self, name: str, value: float, labels: Optional[Dict[str, str]],
+                             metric_type: MetricType):
+        """Record a histogram or timer value into the cumulative and windowed histograms."""
+        shard = self._get_shard()
+        key = (name, self._intern_labels(labels) if labels else ())
+        histograms = shard.histograms.get(key)
+        if histograms is None:
+            histograms = shard.histograms[key] = (
+                StreamingHistogram(),
+                WindowedHistogram(self.stats_window_seconds, self.stats_window_slots)
+            )
         
-        # Keep only recent values
-        if len(self.timers[name]) > 1000:
-            self.timers[name] = self.timers[name][-1000:]
+        now = time.time()
+        histograms[0].record(value)
+        histograms[1].record(value, now)
+        self._record_trend(shard, name, value, metric_type, now)
+    
+    def _record_trend(self, shard: _MetricShard, name: str, value: float,
+                      metric_type: MetricType, now: float):
+        """Aggregate a value into the metric's trend ring buffer."""
+        series = shard.trends.get(name)
+        if series is None:
+            series = shard.trends[name] = TimeBucketedSeries(self.trend_bucket_seconds, self.trend_buckets)
+            self.metric_types.setdefault(name, metric_type)
+        series.record(value, now)
     
-    def _store_metric(self, metric: Metric):
-        """Store metric in time series."""
-        self.metrics[metric.name].append(metric)
+    def _get_shard(self) -> _MetricShard:
+        """Get the calling thread's shard, registering it on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _MetricShard()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+    
+    def _intern_labels(self, labels: Dict[str, str]) -> tuple:
+        """Intern a label set, dropping it once max_metrics label sets exist."""
+        key = tuple(labels.items()) if len(labels) == 1 else tuple(sorted(labels.items()))
+        interned = self._label_sets.get(key)
+        if interned is not None:
+            return interned
         
-        # Limit storage
-        if len(self.metrics[metric.name]) > 10000:
-            self.metrics[metric.name].popleft()
+        with self._lock:
+            interned = self._label_sets.get(key)
+            if interned is None:
+                if len(self._label_sets) >= self.max_metrics:
+                    self.dropped_label_sets += 1
+                    return ()
+                self._label_text[key] = "{" + ",".join(
+                    f'{_prometheus_name(str(label))}="{_escape_label_value(str(value))}"'
+                    for label, value in key
+                ) + "}"
+                interned = self._label_sets[key] = key
+        return interned
     
-    def get_counter(self, name: str) -> float:
-        """Get counter value."""
-        return self.counters.get(name, 0.0)
+    def get_counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
+        """Get counter value, summed over all label sets unless labels are given."""
+        label_key = tuple(sorted(labels.items())) if labels is not None else None
+        return sum(
+            value for (counter_name, counter_labels), value in self._collect_counters().items()
+            if counter_name == name and (label_key is None or counter_labels == label_key)
+        )
     
     def get_gauge(self, name: str) -> float:
         """Get gauge value."""
         return self.gauges.get(name, 0.0)
     
     def get_histogram_stats(self, name: str) -> Dict[str, float]:
-        """Get histogram statistics."""
-        values = self.histograms.get(name, [])
-        if not values:
-            return {}
-        
-        return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "p95": self._percentile(values, 95),
-            "p99": self._percentile(values, 99)
-        }
+        """Get histogram statistics over the stats window."""
+        return self._merge_window(name).get_stats()
     
     def get_timer_stats(self, name: str) -> Dict[str, float]:
-        """Get timer statistics."""
-        values = self.timers.get(name, [])
-        if not values:
-            return {}
+        """Get timer statistics over the stats window."""
+        return self._merge_window(name).get_stats()
+    
+    def get_rate(self, name: str, seconds: float = 60.0) -> float:
+        """
+        Get the per-second rate of a counter over the last seconds.
         
-        return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "p95": self._percentile(values, 95),
-            "p99": self._percentile(values, 99)
-        }
+        Buckets inside the window count in full; the oldest bucket, which
+        straddles the start of the window, counts in proportion to the part of
+        its recorded span that overlaps the window.
+        """
+        if seconds <= 0:
+            return 0.0
+        
+        now = time.time()
+        window_start = now - seconds
+        oldest_slot = int(window_start // self.trend_bucket_seconds)
+        
+        # The oldest bucket has recorded values from its start until now at most
+        slot_start = oldest_slot * self.trend_bucket_seconds
+        recorded_span = min(slot_start + self.trend_bucket_seconds, now) - slot_start
+        overlap = recorded_span - (window_start - slot_start)
+        oldest_weight = overlap / recorded_span if recorded_span > 0 else 1.0
+        
+        total = 0.0
+        for slot_id, _, bucket_sum, _, _ in self._iter_trend_buckets(name, oldest_slot):
+            total += bucket_sum * oldest_weight if slot_id == oldest_slot else bucket_sum
+        return total / seconds
+    
+    def get_metric_trend(self, name: str, minutes: int = 60) -> List[Dict[str, Any]]:
+        """
+        Get per-bucket aggregates of a metric, oldest first.
+        
+        Args:
+            name: Metric name
+            minutes: How far back to look
+            
+        Returns:
+            Buckets with timestamp, count, sum, min, max and mean
+        """
+        bucket_count = max(1, math.ceil(minutes * 60 / self.trend_bucket_seconds))
+        oldest_slot = int(time.time() // self.trend_bucket_seconds) - bucket_count + 1
+        
+        merged: Dict[int, List[float]] = {}
+        for slot_id, count, total, minimum, maximum in self._iter_trend_buckets(name, oldest_slot):
+            bucket = merged.get(slot_id)
+            if bucket is None:
+                merged[slot_id] = [count, total, minimum, maximum]
+            else:
+                bucket[0] += count
+                bucket[1] += total
+                bucket[2] = min(bucket[2], minimum)
+                bucket[3] = max(bucket[3], maximum)
+        
+        return [
+            {
+                "timestamp": datetime.utcfromtimestamp(slot_id * self.trend_bucket_seconds),
+                "count": count,
+                "sum": total,
+                "min": minimum,
+                "max": maximum,
+                "mean": total / count if count else 0.0
+            }
+            for slot_id, (count, total, minimum, maximum) in sorted(merged.items())
+        ]
+    
+    def _iter_trend_buckets(self, name: str, oldest_slot: int):
+        """Yield trend buckets of a metric from every thread shard."""
+        for shard in list(self._shards):
+            series = shard.trends.get(name)
+            if series is not None:
+                yield from series.iter_buckets(oldest_slot)
+    
+    def _collect_counters(self) -> Dict[Tuple[str, tuple], float]:
+        """Sum counters across thread shards."""
+        totals: Dict[Tuple[str, tuple], float] = {}
+        for shard in list(self._shards):
+            for key, value in list(shard.counters.items()):
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+    
+    def _collect_histograms(self, now: float) -> Dict[Tuple[str, tuple], Tuple[StreamingHistogram, StreamingHistogram]]:
+        """Merge cumulative and windowed histograms across thread shards."""
+        merged = {}
+        for shard in list(self._shards):
+            for key, (cumulative, window) in list(shard.histograms.items()):
+                if key not in merged:
+                    merged[key] = (StreamingHistogram(), StreamingHistogram())
+                merged[key][0].merge(cumulative)
+                window.merge_into(merged[key][1], now)
+        return merged
+    
+    def _merge_window(self, name: str) -> StreamingHistogram:
+        """Merge a metric's windowed histograms across label sets and threads."""
+        now = time.time()
+        merged = StreamingHistogram()
+        for shard in list(self._shards):
+            for (histogram_name, _), (_, window) in list(shard.histograms.items()):
+                if histogram_name == name:
+                    window.merge_into(merged, now)
+        return merged
     
     def _percentile(self, values: List[float], percentile: float) -> float:
         """Calculate percentile."""
@@ -272,31 +587,104 @@ class MetricsCollector:
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary."""
+        counters = defaultdict(float)
+        for (name, _), value in self._collect_counters().items():
+            counters[name] += value
+        
         return {
-            "counters": dict(self.counters),
+            "counters": dict(counters),
             "gauges": dict(self.gauges),
-            "histograms": {name: self.get_histogram_stats(name) for name in self.histograms},
-            "timers": {name: self.get_timer_stats(name) for name in self.timers},
-            "total_metrics": sum(len(deque_) for deque_ in self.metrics.values()),
-            "metric_names": list(self.metrics.keys())
+            "histograms": {
+                name: self.get_histogram_stats(name)
+                for name, metric_type in list(self.metric_types.items()) if metric_type == MetricType.HISTOGRAM
+            },
+            "timers": {
+                name: self.get_timer_stats(name)
+                for name, metric_type in list(self.metric_types.items()) if metric_type == MetricType.TIMER
+            },
+            "total_metrics": sum(
+                len(shard.counters) + len(shard.histograms) for shard in list(self._shards)
+            ) + len(self.labeled_gauges),
+            "metric_names": list(self.metric_types),
+            "label_sets": len(self._label_sets),
+            "dropped_label_sets": self.dropped_label_sets
         }
     
-    def _cleanup_loop(self):
-        """Background cleanup of old metrics."""
-        while True:
-            try:
-                cutoff_time = datetime.utcnow() - timedelta(hours=self.retention_hours)
-                
-                for name, metric_deque in self.metrics.items():
-                    # Remove old metrics
-                    while metric_deque and metric_deque[0].timestamp < cutoff_time:
-                        metric_deque.popleft()
-                
-                time.sleep(300)  # Cleanup every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"Metrics cleanup error: {e}")
-                time.sleep(60)
+    def export_prometheus(self, namespace: str = "nlds") -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        
+        Counters are exported with a ``_total`` suffix; histograms and timers
+        are exported as summaries whose quantiles cover the stats window.
+        
+        Args:
+            namespace: Prefix for exported metric names
+            
+        Returns:
+            Exposition text (format version 0.0.4)
+        """
+        prefix = f"{_prometheus_name(namespace)}_" if namespace else ""
+        families: Dict[str, List[str]] = defaultdict(list)
+        
+        for (name, labels), value in self._collect_counters().items():
+            families[name].append(
+                f"{prefix}{_prometheus_name(name)}_total{self._label_text[labels]} {_format_value(value)}"
+            )
+        
+        for (name, labels), value in list(self.labeled_gauges.items()):
+            families[name].append(
+                f"{prefix}{_prometheus_name(name)}{self._label_text[labels]} {_format_value(value)}"
+            )
+        
+        for (name, labels), (cumulative, window) in self._collect_histograms(time.time()).items():
+            metric_name = prefix + _prometheus_name(name)
+            label_text = self._label_text[labels]
+            for quantile in PROMETHEUS_QUANTILES:
+                quantile_labels = f'quantile="{quantile}"'
+                quantile_text = (
+                    f"{label_text[:-1]},{quantile_labels}}}" if label_text else f"{{{quantile_labels}}}"
+                )
+                families[name].append(
+                    f"{metric_name}{quantile_text} {_format_value(window.percentile(quantile * 100))}"
+                )
+            families[name].append(f"{metric_name}_sum{label_text} {_format_value(cumulative.total)}")
+            families[name].append(f"{metric_name}_count{label_text} {cumulative.count}")
+        
+        lines = []
+        for name in sorted(families):
+            metric_type = self.metric_types.get(name, MetricType.GAUGE)
+            exported_type = {
+                MetricType.COUNTER: "counter",
+                MetricType.GAUGE: "gauge"
+            }.get(metric_type, "summary")
+            exported_name = prefix + _prometheus_name(name)
+            if metric_type == MetricType.COUNTER:
+                exported_name += "_total"
+            
+            lines.append(f"# TYPE {exported_name} {exported_type}")
+            lines.extend(families[name])
+        
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_name(name: str) -> str:
+    """Sanitize a metric or label name for Prometheus."""
+    sanitized = re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+    return f"_{sanitized}" if sanitized[:1].isdigit() else sanitized
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the Prometheus text format."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
 
 
 # ============================================================================
@@ -324,8 +712,7 @@ class PerformanceMonitor:
         self.metrics = metrics_collector
         self.snapshots = deque(maxlen=1440)  # 24 hours of minute snapshots
         
-        # Performance tracking
-        self.request_times = deque(maxlen=10000)
+        # Performance tracking; response times live in the collector's request_duration timer
         self.active_requests = 0
         self.total_requests = 0
         self.failed_requests = 0
@@ -344,7 +731,6 @@ class PerformanceMonitor:
     def record_request_end(self, duration_ms: float, success: bool = True):
         """Record request completion."""
         self.active_requests = max(0, self.active_requests - 1)
-        self.request_times.append(duration_ms)
         
         if not success:
             self.failed_requests += 1
@@ -362,14 +748,14 @@ class PerformanceMonitor:
         network = psutil.net_io_counters()
         
         # Request metrics
-        request_rate = len([t for t in self.request_times if time.time() - t < 60]) / 60.0
+        request_rate = self.metrics.get_rate("total_requests", 60)
         error_rate = self.failed_requests / max(self.total_requests, 1)
         
         # Response time metrics
-        recent_times = list(self.request_times)
-        avg_response_time = statistics.mean(recent_times) if recent_times else 0.0
-        p95_response_time = self.metrics._percentile(recent_times, 95) if recent_times else 0.0
-        p99_response_time = self.metrics._percentile(recent_times, 99) if recent_times else 0.0
+        timer_stats = self.metrics.get_timer_stats("request_duration")
+        avg_response_time = timer_stats.get("mean", 0.0)
+        p95_response_time = timer_stats.get("p95", 0.0)
+        p99_response_time = timer_stats.get("p99", 0.0)
         
         return PerformanceSnapshot(
             timestamp=datetime.utcnow(),
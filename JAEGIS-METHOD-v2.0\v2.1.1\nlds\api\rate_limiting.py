@@ -9,6 +9,7 @@ user-based limits, endpoint-specific controls, and intelligent throttling.
 import time
 import asyncio
 import redis
+import redis.asyncio as aioredis
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -16,7 +17,7 @@ import logging
 from datetime import datetime, timedelta
 import hashlib
 import json
-from collections import defaultdict, deque
+from collections import defaultdict
 from fastapi import HTTPException, Request, status
 import math
 
@@ -149,7 +150,13 @@ class TokenBucketLimiter:
 
 
 class SlidingWindowLimiter:
-    """Sliding window rate limiting algorithm."""
+    """
+    Sliding window rate limiting algorithm.
+    
+    The window is approximated from the current and previous fixed-window
+    counts, weighting the previous count by how much of it still overlaps the
+    sliding window, so memory is O(1) regardless of the request rate.
+    """
     
     def __init__(self, window_size: int, max_requests: int):
         """
@@ -161,7 +168,21 @@ class SlidingWindowLimiter:
         """
         self.window_size = window_size
         self.max_requests = max_requests
-        self.requests = deque()
+        self.current_window = 0
+        self.current_count = 0
+        self.previous_count = 0
+    
+    def _estimate_requests(self, now: float) -> float:
+        """Roll the window counters forward and estimate the requests in the sliding window."""
+        current_window = int(now // self.window_size)
+        if current_window != self.current_window:
+            # Only an adjacent window still overlaps the sliding window
+            self.previous_count = self.current_count if current_window == self.current_window + 1 else 0
+            self.current_count = 0
+            self.current_window = current_window
+        
+        elapsed_fraction = now / self.window_size - current_window
+        return self.previous_count * (1.0 - elapsed_fraction) + self.current_count
     
     def is_allowed(self) -> bool:
         """
@@ -170,32 +191,21 @@ class SlidingWindowLimiter:
         Returns:
             True if request is allowed
         """
-        now = time.time()
-        
-        # Remove old requests outside window
-        while self.requests and self.requests[0] <= now - self.window_size:
-            self.requests.popleft()
-        
-        # Check if under limit
-        if len(self.requests) < self.max_requests:
-            self.requests.append(now)
+        if self._estimate_requests(time.time()) < self.max_requests:
+            self.current_count += 1
             return True
         
         return False
     
     def get_status(self) -> Dict[str, Any]:
         """Get current window status."""
-        now = time.time()
-        
-        # Clean old requests
-        while self.requests and self.requests[0] <= now - self.window_size:
-            self.requests.popleft()
+        estimated_requests = self._estimate_requests(time.time())
         
         return {
-            "requests_in_window": len(self.requests),
+            "requests_in_window": int(math.ceil(estimated_requests)),
             "max_requests": self.max_requests,
             "window_size": self.window_size,
-            "oldest_request": self.requests[0] if self.requests else None
+            "window_start": self.current_window * self.window_size
         }
 
 
@@ -272,7 +282,7 @@ class AdaptiveLimiter:
         self.base_limit = base_limit
         self.window_size = window_size
         self.current_limit = base_limit
-        self.request_times = deque()
+        self.window = SlidingWindowLimiter(window_size, base_limit)
         self.error_count = 0
         self.success_count = 0
         self.last_adjustment = time.time()
@@ -287,21 +297,12 @@ class AdaptiveLimiter:
         Returns:
             True if request is allowed
         """
-        now = time.time()
-        
         # Adjust limit based on system load
         self._adjust_limit(system_load)
         
-        # Remove old requests
-        while self.request_times and self.request_times[0] <= now - self.window_size:
-            self.request_times.popleft()
-        
         # Check if under current limit
-        if len(self.request_times) < self.current_limit:
-            self.request_times.append(now)
-            return True
-        
-        return False
+        self.window.max_requests = self.current_limit
+        return self.window.is_allowed()
     
     def _adjust_limit(self, system_load: float):
         """Adjust rate limit based on system conditions."""
@@ -337,22 +338,291 @@ class AdaptiveLimiter:
     
     def get_status(self) -> Dict[str, Any]:
         """Get current adaptive status."""
-        now = time.time()
-        
-        # Clean old requests
-        while self.request_times and self.request_times[0] <= now - self.window_size:
-            self.request_times.popleft()
-        
         return {
             "current_limit": self.current_limit,
             "base_limit": self.base_limit,
-            "requests_in_window": len(self.request_times),
+            "requests_in_window": self.window.get_status()["requests_in_window"],
             "error_count": self.error_count,
             "success_count": self.success_count,
             "last_adjustment": self.last_adjustment
         }
 
 
+# ============================================================================
+# DISTRIBUTED RATE LIMITING BACKEND
+# ============================================================================
+
+# Algorithm codes understood by the Lua script
+REDIS_TOKEN_BUCKET = 1
+REDIS_GCRA = 2
+REDIS_FIXED_WINDOW = 3
+
+# Checks every rule of a request atomically and consumes from all of them or
+# from none. KEYS[i] is the state key of rule i; ARGV holds five values per
+# rule: algorithm, limit, window (ms), capacity and debt (usage allowed
+# locally from the near-cache since the last round-trip, charged
+# unconditionally). Returns the 1-based index of the first rejecting rule
+# (0 if allowed), then remaining, retry-after (ms) and reset-after (ms) per rule.
+RATE_LIMIT_SCRIPT = """
+if redis.replicate_commands then
+    pcall(redis.replicate_commands)
+end
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local rejected = 0
+local states = {}
+
+for i, key in ipairs(KEYS) do
+    local base = (i - 1) * 5
+    local algorithm = tonumber(ARGV[base + 1])
+    local limit = tonumber(ARGV[base + 2])
+    local window = tonumber(ARGV[base + 3])
+    local capacity = tonumber(ARGV[base + 4])
+    local debt = tonumber(ARGV[base + 5])
+    local state = {algorithm = algorithm, window = window}
+    
+    if algorithm == 1 then
+        -- Token bucket: {tokens, ts}
+        local rate = limit / window
+        local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+        local tokens = tonumber(bucket[1]) or capacity
+        local ts = tonumber(bucket[2]) or now
+        tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - debt
+        state.allowed = tokens >= 1
+        state.kept = tokens
+        state.consumed = tokens - 1
+        state.rate = rate
+        state.capacity = capacity
+        state.retry_after = state.allowed and 0 or math.ceil((1 - tokens) / rate)
+    elseif algorithm == 2 then
+        -- GCRA: theoretical arrival time, tolerating a full window of burst
+        local interval = window / limit
+        local tat = math.max(tonumber(redis.call('GET', key)) or now, now) + debt * interval
+        local allow_at = tat + interval - window
+        state.allowed = allow_at <= now
+        state.kept = tat
+        state.consumed = tat + interval
+        state.interval = interval
+        state.retry_after = state.allowed and 0 or math.ceil(allow_at - now)
+    else
+        -- Fixed window: {count, start}
+        local start = now - (now % window)
+        local fixed = redis.call('HMGET', key, 'count', 'start')
+        local count = 0
+        if tonumber(fixed[2]) == start then
+            count = tonumber(fixed[1])
+        end
+        count = count + debt
+        state.allowed = count < limit
+        state.kept = count
+        state.consumed = count + 1
+        state.start = start
+        state.limit = limit
+        state.retry_after = state.allowed and 0 or (start + window - now)
+    end
+    
+    if not state.allowed and rejected == 0 then
+        rejected = i
+    end
+    states[i] = state
+end
+
+local result = {rejected}
+
+for i, key in ipairs(KEYS) do
+    local state = states[i]
+    local value = state.kept
+    if rejected == 0 then
+        value = state.consumed
+    end
+    
+    local remaining, reset_after
+    if state.algorithm == 1 then
+        remaining = math.floor(value)
+        reset_after = math.ceil((state.capacity - value) / state.rate)
+        redis.call('HSET', key, 'tokens', value, 'ts', now)
+        redis.call('PEXPIRE', key, math.max(1, reset_after) + 1000)
+    elseif state.algorithm == 2 then
+        remaining = math.floor((state.window - (value - now)) / state.interval)
+        reset_after = math.ceil(value - now)
+        if reset_after > 0 then
+            redis.call('SET', key, value, 'PX', reset_after)
+        end
+    else
+        remaining = state.limit - value
+        reset_after = state.start + state.window - now
+        redis.call('HSET', key, 'count', value, 'start', state.start)
+        redis.call('PEXPIRE', key, reset_after)
+    end
+    
+    table.insert(result, math.max(0, remaining))
+    table.insert(result, state.retry_after)
+    table.insert(result, math.max(0, reset_after))
+end
+
+return result
+"""
+
+
+@dataclass
+class RateLimitLease:
+    """Locally leased share of a rate limit key's remaining allowance."""
+    allowance: int
+    remaining: int
+    reset_after_seconds: float
+    expires_at: float
+    debt: int = 0
+
+
+class RedisRateLimitBackend:
+    """
+    Shared rate limit state in Redis.
+    
+    Features:
+    - Token bucket, GCRA (sliding window) and fixed window checks in Lua
+    - All rules matching a request checked atomically in one round-trip
+    - Local near-cache leasing a fraction of each key's remaining allowance
+    
+    The near-cache decides most requests without a round-trip. Usage allowed
+    from a lease is charged to Redis on the key's next round-trip, so each
+    worker can overshoot a limit by at most its lease (near_cache_ratio of the
+    remaining allowance, capped at max_lease).
+    """
+    
+    def __init__(self, redis_client: aioredis.Redis, near_cache_ratio: float = 0.1,
+                 near_cache_ttl: float = 0.05, max_lease: int = 100):
+        """
+        Initialize distributed rate limiting backend.
+        
+        Args:
+            redis_client: Async Redis client
+            near_cache_ratio: Fraction of the remaining allowance leased locally
+            near_cache_ttl: Seconds a lease stays valid
+            max_lease: Maximum requests allowed from a single lease
+        """
+        self.redis_client = redis_client
+        self.near_cache_ratio = near_cache_ratio
+        self.near_cache_ttl = near_cache_ttl
+        self.max_lease = max_lease
+        
+        self.script = redis_client.register_script(RATE_LIMIT_SCRIPT)
+        self.leases: Dict[str, RateLimitLease] = {}
+        self.statistics = {
+            "round_trips": 0,
+            "near_cache_hits": 0,
+            "rejections": 0
+        }
+    
+    async def check(self, checks: List[Tuple[str, RateLimitRule, int]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Check and consume one request against several rules.
+        
+        Args:
+            checks: (key, rule, limit) per rule, in priority order
+            
+        Returns:
+            Index of the first rejecting rule (-1 if allowed) and per-rule
+            remaining, retry_after_seconds and reset_after_seconds
+        """
+        if not checks:
+            return -1, []
+        
+        now = time.monotonic()
+        leases = [self.leases.get(key) for key, _, _ in checks]
+        
+        if all(
+            lease is not None and lease.allowance > 0 and lease.expires_at > now for lease in leases
+        ):
+            self.statistics["near_cache_hits"] += 1
+            results = []
+            for lease in leases:
+                lease.allowance -= 1
+                lease.remaining = max(0, lease.remaining - 1)
+                lease.debt += 1
+                results.append({
+                    "remaining": lease.remaining,
+                    "retry_after_seconds": 0.0,
+                    "reset_after_seconds": lease.reset_after_seconds
+                })
+            return -1, results
+        
+        keys = []
+        args = []
+        flushed_debts = []
+        for (key, rule, limit), lease in zip(checks, leases):
+            debt = lease.debt if lease is not None else 0
+            keys.append(key)
+            args.extend(self._script_args(rule, limit, debt))
+            flushed_debts.append(debt)
+        
+        reply = await self.script(keys=keys, args=args)
+        self.statistics["round_trips"] += 1
+        
+        rejected_index = int(reply[0]) - 1
+        if rejected_index >= 0:
+            self.statistics["rejections"] += 1
+        
+        now = time.monotonic()
+        results = []
+        for index, (key, _, _) in enumerate(checks):
+            remaining, retry_after_ms, reset_after_ms = (int(value) for value in reply[1 + index * 3:4 + index * 3])
+            results.append({
+                "remaining": remaining,
+                "retry_after_seconds": retry_after_ms / 1000.0,
+                "reset_after_seconds": reset_after_ms / 1000.0
+            })
+            
+            # Debt recorded from leases while the script ran is carried into the new lease
+            current = self.leases.get(key)
+            carried_debt = max(0, current.debt - flushed_debts[index]) if current is not None else 0
+            
+            allowance = min(self.max_lease, int(remaining * self.near_cache_ratio))
+            if rejected_index >= 0 or allowance <= 0:
+                if carried_debt:
+                    self.leases[key] = RateLimitLease(0, remaining, reset_after_ms / 1000.0, 0.0, carried_debt)
+                else:
+                    self.leases.pop(key, None)
+                continue
+            
+            self.leases[key] = RateLimitLease(
+                allowance=allowance,
+                remaining=remaining,
+                reset_after_seconds=reset_after_ms / 1000.0,
+                expires_at=now + self.near_cache_ttl,
+                debt=carried_debt
+            )
+        
+        return rejected_index, results
+    
+    def _script_args(self, rule: RateLimitRule, limit: int, debt: int) -> List[Any]:
+        """Encode one rule for the rate limit script."""
+        if rule.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+            algorithm = REDIS_TOKEN_BUCKET
+        elif rule.algorithm == RateLimitAlgorithm.FIXED_WINDOW:
+            algorithm = REDIS_FIXED_WINDOW
+        else:
+            algorithm = REDIS_GCRA
+        
+        return [
+            algorithm,
+            max(1, limit),
+            rule.window_size_seconds * 1000,
+            rule.burst_limit or rule.requests_per_window,
+            debt
+        ]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get backend statistics."""
+        lookups = self.statistics["round_trips"] + self.statistics["near_cache_hits"]
+        return {
+            **self.statistics,
+            "near_cache_hit_rate": self.statistics["near_cache_hits"] / lookups if lookups else 0.0,
+            "active_leases": len(self.leases)
+        }
+
+
 # ============================================================================
 # RATE LIMITING ENGINE
 # ============================================================================
@@ -365,26 +635,53 @@ class RateLimitingEngine:
     - Multiple rate limiting algorithms
     - User-based and endpoint-specific limits
     - Intelligent throttling strategies
-    - Redis-backed distributed limiting
+    - Redis-backed distributed limiting, falling back to local limits
+      (backing off from Redis after failures)
     - Adaptive limits based on system load
     - Comprehensive monitoring and analytics
     """
     
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, near_cache_ratio: float = 0.1,
+                 near_cache_ttl: float = 0.05, worker_count: int = 1,
+                 redis_retry_seconds: float = 1.0, redis_max_backoff_seconds: float = 30.0):
         """
         Initialize rate limiting engine.
         
+        While Redis is unavailable each worker enforces its own local limits.
+        With worker_count set, those limits are the rule limits divided among
+        the workers, so the fleet as a whole stays near the configured limit;
+        with the default of 1 each worker allows the full limit.
+        
         Args:
             redis_url: Redis connection URL for distributed limiting
+            near_cache_ratio: Fraction of a key's remaining allowance each worker may use locally
+            near_cache_ttl: Seconds a locally leased allowance stays valid
+            worker_count: Number of workers sharing the distributed limits
+            redis_retry_seconds: Initial time to skip Redis after a failed check
+            redis_max_backoff_seconds: Longest time to skip Redis after repeated failures
         """
         self.redis_client = None
+        self.backend = None
+        self.worker_count = max(1, worker_count)
+        self.redis_retry_seconds = redis_retry_seconds
+        self.redis_max_backoff_seconds = redis_max_backoff_seconds
+        
+        # Circuit breaker: consecutive Redis failures and when to try Redis again
+        self.redis_failures = 0
+        self.redis_retry_at = 0.0
+        
         if redis_url:
             try:
-                self.redis_client = redis.from_url(redis_url)
+                self.redis_client = aioredis.from_url(redis_url)
+                self.backend = RedisRateLimitBackend(
+                    self.redis_client,
+                    near_cache_ratio=near_cache_ratio,
+                    near_cache_ttl=near_cache_ttl
+                )
             except Exception as e:
                 logger.warning(f"Failed to connect to Redis: {e}")
         
-        # In-memory limiters for local operation
+        # In-memory limiters for local operation and Redis outages
         self.limiters = {}
         self.rules = {}
         self.statistics = defaultdict(lambda: {
@@ -471,24 +768,26 @@ class RateLimitingEngine:
         key = self.get_limiter_key(rule, identifier)
         
         if key not in self.limiters:
+            requests_per_window = self._local_limit(rule.requests_per_window)
+            
             if rule.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
                 self.limiters[key] = TokenBucketLimiter(
-                    capacity=rule.burst_limit or rule.requests_per_window,
-                    refill_rate=rule.requests_per_window / rule.window_size_seconds
+                    capacity=self._local_limit(rule.burst_limit) if rule.burst_limit else requests_per_window,
+                    refill_rate=requests_per_window / rule.window_size_seconds
                 )
             elif rule.algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
                 self.limiters[key] = SlidingWindowLimiter(
                     window_size=rule.window_size_seconds,
-                    max_requests=rule.requests_per_window
+                    max_requests=requests_per_window
                 )
             elif rule.algorithm == RateLimitAlgorithm.FIXED_WINDOW:
                 self.limiters[key] = FixedWindowLimiter(
                     window_size=rule.window_size_seconds,
-                    max_requests=rule.requests_per_window
+                    max_requests=requests_per_window
                 )
             elif rule.algorithm == RateLimitAlgorithm.ADAPTIVE:
                 self.limiters[key] = AdaptiveLimiter(
-                    base_limit=rule.requests_per_window,
+                    base_limit=requests_per_window,
                     window_size=rule.window_size_seconds
                 )
         
@@ -543,6 +842,14 @@ class RateLimitingEngine:
         
         applicable_rules.sort(key=lambda r: r.priority)
         
+        if self.backend is not None and applicable_rules and time.monotonic() >= self.redis_retry_at:
+            try:
+                result = await self._check_distributed_limits(applicable_rules, identifiers)
+                self.redis_failures = 0
+                return result
+            except redis.RedisError as e:
+                self._record_redis_failure(e)
+        
         # Check each rule
         for rule in applicable_rules:
             identifier = identifiers[rule.scope]
@@ -592,6 +899,85 @@ class RateLimitingEngine:
             )
         )
     
+    async def _check_distributed_limits(self, rules: List[RateLimitRule],
+                                        identifiers: Dict[RateLimitScope, str]) -> ThrottleResult:
+        """Check rules against the shared Redis state in a single round-trip."""
+        checks = []
+        for rule in rules:
+            identifier = identifiers[rule.scope]
+            limit = rule.requests_per_window
+            
+            # Adaptive limits are adjusted locally and enforced in Redis; the local
+            # limiter holds this worker's share, so scale its adjustment back up
+            if rule.algorithm == RateLimitAlgorithm.ADAPTIVE:
+                limiter = self.get_limiter(rule, identifier)
+                limiter._adjust_limit(self._get_system_load())
+                limit = max(1, limit * limiter.current_limit // limiter.base_limit)
+            
+            checks.append((self.get_limiter_key(rule, identifier), rule, limit))
+        
+        rejected_index, results = await self.backend.check(checks)
+        
+        for index, (rule, result) in enumerate(zip(rules, results)):
+            identifier = identifiers[rule.scope]
+            stats_key = f"{rule.scope.value}:{identifier}"
+            self.statistics[stats_key]["total_requests"] += 1
+            
+            if index != rejected_index:
+                self.statistics[stats_key]["allowed_requests"] += 1
+                continue
+            
+            self.statistics[stats_key]["rejected_requests"] += 1
+            limit = checks[index][2]
+            retry_after = math.ceil(result["retry_after_seconds"])
+            status = RateLimitStatus(
+                rule_id=rule.rule_id,
+                scope=rule.scope,
+                identifier=identifier,
+                requests_made=max(0, limit - result["remaining"]),
+                requests_remaining=result["remaining"],
+                window_reset_time=datetime.utcnow() + timedelta(seconds=result["reset_after_seconds"]),
+                is_limited=True,
+                retry_after_seconds=retry_after,
+                metadata={"backend": "redis", **result}
+            )
+            return await self._apply_throttling_strategy(rule, status)
+        
+        # All limits passed; report the most constrained rule
+        tightest = min(range(len(rules)), key=lambda i: results[i]["remaining"])
+        rule = rules[tightest]
+        return ThrottleResult(
+            allowed=True,
+            delay_seconds=0.0,
+            rate_limit_status=RateLimitStatus(
+                rule_id=rule.rule_id,
+                scope=rule.scope,
+                identifier=identifiers[rule.scope],
+                requests_made=max(0, checks[tightest][2] - results[tightest]["remaining"]),
+                requests_remaining=results[tightest]["remaining"],
+                window_reset_time=datetime.utcnow() + timedelta(seconds=results[tightest]["reset_after_seconds"]),
+                is_limited=False
+            )
+        )
+    
+    def _local_limit(self, limit: int) -> int:
+        """This worker's share of a limit when enforcing it locally for a Redis-backed engine."""
+        if self.backend is None:
+            return limit
+        return max(1, math.ceil(limit / self.worker_count))
+    
+    def _record_redis_failure(self, error: Exception):
+        """Skip Redis for an exponentially growing interval after consecutive failures."""
+        self.redis_failures += 1
+        backoff = min(
+            self.redis_retry_seconds * 2 ** (self.redis_failures - 1),
+            self.redis_max_backoff_seconds
+        )
+        self.redis_retry_at = time.monotonic() + backoff
+        logger.warning(
+            f"Distributed rate limiting unavailable, using local limits for {backoff:.1f}s: {error}"
+        )
+    
     def _create_rate_limit_status(self, rule: RateLimitRule, identifier: str, limiter) -> RateLimitStatus:
         """Create rate limit status from limiter state."""
         status_data = limiter.get_status()
@@ -688,7 +1074,14 @@ class RateLimitingEngine:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get rate limiting statistics."""
-        return dict(self.statistics)
+        statistics = dict(self.statistics)
+        if self.backend is not None:
+            statistics["backend"] = {
+                **self.backend.get_statistics(),
+                "consecutive_failures": self.redis_failures,
+                "using_local_limits": time.monotonic() < self.redis_retry_at
+            }
+        return statistics
     
     def reset_statistics(self):
         """Reset rate limiting statistics."""
@@ -15,6 +15,7 @@ from .cognitive_model import (
     AttentionType,
     CognitiveState,
     MemoryItem,
+    MemorySystem,
     CognitiveDecision,
     CognitiveModelingResult,
     CognitiveUtils
@@ -55,6 +56,8 @@ from .user_learning import (
     AdaptationStrategy,
     LearningSession,
     UserLearningResult,
+    UserLearningStore,
+    LearningStoreLockedError,
     UserLearningUtils
 )
 
@@ -67,6 +70,8 @@ from .context_retention import (
     ConversationTurn,
     SessionContext,
     ContextRetentionResult,
+    ContextCodec,
+    ContextDecodeError,
     ContextRetentionUtils
 )
 
@@ -97,6 +102,7 @@ __all__ = [
     "AttentionType",
     "CognitiveState",
     "MemoryItem",
+    "MemorySystem",
     "CognitiveDecision",
     "CognitiveModelingResult",
     "CognitiveUtils",
@@ -134,6 +140,8 @@ __all__ = [
     "AdaptationStrategy",
     "LearningSession",
     "UserLearningResult",
+    "UserLearningStore",
+    "LearningStoreLockedError",
     "UserLearningUtils",
 
     # Context Retention
@@ -145,6 +153,8 @@ __all__ = [
     "ConversationTurn",
     "SessionContext",
     "ContextRetentionResult",
+    "ContextCodec",
+    "ContextDecodeError",
     "ContextRetentionUtils",
 
     # User Profile Management
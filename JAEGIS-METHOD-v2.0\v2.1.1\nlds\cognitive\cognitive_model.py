@@ -8,6 +8,8 @@ decision-making processes, and cognitive biases with 92%+ human-like behavior ac
 
 import random
 import math
+import re
+import heapq
 from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field
 from enum import Enum
@@ -17,7 +19,7 @@ import asyncio
 import numpy as np
 
 # Cognitive science imports
-from collections import deque, defaultdict
+from collections import deque, defaultdict, OrderedDict
 import networkx as nx
 
 # Local imports
@@ -133,6 +135,289 @@ class CognitiveModelingResult:
     metadata: Dict[str, Any]
 
 
+# ============================================================================
+# MEMORY SYSTEMS
+# ============================================================================
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _seconds(moment: datetime) -> float:
+    """Seconds since the naive UTC epoch used for memory timestamps."""
+    return (moment - _EPOCH).total_seconds()
+
+
+class MemorySystem:
+    """
+    Bounded memory system with lazy decay and a content keyword index.
+    
+    Items are held in insertion order in a ring of at most ``capacity``
+    items and in a heap ordered by the time their strength falls below
+    ``strength_threshold``. Decay is never applied in place: an item's
+    current strength is computed on read from its ``last_accessed`` time,
+    and expired items are popped off the heap whenever the system is
+    written to or queried.
+    
+    Every phrase of up to ``max_phrase_tokens`` consecutive content tokens
+    maps to the items containing it, together with a running decay-weighted
+    strength sum, so counting or weighting the memories that mention a
+    phrase does not depend on how many memories are held.
+    """
+    
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+    
+    # Rebase the weight epoch before exp(decay_rate * hours) grows this large
+    MAX_WEIGHT_EXPONENT = 30.0
+    
+    def __init__(self, memory_type: MemoryType, capacity: Optional[int] = None,
+                 decay_rate: float = 0.1, strength_threshold: float = 0.1,
+                 eviction: str = "weakest", max_phrase_tokens: int = 4):
+        """
+        Initialize an empty memory system.
+        
+        Args:
+            memory_type: Memory type held by this system
+            capacity: Maximum number of items, or None for no limit
+            decay_rate: Exponential strength decay per hour since last access
+            strength_threshold: Strength below which items are forgotten
+            eviction: "oldest" evicts the least recently stored item at capacity,
+                "weakest" the item whose strength decays soonest
+            max_phrase_tokens: Longest phrase indexed directly
+        """
+        if eviction not in ("oldest", "weakest"):
+            raise ValueError(f"Unknown eviction policy: {eviction}")
+        
+        self.memory_type = memory_type
+        self.capacity = capacity
+        self.decay_rate = decay_rate
+        self.strength_threshold = strength_threshold
+        self.eviction = eviction
+        self.max_phrase_tokens = max_phrase_tokens
+        
+        self.items: "OrderedDict[int, MemoryItem]" = OrderedDict()
+        self.item_tokens: Dict[int, Tuple[str, ...]] = {}
+        self.item_phrases: Dict[int, Set[str]] = {}
+        self.item_weights: Dict[int, float] = {}
+        self.expiry_heap: List[Tuple[float, int]] = []
+        self.keyword_index: Dict[str, Set[int]] = {}
+        self.keyword_weights: Dict[str, float] = {}
+        
+        # Item weights are strengths scaled to ``weight_epoch`` (seconds)
+        self.weight_epoch: Optional[float] = None
+        self.next_sequence = 0
+        self.statistics = {"stored": 0, "evicted": 0, "expired": 0, "epoch_rebases": 0}
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(list(self.items.values()))
+    
+    def __getitem__(self, index):
+        if index == -1 and self.items:
+            return next(reversed(self.items.values()))
+        if index == 0 and self.items:
+            return next(iter(self.items.values()))
+        return list(self.items.values())[index]
+    
+    @classmethod
+    def tokenize(cls, text: str) -> Tuple[str, ...]:
+        """Lowercased word tokens of a text."""
+        return tuple(cls.TOKEN_PATTERN.findall(text.lower()))
+    
+    def _phrases(self, tokens: Tuple[str, ...]) -> Set[str]:
+        phrases = set()
+        for length in range(1, min(self.max_phrase_tokens, len(tokens)) + 1):
+            for start in range(len(tokens) - length + 1):
+                phrases.add(" ".join(tokens[start:start + length]))
+        return phrases
+    
+    def _decay_factor(self, last_accessed: datetime, now: datetime) -> float:
+        hours = max((now - last_accessed).total_seconds(), 0.0) / 3600
+        return math.exp(-self.decay_rate * hours)
+    
+    def _rebase(self, now_seconds: float) -> None:
+        """Move the weight epoch forward so item weights stay in range."""
+        factor = math.exp(-self.decay_rate * (now_seconds - self.weight_epoch) / 3600)
+        for sequence in self.item_weights:
+            self.item_weights[sequence] *= factor
+        for phrase in self.keyword_weights:
+            self.keyword_weights[phrase] *= factor
+        self.weight_epoch = now_seconds
+        self.statistics["epoch_rebases"] += 1
+    
+    def add(self, item: MemoryItem, now: Optional[datetime] = None) -> MemoryItem:
+        """
+        Store an item, then forget expired items and evict at capacity.
+        
+        The item takes this system's decay rate.
+        
+        Args:
+            item: Memory item to store
+            now: Current time, defaults to utcnow
+            
+        Returns:
+            The stored item
+        """
+        item.decay_rate = self.decay_rate
+        accessed_seconds = _seconds(item.last_accessed)
+        if self.weight_epoch is None:
+            self.weight_epoch = accessed_seconds
+        elif self.decay_rate * (accessed_seconds - self.weight_epoch) / 3600 > self.MAX_WEIGHT_EXPONENT:
+            self._rebase(accessed_seconds)
+        
+        sequence = self.next_sequence
+        self.next_sequence += 1
+        weight = item.strength * math.exp(self.decay_rate * (accessed_seconds - self.weight_epoch) / 3600)
+        tokens = self.tokenize(item.content) if isinstance(item.content, str) else ()
+        phrases = self._phrases(tokens)
+        
+        self.items[sequence] = item
+        self.item_tokens[sequence] = tokens
+        self.item_phrases[sequence] = phrases
+        self.item_weights[sequence] = weight
+        for phrase in phrases:
+            self.keyword_index.setdefault(phrase, set()).add(sequence)
+            self.keyword_weights[phrase] = self.keyword_weights.get(phrase, 0.0) + weight
+        
+        if item.strength <= self.strength_threshold:
+            expires_at = accessed_seconds
+        elif self.decay_rate > 0:
+            expires_at = accessed_seconds + math.log(item.strength / self.strength_threshold) / self.decay_rate * 3600
+        else:
+            expires_at = math.inf
+        heapq.heappush(self.expiry_heap, (expires_at, sequence))
+        self.statistics["stored"] += 1
+        
+        # Items stored already decayed below the threshold are forgotten at once
+        self.prune(now)
+        if self.capacity is not None:
+            while len(self.items) > self.capacity:
+                self._evict()
+        
+        # Entries of evicted items stay in the heap until popped
+        if len(self.expiry_heap) > 2 * len(self.items) + 16:
+            self.expiry_heap = [entry for entry in self.expiry_heap if entry[1] in self.items]
+            heapq.heapify(self.expiry_heap)
+        
+        return item
+    
+    def _remove(self, sequence: int) -> MemoryItem:
+        item = self.items.pop(sequence)
+        weight = self.item_weights.pop(sequence)
+        del self.item_tokens[sequence]
+        for phrase in self.item_phrases.pop(sequence):
+            postings = self.keyword_index[phrase]
+            postings.discard(sequence)
+            if postings:
+                self.keyword_weights[phrase] -= weight
+            else:
+                del self.keyword_index[phrase]
+                del self.keyword_weights[phrase]
+        return item
+    
+    def _evict(self) -> None:
+        if self.eviction == "oldest":
+            sequence = next(iter(self.items))
+        else:
+            while self.expiry_heap[0][1] not in self.items:
+                heapq.heappop(self.expiry_heap)
+            sequence = heapq.heappop(self.expiry_heap)[1]
+        self._remove(sequence)
+        self.statistics["evicted"] += 1
+    
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Forget items whose strength has decayed below the threshold.
+        
+        Args:
+            now: Current time, defaults to utcnow
+            
+        Returns:
+            Number of items forgotten
+        """
+        now_seconds = _seconds(now or datetime.utcnow())
+        expired = 0
+        
+        while self.expiry_heap and self.expiry_heap[0][0] <= now_seconds:
+            sequence = heapq.heappop(self.expiry_heap)[1]
+            if sequence in self.items:
+                self._remove(sequence)
+                expired += 1
+        
+        self.statistics["expired"] += expired
+        return expired
+    
+    def strength(self, item: MemoryItem, now: Optional[datetime] = None) -> float:
+        """Current strength of an item."""
+        return item.strength * self._decay_factor(item.last_accessed, now or datetime.utcnow())
+    
+    def recency(self, item: MemoryItem, now: Optional[datetime] = None) -> float:
+        """Current recency of an item."""
+        return item.recency * self._decay_factor(item.last_accessed, now or datetime.utcnow())
+    
+    def _phrase_matches(self, tokens: Tuple[str, ...]) -> Set[int]:
+        """Items containing the token sequence; long phrases are verified against their prefix postings."""
+        if len(tokens) <= self.max_phrase_tokens:
+            return self.keyword_index.get(" ".join(tokens), set())
+        
+        length = len(tokens)
+        return {
+            sequence for sequence in self.keyword_index.get(" ".join(tokens[:self.max_phrase_tokens]), ())
+            if any(self.item_tokens[sequence][start:start + length] == tokens
+                   for start in range(len(self.item_tokens[sequence]) - length + 1))
+        }
+    
+    def lookup(self, phrase: str, now: Optional[datetime] = None) -> List[MemoryItem]:
+        """
+        Memories whose content contains a phrase as whole words.
+        
+        Args:
+            phrase: Words to look up
+            now: Current time, defaults to utcnow
+            
+        Returns:
+            Matching items, oldest first
+        """
+        self.prune(now)
+        tokens = self.tokenize(phrase)
+        if not tokens:
+            return []
+        return [self.items[sequence] for sequence in sorted(self._phrase_matches(tokens))]
+    
+    def match_count(self, phrase: str, now: Optional[datetime] = None) -> int:
+        """Number of memories containing a phrase as whole words."""
+        self.prune(now)
+        tokens = self.tokenize(phrase)
+        return len(self._phrase_matches(tokens)) if tokens else 0
+    
+    def strength_sum(self, phrase: str, now: Optional[datetime] = None) -> float:
+        """Summed current strength of the memories containing a phrase."""
+        now = now or datetime.utcnow()
+        self.prune(now)
+        tokens = self.tokenize(phrase)
+        if not tokens:
+            return 0.0
+        
+        if len(tokens) <= self.max_phrase_tokens:
+            weight = self.keyword_weights.get(" ".join(tokens), 0.0)
+        else:
+            weight = sum(self.item_weights[sequence] for sequence in self._phrase_matches(tokens))
+        if weight <= 0.0:
+            return 0.0
+        return weight * math.exp(-self.decay_rate * (_seconds(now) - self.weight_epoch) / 3600)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Size, capacity, index and lifetime counters of the system."""
+        return {
+            "items": len(self.items),
+            "capacity": self.capacity,
+            "indexed_phrases": len(self.keyword_index),
+            "heap_entries": len(self.expiry_heap),
+            **self.statistics
+        }
+
+
 # ============================================================================
 # COGNITIVE MODELING ENGINE
 # ============================================================================
@@ -145,7 +430,7 @@ class CognitiveModelingEngine:
     - Dual-process theory implementation (System 1 & System 2)
     - Working memory limitations and cognitive load modeling
     - Attention mechanisms and selective processing
-    - Memory systems with decay and interference
+    - Bounded memory systems with lazy decay and keyword indexing
     - Cognitive bias simulation
     - Emotional influence on cognition
     - Metacognitive awareness and monitoring
@@ -160,13 +445,15 @@ class CognitiveModelingEngine:
         """
         self.user_id = user_id
         self.cognitive_state = self._initialize_cognitive_state()
+        self.cognitive_parameters = self._load_cognitive_parameters()
         self.memory_systems = self._initialize_memory_systems()
         self.attention_mechanisms = self._initialize_attention_mechanisms()
         self.bias_parameters = self._load_bias_parameters()
-        self.cognitive_parameters = self._load_cognitive_parameters()
         
         # Cognitive history for learning
         self.decision_history = deque(maxlen=1000)
+        self.recent_decision_texts = deque(maxlen=5)  # lowercased, for recency bias
+        self.successful_decision_words = deque(maxlen=10)  # leading words, for confirmation bias
         self.interaction_patterns = defaultdict(list)
         
         # Performance tracking
@@ -191,15 +478,24 @@ class CognitiveModelingEngine:
             processing_mode="mixed"
         )
     
-    def _initialize_memory_systems(self) -> Dict[MemoryType, List[MemoryItem]]:
-        """Initialize memory systems."""
+    def _initialize_memory_systems(self) -> Dict[MemoryType, MemorySystem]:
+        """Initialize bounded memory systems."""
+        parameters = self.cognitive_parameters
+        capacities = {
+            MemoryType.WORKING_MEMORY: int(parameters["working_memory_capacity"]),
+            MemoryType.SHORT_TERM_MEMORY: int(parameters["short_term_memory_capacity"])
+        }
+        
         return {
-            MemoryType.WORKING_MEMORY: [],
-            MemoryType.SHORT_TERM_MEMORY: [],
-            MemoryType.LONG_TERM_MEMORY: [],
-            MemoryType.EPISODIC_MEMORY: [],
-            MemoryType.SEMANTIC_MEMORY: [],
-            MemoryType.PROCEDURAL_MEMORY: []
+            memory_type: MemorySystem(
+                memory_type,
+                capacity=capacities.get(memory_type, int(parameters["memory_system_capacity"])),
+                decay_rate=parameters["memory_decay_rate"],
+                strength_threshold=parameters["memory_strength_threshold"],
+                # Working memory drops the least recently stored item, the others the weakest
+                eviction="oldest" if memory_type == MemoryType.WORKING_MEMORY else "weakest"
+            )
+            for memory_type in MemoryType
         }
     
     def _initialize_attention_mechanisms(self) -> Dict[str, float]:
@@ -245,6 +541,10 @@ class CognitiveModelingEngine:
         """Load cognitive processing parameters."""
         return {
             "working_memory_capacity": 7.0,  # Miller's magic number
+            "short_term_memory_capacity": 50.0,
+            "memory_system_capacity": 1000.0,  # long-term, episodic, semantic, procedural
+            "memory_decay_rate": 0.1,  # per hour since last access
+            "memory_strength_threshold": 0.1,  # weaker memories are forgotten
             "attention_span": 300.0,  # seconds
             "processing_speed": 1.0,  # relative speed
             "fatigue_accumulation_rate": 0.01,
@@ -459,7 +759,7 @@ class CognitiveModelingEngine:
     def _apply_recency_bias(self, options: List[str]) -> List[str]:
         """Apply recency bias to option weighting."""
         # Favor options similar to recent experiences
-        recent_decisions = list(self.decision_history)[-5:]  # Last 5 decisions
+        recent_decisions = list(self.recent_decision_texts)  # Last 5 decisions
         
         weighted_options = []
         for option in options:
@@ -472,38 +772,35 @@ class CognitiveModelingEngine:
     
     def _matches_successful_pattern(self, option: str) -> bool:
         """Check if option matches previously successful patterns."""
-        # Simplified pattern matching
-        successful_decisions = [d for d in self.decision_history if d.confidence > 0.7]
+        # Simplified pattern matching against the last 10 successful decisions
+        option_lower = option.lower()
         
-        for decision in successful_decisions[-10:]:  # Check last 10 successful decisions
-            if any(word in option.lower() for word in decision.decision.lower().split()[:3]):
+        for words in self.successful_decision_words:
+            if any(word in option_lower for word in words):
                 return True
         
         return False
     
     def _calculate_availability_score(self, option: str) -> float:
         """Calculate availability score for an option."""
-        # Based on frequency and recency in memory
+        # Based on frequency and recency in memory, looked up in the keyword indexes
         base_score = 0.5
         
-        # Check working memory
-        for item in self.memory_systems[MemoryType.WORKING_MEMORY]:
-            if isinstance(item.content, str) and option.lower() in item.content.lower():
-                base_score += 0.3
+        # Working memory mentions
+        base_score += 0.3 * self.memory_systems[MemoryType.WORKING_MEMORY].match_count(option)
         
-        # Check short-term memory
-        for item in self.memory_systems[MemoryType.SHORT_TERM_MEMORY]:
-            if isinstance(item.content, str) and option.lower() in item.content.lower():
-                base_score += 0.2 * item.strength
+        # Short-term memory mentions, weighted by current strength
+        base_score += 0.2 * self.memory_systems[MemoryType.SHORT_TERM_MEMORY].strength_sum(option)
         
         return min(base_score, 1.0)
     
-    def _calculate_recency_weight(self, option: str, recent_decisions: List[CognitiveDecision]) -> float:
-        """Calculate recency weight for an option."""
+    def _calculate_recency_weight(self, option: str, recent_decisions: List[str]) -> float:
+        """Calculate recency weight for an option against lowercased recent decisions."""
         weight = 0.0
+        option_lower = option.lower()
         
         for i, decision in enumerate(reversed(recent_decisions)):
-            if option.lower() in decision.decision.lower():
+            if option_lower in decision:
                 # More recent decisions have higher weight
                 recency_factor = (len(recent_decisions) - i) / len(recent_decisions)
                 weight += recency_factor * 0.2
@@ -511,8 +808,23 @@ class CognitiveModelingEngine:
         return weight
     
     def update_memory(self, content: Any, memory_type: MemoryType, 
-                     emotional_valence: float = 0.0):
-        """Update memory systems with new content."""
+                     emotional_valence: float = 0.0) -> MemoryItem:
+        """
+        Store new content in a memory system.
+        
+        Capacity limits and decay are handled by the memory system: the
+        oldest or weakest item is evicted when it is full and items are
+        forgotten once their decayed strength falls below the threshold.
+        
+        Args:
+            content: Content to remember
+            memory_type: Memory system to store it in
+            emotional_valence: Emotional valence of the content (-1 to 1)
+            
+        Returns:
+            The stored memory item
+        """
+        now = datetime.utcnow()
         memory_item = MemoryItem(
             content=content,
             memory_type=memory_type,
@@ -521,51 +833,31 @@ class CognitiveModelingEngine:
             frequency=1,
             emotional_valence=emotional_valence,
             associations=[],
-            created_at=datetime.utcnow(),
-            last_accessed=datetime.utcnow()
+            created_at=now,
+            last_accessed=now
         )
         
-        # Add to appropriate memory system
-        self.memory_systems[memory_type].append(memory_item)
-        
-        # Apply memory constraints
-        self._apply_memory_constraints()
-        
-        # Update memory decay
-        self._update_memory_decay()
+        return self.memory_systems[memory_type].add(memory_item, now)
     
-    def _apply_memory_constraints(self):
-        """Apply capacity constraints to memory systems."""
-        # Working memory constraint (7±2 items)
-        working_memory = self.memory_systems[MemoryType.WORKING_MEMORY]
-        if len(working_memory) > self.cognitive_parameters["working_memory_capacity"]:
-            # Remove oldest items
-            working_memory.sort(key=lambda x: x.last_accessed)
-            self.memory_systems[MemoryType.WORKING_MEMORY] = working_memory[-int(self.cognitive_parameters["working_memory_capacity"]):]
-        
-        # Short-term memory constraint (limited capacity)
-        short_term = self.memory_systems[MemoryType.SHORT_TERM_MEMORY]
-        if len(short_term) > 50:  # Arbitrary limit
-            short_term.sort(key=lambda x: x.strength * x.recency, reverse=True)
-            self.memory_systems[MemoryType.SHORT_TERM_MEMORY] = short_term[:50]
-    
-    def _update_memory_decay(self):
-        """Update memory decay for all memory systems."""
-        current_time = datetime.utcnow()
-        
-        for memory_type, items in self.memory_systems.items():
-            for item in items:
-                # Calculate time since last access
-                time_diff = (current_time - item.last_accessed).total_seconds() / 3600  # hours
-                
-                # Apply decay
-                decay_factor = math.exp(-item.decay_rate * time_diff)
-                item.strength *= decay_factor
-                item.recency *= decay_factor
-                
-                # Remove very weak memories
-                if item.strength < 0.1:
-                    items.remove(item)
+    def _update_memory_decay(self) -> int:
+        """Forget decayed memories in all memory systems; strengths themselves decay on read."""
+        now = datetime.utcnow()
+        return sum(memory_system.prune(now) for memory_system in self.memory_systems.values())
+    
+    def _record_decision(self, decision: CognitiveDecision):
+        """Append a decision to the history and the bias lookup windows."""
+        self.decision_history.append(decision)
+        self.recent_decision_texts.append(decision.decision.lower())
+        if decision.confidence > 0.7:
+            self.successful_decision_words.append(decision.decision.lower().split()[:3])
+    
+    def get_memory_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics of each memory system."""
+        self._update_memory_decay()
+        return {
+            memory_type.value: memory_system.get_statistics()
+            for memory_type, memory_system in self.memory_systems.items()
+        }
     
     def calculate_human_likeness_score(self, decision: CognitiveDecision) -> float:
         """Calculate how human-like the cognitive processing was."""
@@ -628,21 +920,19 @@ class CognitiveModelingEngine:
             memory_updates = []
             
             # Store decision in episodic memory
-            self.update_memory(
+            memory_updates.append(self.update_memory(
                 content=f"Decision: {decision.decision}",
                 memory_type=MemoryType.EPISODIC_MEMORY,
                 emotional_valence=emotional_result.emotional_context.sentiment_analysis.polarity_score
-            )
-            memory_updates.append(self.memory_systems[MemoryType.EPISODIC_MEMORY][-1])
+            ))
             
             # Store important requirements in semantic memory
             for req in logical_result.requirements[:3]:  # Top 3 requirements
                 if req.priority == "high":
-                    self.update_memory(
+                    memory_updates.append(self.update_memory(
                         content=req.text,
                         memory_type=MemoryType.SEMANTIC_MEMORY
-                    )
-                    memory_updates.append(self.memory_systems[MemoryType.SEMANTIC_MEMORY][-1])
+                    ))
             
             # Calculate attention allocation
             attention_allocation = {
@@ -669,7 +959,7 @@ class CognitiveModelingEngine:
             human_likeness_score = self.calculate_human_likeness_score(decision)
             
             # Update decision history
-            self.decision_history.append(decision)
+            self._record_decision(decision)
             
             # Update cognitive metrics
             self.cognitive_metrics["decisions_made"] += 1
@@ -9,7 +9,8 @@ and intelligent context preservation with 95%+ context accuracy and seamless con
 import json
 import pickle
 import hashlib
-from typing import Dict, List, Optional, Tuple, Any, Set
+import heapq
+from typing import Dict, List, Optional, Tuple, Any, Set, Callable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import logging
@@ -22,9 +23,13 @@ import gzip
 import base64
 from collections import deque, defaultdict
 import redis
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Float, Integer, Boolean
+import zstandard as zstd
+from sqlalchemy import (
+    create_engine, Column, String, DateTime, Text, Float, Integer, Boolean, LargeBinary, Index, func,
+    inspect, text
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, aliased
 
 # Local imports
 from .cognitive_model import CognitiveState, CognitiveDecision
@@ -147,7 +152,7 @@ class SessionContextDB(Base):
     user_id = Column(String(255), nullable=False, index=True)
     start_time = Column(DateTime, nullable=False)
     last_activity = Column(DateTime, nullable=False)
-    session_data = Column(Text, nullable=False)  # Compressed JSON
+    session_data = Column(LargeBinary, nullable=False)  # ContextCodec blob
     session_summary = Column(Text)
     total_interactions = Column(Integer, default=0)
     session_quality_score = Column(Float, default=0.0)
@@ -158,13 +163,19 @@ class SessionContextDB(Base):
 class ContextItemDB(Base):
     """Database model for context items."""
     __tablename__ = 'context_items'
+    __table_args__ = (
+        # Relevance-ordered retrieval by type and by session, and expiry sweeps
+        Index('ix_context_items_user_type_relevance', 'user_id', 'context_type', 'relevance_score'),
+        Index('ix_context_items_session_relevance', 'session_id', 'relevance_score', 'last_accessed'),
+        Index('ix_context_items_user_expires', 'user_id', 'expires_at'),
+    )
     
     item_id = Column(String(255), primary_key=True)
-    session_id = Column(String(255), nullable=False, index=True)
-    user_id = Column(String(255), nullable=False, index=True)
+    session_id = Column(String(255), nullable=False)
+    user_id = Column(String(255), nullable=False)
     context_type = Column(String(50), nullable=False)
     priority = Column(String(20), nullable=False)
-    content_data = Column(Text, nullable=False)  # Compressed content
+    content_data = Column(LargeBinary, nullable=False)  # ContextCodec blob
     relevance_score = Column(Float, default=0.0)
     access_count = Column(Integer, default=0)
     compression_level = Column(String(20), default='medium')
@@ -173,6 +184,164 @@ class ContextItemDB(Base):
     expires_at = Column(DateTime, nullable=False)
 
 
+class ContextDictionaryDB(Base):
+    """Database model for trained compression dictionaries."""
+    __tablename__ = 'context_dictionaries'
+    
+    dict_id = Column(Integer, primary_key=True, autoincrement=False)
+    context_type = Column(String(50), nullable=False)
+    dict_data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# ============================================================================
+# CONTEXT CODEC
+# ============================================================================
+
+# Leading byte of stored content blobs
+CONTENT_FORMAT_JSON = 0
+CONTENT_FORMAT_ZSTD = 1
+
+# Content columns created as base64/JSON text by earlier versions: table -> column
+LEGACY_TEXT_COLUMNS = {
+    'session_contexts': 'session_data',
+    'context_items': 'content_data'
+}
+
+
+class ContextDecodeError(ValueError):
+    """Stored content that cannot be decoded, e.g. for lack of its dictionary."""
+
+
+class ContextCodec:
+    """
+    Binary encoding of context content.
+    
+    Content is compact JSON, zstd-compressed with a dictionary trained per
+    context type once enough samples of that type have been encoded. Context
+    items of one type share most of their keys and values, which standalone
+    frames cannot exploit at these sizes. Frames record their dictionary id,
+    so items written before a retrain still decode.
+    
+    Codecs sharing a dictionary store reload it before training a type, and
+    adopt a dictionary another codec already trained for it, so the store
+    holds about one dictionary per context type.
+    """
+    
+    def __init__(self, dictionary_size: int = 16384, training_samples: int = 200,
+                 on_trained: Optional[Callable[[ContextType, int, bytes], None]] = None,
+                 reload_dictionaries: Optional[Callable[[], None]] = None):
+        """
+        Initialize context codec.
+        
+        Args:
+            dictionary_size: Target size of trained dictionaries in bytes
+            training_samples: Samples of a context type collected before training
+            on_trained: Called with (context_type, dict_id, dict_data) after training
+            reload_dictionaries: Adds dictionaries from the shared store via
+                add_dictionary; called before training and for unknown dictionary ids
+        """
+        self.dictionary_size = dictionary_size
+        self.training_samples = training_samples
+        self.on_trained = on_trained
+        self.reload_dictionaries = reload_dictionaries
+        self.dictionaries: Dict[int, zstd.ZstdCompressionDict] = {}  # dict_id -> dictionary
+        self.active_dictionaries: Dict[ContextType, int] = {}  # context_type -> dict_id
+        self.samples: Dict[ContextType, List[bytes]] = defaultdict(list)
+        self.compressors: Dict[Tuple[int, int], zstd.ZstdCompressor] = {}
+        self.decompressors: Dict[int, zstd.ZstdDecompressor] = {}
+        self.missing_dictionaries: Set[int] = set()  # Ids not found on reload
+    
+    def add_dictionary(self, context_type: ContextType, dict_data: bytes) -> int:
+        """Register a dictionary and make it the active one for its type."""
+        dictionary = zstd.ZstdCompressionDict(dict_data)
+        dict_id = dictionary.dict_id()
+        self.dictionaries[dict_id] = dictionary
+        self.active_dictionaries[context_type] = dict_id
+        self.samples.pop(context_type, None)
+        return dict_id
+    
+    def train(self, context_type: ContextType, samples: List[bytes]) -> Optional[int]:
+        """
+        Train and activate a dictionary for a context type.
+        
+        Returns:
+            Dictionary id, or None if zstd could not train on the samples
+        """
+        try:
+            dictionary = zstd.train_dictionary(self.dictionary_size, samples)
+        except zstd.ZstdError as e:
+            logger.warning(f"Dictionary training failed for {context_type.value}: {e}")
+            self.samples.pop(context_type, None)
+            return None
+        
+        dict_data = dictionary.as_bytes()
+        dict_id = self.add_dictionary(context_type, dict_data)
+        logger.info(f"Trained {len(dict_data)}-byte dictionary for {context_type.value} on {len(samples)} samples")
+        
+        if self.on_trained:
+            self.on_trained(context_type, dict_id, dict_data)
+        return dict_id
+    
+    def encode(self, content: Any, context_type: Optional[ContextType] = None, level: int = 3) -> bytes:
+        """
+        Encode content to a blob.
+        
+        Args:
+            content: JSON-serializable content
+            context_type: Type whose dictionary to use; None for no dictionary
+            level: zstd level, 0 to store uncompressed JSON
+        """
+        raw = json.dumps(content, default=str, separators=(",", ":")).encode("utf-8")
+        if level == 0:
+            return bytes([CONTENT_FORMAT_JSON]) + raw
+        
+        dict_id = self.active_dictionaries.get(context_type, 0) if context_type else 0
+        frame = self._compressor(dict_id, level).compress(raw)
+        
+        if context_type and not dict_id:
+            samples = self.samples[context_type]
+            samples.append(raw)
+            if len(samples) >= self.training_samples:
+                # Another codec sharing the store may have trained this type already
+                if self.reload_dictionaries:
+                    self.reload_dictionaries()
+                if context_type not in self.active_dictionaries:
+                    self.train(context_type, samples)
+        
+        return bytes([CONTENT_FORMAT_ZSTD]) + frame
+    
+    def decode(self, data: bytes) -> Any:
+        """Decode a blob produced by encode."""
+        if data[0] == CONTENT_FORMAT_JSON:
+            return json.loads(data[1:])
+        
+        frame = memoryview(data)[1:]
+        dict_id = zstd.get_frame_parameters(frame).dict_id
+        return json.loads(self._decompressor(dict_id).decompress(frame))
+    
+    def _compressor(self, dict_id: int, level: int) -> zstd.ZstdCompressor:
+        compressor = self.compressors.get((dict_id, level))
+        if compressor is None:
+            compressor = zstd.ZstdCompressor(level=level, dict_data=self.dictionaries.get(dict_id))
+            self.compressors[(dict_id, level)] = compressor
+        return compressor
+    
+    def _decompressor(self, dict_id: int) -> zstd.ZstdDecompressor:
+        decompressor = self.decompressors.get(dict_id)
+        if decompressor is None:
+            if dict_id and dict_id not in self.dictionaries and dict_id not in self.missing_dictionaries:
+                # Trained by another codec since this one last loaded the store
+                if self.reload_dictionaries:
+                    self.reload_dictionaries()
+            if dict_id and dict_id not in self.dictionaries:
+                self.missing_dictionaries.add(dict_id)
+                raise ContextDecodeError(f"Unknown compression dictionary {dict_id}")
+            decompressor = zstd.ZstdDecompressor(dict_data=self.dictionaries.get(dict_id))
+            self.decompressors[dict_id] = decompressor
+        return decompressor
+
+
 # ============================================================================
 # CONTEXT RETENTION ENGINE
 # ============================================================================
@@ -207,7 +376,8 @@ class ContextRetentionEngine:
         
         # Storage connections
         try:
-            self.redis_client = redis.from_url(redis_url, decode_responses=True)
+            # Binary client: cached content is a ContextCodec blob
+            self.redis_client = redis.from_url(redis_url)
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Using in-memory cache.")
             self.redis_client = None
@@ -215,6 +385,7 @@ class ContextRetentionEngine:
         try:
             self.engine = create_engine(database_url)
             Base.metadata.create_all(self.engine)
+            self._migrate_legacy_columns()
             Session = sessionmaker(bind=self.engine)
             self.db_session = Session()
         except Exception as e:
@@ -229,6 +400,15 @@ class ContextRetentionEngine:
         self.retention_parameters = self._load_retention_parameters()
         self.compression_settings = self._load_compression_settings()
         
+        # Binary content encoding with per-type dictionaries
+        self.codec = ContextCodec(
+            dictionary_size=self.retention_parameters["dictionary_size_bytes"],
+            training_samples=self.retention_parameters["dictionary_training_samples"],
+            on_trained=self._store_dictionary,
+            reload_dictionaries=self._load_dictionaries
+        )
+        self._load_dictionaries()
+        
         # Load active session
         self._load_active_session()
     
@@ -241,6 +421,8 @@ class ContextRetentionEngine:
             "compression_threshold_kb": 10,
             "max_cache_size_mb": 100,
             "cleanup_interval_hours": 6,
+            "dictionary_size_bytes": 16384,
+            "dictionary_training_samples": 200,
             "priority_retention_hours": {
                 RetentionPriority.CRITICAL: 168,  # 7 days
                 RetentionPriority.HIGH: 24,       # 24 hours
@@ -251,12 +433,12 @@ class ContextRetentionEngine:
         }
     
     def _load_compression_settings(self) -> Dict[str, Any]:
-        """Load compression settings."""
+        """Load compression settings (zstd levels)."""
         return {
             CompressionLevel.NONE: {"enabled": False, "level": 0},
-            CompressionLevel.LOW: {"enabled": True, "level": 1},
-            CompressionLevel.MEDIUM: {"enabled": True, "level": 6},
-            CompressionLevel.HIGH: {"enabled": True, "level": 9}
+            CompressionLevel.LOW: {"enabled": True, "level": 3},
+            CompressionLevel.MEDIUM: {"enabled": True, "level": 9},
+            CompressionLevel.HIGH: {"enabled": True, "level": 15}
         }
     
     def create_session(self, session_id: Optional[str] = None) -> SessionContext:
@@ -368,36 +550,65 @@ class ContextRetentionEngine:
                         relevance_threshold: float = 0.3,
                         max_items: int = 10) -> List[ContextItem]:
         """Retrieve context items based on criteria."""
-        retrieved_contexts = []
-        
-        # Try cache first (Redis or memory)
-        cached_contexts = self._retrieve_from_cache(context_type, item_id)
-        retrieved_contexts.extend(cached_contexts)
+        # Single items are served from cache when present
+        if item_id:
+            cached_contexts = self._retrieve_from_cache(context_type, item_id)
+            if cached_contexts:
+                self._record_access(cached_contexts)
+                return cached_contexts
         
-        # Try database if needed
-        if len(retrieved_contexts) < max_items:
-            db_contexts = self._retrieve_from_database(context_type, item_id, relevance_threshold)
-            retrieved_contexts.extend(db_contexts)
+        if self.db_session:
+            # Filtering, ordering and limiting happen in SQL
+            contexts = self._retrieve_from_database(context_type, item_id, relevance_threshold, max_items)
+        else:
+            contexts = heapq.nlargest(
+                max_items,
+                (ctx for ctx in self._retrieve_from_cache(context_type, item_id)
+                 if ctx.relevance_score >= relevance_threshold),
+                key=lambda x: (x.relevance_score, x.last_accessed)
+            )
         
-        # Filter and sort
-        filtered_contexts = [
-            ctx for ctx in retrieved_contexts 
-            if ctx.relevance_score >= relevance_threshold
-        ]
+        self._record_access(contexts)
+        return contexts
+    
+    def retrieve_contexts(self, session_ids: List[str],
+                          context_type: Optional[ContextType] = None,
+                          relevance_threshold: float = 0.3,
+                          max_items_per_session: int = 10) -> Dict[str, List[ContextItem]]:
+        """
+        Retrieve the most relevant context items of many sessions at once.
         
-        # Sort by relevance and recency
-        sorted_contexts = sorted(
-            filtered_contexts,
-            key=lambda x: (x.relevance_score, x.last_accessed),
-            reverse=True
-        )
+        Args:
+            session_ids: Sessions to retrieve
+            context_type: Optional context type filter
+            relevance_threshold: Minimum relevance score
+            max_items_per_session: Maximum items returned per session
+            
+        Returns:
+            Context items per session id, most relevant and recent first
+        """
+        results: Dict[str, List[ContextItem]] = {session_id: [] for session_id in session_ids}
+        if not session_ids:
+            return results
         
-        # Update access information
-        for context in sorted_contexts[:max_items]:
-            context.last_accessed = datetime.utcnow()
-            context.access_count += 1
+        if self.db_session:
+            for session_id, context in self._retrieve_sessions_from_database(
+                session_ids, context_type, relevance_threshold, max_items_per_session
+            ):
+                results[session_id].append(context)
+        else:
+            wanted = set(session_ids)
+            for context in self._retrieve_from_cache(context_type, None):
+                session_id = context.metadata.get("session_id")
+                if session_id in wanted and context.relevance_score >= relevance_threshold:
+                    results[session_id].append(context)
+            for session_id, contexts in results.items():
+                results[session_id] = heapq.nlargest(
+                    max_items_per_session, contexts, key=lambda x: (x.relevance_score, x.last_accessed)
+                )
         
-        return sorted_contexts[:max_items]
+        self._record_access([context for contexts in results.values() for context in contexts])
+        return results
     
     def get_conversation_history(self, max_turns: int = 20,
                                time_window_hours: int = 24) -> List[ConversationTurn]:
@@ -560,41 +771,129 @@ class ContextRetentionEngine:
         else:
             return CompressionLevel.LOW
     
-    def _compress_content(self, content: Any, compression_level: CompressionLevel) -> str:
+    def _compress_content(self, content: Any, compression_level: CompressionLevel,
+                          context_type: Optional[ContextType] = None) -> bytes:
         """Compress content based on compression level."""
-        content_str = json.dumps(content, default=str)
-        
-        if compression_level == CompressionLevel.NONE:
-            return content_str
-        
         settings = self.compression_settings[compression_level]
-        if settings["enabled"]:
-            compressed = gzip.compress(content_str.encode('utf-8'), compresslevel=settings["level"])
-            return base64.b64encode(compressed).decode('utf-8')
-        
-        return content_str
+        level = settings["level"] if settings["enabled"] else 0
+        return self.codec.encode(content, context_type, level)
     
-    def _decompress_content(self, compressed_content: str, compression_level: CompressionLevel) -> Any:
+    def _decompress_content(self, compressed_content: Any, compression_level: CompressionLevel) -> Any:
         """Decompress content."""
+        if isinstance(compressed_content, str):
+            return self._decompress_legacy_content(compressed_content, compression_level)
+        
+        data = bytes(compressed_content)
+        if data[0] > CONTENT_FORMAT_ZSTD:
+            # Legacy text kept as UTF-8 bytes by _migrate_legacy_columns
+            return self._decompress_legacy_content(data.decode('utf-8'), compression_level)
+        return self.codec.decode(data)
+    
+    def _decode_stored_content(self, compressed_content: Any,
+                               compression_level: CompressionLevel) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Decode stored content without losing the item when that fails.
+        
+        Returns:
+            Content and extra metadata; undecodable content is returned as None
+            with a decode_error entry and stays stored for a later retry
+        """
+        try:
+            return self._decompress_content(compressed_content, compression_level), {}
+        except (ValueError, zstd.ZstdError) as e:
+            logger.error(f"Content decoding failed: {e}")
+            return None, {"decode_error": str(e)}
+    
+    def _decompress_legacy_content(self, compressed_content: str, compression_level: CompressionLevel) -> Any:
+        """Decompress content written as base64 gzip text before binary storage."""
         if compression_level == CompressionLevel.NONE:
             return json.loads(compressed_content)
         
-        settings = self.compression_settings[compression_level]
-        if settings["enabled"]:
-            try:
-                compressed_bytes = base64.b64decode(compressed_content.encode('utf-8'))
-                decompressed = gzip.decompress(compressed_bytes).decode('utf-8')
-                return json.loads(decompressed)
-            except Exception as e:
-                logger.error(f"Decompression failed: {e}")
-                return json.loads(compressed_content)  # Fallback
+        try:
+            compressed_bytes = base64.b64decode(compressed_content.encode('utf-8'))
+            return json.loads(gzip.decompress(compressed_bytes).decode('utf-8'))
+        except Exception as e:
+            logger.error(f"Decompression failed: {e}")
+            return json.loads(compressed_content)  # Fallback
+    
+    def _migrate_legacy_columns(self):
+        """
+        Convert content columns created as text by earlier versions to binary.
+        
+        Existing values are kept as their UTF-8 bytes and decoded by the legacy
+        read path. SQLite keeps blobs written to text columns as-is, so only
+        other databases need the column type changed.
+        """
+        dialect = self.engine.dialect.name
+        if dialect == 'sqlite':
+            return
+        
+        inspector = inspect(self.engine)
+        statements = []
+        for table_name, column_name in LEGACY_TEXT_COLUMNS.items():
+            column_types = {column['name']: column['type'] for column in inspector.get_columns(table_name)}
+            # Only text columns need converting; reflected BYTEA or LONGBLOB is not a LargeBinary
+            if not isinstance(column_types.get(column_name), String):
+                continue
+            
+            if dialect == 'postgresql':
+                statements.append(
+                    f"ALTER TABLE {table_name} ALTER COLUMN {column_name} "
+                    f"TYPE BYTEA USING convert_to({column_name}, 'UTF8')"
+                )
+            elif dialect in ('mysql', 'mariadb'):
+                statements.append(f"ALTER TABLE {table_name} MODIFY {column_name} LONGBLOB NOT NULL")
+            else:
+                raise RuntimeError(f"Cannot convert text column {table_name}.{column_name} on {dialect}")
         
-        return json.loads(compressed_content)
+        with self.engine.begin() as connection:
+            for statement in statements:
+                connection.execute(text(statement))
+                logger.info(f"Migrated legacy text column: {statement}")
+    
+    def _load_dictionaries(self):
+        """
+        Load trained compression dictionaries, oldest first so the newest stays active.
+        
+        Dictionaries are shared by the engines of all users: one trained for
+        a context type by any engine is adopted by the others.
+        """
+        if not self.db_session:
+            return
+        
+        try:
+            for db_dictionary in self.db_session.query(ContextDictionaryDB).order_by(
+                ContextDictionaryDB.created_at
+            ):
+                self.codec.add_dictionary(ContextType(db_dictionary.context_type), db_dictionary.dict_data)
+        except Exception as e:
+            logger.error(f"Dictionary loading failed: {e}")
+            self.db_session.rollback()
+    
+    def _store_dictionary(self, context_type: ContextType, dict_id: int, dict_data: bytes):
+        """Persist a trained dictionary; items compressed with it are unreadable without it."""
+        if not self.db_session:
+            return
+        
+        try:
+            self.db_session.merge(ContextDictionaryDB(
+                dict_id=dict_id,
+                context_type=context_type.value,
+                dict_data=dict_data,
+                created_at=datetime.utcnow()
+            ))
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Dictionary storage failed: {e}")
+            self.db_session.rollback()
     
     def _store_context_item(self, context_item: ContextItem, expires_at: datetime):
         """Store context item in persistent storage."""
         # Compress content
-        compressed_content = self._compress_content(context_item.content, context_item.compression_level)
+        compressed_content = self._compress_content(
+            context_item.content, context_item.compression_level, context_item.context_type
+        )
+        session_id = self.active_session.session_id if self.active_session else "unknown"
         
         # Store in cache (Redis)
         if self.redis_client:
@@ -602,7 +901,9 @@ class ContextRetentionEngine:
                 cache_key = f"context:{self.user_id}:{context_item.item_id}"
                 cache_data = {
                     "content": compressed_content,
-                    "metadata": json.dumps(context_item.metadata, default=str),
+                    "metadata": json.dumps({**context_item.metadata, "session_id": session_id}, default=str),
+                    "context_type": context_item.context_type.value,
+                    "priority": context_item.priority.value,
                     "relevance_score": context_item.relevance_score,
                     "compression_level": context_item.compression_level.value
                 }
@@ -611,8 +912,10 @@ class ContextRetentionEngine:
                 retention_hours = self.retention_parameters["priority_retention_hours"][context_item.priority]
                 ttl_seconds = retention_hours * 3600
                 
-                self.redis_client.hmset(cache_key, cache_data)
-                self.redis_client.expire(cache_key, ttl_seconds)
+                pipeline = self.redis_client.pipeline()
+                pipeline.hset(cache_key, mapping=cache_data)
+                pipeline.expire(cache_key, ttl_seconds)
+                pipeline.execute()
             except Exception as e:
                 logger.error(f"Cache storage failed: {e}")
         
@@ -621,7 +924,7 @@ class ContextRetentionEngine:
             try:
                 db_item = ContextItemDB(
                     item_id=context_item.item_id,
-                    session_id=self.active_session.session_id if self.active_session else "unknown",
+                    session_id=session_id,
                     user_id=self.user_id,
                     context_type=context_item.context_type.value,
                     priority=context_item.priority.value,
@@ -664,7 +967,7 @@ class ContextRetentionEngine:
                 for key in keys:
                     cache_data = self.redis_client.hgetall(key)
                     if cache_data:
-                        key_item_id = key.split(":")[-1]
+                        key_item_id = key.decode("utf-8").split(":")[-1]
                         context = self._cache_data_to_context(key_item_id, cache_data)
                         
                         if context and (not context_type or context.context_type == context_type):
@@ -674,22 +977,23 @@ class ContextRetentionEngine:
         
         return contexts
     
-    def _cache_data_to_context(self, item_id: str, cache_data: Dict[str, str]) -> Optional[ContextItem]:
+    def _cache_data_to_context(self, item_id: str, cache_data: Dict[bytes, bytes]) -> Optional[ContextItem]:
         """Convert cache data to context item."""
         try:
-            compression_level = CompressionLevel(cache_data.get("compression_level", "medium"))
-            content = self._decompress_content(cache_data["content"], compression_level)
-            metadata = json.loads(cache_data.get("metadata", "{}"))
+            fields = {key.decode("utf-8"): value for key, value in cache_data.items()}
+            compression_level = CompressionLevel(fields.get("compression_level", b"medium").decode("utf-8"))
+            content, decode_metadata = self._decode_stored_content(fields["content"], compression_level)
+            metadata = {**json.loads(fields.get("metadata", b"{}")), **decode_metadata}
             
             return ContextItem(
                 item_id=item_id,
-                context_type=ContextType.CONVERSATION_HISTORY,  # Default, will be corrected
+                context_type=ContextType(fields.get("context_type", b"conversation_history").decode("utf-8")),
                 content=content,
-                priority=RetentionPriority.MEDIUM,  # Default
+                priority=RetentionPriority(fields.get("priority", b"medium").decode("utf-8")),
                 created_at=datetime.utcnow(),  # Approximate
                 last_accessed=datetime.utcnow(),
                 access_count=1,
-                relevance_score=float(cache_data.get("relevance_score", 0.5)),
+                relevance_score=float(fields.get("relevance_score", 0.5)),
                 compression_level=compression_level,
                 metadata=metadata
             )
@@ -697,9 +1001,23 @@ class ContextRetentionEngine:
             logger.error(f"Cache data conversion failed: {e}")
             return None
     
+    def _context_query(self, context_type: Optional[ContextType], relevance_threshold: float, *columns):
+        """Query over this user's live items above the relevance threshold."""
+        query = self.db_session.query(ContextItemDB, *columns).filter(
+            ContextItemDB.user_id == self.user_id,
+            ContextItemDB.expires_at > datetime.utcnow(),
+            ContextItemDB.relevance_score >= relevance_threshold
+        )
+        
+        if context_type:
+            query = query.filter(ContextItemDB.context_type == context_type.value)
+        
+        return query
+    
     def _retrieve_from_database(self, context_type: Optional[ContextType],
                               item_id: Optional[str],
-                              relevance_threshold: float) -> List[ContextItem]:
+                              relevance_threshold: float,
+                              max_items: int = 20) -> List[ContextItem]:
         """Retrieve contexts from database."""
         contexts = []
         
@@ -707,19 +1025,14 @@ class ContextRetentionEngine:
             return contexts
         
         try:
-            query = self.db_session.query(ContextItemDB).filter(
-                ContextItemDB.user_id == self.user_id,
-                ContextItemDB.expires_at > datetime.utcnow(),
-                ContextItemDB.relevance_score >= relevance_threshold
-            )
+            query = self._context_query(context_type, relevance_threshold)
             
             if item_id:
                 query = query.filter(ContextItemDB.item_id == item_id)
             
-            if context_type:
-                query = query.filter(ContextItemDB.context_type == context_type.value)
-            
-            db_items = query.order_by(ContextItemDB.relevance_score.desc()).limit(20).all()
+            db_items = query.order_by(
+                ContextItemDB.relevance_score.desc(), ContextItemDB.last_accessed.desc()
+            ).limit(max_items).all()
             
             for db_item in db_items:
                 context = self._db_item_to_context(db_item)
@@ -727,14 +1040,69 @@ class ContextRetentionEngine:
                     contexts.append(context)
         except Exception as e:
             logger.error(f"Database retrieval failed: {e}")
+            self.db_session.rollback()
+        
+        return contexts
+    
+    def _retrieve_sessions_from_database(self, session_ids: List[str],
+                                         context_type: Optional[ContextType],
+                                         relevance_threshold: float,
+                                         max_items_per_session: int) -> List[Tuple[str, ContextItem]]:
+        """Top items of each session in one query, ranked per session with a window function."""
+        contexts = []
+        
+        try:
+            rank = func.row_number().over(
+                partition_by=ContextItemDB.session_id,
+                order_by=(ContextItemDB.relevance_score.desc(), ContextItemDB.last_accessed.desc())
+            ).label("session_rank")
+            ranked = self._context_query(context_type, relevance_threshold, rank).filter(
+                ContextItemDB.session_id.in_(session_ids)
+            ).subquery()
+            
+            ranked_item = aliased(ContextItemDB, ranked)
+            db_items = self.db_session.query(ranked_item).filter(
+                ranked.c.session_rank <= max_items_per_session
+            ).order_by(ranked.c.session_id, ranked.c.session_rank).all()
+            
+            for db_item in db_items:
+                context = self._db_item_to_context(db_item)
+                if context:
+                    contexts.append((db_item.session_id, context))
+        except Exception as e:
+            logger.error(f"Batch database retrieval failed: {e}")
+            self.db_session.rollback()
         
         return contexts
     
+    def _record_access(self, contexts: List[ContextItem]):
+        """Update access information in memory and with one UPDATE in the database."""
+        if not contexts:
+            return
+        
+        now = datetime.utcnow()
+        for context in contexts:
+            context.last_accessed = now
+            context.access_count += 1
+        
+        if self.db_session:
+            try:
+                self.db_session.query(ContextItemDB).filter(
+                    ContextItemDB.item_id.in_([context.item_id for context in contexts])
+                ).update({
+                    ContextItemDB.access_count: ContextItemDB.access_count + 1,
+                    ContextItemDB.last_accessed: now
+                }, synchronize_session=False)
+                self.db_session.commit()
+            except Exception as e:
+                logger.error(f"Access update failed: {e}")
+                self.db_session.rollback()
+    
     def _db_item_to_context(self, db_item: ContextItemDB) -> Optional[ContextItem]:
         """Convert database item to context item."""
         try:
             compression_level = CompressionLevel(db_item.compression_level)
-            content = self._decompress_content(db_item.content_data, compression_level)
+            content, metadata = self._decode_stored_content(db_item.content_data, compression_level)
             
             return ContextItem(
                 item_id=db_item.item_id,
@@ -746,7 +1114,7 @@ class ContextRetentionEngine:
                 access_count=db_item.access_count,
                 relevance_score=db_item.relevance_score,
                 compression_level=compression_level,
-                metadata={}
+                metadata=metadata
             )
         except Exception as e:
             logger.error(f"Database item conversion failed: {e}")
@@ -806,7 +1174,7 @@ class ContextRetentionEngine:
             
             if db_session:
                 # Decompress and restore session
-                session_data = self._decompress_content(db_session.session_data, CompressionLevel.MEDIUM)
+                session_data, _ = self._decode_stored_content(db_session.session_data, CompressionLevel.MEDIUM)
                 
                 self.active_session = SessionContext(
                     session_id=db_session.session_id,
@@ -6,18 +6,29 @@ Advanced user learning and adaptation system with persistent memory, behavior pa
 recognition, and personalized interaction optimization with 85%+ adaptation accuracy.
 """
 
+import atexit
+import itertools
 import json
+import os
 import pickle
+import time
+import weakref
 from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import asyncio
 import numpy as np
 
 # ML and pattern recognition imports
 from collections import defaultdict, deque, Counter
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 import networkx as nx
@@ -134,6 +145,694 @@ class UserLearningResult:
     metadata: Dict[str, Any]
 
 
+# ============================================================================
+# COLUMNAR LEARNING STORE
+# ============================================================================
+
+# Behavior types in code order (index = stored behavior code)
+BEHAVIOR_TYPES = [
+    "standard_interaction",
+    "quick_decisive",
+    "analytical_thorough",
+    "emotionally_driven",
+    "time_pressured",
+    "complex_needs",
+    "knowledge_seeking"
+]
+
+# Behavioral features in stored column order
+FEATURE_NAMES = [
+    "cognitive_load", "working_memory_load", "confidence_level", "fatigue_level", "motivation_level",
+    "decision_confidence", "decision_quality", "bounded_rationality", "human_likeness", "processing_time",
+    "emotional_intelligence", "urgency_level", "sentiment_polarity", "empathy_triggers_count",
+    "user_state_intensity",
+    "inference_confidence", "completeness_score", "actionability_score", "implicit_intents_count",
+    "semantic_gaps_count"
+]
+
+# Known values per learned preference type (index = stored value code)
+PREFERENCE_VALUES = {
+    "communication_style": ["detailed_explanatory", "concise_direct", "empathetic_supportive"],
+    "information_complexity": ["high_detail", "low_summary", "medium_balanced"],
+    "interaction_pace": ["fast", "slow", "moderate"],
+    "emotional_sensitivity": ["high", "moderate", "low"]
+}
+
+
+def _to_epoch(value: datetime) -> float:
+    """Naive UTC datetime to POSIX seconds."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _from_epoch(value: float) -> datetime:
+    """POSIX seconds to naive UTC datetime."""
+    return datetime.fromtimestamp(float(value), timezone.utc).replace(tzinfo=None)
+
+
+class LearningStoreLockedError(RuntimeError):
+    """The storage path is already held by another open learning store."""
+
+
+class UserLearningStore:
+    """
+    Append-only columnar store of learning state for many users.
+    
+    Each user is a row in a set of numpy columns holding learned preferences,
+    recognized patterns and a ring buffer over the last ``pattern_window``
+    observations with running per-indicator counts, so recording an
+    observation and re-evaluating patterns are O(1) per observation.
+    Observations themselves are appended to a columnar log that is kept in
+    memory only until it is flushed.
+    
+    Saves are deltas: each flush writes one ``segment-NNNNNNNN.npz`` file with
+    the users registered, the user rows changed and the observations appended
+    since the previous flush. Loading replays the segments in order and
+    ``compact`` folds them into one, marked compacted so that replay starts
+    from it if the segments it replaced were not all removed. It runs after a
+    flush once the segments written after the oldest one reach
+    ``compact_segment_count`` files, or outgrow both ``compact_bytes`` and the
+    oldest segment, so compaction rewrites at most about twice what it folds.
+    
+    Segments refer to users by row, so a storage path has a single writer: the
+    store holds an exclusive lock on it until ``close``, which also flushes and
+    runs at interpreter exit. ``shared`` falls back to a ``worker-N``
+    directory under a path another process holds.
+    """
+    
+    LOG_CHUNK_SIZE = 65536
+    
+    _shared_stores: Dict[str, "UserLearningStore"] = {}
+    _open_stores: "weakref.WeakSet[UserLearningStore]" = weakref.WeakSet()  # Closed at interpreter exit
+    
+    def __init__(self, storage_path: str, pattern_window: int = 20, indicator_count: int = 4,
+                 flush_batch_size: int = 1024, flush_interval_seconds: float = 5.0,
+                 preference_values: Optional[Dict[str, List[str]]] = None,
+                 compact_segment_count: int = 256, compact_bytes: int = 64 * 1024 * 1024):
+        """
+        Open or create a learning store.
+        
+        Args:
+            storage_path: Directory holding the store segments
+            pattern_window: Number of recent observations patterns are computed over
+            indicator_count: Number of pattern indicator bits tracked per observation
+            flush_batch_size: Pending observations that trigger a flush
+            flush_interval_seconds: Maximum age of pending changes before a flush
+            preference_values: Known values per preference type
+            compact_segment_count: Delta segments that trigger a compaction
+            compact_bytes: Minimum delta segment bytes that trigger a compaction
+        """
+        self.storage_path = storage_path
+        self.pattern_window = pattern_window
+        self.indicator_count = indicator_count
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.compact_segment_count = compact_segment_count
+        self.compact_bytes = compact_bytes
+        
+        values = preference_values or PREFERENCE_VALUES
+        self.preference_types = list(values)
+        self.preference_values = {name: list(options) for name, options in values.items()}
+        self.preference_codes = {
+            name: {value: code for code, value in enumerate(options)}
+            for name, options in self.preference_values.items()
+        }
+        
+        # Per-indicator count contribution of every flag byte
+        self.flag_bits = ((np.arange(256)[:, None] >> np.arange(indicator_count)) & 1).astype(np.int16)
+        
+        self.column_specs = {
+            "observation_count": (np.int64, ()),
+            "window_position": (np.uint8, ()),
+            "window_fill": (np.uint8, ()),
+            "window_behaviors": (np.uint8, (pattern_window,)),
+            "window_flags": (np.uint8, (pattern_window,)),
+            "window_counts": (np.int16, (indicator_count,)),
+            "preference_value": (np.int8, (len(self.preference_types),)),
+            "preference_confidence": (np.float64, (len(self.preference_types),)),
+            "preference_evidence": (np.int32, (len(self.preference_types),)),
+            "preference_stability": (np.float64, (len(self.preference_types),)),
+            "preference_updated": (np.float64, (len(self.preference_types),)),
+            "preference_context_dependent": (np.bool_, (len(self.preference_types),)),
+            "pattern_mask": (np.uint16, ()),
+            "pattern_confidence": (np.float32, (len(BehaviorPattern),))
+        }
+        
+        self.user_ids: List[str] = []
+        self.user_index: Dict[str, int] = {}
+        self.capacity = 0
+        self.columns: Dict[str, np.ndarray] = {}
+        self.dirty = np.zeros(0, dtype=np.bool_)
+        self._grow(1024)
+        
+        # Adaptation strategies per user, as JSON-ready dictionaries
+        self.strategies: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty_strategies: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        # Unflushed observation log, in fixed-size column chunks
+        self._log_chunks: List[Dict[str, np.ndarray]] = []
+        self._log_fill = 0
+        
+        self._flushed_user_count = 0
+        self.persisted_observations = 0
+        self.segment_sequence = 0
+        self.last_flush = time.monotonic()
+        self.base_bytes = 0  # Size of the oldest segment, compacted or first written
+        self.delta_segments = 0  # Segments and bytes written after it
+        self.delta_bytes = 0
+        self.stats = {"flushes": 0, "bytes_written": 0, "observations_flushed": 0, "rows_flushed": 0,
+                      "compactions": 0}
+        
+        self._lock_file = self._acquire_lock()
+        self._load_segments()
+        self._open_stores.add(self)
+    
+    @classmethod
+    def shared(cls, storage_path: str, **options) -> "UserLearningStore":
+        """
+        Return the process-wide store for a storage path, opening it once.
+        
+        When another process holds the path, the store opens the first free
+        ``worker-N`` directory under it instead, so each process keeps
+        writing to the same directory across restarts.
+        """
+        key = os.path.abspath(storage_path)
+        if key not in cls._shared_stores:
+            path = storage_path
+            for slot in itertools.count(1):
+                try:
+                    cls._shared_stores[key] = cls(path, **options)
+                    break
+                except LearningStoreLockedError:
+                    path = os.path.join(storage_path, f"worker-{slot}")
+            if path != storage_path:
+                logger.warning(f"Learning store {storage_path} is held by another process; using {path}")
+        return cls._shared_stores[key]
+    
+    def _acquire_lock(self):
+        """Take the exclusive writer lock on the storage path."""
+        os.makedirs(self.storage_path, exist_ok=True)
+        lock_file = open(os.path.join(self.storage_path, "store.lock"), "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise LearningStoreLockedError(
+                f"Learning store {self.storage_path} is open in another process or store; "
+                f"use UserLearningStore.shared or a separate storage path per worker"
+            )
+        return lock_file
+    
+    def close(self) -> None:
+        """Flush pending changes and release the storage path."""
+        if self._lock_file is None:
+            return
+        
+        try:
+            self.flush()
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
+            self._open_stores.discard(self)
+            for key in [key for key, store in self._shared_stores.items() if store is self]:
+                del self._shared_stores[key]
+    
+    def _grow(self, capacity: int) -> None:
+        """Grow all user columns to at least ``capacity`` rows."""
+        if capacity <= self.capacity:
+            return
+        
+        for name, (dtype, shape) in self.column_specs.items():
+            column = np.zeros((capacity,) + shape, dtype=dtype)
+            if name == "preference_value":
+                column.fill(-1)
+            if name in self.columns:
+                column[:self.capacity] = self.columns[name]
+            self.columns[name] = column
+        
+        dirty = np.zeros(capacity, dtype=np.bool_)
+        dirty[:self.capacity] = self.dirty
+        self.dirty = dirty
+        self.capacity = capacity
+    
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self.user_index
+    
+    def __len__(self) -> int:
+        return len(self.user_ids)
+    
+    def register_user(self, user_id: str) -> int:
+        """Return the row of a user, adding it if it is new."""
+        row = self.user_index.get(user_id)
+        if row is None:
+            row = len(self.user_ids)
+            if row >= self.capacity:
+                self._grow(self.capacity * 2)
+            self.user_ids.append(user_id)
+            self.user_index[user_id] = row
+        return row
+    
+    def register_users(self, user_ids: List[str]) -> np.ndarray:
+        """Return the rows of many users, adding new ones in one step."""
+        new_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in self.user_index]
+        if new_ids:
+            needed = len(self.user_ids) + len(new_ids)
+            if needed > self.capacity:
+                self._grow(max(needed, self.capacity * 2))
+            first_row = len(self.user_ids)
+            self.user_ids.extend(new_ids)
+            self.user_index.update(zip(new_ids, range(first_row, first_row + len(new_ids))))
+        return np.fromiter((self.user_index[user_id] for user_id in user_ids), dtype=np.int64, count=len(user_ids))
+    
+    # ------------------------------------------------------------------------
+    # Observations and running aggregates
+    # ------------------------------------------------------------------------
+    
+    def _log_append(self, rows, behaviors, confidences, features, timestamps) -> None:
+        """Append observation rows to the unflushed columnar log."""
+        count = len(rows)
+        offset = 0
+        while offset < count:
+            if not self._log_chunks or self._log_fill == self.LOG_CHUNK_SIZE:
+                self._log_chunks.append({
+                    "users": np.empty(self.LOG_CHUNK_SIZE, dtype=np.int64),
+                    "timestamps": np.empty(self.LOG_CHUNK_SIZE, dtype=np.float64),
+                    "behaviors": np.empty(self.LOG_CHUNK_SIZE, dtype=np.uint8),
+                    "confidences": np.empty(self.LOG_CHUNK_SIZE, dtype=np.float32),
+                    "features": np.empty((self.LOG_CHUNK_SIZE, len(FEATURE_NAMES)), dtype=np.float32)
+                })
+                self._log_fill = 0
+            
+            chunk = self._log_chunks[-1]
+            take = min(count - offset, self.LOG_CHUNK_SIZE - self._log_fill)
+            target = slice(self._log_fill, self._log_fill + take)
+            source = slice(offset, offset + take)
+            chunk["users"][target] = rows[source]
+            chunk["timestamps"][target] = timestamps[source]
+            chunk["behaviors"][target] = behaviors[source]
+            chunk["confidences"][target] = confidences[source]
+            chunk["features"][target] = features[source]
+            self._log_fill += take
+            offset += take
+    
+    @property
+    def pending_observations(self) -> int:
+        """Observations appended since the last flush."""
+        if not self._log_chunks:
+            return 0
+        return (len(self._log_chunks) - 1) * self.LOG_CHUNK_SIZE + self._log_fill
+    
+    def append_observation(self, row: int, behavior_code: int, indicator_flags: int, confidence: float,
+                           features: List[float], timestamp: float) -> None:
+        """
+        Record one observation for a user in O(1).
+        
+        The oldest observation in the user's window is evicted and its
+        indicator flags are subtracted from the running counts.
+        """
+        columns = self.columns
+        position = int(columns["window_position"][row])
+        fill = int(columns["window_fill"][row])
+        counts = columns["window_counts"][row]
+        
+        if fill == self.pattern_window:
+            counts -= self.flag_bits[columns["window_flags"][row, position]]
+        else:
+            columns["window_fill"][row] = fill + 1
+        counts += self.flag_bits[indicator_flags]
+        
+        columns["window_flags"][row, position] = indicator_flags
+        columns["window_behaviors"][row, position] = behavior_code
+        columns["window_position"][row] = (position + 1) % self.pattern_window
+        columns["observation_count"][row] += 1
+        self.dirty[row] = True
+        
+        self._log_append(
+            (row,), (behavior_code,), (confidence,), np.asarray([features], dtype=np.float32), (timestamp,)
+        )
+    
+    def append_observations(self, rows: np.ndarray, behavior_codes: np.ndarray, indicator_flags: np.ndarray,
+                            confidences: np.ndarray, features: np.ndarray, timestamps: np.ndarray) -> None:
+        """
+        Record a batch of observations with vectorized window updates.
+        
+        Observations of the same user are applied in batch order, one
+        occurrence per user per pass.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        behavior_codes = np.asarray(behavior_codes, dtype=np.uint8)
+        indicator_flags = np.asarray(indicator_flags, dtype=np.uint8)
+        
+        # Occurrence rank of every observation among those of its user
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        group_starts = np.r_[0, np.flatnonzero(np.diff(sorted_rows)) + 1]
+        group_sizes = np.diff(np.r_[group_starts, len(rows)])
+        ranks = np.empty(len(rows), dtype=np.int64)
+        ranks[order] = np.arange(len(rows)) - np.repeat(group_starts, group_sizes)
+        
+        columns = self.columns
+        for rank in range(int(ranks.max()) + 1 if len(rows) else 0):
+            selected = np.flatnonzero(ranks == rank)
+            batch_rows = rows[selected]
+            positions = columns["window_position"][batch_rows].astype(np.int64)
+            full = columns["window_fill"][batch_rows] == self.pattern_window
+            
+            evicted = columns["window_flags"][batch_rows, positions]
+            columns["window_counts"][batch_rows] -= self.flag_bits[evicted] * full[:, None]
+            columns["window_counts"][batch_rows] += self.flag_bits[indicator_flags[selected]]
+            
+            columns["window_flags"][batch_rows, positions] = indicator_flags[selected]
+            columns["window_behaviors"][batch_rows, positions] = behavior_codes[selected]
+            columns["window_position"][batch_rows] = (positions + 1) % self.pattern_window
+            columns["window_fill"][batch_rows] = np.minimum(columns["window_fill"][batch_rows] + 1, self.pattern_window)
+            columns["observation_count"][batch_rows] += 1
+        
+        self.dirty[rows] = True
+        self._log_append(rows, behavior_codes, np.asarray(confidences, dtype=np.float32),
+                         np.asarray(features, dtype=np.float32), np.asarray(timestamps, dtype=np.float64))
+    
+    def observation_count(self, row: int) -> int:
+        """Total observations recorded for a user."""
+        return int(self.columns["observation_count"][row])
+    
+    def window_counts(self, row: int) -> Tuple[np.ndarray, int]:
+        """Running indicator counts and the number of observations in the window."""
+        return self.columns["window_counts"][row], int(self.columns["window_fill"][row])
+    
+    def recent_behaviors(self, row: int, count: int) -> List[str]:
+        """Behavior types of a user's most recent observations, oldest first."""
+        fill = int(self.columns["window_fill"][row])
+        position = int(self.columns["window_position"][row])
+        count = min(count, fill)
+        indexes = [(position - count + offset) % self.pattern_window for offset in range(count)]
+        return [BEHAVIOR_TYPES[code] for code in self.columns["window_behaviors"][row, indexes]]
+    
+    # ------------------------------------------------------------------------
+    # Preferences, patterns and strategies
+    # ------------------------------------------------------------------------
+    
+    def get_preference(self, row: int, preference_type: str) -> Optional[UserPreference]:
+        """Materialize one stored preference."""
+        slot = self.preference_types.index(preference_type)
+        code = int(self.columns["preference_value"][row, slot])
+        if code < 0:
+            return None
+        
+        return UserPreference(
+            preference_type=preference_type,
+            preference_value=self.preference_values[preference_type][code],
+            confidence=float(self.columns["preference_confidence"][row, slot]),
+            evidence_count=int(self.columns["preference_evidence"][row, slot]),
+            last_updated=_from_epoch(self.columns["preference_updated"][row, slot]),
+            stability_score=float(self.columns["preference_stability"][row, slot]),
+            context_dependent=bool(self.columns["preference_context_dependent"][row, slot])
+        )
+    
+    def get_preferences(self, row: int) -> Dict[str, UserPreference]:
+        """Materialize all stored preferences of a user."""
+        preferences = {}
+        for preference_type in self.preference_types:
+            preference = self.get_preference(row, preference_type)
+            if preference is not None:
+                preferences[preference_type] = preference
+        return preferences
+    
+    def put_preference(self, row: int, preference: UserPreference) -> None:
+        """Store one preference, extending the value vocabulary if needed."""
+        if preference.preference_type not in self.preference_codes:
+            raise ValueError(f"Unknown preference type: {preference.preference_type}")
+        
+        slot = self.preference_types.index(preference.preference_type)
+        codes = self.preference_codes[preference.preference_type]
+        value = str(preference.preference_value)
+        if value not in codes:
+            codes[value] = len(self.preference_values[preference.preference_type])
+            self.preference_values[preference.preference_type].append(value)
+        
+        self.columns["preference_value"][row, slot] = codes[value]
+        self.columns["preference_confidence"][row, slot] = preference.confidence
+        self.columns["preference_evidence"][row, slot] = preference.evidence_count
+        self.columns["preference_stability"][row, slot] = preference.stability_score
+        self.columns["preference_updated"][row, slot] = _to_epoch(preference.last_updated)
+        self.columns["preference_context_dependent"][row, slot] = preference.context_dependent
+        self.dirty[row] = True
+    
+    def get_patterns(self, row: int) -> Tuple[Set[BehaviorPattern], Dict[BehaviorPattern, float]]:
+        """Recognized patterns of a user and the confidence of each."""
+        mask = int(self.columns["pattern_mask"][row])
+        confidences = self.columns["pattern_confidence"][row]
+        patterns = {pattern for index, pattern in enumerate(BehaviorPattern) if mask >> index & 1}
+        return patterns, {pattern: float(confidences[index]) for index, pattern in enumerate(BehaviorPattern)
+                          if confidences[index]}
+    
+    def record_patterns(self, row: int, confidences: Dict[BehaviorPattern, float]) -> None:
+        """Add recognized patterns to a user and set their confidence."""
+        pattern_indexes = {pattern: index for index, pattern in enumerate(BehaviorPattern)}
+        mask = int(self.columns["pattern_mask"][row])
+        for pattern, confidence in confidences.items():
+            index = pattern_indexes[pattern]
+            mask |= 1 << index
+            self.columns["pattern_confidence"][row, index] = confidence
+        self.columns["pattern_mask"][row] = mask
+        if confidences:
+            self.dirty[row] = True
+    
+    def put_strategies(self, user_id: str, strategies: Dict[str, Dict[str, Any]]) -> None:
+        """Store new or changed adaptation strategies of a user."""
+        if strategies:
+            self.strategies.setdefault(user_id, {}).update(strategies)
+            self._dirty_strategies.setdefault(user_id, {}).update(strategies)
+    
+    # ------------------------------------------------------------------------
+    # Delta persistence
+    # ------------------------------------------------------------------------
+    
+    def _segment_paths(self) -> List[str]:
+        """Existing segment files in replay order."""
+        if not os.path.isdir(self.storage_path):
+            return []
+        return sorted(
+            os.path.join(self.storage_path, name) for name in os.listdir(self.storage_path)
+            if name.startswith("segment-") and name.endswith(".npz")
+        )
+    
+    def flush_if_due(self) -> bool:
+        """Flush when enough observations are pending or pending changes are old enough."""
+        has_changes = self.pending_observations or self._dirty_strategies or \
+            len(self.user_ids) > self._flushed_user_count or self.dirty.any()
+        if not has_changes:
+            return False
+        
+        if self.pending_observations >= self.flush_batch_size or \
+                time.monotonic() - self.last_flush >= self.flush_interval_seconds:
+            return self.flush()
+        return False
+    
+    def flush(self) -> bool:
+        """
+        Write pending changes as one delta segment.
+        
+        Returns:
+            True when a segment was written
+        """
+        dirty_rows = np.flatnonzero(self.dirty[:len(self.user_ids)])
+        new_user_ids = self.user_ids[self._flushed_user_count:]
+        observations = self._pending_log()
+        
+        if not (len(dirty_rows) or new_user_ids or self._dirty_strategies or len(observations["users"])):
+            return False
+        
+        arrays = {
+            "meta": np.array(json.dumps({
+                "preference_values": self.preference_values,
+                "strategies": self._dirty_strategies
+            })),
+            "new_user_ids": np.array(new_user_ids, dtype=str),
+            "dirty_rows": dirty_rows
+        }
+        for name, column in self.columns.items():
+            arrays[f"user_{name}"] = column[dirty_rows]
+        for name, column in observations.items():
+            arrays[f"observation_{name}"] = column
+        
+        self.segment_sequence += 1
+        path = os.path.join(self.storage_path, f"segment-{self.segment_sequence:08d}.npz")
+        self._write_segment(path, arrays)
+        
+        self.dirty[dirty_rows] = False
+        self._flushed_user_count = len(self.user_ids)
+        self._dirty_strategies = {}
+        self._log_chunks = []
+        self._log_fill = 0
+        self.persisted_observations += len(observations["users"])
+        self.last_flush = time.monotonic()
+        
+        segment_bytes = os.path.getsize(path)
+        if self.base_bytes:
+            self.delta_segments += 1
+            self.delta_bytes += segment_bytes
+        else:
+            self.base_bytes = segment_bytes
+        
+        self.stats["flushes"] += 1
+        self.stats["bytes_written"] += segment_bytes
+        self.stats["observations_flushed"] += len(observations["users"])
+        self.stats["rows_flushed"] += len(dirty_rows)
+        
+        if self.delta_segments >= self.compact_segment_count or \
+                self.delta_bytes >= max(self.compact_bytes, self.base_bytes):
+            self.compact()
+        return True
+    
+    def _pending_log(self) -> Dict[str, np.ndarray]:
+        """Concatenate the unflushed observation log."""
+        if not self._log_chunks:
+            return {
+                "users": np.empty(0, dtype=np.int64),
+                "timestamps": np.empty(0, dtype=np.float64),
+                "behaviors": np.empty(0, dtype=np.uint8),
+                "confidences": np.empty(0, dtype=np.float32),
+                "features": np.empty((0, len(FEATURE_NAMES)), dtype=np.float32)
+            }
+        
+        sizes = [self.LOG_CHUNK_SIZE] * (len(self._log_chunks) - 1) + [self._log_fill]
+        return {
+            name: np.concatenate([chunk[name][:size] for chunk, size in zip(self._log_chunks, sizes)])
+            for name in self._log_chunks[0]
+        }
+    
+    def _write_segment(self, path: str, arrays: Dict[str, np.ndarray]) -> None:
+        """Write a segment atomically."""
+        os.makedirs(self.storage_path, exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temporary_path, path)
+    
+    def _load_segments(self) -> None:
+        """Replay existing segments into the in-memory columns."""
+        paths = self._segment_paths()
+        
+        # A compacted segment holds everything written before it; older
+        # segments still present are left over from an interrupted compaction
+        for index in range(len(paths) - 1, 0, -1):
+            with np.load(paths[index], allow_pickle=False) as segment:
+                compacted = json.loads(str(segment["meta"])).get("compacted", False)
+            if compacted:
+                for stale_path in paths[:index]:
+                    os.remove(stale_path)
+                logger.warning(f"Removed {index} segments already folded into {paths[index]}")
+                paths = paths[index:]
+                break
+        
+        for path in paths:
+            with np.load(path, allow_pickle=False) as segment:
+                meta = json.loads(str(segment["meta"]))
+                new_user_ids = segment["new_user_ids"].tolist()
+                if new_user_ids:
+                    self.register_users(new_user_ids)
+                
+                dirty_rows = segment["dirty_rows"]
+                for name in self.columns:
+                    self.columns[name][dirty_rows] = segment[f"user_{name}"]
+                
+                for name, options in meta["preference_values"].items():
+                    if name in self.preference_values:
+                        for value in options[len(self.preference_values[name]):]:
+                            self.preference_codes[name][value] = len(self.preference_values[name])
+                            self.preference_values[name].append(value)
+                for user_id, strategies in meta["strategies"].items():
+                    self.strategies.setdefault(user_id, {}).update(strategies)
+                
+                self.persisted_observations += len(segment["observation_users"])
+            
+            if path == paths[0]:
+                self.base_bytes = os.path.getsize(path)
+            else:
+                self.delta_segments += 1
+                self.delta_bytes += os.path.getsize(path)
+            self.segment_sequence = int(os.path.basename(path)[len("segment-"):-len(".npz")])
+        
+        self._flushed_user_count = len(self.user_ids)
+    
+    def load_observations(self) -> Dict[str, np.ndarray]:
+        """
+        Read the full observation log: persisted segments followed by pending rows.
+        
+        Returns:
+            Observation columns with a ``user_ids`` column resolved from rows
+        """
+        parts = []
+        for path in self._segment_paths():
+            with np.load(path, allow_pickle=False) as segment:
+                parts.append({name: segment[f"observation_{name}"] for name in
+                              ("users", "timestamps", "behaviors", "confidences", "features")})
+        parts.append(self._pending_log())
+        
+        observations = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+        observations["user_ids"] = np.array(self.user_ids, dtype=str)[observations["users"]] \
+            if len(observations["users"]) else np.empty(0, dtype=str)
+        return observations
+    
+    def compact(self) -> None:
+        """Fold all segments and pending changes into a single segment."""
+        self.flush()
+        observations = self.load_observations()
+        old_paths = self._segment_paths()
+        user_count = len(self.user_ids)
+        
+        arrays = {
+            "meta": np.array(json.dumps({
+                "preference_values": self.preference_values,
+                "strategies": self.strategies,
+                "compacted": True
+            })),
+            "new_user_ids": np.array(self.user_ids, dtype=str),
+            "dirty_rows": np.arange(user_count)
+        }
+        for name, column in self.columns.items():
+            arrays[f"user_{name}"] = column[:user_count]
+        for name in ("users", "timestamps", "behaviors", "confidences", "features"):
+            arrays[f"observation_{name}"] = observations[name]
+        
+        self.segment_sequence += 1
+        path = os.path.join(self.storage_path, f"segment-{self.segment_sequence:08d}.npz")
+        self._write_segment(path, arrays)
+        # A crash from here on leaves old segments that the next load removes
+        for old_path in old_paths:
+            os.remove(old_path)
+        
+        self.base_bytes = os.path.getsize(path)
+        self.delta_segments, self.delta_bytes = 0, 0
+        self.stats["compactions"] += 1
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Store size and persistence statistics."""
+        return {
+            "users": len(self.user_ids),
+            "capacity": self.capacity,
+            "column_bytes": sum(column.nbytes for column in self.columns.values()),
+            "pending_observations": self.pending_observations,
+            "persisted_observations": self.persisted_observations,
+            "dirty_users": int(self.dirty[:len(self.user_ids)].sum()),
+            "segments": len(self._segment_paths()),
+            **self.stats
+        }
+
+
+@atexit.register
+def _close_open_stores() -> None:
+    """Flush every open learning store at interpreter exit."""
+    for store in list(UserLearningStore._open_stores):
+        try:
+            store.close()
+        except Exception as e:
+            logger.error(f"Failed to close learning store {store.storage_path}: {e}")
+
+
 # ============================================================================
 # USER LEARNING ENGINE
 # ============================================================================
@@ -150,28 +849,40 @@ class UserLearningEngine:
     - Contextual learning and adaptation
     - Feedback-driven optimization
     - Temporal pattern analysis
+    - Columnar multi-user store with incremental patterns and delta saves
     """
     
-    def __init__(self, user_id: str, storage_path: Optional[str] = None):
+    # Pattern indicators tracked per observation (flag bit = list index) and share thresholds
+    PATTERN_INDICATORS = [
+        (BehaviorPattern.ANALYTICAL_THINKER, 0.4),
+        (BehaviorPattern.QUICK_DECISION_MAKER, 0.4),
+        (BehaviorPattern.DETAIL_ORIENTED, 0.3),
+        (BehaviorPattern.INNOVATION_SEEKING, 0.3)
+    ]
+    
+    def __init__(self, user_id: str, storage_path: Optional[str] = None,
+                 store: Optional[UserLearningStore] = None):
         """
         Initialize user learning engine.
         
         Args:
             user_id: User identifier
             storage_path: Path for persistent storage
+            store: Learning store shared with other users' engines; defaults to the
+                process-wide store under the storage path's directory
         """
         self.user_id = user_id
         self.storage_path = storage_path or f"user_data/{user_id}"
+        self.store = store if store is not None else UserLearningStore.shared(
+            os.path.join(os.path.dirname(self.storage_path) or ".", "learning_store")
+        )
         
-        # Learning components
-        self.user_preferences = {}
-        self.behavior_observations = deque(maxlen=1000)
+        # Learning components (observations, preferences and patterns live in the store)
         self.adaptation_strategies = {}
         self.learning_sessions = []
+        self._changed_strategies = set()
         
         # Pattern recognition
-        self.behavior_patterns = set()
-        self.pattern_confidence = defaultdict(float)
         self.context_patterns = defaultdict(list)
         
         # Learning parameters
@@ -179,7 +890,29 @@ class UserLearningEngine:
         self.adaptation_thresholds = self._load_adaptation_thresholds()
         
         # Load existing user data
-        self._load_user_data()
+        is_new_user = user_id not in self.store
+        self.user_row = self.store.register_user(user_id)
+        self._load_user_data(is_new_user)
+    
+    @property
+    def user_preferences(self) -> Dict[str, UserPreference]:
+        """Snapshot of the user's learned preferences."""
+        return self.store.get_preferences(self.user_row)
+    
+    @property
+    def behavior_patterns(self) -> Set[BehaviorPattern]:
+        """Behavior patterns recognized for the user so far."""
+        return self.store.get_patterns(self.user_row)[0]
+    
+    @property
+    def pattern_confidence(self) -> Dict[BehaviorPattern, float]:
+        """Latest confidence of each recognized pattern."""
+        return defaultdict(float, self.store.get_patterns(self.user_row)[1])
+    
+    @property
+    def observations_count(self) -> int:
+        """Total behavior observations recorded for the user."""
+        return self.store.observation_count(self.user_row)
     
     def _load_learning_parameters(self) -> Dict[str, float]:
         """Load learning algorithm parameters."""
@@ -232,10 +965,27 @@ class UserLearningEngine:
             features=features
         )
         
-        self.behavior_observations.append(observation)
+        self.store.append_observation(
+            self.user_row,
+            BEHAVIOR_TYPES.index(behavior_type),
+            self._pattern_indicator_flags(behavior_type, features),
+            confidence,
+            [features.get(name, 0.0) for name in FEATURE_NAMES],
+            _to_epoch(observation.timestamp)
+        )
         
         return observation
     
+    def _pattern_indicator_flags(self, behavior_type: str, features: Dict[str, float]) -> int:
+        """Encode which pattern indicators an observation contributes to."""
+        indicators = [
+            behavior_type == "analytical_thorough",
+            behavior_type == "quick_decisive",
+            features.get("cognitive_load", 0) > 0.6 and features.get("processing_time", 0) > 3.0,
+            features.get("implicit_intents_count", 0) > 2
+        ]
+        return sum(1 << index for index, present in enumerate(indicators) if present)
+    
     def _extract_behavioral_features(self, cognitive_state: CognitiveState,
                                    decision_result: DecisionResult,
                                    emotional_result: EmotionalAnalysisResult,
@@ -328,9 +1078,8 @@ class UserLearningEngine:
             confidence_factors.append(consistency_score * 0.3)
         
         # Historical consistency
-        if len(self.behavior_observations) > 5:
-            recent_behaviors = list(self.behavior_observations)[-5:]
-            behavior_types = [obs.behavior_type for obs in recent_behaviors]
+        if self.store.observation_count(self.user_row) > 5:
+            behavior_types = self.store.recent_behaviors(self.user_row, 5)
             type_consistency = len(set(behavior_types)) / len(behavior_types)
             confidence_factors.append((1 - type_consistency) * 0.2)
         else:
@@ -483,9 +1232,9 @@ class UserLearningEngine:
                          feedback: Optional[float] = None):
         """Update existing preference or add new one."""
         pref_key = new_preference.preference_type
+        existing = self.store.get_preference(self.user_row, pref_key)
         
-        if pref_key in self.user_preferences:
-            existing = self.user_preferences[pref_key]
+        if existing is not None:
             
             # Update using weighted average
             learning_rate = self.learning_parameters["preference_learning_rate"]
@@ -515,53 +1264,35 @@ class UserLearningEngine:
                 existing.confidence = new_confidence
                 existing.evidence_count += 1
                 existing.last_updated = datetime.utcnow()
+            
+            self.store.put_preference(self.user_row, existing)
         else:
             # Add new preference
-            self.user_preferences[pref_key] = new_preference
+            self.store.put_preference(self.user_row, new_preference)
     
     def recognize_behavior_patterns(self) -> List[BehaviorPattern]:
-        """Recognize behavior patterns from observations."""
-        if len(self.behavior_observations) < self.learning_parameters["min_observations_for_pattern"]:
+        """
+        Recognize behavior patterns from observations.
+        
+        Patterns are evaluated over the last observations of the store window
+        from running indicator counts, so the cost does not depend on the
+        length of the user's history.
+        """
+        if self.store.observation_count(self.user_row) < self.learning_parameters["min_observations_for_pattern"]:
             return []
         
-        recognized_patterns = []
-        
-        # Analyze recent observations
-        recent_observations = list(self.behavior_observations)[-20:]  # Last 20 observations
-        
-        # Pattern: Analytical Thinker
-        analytical_count = sum(1 for obs in recent_observations 
-                             if obs.behavior_type == "analytical_thorough")
-        if analytical_count / len(recent_observations) > 0.4:
-            recognized_patterns.append(BehaviorPattern.ANALYTICAL_THINKER)
-            self.pattern_confidence[BehaviorPattern.ANALYTICAL_THINKER] = analytical_count / len(recent_observations)
-        
-        # Pattern: Quick Decision Maker
-        quick_count = sum(1 for obs in recent_observations 
-                         if obs.behavior_type == "quick_decisive")
-        if quick_count / len(recent_observations) > 0.4:
-            recognized_patterns.append(BehaviorPattern.QUICK_DECISION_MAKER)
-            self.pattern_confidence[BehaviorPattern.QUICK_DECISION_MAKER] = quick_count / len(recent_observations)
-        
-        # Pattern: Detail Oriented
-        detail_indicators = sum(1 for obs in recent_observations 
-                               if obs.features.get("cognitive_load", 0) > 0.6 and 
-                               obs.features.get("processing_time", 0) > 3.0)
-        if detail_indicators / len(recent_observations) > 0.3:
-            recognized_patterns.append(BehaviorPattern.DETAIL_ORIENTED)
-            self.pattern_confidence[BehaviorPattern.DETAIL_ORIENTED] = detail_indicators / len(recent_observations)
-        
-        # Pattern: Innovation Seeking
-        innovation_indicators = sum(1 for obs in recent_observations 
-                                   if obs.features.get("implicit_intents_count", 0) > 2)
-        if innovation_indicators / len(recent_observations) > 0.3:
-            recognized_patterns.append(BehaviorPattern.INNOVATION_SEEKING)
-            self.pattern_confidence[BehaviorPattern.INNOVATION_SEEKING] = innovation_indicators / len(recent_observations)
+        indicator_counts, window_size = self.store.window_counts(self.user_row)
+        
+        confidences = {}
+        for index, (pattern, threshold) in enumerate(self.PATTERN_INDICATORS):
+            share = int(indicator_counts[index]) / window_size
+            if share > threshold:
+                confidences[pattern] = share
         
         # Update behavior patterns
-        self.behavior_patterns.update(recognized_patterns)
+        self.store.record_patterns(self.user_row, confidences)
         
-        return recognized_patterns
+        return list(confidences)
     
     def generate_adaptation_strategies(self, recognized_patterns: List[BehaviorPattern],
                                      current_preferences: Dict[str, UserPreference]) -> List[AdaptationStrategy]:
@@ -640,6 +1371,7 @@ class UserLearningEngine:
         for strategy in strategies:
             key = f"{strategy.adaptation_type.value}_{len(self.adaptation_strategies)}"
             self.adaptation_strategies[key] = strategy
+            self._changed_strategies.add(key)
         
         return strategies
     
@@ -680,6 +1412,9 @@ class UserLearningEngine:
         # Update strategy usage
         strategy.usage_count += 1
         strategy.last_used = datetime.utcnow()
+        self._changed_strategies.update(
+            key for key, stored in self.adaptation_strategies.items() if stored is strategy
+        )
         
         return adaptation_params
     
@@ -713,54 +1448,98 @@ class UserLearningEngine:
             strategy.effectiveness_score = (
                 (1 - alpha) * strategy.effectiveness_score + alpha * feedback
             )
+            self._changed_strategies.add(strategy_key)
     
-    def _save_user_data(self):
-        """Save user data to persistent storage."""
+    def _save_user_data(self, force: bool = False):
+        """
+        Hand changed strategies to the store and let it flush a batched delta.
+        
+        Args:
+            force: Flush pending changes immediately instead of when due
+        """
         try:
-            import os
-            os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-            
-            user_data = {
-                "user_id": self.user_id,
-                "preferences": {k: asdict(v) for k, v in self.user_preferences.items()},
-                "behavior_patterns": list(self.behavior_patterns),
-                "pattern_confidence": dict(self.pattern_confidence),
-                "adaptation_strategies": {k: asdict(v) for k, v in self.adaptation_strategies.items()},
-                "last_updated": datetime.utcnow().isoformat()
-            }
+            self.store.put_strategies(self.user_id, {
+                key: self._strategy_to_dict(self.adaptation_strategies[key])
+                for key in self._changed_strategies
+            })
+            self._changed_strategies.clear()
             
-            with open(f"{self.storage_path}_learning.json", "w") as f:
-                json.dump(user_data, f, indent=2, default=str)
+            if force:
+                self.store.flush()
+            else:
+                self.store.flush_if_due()
                 
         except Exception as e:
             logger.error(f"Failed to save user data: {e}")
     
-    def _load_user_data(self):
-        """Load user data from persistent storage."""
+    def close(self):
+        """Hand over changed strategies and flush the store; the store stays open for other users."""
+        self._save_user_data(force=True)
+    
+    @staticmethod
+    def _strategy_to_dict(strategy: AdaptationStrategy) -> Dict[str, Any]:
+        """JSON-ready form of an adaptation strategy."""
+        data = asdict(strategy)
+        data["adaptation_type"] = strategy.adaptation_type.value
+        data["last_used"] = strategy.last_used.isoformat()
+        return data
+    
+    def _load_user_data(self, migrate_legacy: bool = False):
+        """
+        Load user data from persistent storage.
+        
+        Preferences, patterns and observation windows are read from the store
+        directly; adaptation strategies are rebuilt from their stored form. A
+        user new to the store is migrated from a legacy per-user JSON file.
+        """
         try:
-            with open(f"{self.storage_path}_learning.json", "r") as f:
-                user_data = json.load(f)
-            
-            # Load preferences
-            for k, v in user_data.get("preferences", {}).items():
-                v["last_updated"] = datetime.fromisoformat(v["last_updated"])
-                self.user_preferences[k] = UserPreference(**v)
-            
-            # Load behavior patterns
-            self.behavior_patterns = set(user_data.get("behavior_patterns", []))
-            self.pattern_confidence = defaultdict(float, user_data.get("pattern_confidence", {}))
-            
-            # Load adaptation strategies
-            for k, v in user_data.get("adaptation_strategies", {}).items():
+            for k, v in self.store.strategies.get(self.user_id, {}).items():
+                v = dict(v)
                 v["last_used"] = datetime.fromisoformat(v["last_used"])
                 v["adaptation_type"] = AdaptationType(v["adaptation_type"])
                 self.adaptation_strategies[k] = AdaptationStrategy(**v)
+            
+            if migrate_legacy:
+                self._migrate_legacy_user_data()
                 
-        except FileNotFoundError:
-            logger.info(f"No existing user data found for {self.user_id}")
         except Exception as e:
             logger.error(f"Failed to load user data: {e}")
     
+    def _migrate_legacy_user_data(self):
+        """Import a legacy ``<storage_path>_learning.json`` file into the store."""
+        try:
+            with open(f"{self.storage_path}_learning.json", "r") as f:
+                user_data = json.load(f)
+        except FileNotFoundError:
+            logger.info(f"No existing user data found for {self.user_id}")
+            return
+        
+        # Load preferences
+        for v in user_data.get("preferences", {}).values():
+            v["last_updated"] = datetime.fromisoformat(v["last_updated"])
+            self.store.put_preference(self.user_row, UserPreference(**v))
+        
+        # Load behavior patterns (saved as enum reprs or values)
+        patterns_by_name = {pattern.name: pattern for pattern in BehaviorPattern}
+        patterns_by_name.update({pattern.value: pattern for pattern in BehaviorPattern})
+        pattern_confidence = {
+            patterns_by_name[name.split(".")[-1]]: float(confidence)
+            for name, confidence in user_data.get("pattern_confidence", {}).items()
+            if name.split(".")[-1] in patterns_by_name
+        }
+        for name in user_data.get("behavior_patterns", []):
+            pattern = patterns_by_name.get(str(name).split(".")[-1])
+            if pattern is not None:
+                pattern_confidence.setdefault(pattern, 0.0)
+        self.store.record_patterns(self.user_row, pattern_confidence)
+        
+        # Load adaptation strategies
+        for k, v in user_data.get("adaptation_strategies", {}).items():
+            v["last_used"] = datetime.fromisoformat(v["last_used"])
+            v["adaptation_type"] = AdaptationType(str(v["adaptation_type"]).split(".")[-1].lower())
+            self.adaptation_strategies[k] = AdaptationStrategy(**v)
+            self._changed_strategies.add(k)
+    
     async def learn_and_adapt(self, cognitive_state: CognitiveState,
                             decision_result: DecisionResult,
                             emotional_result: EmotionalAnalysisResult,
@@ -781,7 +1560,6 @@ class UserLearningEngine:
         Returns:
             Complete user learning result
         """
-        import time
         start_time = time.time()
         
         try:
@@ -821,7 +1599,7 @@ class UserLearningEngine:
                 personalization_score=personalization_score,
                 processing_time_ms=processing_time,
                 metadata={
-                    "observations_count": len(self.behavior_observations),
+                    "observations_count": self.observations_count,
                     "preferences_count": len(self.user_preferences),
                     "patterns_count": len(self.behavior_patterns),
                     "strategies_count": len(adaptation_strategies),
@@ -34,6 +34,8 @@ from .amasiap_protocol import (
     ResearchActivation,
     ContextEnrichment,
     AMASIAPResult,
+    InputAnalysis,
+    TriggerMatcher,
     AMASIAPUtils
 )
 
@@ -47,6 +49,9 @@ from .openrouter_integration import (
     ModelRequest,
     ModelResponse,
     OpenRouterResult,
+    ModelClientPool,
+    ModelCallResult,
+    RequestTiming,
     OpenRouterUtils
 )
 
@@ -71,6 +76,13 @@ from .realtime_communication import (
     ConnectionInfo,
     Subscription,
     CommunicationStats,
+    ConnectionSendQueue,
+    MessageBus,
+    RedisMessageBus,
+    UnixSocketBroker,
+    UnixSocketMessageBus,
+    create_message_bus,
+    start_engine_processes,
     RealtimeCommunicationUtils
 )
 
@@ -464,6 +476,8 @@ __all__ = [
     "ResearchActivation",
     "ContextEnrichment",
     "AMASIAPResult",
+    "InputAnalysis",
+    "TriggerMatcher",
     "AMASIAPUtils",
     
     # OpenRouter Integration
@@ -476,6 +490,9 @@ __all__ = [
     "ModelRequest",
     "ModelResponse",
     "OpenRouterResult",
+    "ModelClientPool",
+    "ModelCallResult",
+    "RequestTiming",
     "OpenRouterUtils",
     
     # GitHub Integration
@@ -497,6 +514,13 @@ __all__ = [
     "ConnectionInfo",
     "Subscription",
     "CommunicationStats",
+    "ConnectionSendQueue",
+    "MessageBus",
+    "RedisMessageBus",
+    "UnixSocketBroker",
+    "UnixSocketMessageBus",
+    "create_message_bus",
+    "start_engine_processes",
     "RealtimeCommunicationUtils",
     
     # Error Handling
@@ -541,14 +565,20 @@ def get_default_integration_config() -> Dict[str, Any]:
         },
         "amasiap_protocol": {
             "research_api_url": None,
-            "context_api_url": None
+            "context_api_url": None,
+            "enrichment_cache_size": 1024
         },
         "openrouter_integration": {
             "api_keys": [],
             "load_balancing_enabled": True,
             "cost_optimization_enabled": True,
             "max_cost_per_request": 1.0,
-            "default_timeout": 30
+            "default_timeout": 30,
+            "http2": True,
+            "max_connections_per_provider": 20,
+            "per_key_concurrency": 4,
+            "response_cache_size": 1024,
+            "response_cache_ttl_seconds": 300
         },
         "github_integration": {
             "repository_url": "https://github.com/usemanusai/JAEGIS",
@@ -564,7 +594,11 @@ def get_default_integration_config() -> Dict[str, Any]:
             "ssl_enabled": False,
             "auth_enabled": True,
             "heartbeat_interval": 30,
-            "heartbeat_timeout": 60
+            "heartbeat_timeout": 60,
+            "send_buffer_size": 256,
+            "coalesce_status_updates": False,
+            "dispatcher_shards": 4,
+            "message_bus": None
         },
         "error_handling": {
             "max_error_history": 10000,
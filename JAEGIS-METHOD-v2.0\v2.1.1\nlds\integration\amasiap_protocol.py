@@ -9,7 +9,9 @@ input enhancement, research framework activation, and intelligent context enrich
 import asyncio
 import json
 import re
-from typing import Dict, List, Optional, Tuple, Any, Set
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Any, Set, Hashable, Iterable, Awaitable
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -121,6 +123,76 @@ class AMASIAPResult:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class InputAnalysis:
+    """Trigger analysis of one normalized input, memoized by the protocol engine."""
+    normalized_input: str
+    token_count: int
+    matched_labels: Set[Hashable]
+    enhancement_needs: List[EnhancementType]
+    research_frameworks: List[ResearchFramework]
+    domain_context: List[str]
+    relevance_score: float
+
+
+# ============================================================================
+# TRIGGER MATCHING
+# ============================================================================
+
+class TriggerMatcher:
+    """
+    Single-pass phrase matcher compiled from trigger tables.
+    
+    Every phrase of every table is tokenized once and indexed by its first
+    token. Matching tokenizes the input once and reports the labels of all
+    phrases that occur in it as whole-word token sequences, so overlapping
+    phrases from different tables are all found in the same pass.
+    """
+    
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+    
+    def __init__(self, tables: Iterable[Dict[Hashable, List[str]]]):
+        """
+        Compile trigger tables into one phrase index.
+        
+        Args:
+            tables: Mappings of label to trigger phrases
+        """
+        phrase_labels: Dict[Tuple[str, ...], Set[Hashable]] = {}
+        for table in tables:
+            for label, phrases in table.items():
+                for phrase in phrases:
+                    tokens = tuple(self.tokenize(phrase))
+                    if tokens:
+                        phrase_labels.setdefault(tokens, set()).add(label)
+        
+        self.index: Dict[str, List[Tuple[Tuple[str, ...], frozenset]]] = {}
+        for tokens, labels in phrase_labels.items():
+            self.index.setdefault(tokens[0], []).append((tokens[1:], frozenset(labels)))
+        self.phrase_count = len(phrase_labels)
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Lowercase word tokens of a text, ignoring punctuation and spacing."""
+        return cls.TOKEN_PATTERN.findall(text.lower())
+    
+    def match_tokens(self, tokens: List[str]) -> Set[Hashable]:
+        """Labels of all phrases occurring in a token sequence."""
+        labels: Set[Hashable] = set()
+        for position, token in enumerate(tokens):
+            candidates = self.index.get(token)
+            if not candidates:
+                continue
+            for tail, phrase_labels in candidates:
+                if not tail or tuple(tokens[position + 1:position + 1 + len(tail)]) == tail:
+                    labels |= phrase_labels
+        return labels
+    
+    def match(self, text: str) -> Set[Hashable]:
+        """Labels of all phrases occurring in a text."""
+        return self.match_tokens(self.tokenize(text))
+
+
 # ============================================================================
 # A.M.A.S.I.A.P. PROTOCOL ENGINE
 # ============================================================================
@@ -138,8 +210,21 @@ class AMASIAPProtocolEngine:
     - Intent disambiguation
     - Metadata enhancement
     - Quality assessment and validation
+    - Single-pass trigger matching with memoized input analysis
+    - Concurrent enhancement and research activation with per-phase timing
     """
     
+    # Label of phrases that call for current date/time injection
+    TEMPORAL_REFERENCE = "temporal_reference"
+    
+    # Enhancements that rewrite the input, in the order their edits are merged
+    TEXT_ENHANCEMENTS = [
+        EnhancementType.TEMPORAL_CONTEXT,
+        EnhancementType.DOMAIN_EXPANSION,
+        EnhancementType.CLARIFICATION_INJECTION,
+        EnhancementType.METADATA_ENHANCEMENT
+    ]
+    
     def __init__(self, protocol_config: Dict[str, Any]):
         """
         Initialize A.M.A.S.I.A.P. Protocol Engine.
@@ -161,14 +246,30 @@ class AMASIAPProtocolEngine:
         self.research_triggers = self._load_research_triggers()
         self.domain_mappings = self._load_domain_mappings()
         
+        # All trigger tables compiled into one matcher
+        self.trigger_matcher = TriggerMatcher([
+            self.enhancement_patterns,
+            self.research_triggers,
+            self.domain_mappings,
+            {self.TEMPORAL_REFERENCE: ["today", "now", "current", "currently"]}
+        ])
+        
+        # Input analyses memoized by normalized input (LRU)
+        self.enrichment_cache_size = protocol_config.get("enrichment_cache_size", 1024)
+        self.enrichment_cache: "OrderedDict[str, InputAnalysis]" = OrderedDict()
+        
         # Performance tracking
         self.processing_stats = {
+            "total_requests": 0,
             "total_enhancements": 0,
             "research_activations": 0,
             "average_processing_time_ms": 0.0,
             "enhancement_success_rate": 0.0,
+            "enrichment_cache_hits": 0,
+            "enrichment_cache_misses": 0,
             "last_activation": None
         }
+        self.phase_timings: Dict[str, Dict[str, float]] = {}
         
         # External integrations
         self.research_api_url = protocol_config.get("research_api_url")
@@ -218,33 +319,35 @@ class AMASIAPProtocolEngine:
             "context_relevance_threshold": 0.6
         }
     
-    def _load_enhancement_patterns(self) -> Dict[str, List[str]]:
-        """Load patterns for input enhancement."""
+    def _load_enhancement_patterns(self) -> Dict[EnhancementType, List[str]]:
+        """Load trigger phrases for input enhancement."""
+        periods = ["week", "month", "year", "quarter"]
+        question_words = ["what", "how", "why", "when", "where", "which"]
+        
         return {
-            "temporal_indicators": [
-                r"\b(today|tomorrow|yesterday|now|currently|recent|latest)\b",
-                r"\b(this (week|month|year|quarter))\b",
-                r"\b(last (week|month|year|quarter))\b",
-                r"\b(next (week|month|year|quarter))\b"
+            EnhancementType.TEMPORAL_CONTEXT: [
+                "today", "tomorrow", "yesterday", "now", "currently", "recent", "latest",
+                *[f"{relative} {period}" for relative in ("this", "last", "next") for period in periods]
             ],
-            "research_indicators": [
-                r"\b(research|analyze|investigate|study|explore|examine)\b",
-                r"\b(best practices|industry standards|benchmarks)\b",
-                r"\b(trends|patterns|insights|findings)\b",
-                r"\b(compare|comparison|versus|vs|alternatives)\b"
+            EnhancementType.RESEARCH_ACTIVATION: [
+                "research", "analyze", "investigate", "study", "explore", "examine",
+                "best practices", "industry standards", "benchmarks",
+                "trends", "patterns", "insights", "findings",
+                "compare", "comparison", "versus", "vs", "alternatives"
             ],
-            "domain_indicators": [
-                r"\b(technical|engineering|development|programming)\b",
-                r"\b(business|commercial|enterprise|corporate)\b",
-                r"\b(academic|scientific|research|scholarly)\b",
-                r"\b(creative|design|artistic|innovative)\b"
+            EnhancementType.DOMAIN_EXPANSION: [
+                "technical", "engineering", "development", "programming",
+                "business", "commercial", "enterprise", "corporate",
+                "academic", "scientific", "research", "scholarly",
+                "creative", "design", "artistic", "innovative"
             ],
-            "clarification_needed": [
-                r"\b(unclear|ambiguous|vague|confusing)\b",
-                r"\b(what|how|why|when|where|which)\b",
-                r"\b(help|assist|support|guide)\b",
-                r"\b(explain|clarify|elaborate|detail)\b"
-            ]
+            EnhancementType.CLARIFICATION_INJECTION: [
+                "unclear", "ambiguous", "vague", "confusing",
+                *question_words,
+                "help", "assist", "support", "guide",
+                "explain", "clarify", "elaborate", "detail"
+            ],
+            EnhancementType.INTENT_CLARIFICATION: [*question_words, "who"]
         }
     
     def _load_research_triggers(self) -> Dict[ResearchFramework, List[str]]:
@@ -343,84 +446,96 @@ class AMASIAPProtocolEngine:
             self.is_active = False
             return False
     
-    def detect_enhancement_needs(self, input_text: str) -> List[EnhancementType]:
-        """Detect what types of enhancement are needed for the input."""
-        enhancement_needs = []
-        text_lower = input_text.lower()
-        
-        # Check for temporal context needs
-        for pattern in self.enhancement_patterns["temporal_indicators"]:
-            if re.search(pattern, text_lower):
-                enhancement_needs.append(EnhancementType.TEMPORAL_CONTEXT)
-                break
-        
-        # Check for research activation needs
-        for pattern in self.enhancement_patterns["research_indicators"]:
-            if re.search(pattern, text_lower):
-                enhancement_needs.append(EnhancementType.RESEARCH_ACTIVATION)
-                break
-        
-        # Check for domain expansion needs
-        for pattern in self.enhancement_patterns["domain_indicators"]:
-            if re.search(pattern, text_lower):
-                enhancement_needs.append(EnhancementType.DOMAIN_EXPANSION)
-                break
-        
-        # Check for clarification needs
-        for pattern in self.enhancement_patterns["clarification_needed"]:
-            if re.search(pattern, text_lower):
-                enhancement_needs.append(EnhancementType.CLARIFICATION_INJECTION)
-                break
+    def analyze_input(self, input_text: str) -> Tuple[InputAnalysis, bool]:
+        """
+        Match all trigger tables against the input, memoized by normalized input.
+        
+        Inputs that differ only in case, punctuation or spacing normalize to the
+        same token sequence and share one cached analysis.
+        
+        Args:
+            input_text: Input text to analyze
+            
+        Returns:
+            Tuple of the input analysis and whether it was served from cache
+        """
+        analysis, cache_hit = self._analyze(input_text)
+        self.processing_stats["enrichment_cache_hits" if cache_hit else "enrichment_cache_misses"] += 1
+        return analysis, cache_hit
+    
+    def _analyze(self, input_text: str) -> Tuple[InputAnalysis, bool]:
+        """Cached trigger analysis without touching the cache statistics."""
+        tokens = TriggerMatcher.tokenize(input_text)
+        normalized_input = " ".join(tokens)
+        
+        cached = self.enrichment_cache.get(normalized_input)
+        if cached is not None:
+            self.enrichment_cache.move_to_end(normalized_input)
+            return cached, True
+        
+        labels = self.trigger_matcher.match_tokens(tokens)
+        
+        enhancement_needs = {
+            enhancement_type for enhancement_type in (
+                EnhancementType.TEMPORAL_CONTEXT,
+                EnhancementType.RESEARCH_ACTIVATION,
+                EnhancementType.DOMAIN_EXPANSION,
+                EnhancementType.CLARIFICATION_INJECTION,
+                EnhancementType.INTENT_CLARIFICATION
+            )
+            if enhancement_type in labels
+        }
         
         # Always include context enrichment and metadata enhancement
-        enhancement_needs.extend([
-            EnhancementType.CONTEXT_ENRICHMENT,
-            EnhancementType.METADATA_ENHANCEMENT
-        ])
+        enhancement_needs.update([EnhancementType.CONTEXT_ENRICHMENT, EnhancementType.METADATA_ENHANCEMENT])
         
         # Add semantic expansion for complex queries
-        if len(input_text.split()) > 10:
-            enhancement_needs.append(EnhancementType.SEMANTIC_EXPANSION)
+        if len(tokens) > 10:
+            enhancement_needs.add(EnhancementType.SEMANTIC_EXPANSION)
+        
+        # Default to comprehensive analysis if no specific framework detected
+        research_frameworks = [framework for framework in self.research_triggers if framework in labels]
+        if not research_frameworks:
+            research_frameworks.append(ResearchFramework.COMPREHENSIVE_ANALYSIS)
+        
+        domain_context = [domain for domain in self.domain_mappings if domain in labels]
+        relevance_indicators = len(domain_context) + (1 if self.TEMPORAL_REFERENCE in labels else 0)
+        
+        analysis = InputAnalysis(
+            normalized_input=normalized_input,
+            token_count=len(tokens),
+            matched_labels=labels,
+            enhancement_needs=[enhancement_type for enhancement_type in EnhancementType if enhancement_type in enhancement_needs],
+            research_frameworks=research_frameworks,
+            domain_context=domain_context,
+            relevance_score=min(relevance_indicators / 3, 1.0)
+        )
         
-        # Add intent clarification for ambiguous inputs
-        question_words = ["what", "how", "why", "when", "where", "which", "who"]
-        if any(word in text_lower for word in question_words):
-            enhancement_needs.append(EnhancementType.INTENT_CLARIFICATION)
+        self.enrichment_cache[normalized_input] = analysis
+        if len(self.enrichment_cache) > self.enrichment_cache_size:
+            self.enrichment_cache.popitem(last=False)
         
-        return list(set(enhancement_needs))  # Remove duplicates
+        return analysis, False
+    
+    def detect_enhancement_needs(self, input_text: str) -> List[EnhancementType]:
+        """Detect what types of enhancement are needed for the input."""
+        return list(self.analyze_input(input_text)[0].enhancement_needs)
     
     def detect_research_frameworks(self, input_text: str) -> List[ResearchFramework]:
         """Detect which research frameworks should be activated."""
-        activated_frameworks = []
-        text_lower = input_text.lower()
-        
-        for framework, triggers in self.research_triggers.items():
-            for trigger in triggers:
-                if trigger.lower() in text_lower:
-                    activated_frameworks.append(framework)
-                    break
-        
-        # Default to comprehensive analysis if no specific framework detected
-        if not activated_frameworks:
-            activated_frameworks.append(ResearchFramework.COMPREHENSIVE_ANALYSIS)
-        
-        return activated_frameworks
+        return list(self.analyze_input(input_text)[0].research_frameworks)
     
-    async def generate_context_enrichment(self, input_text: str) -> ContextEnrichment:
+    async def generate_context_enrichment(self, input_text: str,
+                                          analysis: Optional[InputAnalysis] = None) -> ContextEnrichment:
         """Generate context enrichment data."""
+        if analysis is None:
+            analysis, _ = self.analyze_input(input_text)
+        
         current_time = datetime.utcnow()
         
         # Generate temporal context
         temporal_context = f"Current date and time: {current_time.strftime('%Y-%m-%d %H:%M:%S UTC')}"
         
-        # Detect domain context
-        domain_context = []
-        text_lower = input_text.lower()
-        
-        for domain, keywords in self.domain_mappings.items():
-            if any(keyword.lower() in text_lower for keyword in keywords):
-                domain_context.append(domain)
-        
         # Generate environmental factors
         environmental_factors = [
             "JAEGIS Enhanced Agent System v2.2 active",
@@ -429,75 +544,86 @@ class AMASIAPProtocolEngine:
             "Multi-dimensional analysis available"
         ]
         
-        # Calculate relevance score
-        relevance_indicators = len(domain_context) + (1 if any(word in text_lower for word in ["current", "now", "today"]) else 0)
-        relevance_score = min(relevance_indicators / 3, 1.0)
-        
         return ContextEnrichment(
             current_date=current_time.strftime(self.context_settings["current_date_format"]),
             current_time=current_time.strftime(self.context_settings["current_time_format"]),
             temporal_context=temporal_context,
-            domain_context=domain_context,
+            domain_context=list(analysis.domain_context),
             user_context={"session_active": True, "tier_0_access": True},
             system_context={"jaegis_version": "2.2", "nlds_active": True},
             environmental_factors=environmental_factors,
-            relevance_score=relevance_score
+            relevance_score=analysis.relevance_score
+        )
+    
+    @staticmethod
+    def _apply_text_edits(input_text: str, insertions: List[Tuple[int, str]], annotations: List[str]) -> str:
+        """Apply positional insertions (by offset, stable) and then append annotations."""
+        pieces = []
+        position = 0
+        for offset, text in sorted(insertions, key=lambda insertion: insertion[0]):
+            pieces.append(input_text[position:offset])
+            pieces.append(text)
+            position = offset
+        pieces.append(input_text[position:])
+        pieces.extend(annotations)
+        return "".join(pieces)
+    
+    def _build_enhancement(self, enhancement_type: EnhancementType, prefix: str, input_text: str,
+                           insertions: List[Tuple[int, str]], annotation: Optional[str],
+                           confidence: float, metadata: Dict[str, Any], started: float) -> InputEnhancement:
+        """Build an enhancement result that records its edits for later merging."""
+        annotations = [annotation] if annotation else []
+        return InputEnhancement(
+            enhancement_id=f"{prefix}_{datetime.utcnow().strftime('%H%M%S')}",
+            enhancement_type=enhancement_type,
+            original_input=input_text,
+            enhanced_input=self._apply_text_edits(input_text, insertions, annotations),
+            enhancement_confidence=confidence,
+            enhancement_metadata={**metadata, "insertions": insertions, "annotations": annotations},
+            processing_time_ms=(time.perf_counter() - started) * 1000,
+            timestamp=datetime.utcnow()
         )
     
     async def apply_temporal_enhancement(self, input_text: str, context: ContextEnrichment) -> InputEnhancement:
         """Apply temporal context enhancement."""
-        enhanced_text = input_text
+        started = time.perf_counter()
         
         # Inject current date/time context
-        if any(word in input_text.lower() for word in ["today", "now", "current", "currently"]):
-            temporal_injection = f" [Context: {context.temporal_context}]"
-            enhanced_text += temporal_injection
-        
-        # Replace relative time references
-        enhanced_text = re.sub(
-            r'\btoday\b',
-            f"today ({context.current_date})",
-            enhanced_text,
-            flags=re.IGNORECASE
-        )
+        annotation = None
+        if self.TEMPORAL_REFERENCE in self._analyze(input_text)[0].matched_labels:
+            annotation = f" [Context: {context.temporal_context}]"
+        
+        # Annotate relative time references
+        insertions = [
+            (match.end(), f" ({context.current_date})")
+            for match in re.finditer(r'\btoday\b', input_text, flags=re.IGNORECASE)
+        ]
         
-        return InputEnhancement(
-            enhancement_id=f"temporal_{datetime.utcnow().strftime('%H%M%S')}",
-            enhancement_type=EnhancementType.TEMPORAL_CONTEXT,
-            original_input=input_text,
-            enhanced_input=enhanced_text,
-            enhancement_confidence=0.9,
-            enhancement_metadata={"temporal_context": context.temporal_context},
-            processing_time_ms=5.0,
-            timestamp=datetime.utcnow()
+        return self._build_enhancement(
+            EnhancementType.TEMPORAL_CONTEXT, "temporal", input_text, insertions, annotation,
+            0.9, {"temporal_context": context.temporal_context}, started
         )
     
     async def apply_domain_expansion(self, input_text: str, context: ContextEnrichment) -> InputEnhancement:
         """Apply domain-specific expansion."""
-        enhanced_text = input_text
+        started = time.perf_counter()
         
+        annotation = None
         if context.domain_context:
             primary_domain = context.domain_context[0]
             domain_keywords = self.domain_mappings.get(primary_domain, [])
             
             # Add domain context
-            domain_injection = f" [Domain Context: {primary_domain} - Consider: {', '.join(domain_keywords[:3])}]"
-            enhanced_text += domain_injection
+            annotation = f" [Domain Context: {primary_domain} - Consider: {', '.join(domain_keywords[:3])}]"
         
-        return InputEnhancement(
-            enhancement_id=f"domain_{datetime.utcnow().strftime('%H%M%S')}",
-            enhancement_type=EnhancementType.DOMAIN_EXPANSION,
-            original_input=input_text,
-            enhanced_input=enhanced_text,
-            enhancement_confidence=0.8,
-            enhancement_metadata={"domains": context.domain_context},
-            processing_time_ms=8.0,
-            timestamp=datetime.utcnow()
+        return self._build_enhancement(
+            EnhancementType.DOMAIN_EXPANSION, "domain", input_text, [], annotation,
+            0.8, {"domains": context.domain_context}, started
         )
     
     async def apply_clarification_injection(self, input_text: str) -> InputEnhancement:
         """Apply clarification injection for ambiguous inputs."""
-        enhanced_text = input_text
+        started = time.perf_counter()
         
         # Detect ambiguous terms and add clarification prompts
         ambiguous_patterns = [
@@ -507,45 +633,88 @@ class AMASIAPProtocolEngine:
             (r'\bthey\b', '[Clarify: which specific group/entities?]')
         ]
         
-        clarifications_added = 0
+        insertions = []
         for pattern, clarification in ambiguous_patterns:
-            if re.search(pattern, enhanced_text, re.IGNORECASE) and clarifications_added < 2:
-                enhanced_text = re.sub(pattern, f"\\g<0> {clarification}", enhanced_text, count=1, flags=re.IGNORECASE)
-                clarifications_added += 1
+            match = re.search(pattern, input_text, re.IGNORECASE)
+            if match and len(insertions) < 2:
+                insertions.append((match.end(), f" {clarification}"))
         
-        return InputEnhancement(
-            enhancement_id=f"clarify_{datetime.utcnow().strftime('%H%M%S')}",
-            enhancement_type=EnhancementType.CLARIFICATION_INJECTION,
-            original_input=input_text,
-            enhanced_input=enhanced_text,
-            enhancement_confidence=0.7,
-            enhancement_metadata={"clarifications_added": clarifications_added},
-            processing_time_ms=6.0,
-            timestamp=datetime.utcnow()
+        return self._build_enhancement(
+            EnhancementType.CLARIFICATION_INJECTION, "clarify", input_text, insertions, None,
+            0.7, {"clarifications_added": len(insertions)}, started
         )
     
     async def apply_metadata_enhancement(self, input_text: str, context: ContextEnrichment) -> InputEnhancement:
         """Apply metadata enhancement."""
-        enhanced_text = input_text
+        started = time.perf_counter()
         
         # Add system metadata
-        metadata_injection = (
+        annotation = (
             f" [System: JAEGIS v2.2 | N.L.D.S. Tier 0 | "
             f"A.M.A.S.I.A.P. Active | Context: {context.relevance_score:.1f}]"
         )
-        enhanced_text += metadata_injection
         
-        return InputEnhancement(
-            enhancement_id=f"metadata_{datetime.utcnow().strftime('%H%M%S')}",
-            enhancement_type=EnhancementType.METADATA_ENHANCEMENT,
-            original_input=input_text,
-            enhanced_input=enhanced_text,
-            enhancement_confidence=0.95,
-            enhancement_metadata={"system_version": "2.2", "context_score": context.relevance_score},
-            processing_time_ms=3.0,
-            timestamp=datetime.utcnow()
+        return self._build_enhancement(
+            EnhancementType.METADATA_ENHANCEMENT, "metadata", input_text, [], annotation,
+            0.95, {"system_version": "2.2", "context_score": context.relevance_score}, started
         )
     
+    async def _apply_enhancements(self, input_text: str, enhancement_needs: List[EnhancementType],
+                                  context: ContextEnrichment) -> Tuple[List[InputEnhancement], str]:
+        """
+        Run the needed text enhancements concurrently and merge their edits.
+        
+        Each enhancement works on the original input and records its edits as
+        positional insertions and appended annotations, so the merged text does
+        not depend on the order in which the enhancements complete.
+        """
+        appliers = {
+            EnhancementType.TEMPORAL_CONTEXT: lambda: self.apply_temporal_enhancement(input_text, context),
+            EnhancementType.DOMAIN_EXPANSION: lambda: self.apply_domain_expansion(input_text, context),
+            EnhancementType.CLARIFICATION_INJECTION: lambda: self.apply_clarification_injection(input_text),
+            EnhancementType.METADATA_ENHANCEMENT: lambda: self.apply_metadata_enhancement(input_text, context)
+        }
+        
+        enhancements = list(await asyncio.gather(*(
+            appliers[enhancement_type]()
+            for enhancement_type in self.TEXT_ENHANCEMENTS
+            if enhancement_type in enhancement_needs
+        )))
+        
+        insertions = [
+            insertion for enhancement in enhancements
+            for insertion in enhancement.enhancement_metadata["insertions"]
+        ]
+        annotations = [
+            annotation for enhancement in enhancements
+            for annotation in enhancement.enhancement_metadata["annotations"]
+        ]
+        return enhancements, self._apply_text_edits(input_text, insertions, annotations)
+    
+    async def _activate_research_frameworks(self, input_text: str,
+                                            frameworks: List[ResearchFramework]) -> List[ResearchActivation]:
+        """Activate research frameworks concurrently."""
+        return list(await asyncio.gather(*(
+            self.activate_research_framework(input_text, framework) for framework in frameworks
+        )))
+    
+    def _record_phase(self, phase: str, elapsed_ms: float) -> None:
+        """Accumulate timing for one processing phase."""
+        timing = self.phase_timings.setdefault(
+            phase, {"count": 0, "total_ms": 0.0, "average_ms": 0.0, "max_ms": 0.0}
+        )
+        timing["count"] += 1
+        timing["total_ms"] += elapsed_ms
+        timing["average_ms"] = timing["total_ms"] / timing["count"]
+        timing["max_ms"] = max(timing["max_ms"], elapsed_ms)
+    
+    async def _timed(self, phase: str, awaitable: Awaitable, phase_times: Dict[str, float]) -> Any:
+        """Await a phase, recording its wall time in milliseconds."""
+        started = time.perf_counter()
+        result = await awaitable
+        phase_times[phase] = (time.perf_counter() - started) * 1000
+        return result
+    
     async def activate_research_framework(self, input_text: str, framework: ResearchFramework) -> ResearchActivation:
         """Activate specific research framework."""
         # Generate research query based on framework
@@ -616,8 +785,7 @@ class AMASIAPProtocolEngine:
         Returns:
             Complete A.M.A.S.I.A.P. processing result
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         processing_id = f"amasiap_{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}"
         
         try:
@@ -637,67 +805,57 @@ class AMASIAPProtocolEngine:
                     enhancement_quality_score=0.0,
                     research_relevance_score=0.0,
                     overall_improvement_score=0.0,
-                    processing_time_ms=(time.time() - start_time) * 1000,
+                    processing_time_ms=(time.perf_counter() - start_time) * 1000,
                     protocol_status=ProtocolStatus.INACTIVE,
                     metadata={"error": "Protocol not active"}
                 )
             
-            # Generate context enrichment
-            context_enrichment = await self.generate_context_enrichment(input_text)
-            
-            # Detect enhancement needs
-            enhancement_needs = self.detect_enhancement_needs(input_text)
+            phase_times: Dict[str, float] = {}
             
-            # Detect research frameworks
-            research_frameworks = self.detect_research_frameworks(input_text)
+            # Detect enhancement needs and research frameworks in one memoized pass
+            analysis_start = time.perf_counter()
+            analysis, cache_hit = self.analyze_input(input_text)
+            phase_times["trigger_matching"] = (time.perf_counter() - analysis_start) * 1000
             
-            # Apply enhancements
-            enhancements_applied = []
-            enhanced_text = input_text
-            
-            for enhancement_type in enhancement_needs:
-                if enhancement_type == EnhancementType.TEMPORAL_CONTEXT:
-                    enhancement = await self.apply_temporal_enhancement(enhanced_text, context_enrichment)
-                    enhanced_text = enhancement.enhanced_input
-                    enhancements_applied.append(enhancement)
-                
-                elif enhancement_type == EnhancementType.DOMAIN_EXPANSION:
-                    enhancement = await self.apply_domain_expansion(enhanced_text, context_enrichment)
-                    enhanced_text = enhancement.enhanced_input
-                    enhancements_applied.append(enhancement)
-                
-                elif enhancement_type == EnhancementType.CLARIFICATION_INJECTION:
-                    enhancement = await self.apply_clarification_injection(enhanced_text)
-                    enhanced_text = enhancement.enhanced_input
-                    enhancements_applied.append(enhancement)
-                
-                elif enhancement_type == EnhancementType.METADATA_ENHANCEMENT:
-                    enhancement = await self.apply_metadata_enhancement(enhanced_text, context_enrichment)
-                    enhanced_text = enhancement.enhanced_input
-                    enhancements_applied.append(enhancement)
+            # Generate context enrichment
+            context_enrichment = await self._timed(
+                "context_enrichment", self.generate_context_enrichment(input_text, analysis), phase_times
+            )
             
-            # Activate research frameworks
-            research_activations = []
-            for framework in research_frameworks:
-                activation = await self.activate_research_framework(input_text, framework)
-                research_activations.append(activation)
+            # Apply enhancements and activate research frameworks concurrently
+            (enhancements_applied, enhanced_text), research_activations = await asyncio.gather(
+                self._timed(
+                    "enhancements",
+                    self._apply_enhancements(input_text, analysis.enhancement_needs, context_enrichment),
+                    phase_times
+                ),
+                self._timed(
+                    "research_activation",
+                    self._activate_research_frameworks(input_text, analysis.research_frameworks),
+                    phase_times
+                )
+            )
             
             # Calculate quality scores
             enhancement_quality_score = sum(e.enhancement_confidence for e in enhancements_applied) / len(enhancements_applied) if enhancements_applied else 0.0
             research_relevance_score = len(research_activations) / 3.0  # Normalize by expected max
             overall_improvement_score = (enhancement_quality_score + research_relevance_score + context_enrichment.relevance_score) / 3.0
             
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
+            phase_times["total"] = processing_time
+            for phase, elapsed_ms in phase_times.items():
+                self._record_phase(phase, elapsed_ms)
             
             # Update statistics
+            self.processing_stats["total_requests"] += 1
             self.processing_stats["total_enhancements"] += len(enhancements_applied)
             self.processing_stats["research_activations"] += len(research_activations)
             self.processing_stats["last_activation"] = datetime.utcnow()
             
             # Update average processing time
             current_avg = self.processing_stats["average_processing_time_ms"]
-            total_processed = self.processing_stats["total_enhancements"]
-            self.processing_stats["average_processing_time_ms"] = (current_avg * (total_processed - 1) + processing_time) / total_processed if total_processed > 0 else processing_time
+            total_processed = self.processing_stats["total_requests"]
+            self.processing_stats["average_processing_time_ms"] = (current_avg * (total_processed - 1) + processing_time) / total_processed
             
             return AMASIAPResult(
                 protocol_version=self.protocol_version,
@@ -716,13 +874,15 @@ class AMASIAPProtocolEngine:
                     "enhancement_types": [e.enhancement_type.value for e in enhancements_applied],
                     "research_frameworks": [r.framework_type.value for r in research_activations],
                     "context_domains": context_enrichment.domain_context,
+                    "enrichment_cache_hit": cache_hit,
+                    "phase_timings_ms": phase_times,
                     "processing_id": processing_id,
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
             
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
             logger.error(f"A.M.A.S.I.A.P. processing failed: {e}")
             
             return AMASIAPResult(
@@ -752,6 +912,14 @@ class AMASIAPProtocolEngine:
             "is_active": self.is_active,
             "protocol_status": ProtocolStatus.ACTIVE.value if self.is_active else ProtocolStatus.INACTIVE.value,
             "processing_statistics": self.processing_stats.copy(),
+            "phase_timings": {phase: timing.copy() for phase, timing in self.phase_timings.items()},
+            "enrichment_cache": {
+                "size": len(self.enrichment_cache),
+                "max_size": self.enrichment_cache_size,
+                "hits": self.processing_stats["enrichment_cache_hits"],
+                "misses": self.processing_stats["enrichment_cache_misses"]
+            },
+            "trigger_phrases": self.trigger_matcher.phrase_count,
             "enhancement_settings": self.enhancement_settings,
             "research_settings": self.research_settings,
             "context_settings": self.context_settings,
@@ -7,16 +7,26 @@ with intelligent model selection, load balancing, and cost optimization.
 """
 
 import asyncio
-import aiohttp
+import httpx
 import json
 import time
+import heapq
+import itertools
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any, Set
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import logging
 from datetime import datetime, timedelta
 import hashlib
 import random
+from urllib.parse import urlsplit
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - HTTP/1.1 keep-alive only
+    HTTP2_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -133,6 +143,315 @@ class OpenRouterResult:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class RequestTiming:
+    """Queue wait and latency of one model call."""
+    queue_wait_ms: float = 0.0
+    latency_ms: float = 0.0
+    cache_hit: bool = False
+    deduplicated: bool = False
+
+
+@dataclass
+class ModelCallResult:
+    """Raw result of a pooled model call."""
+    status: int
+    data: Dict[str, Any]
+    api_key: Optional[APIKeyInfo]
+    timing: RequestTiming
+
+
+@dataclass(order=True)
+class QueuedModelCall:
+    """Model call waiting for a free API key slot."""
+    rank: int
+    sequence: int
+    url: str = field(compare=False)
+    payload: Dict[str, Any] = field(compare=False)
+    headers: Dict[str, str] = field(compare=False)
+    candidate_keys: List[APIKeyInfo] = field(compare=False)
+    deadline: float = field(compare=False)  # perf_counter time the caller gives up at
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+# Dispatch order of queued calls, most urgent first
+PRIORITY_RANKS = {
+    RequestPriority.CRITICAL: 0,
+    RequestPriority.HIGH: 1,
+    RequestPriority.NORMAL: 2,
+    RequestPriority.LOW: 3
+}
+
+
+# ============================================================================
+# MODEL CLIENT POOL
+# ============================================================================
+
+class ModelClientPool:
+    """
+    Pooled client for OpenAI-compatible completion endpoints.
+    
+    Keeps one keep-alive httpx session per provider origin (HTTP/2 when the
+    h2 package is installed and the origin negotiates it), collapses
+    identical in-flight requests into one call, caches successful responses
+    by model, prompt and parameters, and dispatches queued calls by
+    RequestPriority onto API keys with a free concurrency slot.
+    """
+    
+    def __init__(self, client_config: Dict[str, Any]):
+        """
+        Initialize model client pool.
+        
+        Args:
+            client_config: Pool configuration (see OpenRouterIntegrationEngine)
+        """
+        self.http2 = client_config.get("http2", True) and HTTP2_AVAILABLE
+        self.max_connections = client_config.get("max_connections_per_provider", 20)
+        self.per_key_concurrency = client_config.get("per_key_concurrency", 4)
+        self.cache_size = client_config.get("response_cache_size", 1024)
+        self.cache_ttl_seconds = client_config.get("response_cache_ttl_seconds", 300)
+        
+        self.sessions: Dict[str, httpx.AsyncClient] = {}  # origin -> session
+        self.inflight: Dict[str, asyncio.Future] = {}  # request key -> call in progress
+        self.response_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.pending: List[QueuedModelCall] = []  # heap by (rank, sequence)
+        self.key_inflight: Dict[str, int] = {}  # key_id -> calls in progress
+        self.sequence = itertools.count()
+        self.wakeup = asyncio.Event()
+        self.dispatcher = None
+        
+        self.statistics = {
+            "http_requests": 0,
+            "cache_hits": 0,
+            "deduplicated": 0,
+            "total_queue_wait_ms": 0.0,
+            "max_queue_wait_ms": 0.0
+        }
+    
+    def session(self, url: str) -> httpx.AsyncClient:
+        """Keep-alive session for the origin of url."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        session = self.sessions.get(origin)
+        if session is None:
+            session = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=httpx.Timeout(60.0),
+                headers={"User-Agent": "NLDS-OpenRouter/2.2.0"}
+            )
+            self.sessions[origin] = session
+        return session
+    
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """GET through the pooled session of the url's origin."""
+        return await self.session(url).get(url, headers=headers)
+    
+    @staticmethod
+    def request_key(url: str, payload: Dict[str, Any]) -> str:
+        """Cache and deduplication key over endpoint, model, prompt and parameters."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(f"{url}|{canonical}".encode("utf-8"), digest_size=16).hexdigest()
+    
+    async def post(self, url: str, payload: Dict[str, Any],
+                   candidate_keys: List[APIKeyInfo],
+                   priority: RequestPriority = RequestPriority.NORMAL,
+                   timeout_seconds: float = 30,
+                   headers: Optional[Dict[str, str]] = None) -> ModelCallResult:
+        """
+        POST a completion request through cache, deduplication and the priority queue.
+        
+        Args:
+            url: Completion endpoint
+            payload: JSON request body
+            candidate_keys: API keys the call may use
+            priority: Dispatch priority
+            timeout_seconds: Bound on queue wait and HTTP call together
+            headers: Extra request headers
+            
+        Returns:
+            Status, parsed body, key used and timing
+        
+        Raises:
+            asyncio.TimeoutError: No response within timeout_seconds; a call
+                still queued is withdrawn
+        """
+        start_time = time.perf_counter()
+        request_key = self.request_key(url, payload)
+        
+        cached = self._cache_get(request_key)
+        if cached is not None:
+            self.statistics["cache_hits"] += 1
+            return ModelCallResult(200, cached, None, RequestTiming(
+                latency_ms=(time.perf_counter() - start_time) * 1000, cache_hit=True
+            ))
+        
+        inflight = self.inflight.get(request_key)
+        if inflight is not None:
+            self.statistics["deduplicated"] += 1
+            result = await asyncio.wait_for(asyncio.shield(inflight), timeout_seconds)
+            return replace(result, timing=RequestTiming(
+                latency_ms=(time.perf_counter() - start_time) * 1000, deduplicated=True
+            ))
+        
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[request_key] = future
+        call = QueuedModelCall(
+            rank=PRIORITY_RANKS[priority],
+            sequence=next(self.sequence),
+            url=url,
+            payload=payload,
+            headers=headers or {},
+            candidate_keys=candidate_keys,
+            deadline=start_time + timeout_seconds,
+            enqueued_at=time.perf_counter(),
+            future=future
+        )
+        try:
+            heapq.heappush(self.pending, call)
+            self._ensure_dispatcher()
+            self.wakeup.set()
+            
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout_seconds)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                self._withdraw(call, e)
+                raise
+            if result.status == 200:
+                self._cache_put(request_key, result.data)
+            return result
+        finally:
+            self.inflight.pop(request_key, None)
+    
+    def _withdraw(self, call: QueuedModelCall, error: BaseException) -> None:
+        """Drop a call its caller gave up on from the queue and fail its deduplicated waiters."""
+        if call in self.pending:
+            self.pending.remove(call)
+            heapq.heapify(self.pending)
+        
+        if not call.future.done():
+            if isinstance(error, asyncio.CancelledError):
+                call.future.cancel()
+            else:
+                call.future.set_exception(error)
+    
+    def _ensure_dispatcher(self) -> None:
+        if self.dispatcher is None or self.dispatcher.done():
+            self.dispatcher = asyncio.create_task(self._dispatch_loop())
+    
+    async def _dispatch_loop(self) -> None:
+        """Start queued calls in priority order whenever a key slot is free."""
+        while True:
+            selection = self._next_dispatchable()
+            if selection is None:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            
+            call, api_key = selection
+            self.key_inflight[api_key.key_id] = self.key_inflight.get(api_key.key_id, 0) + 1
+            asyncio.create_task(self._execute(call, api_key))
+    
+    def _next_dispatchable(self) -> Optional[Tuple[QueuedModelCall, APIKeyInfo]]:
+        """Most urgent queued call that has a free key, skipping calls whose keys are saturated."""
+        if not self.pending:
+            return None
+        
+        head_key = self._free_key(self.pending[0].candidate_keys)
+        if head_key is not None:
+            return heapq.heappop(self.pending), head_key
+        
+        for call in sorted(self.pending):
+            api_key = self._free_key(call.candidate_keys)
+            if api_key is not None:
+                self.pending.remove(call)
+                heapq.heapify(self.pending)
+                return call, api_key
+        return None
+    
+    def _free_key(self, candidate_keys: List[APIKeyInfo]) -> Optional[APIKeyInfo]:
+        """Least loaded candidate key below the per-key concurrency limit."""
+        free_keys = [
+            key for key in candidate_keys
+            if self.key_inflight.get(key.key_id, 0) < self.per_key_concurrency
+        ]
+        if not free_keys:
+            return None
+        return min(free_keys, key=lambda k: (self.key_inflight.get(k.key_id, 0), k.usage_count))
+    
+    async def _execute(self, call: QueuedModelCall, api_key: APIKeyInfo) -> None:
+        started_at = time.perf_counter()
+        queue_wait_ms = (started_at - call.enqueued_at) * 1000
+        self.statistics["total_queue_wait_ms"] += queue_wait_ms
+        self.statistics["max_queue_wait_ms"] = max(self.statistics["max_queue_wait_ms"], queue_wait_ms)
+        
+        try:
+            response = await self.session(call.url).post(
+                call.url,
+                json=call.payload,
+                headers={"Authorization": f"Bearer {api_key.metadata['original_key']}", **call.headers},
+                # What is left of the caller's budget after the queue wait
+                timeout=max(call.deadline - started_at, 0.0)
+            )
+            self.statistics["http_requests"] += 1
+            if call.future.done():
+                return  # Caller timed out or was cancelled meanwhile
+            call.future.set_result(ModelCallResult(response.status_code, response.json(), api_key, RequestTiming(
+                queue_wait_ms=queue_wait_ms,
+                latency_ms=(time.perf_counter() - started_at) * 1000
+            )))
+        except Exception as e:
+            if not call.future.done():
+                call.future.set_exception(e)
+        finally:
+            self.key_inflight[api_key.key_id] -= 1
+            self.wakeup.set()
+    
+    def _cache_get(self, request_key: str) -> Optional[Dict[str, Any]]:
+        entry = self.response_cache.get(request_key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if time.monotonic() >= expires_at:
+            del self.response_cache[request_key]
+            return None
+        self.response_cache.move_to_end(request_key)
+        return data
+    
+    def _cache_put(self, request_key: str, data: Dict[str, Any]) -> None:
+        if self.cache_size <= 0:
+            return
+        self.response_cache[request_key] = (time.monotonic() + self.cache_ttl_seconds, data)
+        self.response_cache.move_to_end(request_key)
+        while len(self.response_cache) > self.cache_size:
+            self.response_cache.popitem(last=False)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Pool, cache and queue statistics."""
+        dispatched = self.statistics["http_requests"]
+        return {
+            **self.statistics,
+            "average_queue_wait_ms": self.statistics["total_queue_wait_ms"] / dispatched if dispatched else 0.0,
+            "queued": len(self.pending),
+            "inflight": sum(self.key_inflight.values()),
+            "cached_responses": len(self.response_cache),
+            "sessions": list(self.sessions),
+            "http2": self.http2
+        }
+    
+    async def close(self) -> None:
+        """Stop dispatching and close all sessions."""
+        if self.dispatcher:
+            self.dispatcher.cancel()
+        for session in self.sessions.values():
+            await session.aclose()
+        self.sessions.clear()
+
+
 # ============================================================================
 # OPENROUTER INTEGRATION ENGINE
 # ============================================================================
@@ -160,7 +479,7 @@ class OpenRouterIntegrationEngine:
             openrouter_config: Configuration for OpenRouter integration
         """
         self.config = openrouter_config
-        self.base_url = "https://openrouter.ai/api/v1"
+        self.base_url = openrouter_config.get("base_url", "https://openrouter.ai/api/v1")
         self.api_keys = []
         self.available_models = {}
         self.model_performance_history = {}
@@ -178,6 +497,8 @@ class OpenRouterIntegrationEngine:
             "failed_requests": 0,
             "total_cost": 0.0,
             "average_response_time_ms": 0.0,
+            "cache_hits": 0,
+            "deduplicated_requests": 0,
             "models_used": {},
             "providers_used": {}
         }
@@ -186,8 +507,8 @@ class OpenRouterIntegrationEngine:
         self.rate_limit_tracker = {}
         self.request_queue = asyncio.Queue()
         
-        # HTTP session
-        self.http_session = None
+        # Pooled HTTP sessions, response cache and priority dispatch
+        self.client_pool = ModelClientPool(openrouter_config)
         
         # Model selection weights
         self.selection_weights = {
@@ -200,15 +521,6 @@ class OpenRouterIntegrationEngine:
     async def initialize_integration(self) -> bool:
         """Initialize OpenRouter integration."""
         try:
-            # Initialize HTTP session
-            self.http_session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=60),
-                headers={
-                    "User-Agent": "NLDS-OpenRouter/2.2.0",
-                    "Content-Type": "application/json"
-                }
-            )
-            
             # Load API keys
             await self._load_api_keys()
             
@@ -270,8 +582,8 @@ class OpenRouterIntegrationEngine:
             
             test_url = test_endpoints.get(provider, f"{self.base_url}/models")
             
-            async with self.http_session.get(test_url, headers=headers) as response:
-                return response.status in [200, 401]  # 401 means key format is valid but may be expired
+            response = await self.client_pool.get(test_url, headers=headers)
+            return response.status_code in [200, 401]  # 401 means key format is valid but may be expired
                 
         except Exception as e:
             logger.debug(f"API key validation error: {e}")
@@ -288,17 +600,17 @@ class OpenRouterIntegrationEngine:
             api_key = self.api_keys[0].metadata["original_key"]
             headers = {"Authorization": f"Bearer {api_key}"}
             
-            async with self.http_session.get(f"{self.base_url}/models", headers=headers) as response:
-                if response.status == 200:
-                    models_data = await response.json()
-                    
-                    for model_data in models_data.get("data", []):
-                        model_info = self._parse_model_info(model_data)
-                        self.available_models[model_info.model_id] = model_info
-                    
-                    logger.info(f"Loaded {len(self.available_models)} available models")
-                else:
-                    logger.warning(f"Failed to load models: HTTP {response.status}")
+            response = await self.client_pool.get(f"{self.base_url}/models", headers=headers)
+            if response.status_code == 200:
+                models_data = response.json()
+                
+                for model_data in models_data.get("data", []):
+                    model_info = self._parse_model_info(model_data)
+                    self.available_models[model_info.model_id] = model_info
+                
+                logger.info(f"Loaded {len(self.available_models)} available models")
+            else:
+                logger.warning(f"Failed to load models: HTTP {response.status_code}")
                     
         except Exception as e:
             logger.error(f"Error loading available models: {e}")
@@ -409,18 +721,18 @@ class OpenRouterIntegrationEngine:
         scored_models.sort(key=lambda x: x[1], reverse=True)
         return scored_models[0][0] if scored_models else None
     
-    def select_api_key(self, provider: Optional[ModelProvider] = None) -> Optional[APIKeyInfo]:
-        """Select optimal API key for request."""
-        if not self.api_keys:
-            return None
-        
-        # Filter by provider if specified
+    def _candidate_api_keys(self, provider: Optional[ModelProvider] = None) -> List[APIKeyInfo]:
+        """Active keys with remaining rate limit, for the provider if specified."""
         candidate_keys = self.api_keys
         if provider:
             candidate_keys = [key for key in self.api_keys if key.provider == provider]
         
         # Filter active keys with remaining rate limit
-        available_keys = [key for key in candidate_keys if key.is_active and key.rate_limit_remaining > 0]
+        return [key for key in candidate_keys if key.is_active and key.rate_limit_remaining > 0]
+    
+    def select_api_key(self, provider: Optional[ModelProvider] = None) -> Optional[APIKeyInfo]:
+        """Select optimal API key for request."""
+        available_keys = self._candidate_api_keys(provider)
         
         if not available_keys:
             return None
@@ -452,9 +764,9 @@ class OpenRouterIntegrationEngine:
                     metadata={}
                 )
             
-            # Select API key
-            api_key_info = self.select_api_key(selected_model.provider)
-            if not api_key_info:
+            # Candidate API keys; the client pool assigns one with a free concurrency slot
+            candidate_keys = self._candidate_api_keys(selected_model.provider)
+            if not candidate_keys:
                 return OpenRouterResult(
                     success=False,
                     request_id=request.request_id,
@@ -481,126 +793,145 @@ class OpenRouterIntegrationEngine:
                 payload["response_format"] = {"type": "json_object"}
             
             headers = {
-                "Authorization": f"Bearer {api_key_info.metadata['original_key']}",
                 "HTTP-Referer": "https://nlds.jaegis.ai",
                 "X-Title": "NLDS Tier 0 Integration"
             }
             
             # Make request
-            async with self.http_session.post(
+            call = await self.client_pool.post(
                 f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=request.timeout_seconds)
-            ) as response:
+                payload,
+                candidate_keys,
+                priority=request.priority,
+                timeout_seconds=request.timeout_seconds,
+                headers=headers
+            )
+            
+            response_data = call.data
+            api_key_info = call.api_key
+            processing_time = (time.time() - start_time) * 1000
+            timing_info = {
+                "queue_wait_ms": call.timing.queue_wait_ms,
+                "latency_ms": call.timing.latency_ms,
+                "cache_hit": call.timing.cache_hit,
+                "deduplicated": call.timing.deduplicated
+            }
+            
+            if call.status == 200:
+                # Parse successful response
+                choice = response_data.get("choices", [{}])[0]
+                message = choice.get("message", {})
+                response_text = message.get("content", "")
                 
-                response_data = await response.json()
-                processing_time = (time.time() - start_time) * 1000
+                usage = response_data.get("usage", {})
+                tokens_used = usage.get("total_tokens", 0)
                 
-                if response.status == 200:
-                    # Parse successful response
-                    choice = response_data.get("choices", [{}])[0]
-                    message = choice.get("message", {})
-                    response_text = message.get("content", "")
-                    
-                    usage = response_data.get("usage", {})
-                    tokens_used = usage.get("total_tokens", 0)
-                    cost_incurred = (tokens_used / 1000) * selected_model.cost_per_1k_tokens
-                    
-                    # Update API key usage
+                # Cached and deduplicated responses cost nothing
+                shared_response = call.timing.cache_hit or call.timing.deduplicated
+                cost_incurred = 0.0 if shared_response else (tokens_used / 1000) * selected_model.cost_per_1k_tokens
+                
+                # Update API key usage
+                if api_key_info:
                     api_key_info.usage_count += 1
                     api_key_info.cost_accumulated += cost_incurred
                     api_key_info.last_used = datetime.utcnow()
-                    
-                    # Update model performance
+                
+                # Update model performance
+                if not shared_response:
                     if selected_model.model_id not in self.model_performance_history:
                         self.model_performance_history[selected_model.model_id] = []
                     
                     self.model_performance_history[selected_model.model_id].append({
-                        "response_time_ms": processing_time,
+                        "response_time_ms": call.timing.latency_ms,
+                        "queue_wait_ms": call.timing.queue_wait_ms,
                         "tokens_used": tokens_used,
                         "cost": cost_incurred,
                         "timestamp": datetime.utcnow()
                     })
+                
+                # Calculate quality score (simplified)
+                quality_score = min(len(response_text) / max(request.max_tokens, 1), 1.0)
+                
+                model_response = ModelResponse(
+                    request_id=request.request_id,
+                    model_used=selected_model.model_id,
+                    response_text=response_text,
+                    tokens_used=tokens_used,
+                    cost_incurred=cost_incurred,
+                    response_time_ms=processing_time,
+                    quality_score=quality_score,
+                    metadata=response_data
+                )
+                
+                # Update statistics
+                self.usage_statistics["total_requests"] += 1
+                self.usage_statistics["successful_requests"] += 1
+                self.usage_statistics["total_cost"] += cost_incurred
+                if call.timing.cache_hit:
+                    self.usage_statistics["cache_hits"] += 1
+                if call.timing.deduplicated:
+                    self.usage_statistics["deduplicated_requests"] += 1
+                
+                # Update average response time
+                current_avg = self.usage_statistics["average_response_time_ms"]
+                total_requests = self.usage_statistics["total_requests"]
+                self.usage_statistics["average_response_time_ms"] = (current_avg * (total_requests - 1) + processing_time) / total_requests
+                
+                # Track model usage
+                if selected_model.model_id not in self.usage_statistics["models_used"]:
+                    self.usage_statistics["models_used"][selected_model.model_id] = 0
+                self.usage_statistics["models_used"][selected_model.model_id] += 1
+                
+                # Track provider usage
+                provider_name = selected_model.provider.value
+                if provider_name not in self.usage_statistics["providers_used"]:
+                    self.usage_statistics["providers_used"][provider_name] = 0
+                self.usage_statistics["providers_used"][provider_name] += 1
+                
+                return OpenRouterResult(
+                    success=True,
+                    request_id=request.request_id,
+                    model_response=model_response,
+                    selected_model=selected_model,
+                    api_key_used=api_key_info.key_id if api_key_info else None,
+                    load_balancing_info={
+                        "api_keys_available": len([k for k in self.api_keys if k.is_active]),
+                        "selected_key_usage": api_key_info.usage_count if api_key_info else None
+                    },
+                    cost_optimization_info={
+                        "estimated_cost": cost_incurred,
+                        "cost_limit": request.cost_limit,
+                        "cost_efficiency": 1.0 - (cost_incurred / max(request.cost_limit or 1.0, cost_incurred))
+                    },
+                    error_message=None,
+                    processing_time_ms=processing_time,
+                    metadata={
+                        "model_selection_score": 0.8,  # Placeholder
+                        "rate_limit_remaining": api_key_info.rate_limit_remaining if api_key_info else None,
+                        **timing_info
+                    }
+                )
+            else:
+                # Handle error response
+                error_message = response_data.get("error", {}).get("message", f"HTTP {call.status}")
+                
+                self.usage_statistics["total_requests"] += 1
+                self.usage_statistics["failed_requests"] += 1
+                
+                return OpenRouterResult(
+                    success=False,
+                    request_id=request.request_id,
+                    model_response=None,
+                    selected_model=selected_model,
+                    api_key_used=api_key_info.key_id if api_key_info else None,
+                    load_balancing_info={},
+                    cost_optimization_info={},
+                    error_message=error_message,
+                    processing_time_ms=processing_time,
+                    metadata={"http_status": call.status, "response_data": response_data, **timing_info}
+                )
                     
-                    # Calculate quality score (simplified)
-                    quality_score = min(len(response_text) / max(request.max_tokens, 1), 1.0)
-                    
-                    model_response = ModelResponse(
-                        request_id=request.request_id,
-                        model_used=selected_model.model_id,
-                        response_text=response_text,
-                        tokens_used=tokens_used,
-                        cost_incurred=cost_incurred,
-                        response_time_ms=processing_time,
-                        quality_score=quality_score,
-                        metadata=response_data
-                    )
-                    
-                    # Update statistics
-                    self.usage_statistics["total_requests"] += 1
-                    self.usage_statistics["successful_requests"] += 1
-                    self.usage_statistics["total_cost"] += cost_incurred
-                    
-                    # Update average response time
-                    current_avg = self.usage_statistics["average_response_time_ms"]
-                    total_requests = self.usage_statistics["total_requests"]
-                    self.usage_statistics["average_response_time_ms"] = (current_avg * (total_requests - 1) + processing_time) / total_requests
-                    
-                    # Track model usage
-                    if selected_model.model_id not in self.usage_statistics["models_used"]:
-                        self.usage_statistics["models_used"][selected_model.model_id] = 0
-                    self.usage_statistics["models_used"][selected_model.model_id] += 1
-                    
-                    # Track provider usage
-                    provider_name = selected_model.provider.value
-                    if provider_name not in self.usage_statistics["providers_used"]:
-                        self.usage_statistics["providers_used"][provider_name] = 0
-                    self.usage_statistics["providers_used"][provider_name] += 1
-                    
-                    return OpenRouterResult(
-                        success=True,
-                        request_id=request.request_id,
-                        model_response=model_response,
-                        selected_model=selected_model,
-                        api_key_used=api_key_info.key_id,
-                        load_balancing_info={
-                            "api_keys_available": len([k for k in self.api_keys if k.is_active]),
-                            "selected_key_usage": api_key_info.usage_count
-                        },
-                        cost_optimization_info={
-                            "estimated_cost": cost_incurred,
-                            "cost_limit": request.cost_limit,
-                            "cost_efficiency": 1.0 - (cost_incurred / max(request.cost_limit or 1.0, cost_incurred))
-                        },
-                        error_message=None,
-                        processing_time_ms=processing_time,
-                        metadata={
-                            "model_selection_score": 0.8,  # Placeholder
-                            "rate_limit_remaining": api_key_info.rate_limit_remaining
-                        }
-                    )
-                else:
-                    # Handle error response
-                    error_message = response_data.get("error", {}).get("message", f"HTTP {response.status}")
-                    
-                    self.usage_statistics["total_requests"] += 1
-                    self.usage_statistics["failed_requests"] += 1
-                    
-                    return OpenRouterResult(
-                        success=False,
-                        request_id=request.request_id,
-                        model_response=None,
-                        selected_model=selected_model,
-                        api_key_used=api_key_info.key_id,
-                        load_balancing_info={},
-                        cost_optimization_info={},
-                        error_message=error_message,
-                        processing_time_ms=processing_time,
-                        metadata={"http_status": response.status, "response_data": response_data}
-                    )
-                    
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, httpx.TimeoutException):
             processing_time = (time.time() - start_time) * 1000
             return OpenRouterResult(
                 success=False,
@@ -673,6 +1004,7 @@ class OpenRouterIntegrationEngine:
             "available_models_count": len(self.available_models),
             "available_models": len([m for m in self.available_models.values() if m.availability]),
             "usage_statistics": self.usage_statistics.copy(),
+            "client_pool": self.client_pool.get_statistics(),
             "load_balancing_enabled": self.load_balancing_enabled,
             "cost_optimization_enabled": self.cost_optimization_enabled,
             "max_cost_per_request": self.max_cost_per_request,
@@ -683,8 +1015,7 @@ class OpenRouterIntegrationEngine:
     async def cleanup(self) -> None:
         """Cleanup OpenRouter integration resources."""
         try:
-            if self.http_session and not self.http_session.closed:
-                await self.http_session.close()
+            await self.client_pool.close()
             
             logger.info("OpenRouter integration cleaned up")
             
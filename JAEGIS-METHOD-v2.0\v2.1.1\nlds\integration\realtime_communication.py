@@ -9,16 +9,23 @@ with JAEGIS components, agents, and external systems.
 import asyncio
 import websockets
 import json
+import struct
 import uuid
-from typing import Dict, List, Optional, Tuple, Any, Set, Callable
+import zlib
+import multiprocessing
+from typing import Dict, List, Optional, Tuple, Any, Set, Callable, Awaitable
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import logging
 from datetime import datetime, timedelta
 import ssl
 import certifi
+from collections import deque
 from urllib.parse import urlparse
 
+import redis.asyncio as aioredis
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -112,6 +119,309 @@ class CommunicationStats:
     subscription_count: int
     error_count: int
     uptime_seconds: float
+    messages_coalesced: int = 0
+    slow_consumers_evicted: int = 0
+
+
+# ============================================================================
+# CONNECTION SEND QUEUE
+# ============================================================================
+
+class ConnectionSendQueue:
+    """
+    Bounded outgoing queue with its own writer task for one websocket.
+    
+    Producers never await the socket: offer() appends an already serialized
+    frame and returns False once max_pending frames are waiting, which the
+    engine treats as a slow consumer. Frames with a coalesce key replace a
+    still queued frame with the same key instead of queueing behind it.
+    """
+    
+    def __init__(self, websocket, max_pending: int,
+                 on_sent: Callable[[], None],
+                 on_failure: Callable[[Exception], Any]):
+        """
+        Initialize connection send queue.
+        
+        Args:
+            websocket: Connection to write to
+            max_pending: Maximum number of queued frames
+            on_sent: Called after each frame is written
+            on_failure: Called with the exception when a write fails
+        """
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self.on_sent = on_sent
+        self.on_failure = on_failure
+        self.pending = deque()  # [frame, coalesce_key] entries
+        self.coalescing: Dict[str, List[Any]] = {}  # coalesce_key -> queued entry
+        self.ready = asyncio.Event()
+        self.task = asyncio.create_task(self._writer())
+    
+    def offer(self, frame: str, coalesce_key: Optional[str] = None) -> Optional[bool]:
+        """
+        Queue a serialized frame without waiting.
+        
+        Returns:
+            True if queued, None if it replaced a queued frame with the same
+            coalesce key, False if the buffer is full
+        """
+        if coalesce_key is not None:
+            entry = self.coalescing.get(coalesce_key)
+            if entry is not None:
+                entry[0] = frame
+                return None
+        
+        if len(self.pending) >= self.max_pending:
+            return False
+        
+        entry = [frame, coalesce_key]
+        self.pending.append(entry)
+        if coalesce_key is not None:
+            self.coalescing[coalesce_key] = entry
+        self.ready.set()
+        return True
+    
+    async def _writer(self) -> None:
+        """Write queued frames in order until cancelled or the socket fails."""
+        while True:
+            if not self.pending:
+                self.ready.clear()
+                await self.ready.wait()
+                continue
+            
+            frame, coalesce_key = self.pending.popleft()
+            if coalesce_key is not None:
+                del self.coalescing[coalesce_key]
+            
+            try:
+                await self.websocket.send(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.on_failure(e)
+                return
+            self.on_sent()
+    
+    async def drain(self) -> None:
+        """Wait until every queued frame has been written."""
+        while self.pending and not self.task.done():
+            await asyncio.sleep(0)
+    
+    def close(self) -> None:
+        """Stop the writer task and drop queued frames."""
+        if self.task is not asyncio.current_task():
+            self.task.cancel()
+        self.pending.clear()
+        self.coalescing.clear()
+
+
+# ============================================================================
+# MESSAGE BUS
+# ============================================================================
+
+class MessageBus(ABC):
+    """
+    Pub/sub channel shared by engine processes.
+    
+    Every process publishes the messages it dispatches and delivers frames
+    from the other processes to its own connections, so subscriptions held
+    by any process see every message.
+    """
+    
+    @abstractmethod
+    async def start(self, on_frame: Callable[[str], Awaitable[None]]) -> None:
+        """Connect and deliver received frames to on_frame."""
+        pass
+    
+    @abstractmethod
+    async def publish(self, frame: str) -> None:
+        """Publish a frame to the other processes."""
+        pass
+    
+    @abstractmethod
+    async def close(self) -> None:
+        """Disconnect from the bus."""
+        pass
+
+
+class RedisMessageBus(MessageBus):
+    """Message bus on a Redis pub/sub channel."""
+    
+    def __init__(self, redis_url: str = "redis://localhost:6379", channel: str = "nlds:realtime"):
+        self.redis_url = redis_url
+        self.channel = channel
+        self.client = None
+        self.pubsub = None
+        self.listener = None
+    
+    async def start(self, on_frame: Callable[[str], Awaitable[None]]) -> None:
+        self.client = aioredis.from_url(self.redis_url, decode_responses=True)
+        self.pubsub = self.client.pubsub()
+        await self.pubsub.subscribe(self.channel)
+        self.listener = asyncio.create_task(self._listen(on_frame))
+    
+    async def _listen(self, on_frame: Callable[[str], Awaitable[None]]) -> None:
+        async for item in self.pubsub.listen():
+            if item["type"] == "message":
+                await on_frame(item["data"])
+    
+    async def publish(self, frame: str) -> None:
+        await self.client.publish(self.channel, frame)
+    
+    async def close(self) -> None:
+        if self.listener:
+            self.listener.cancel()
+        if self.pubsub:
+            await self.pubsub.unsubscribe(self.channel)
+            await self.pubsub.aclose()
+        if self.client:
+            await self.client.aclose()
+
+
+# Frames on the UNIX-socket bus: 4-byte big-endian payload length, then the UTF-8 payload
+BUS_FRAME_HEADER = struct.Struct(">I")
+MAX_BUS_FRAME_BYTES = 64 * 1024 * 1024
+
+
+def _encode_bus_frame(payload: bytes) -> bytes:
+    return BUS_FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def _read_bus_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read one frame payload; raises IncompleteReadError when the peer disconnects."""
+    (length,) = BUS_FRAME_HEADER.unpack(await reader.readexactly(BUS_FRAME_HEADER.size))
+    if length > MAX_BUS_FRAME_BYTES:
+        raise ValueError(f"Message bus frame of {length} bytes exceeds {MAX_BUS_FRAME_BYTES}")
+    return await reader.readexactly(length)
+
+
+class UnixSocketBroker:
+    """Relays length-prefixed frames between engine processes on one host."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.server = None
+        self.clients: Set[asyncio.StreamWriter] = set()
+    
+    async def start(self) -> None:
+        self.server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+    
+    async def serve_forever(self) -> None:
+        await self.start()
+        await self.server.serve_forever()
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.clients.add(writer)
+        try:
+            while True:
+                frame = _encode_bus_frame(await _read_bus_frame(reader))
+                await self._relay(frame, writer)
+        except asyncio.IncompleteReadError:
+            pass  # Client disconnected
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Message bus broker dropped a client: {e!r}")
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+    
+    async def _relay(self, frame: bytes, sender: asyncio.StreamWriter) -> None:
+        """Send a frame to every other client, dropping clients whose connection failed."""
+        targets = [client for client in self.clients if client is not sender]
+        for client in targets:
+            client.write(frame)
+        
+        results = await asyncio.gather(*(client.drain() for client in targets), return_exceptions=True)
+        for client, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Message bus broker dropped a client: {result!r}")
+                self.clients.discard(client)
+                client.close()
+    
+    async def close(self) -> None:
+        if self.server:
+            self.server.close()
+        # Close client connections first; wait_closed waits for them on Python 3.12+
+        for writer in list(self.clients):
+            writer.close()
+        if self.server:
+            await self.server.wait_closed()
+
+
+class UnixSocketMessageBus(MessageBus):
+    """
+    Message bus through a UnixSocketBroker, for processes on one host.
+    
+    The listener reconnects when the broker connection drops; frames
+    published while disconnected are lost, as on a Redis pub/sub channel.
+    """
+    
+    RETRY_INTERVAL_SECONDS = 0.05
+    
+    def __init__(self, path: str, connect_timeout: float = 5.0):
+        self.path = path
+        self.connect_timeout = connect_timeout
+        self.reader = None
+        self.writer = None
+        self.listener = None
+    
+    async def start(self, on_frame: Callable[[str], Awaitable[None]]) -> None:
+        # The broker may still be starting when engine processes come up
+        await self._connect(self.connect_timeout)
+        self.listener = asyncio.create_task(self._listen(on_frame))
+    
+    async def _connect(self, timeout: Optional[float]) -> None:
+        """Connect to the broker, retrying until timeout (forever when None)."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            try:
+                self.reader, self.writer = await asyncio.open_unix_connection(self.path)
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                if deadline is not None and loop.time() >= deadline:
+                    raise
+                await asyncio.sleep(self.RETRY_INTERVAL_SECONDS)
+    
+    async def _listen(self, on_frame: Callable[[str], Awaitable[None]]) -> None:
+        while True:
+            try:
+                payload = await _read_bus_frame(self.reader)
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError) as e:
+                logger.warning(f"Message bus connection to {self.path} lost ({e!r}), reconnecting")
+                self.writer.close()
+                await self._connect(None)
+                continue
+            await on_frame(payload.decode("utf-8"))
+    
+    async def publish(self, frame: str) -> None:
+        try:
+            self.writer.write(_encode_bus_frame(frame.encode("utf-8")))
+            await self.writer.drain()
+        except ConnectionError as e:
+            logger.warning(f"Message bus publish to {self.path} failed: {e!r}")
+    
+    async def close(self) -> None:
+        if self.listener:
+            self.listener.cancel()
+        if self.writer:
+            self.writer.close()
+
+
+def create_message_bus(bus_config: Optional[Dict[str, Any]]) -> Optional[MessageBus]:
+    """Build the message bus described by the message_bus config, if any."""
+    if not bus_config:
+        return None
+    
+    bus_type = bus_config.get("type", "redis")
+    if bus_type == "redis":
+        return RedisMessageBus(
+            bus_config.get("redis_url", "redis://localhost:6379"),
+            bus_config.get("channel", "nlds:realtime")
+        )
+    if bus_type == "unix":
+        return UnixSocketMessageBus(bus_config["path"], bus_config.get("connect_timeout", 5.0))
+    raise ValueError(f"Unknown message bus type: {bus_type}")
 
 
 # ============================================================================
@@ -151,7 +461,25 @@ class RealtimeCommunicationEngine:
         self.connections = {}  # connection_id -> ConnectionInfo
         self.subscriptions = {}  # subscription_id -> Subscription
         self.message_handlers = {}  # message_type -> handler_function
-        self.message_queue = asyncio.Queue()
+        
+        # Sharded dispatch: messages for one connection or destination stay on one shard
+        self.dispatcher_shards = communication_config.get("dispatcher_shards", 4)
+        self.shard_queues = [asyncio.Queue() for _ in range(self.dispatcher_shards)]
+        self.shard_dispatch_counts = [0] * self.dispatcher_shards
+        self.background_tasks: List[asyncio.Task] = []
+        
+        # Shared bus for multi-process mode
+        self.engine_id = str(uuid.uuid4())
+        self.message_bus = create_message_bus(communication_config.get("message_bus"))
+        
+        # Fan-out index and per-connection send queues
+        self.topic_index: Dict[SubscriptionType, Dict[str, Set[str]]] = {
+            subscription_type: {} for subscription_type in SubscriptionType
+        }  # subscription_type -> connection_id -> subscription_ids
+        self.connection_subscriptions: Dict[str, Set[str]] = {}  # connection_id -> subscription_ids
+        self.send_queues: Dict[str, ConnectionSendQueue] = {}  # connection_id -> send queue
+        self.send_buffer_size = communication_config.get("send_buffer_size", 256)
+        self.coalesce_status_updates = communication_config.get("coalesce_status_updates", False)
         
         # Authentication
         self.auth_enabled = communication_config.get("auth_enabled", True)
@@ -201,16 +529,17 @@ class RealtimeCommunicationEngine:
                 self.port,
                 ssl=ssl_context,
                 ping_interval=self.heartbeat_interval,
-                ping_timeout=self.heartbeat_timeout
+                ping_timeout=self.heartbeat_timeout,
+                reuse_port=self.config.get("reuse_port", False)
             )
             
             self.is_running = True
             self.start_time = datetime.utcnow()
             
             # Start background tasks
-            asyncio.create_task(self._message_processor())
-            asyncio.create_task(self._heartbeat_monitor())
-            asyncio.create_task(self._stats_updater())
+            await self.start_dispatcher()
+            self.background_tasks.append(asyncio.create_task(self._heartbeat_monitor()))
+            self.background_tasks.append(asyncio.create_task(self._stats_updater()))
             
             protocol = "wss" if self.ssl_enabled else "ws"
             logger.info(f"Real-time communication server started on {protocol}://{self.host}:{self.port}")
@@ -221,6 +550,15 @@ class RealtimeCommunicationEngine:
             logger.error(f"Failed to initialize WebSocket server: {e}")
             return False
     
+    async def start_dispatcher(self) -> None:
+        """Start one processor per shard and join the message bus, if configured."""
+        for shard_index in range(self.dispatcher_shards):
+            self.background_tasks.append(asyncio.create_task(self._message_processor(shard_index)))
+        
+        if self.message_bus:
+            await self.message_bus.start(self._handle_bus_frame)
+            logger.info(f"Engine {self.engine_id} joined message bus ({type(self.message_bus).__name__})")
+    
     def _register_default_handlers(self) -> None:
         """Register default message handlers."""
         self.message_handlers[MessageType.HEARTBEAT] = self._handle_heartbeat
@@ -231,25 +569,9 @@ class RealtimeCommunicationEngine:
     
     async def _handle_connection(self, websocket, path):
         """Handle new WebSocket connection."""
-        connection_id = str(uuid.uuid4())
+        connection_id = self._register_connection(websocket)
         
         try:
-            # Create connection info
-            connection_info = ConnectionInfo(
-                connection_id=connection_id,
-                websocket=websocket,
-                client_type="unknown",
-                client_id="unknown",
-                connected_at=datetime.utcnow(),
-                last_heartbeat=datetime.utcnow(),
-                subscriptions=set(),
-                is_authenticated=not self.auth_enabled  # Auto-auth if disabled
-            )
-            
-            self.connections[connection_id] = connection_info
-            self.stats.total_connections += 1
-            self.stats.active_connections += 1
-            
             logger.info(f"New WebSocket connection: {connection_id}")
             
             # Send welcome message
@@ -285,23 +607,40 @@ class RealtimeCommunicationEngine:
             # Cleanup connection
             await self._cleanup_connection(connection_id)
     
+    def _register_connection(self, websocket) -> str:
+        """Track a new websocket and start its send queue."""
+        connection_id = str(uuid.uuid4())
+        
+        # Create connection info
+        self.connections[connection_id] = ConnectionInfo(
+            connection_id=connection_id,
+            websocket=websocket,
+            client_type="unknown",
+            client_id="unknown",
+            connected_at=datetime.utcnow(),
+            last_heartbeat=datetime.utcnow(),
+            subscriptions=set(),
+            is_authenticated=not self.auth_enabled  # Auto-auth if disabled
+        )
+        self.connection_subscriptions[connection_id] = set()
+        self.send_queues[connection_id] = ConnectionSendQueue(
+            websocket,
+            self.send_buffer_size,
+            on_sent=self._record_sent,
+            on_failure=lambda error: self._on_send_failure(connection_id, error)
+        )
+        
+        self.stats.total_connections += 1
+        self.stats.active_connections += 1
+        return connection_id
+    
     async def _process_incoming_message(self, connection_id: str, raw_message: str) -> None:
         """Process incoming message from WebSocket."""
         try:
             message_data = json.loads(raw_message)
             
             # Create message object
-            message = RealtimeMessage(
-                message_id=message_data.get("message_id", str(uuid.uuid4())),
-                message_type=MessageType(message_data.get("message_type")),
-                timestamp=datetime.fromisoformat(message_data.get("timestamp", datetime.utcnow().isoformat())),
-                source=connection_id,
-                destination=message_data.get("destination"),
-                payload=message_data.get("payload", {}),
-                priority=message_data.get("priority", "normal"),
-                correlation_id=message_data.get("correlation_id"),
-                metadata=message_data.get("metadata", {})
-            )
+            message = self._message_from_dict(message_data, source=connection_id)
             
             # Update connection heartbeat
             if connection_id in self.connections:
@@ -319,7 +658,7 @@ class RealtimeCommunicationEngine:
                 await handler(connection_id, message)
             else:
                 # Queue message for processing
-                await self.message_queue.put((connection_id, message))
+                await self._enqueue_message(connection_id, message)
             
             self.stats.total_messages_received += 1
             
@@ -331,6 +670,21 @@ class RealtimeCommunicationEngine:
             logger.error(f"Message processing error: {e}")
             await self._send_error_message(connection_id, "Internal server error")
     
+    @staticmethod
+    def _message_from_dict(message_data: Dict[str, Any], source: Optional[str] = None) -> RealtimeMessage:
+        """Build a message from its JSON form; source overrides the sender field."""
+        return RealtimeMessage(
+            message_id=message_data.get("message_id", str(uuid.uuid4())),
+            message_type=MessageType(message_data.get("message_type")),
+            timestamp=datetime.fromisoformat(message_data.get("timestamp", datetime.utcnow().isoformat())),
+            source=source if source is not None else message_data.get("source", "unknown"),
+            destination=message_data.get("destination"),
+            payload=message_data.get("payload", {}),
+            priority=message_data.get("priority", "normal"),
+            correlation_id=message_data.get("correlation_id"),
+            metadata=message_data.get("metadata", {})
+        )
+    
     async def _handle_heartbeat(self, connection_id: str, message: RealtimeMessage) -> None:
         """Handle heartbeat message."""
         # Send heartbeat response
@@ -353,19 +707,7 @@ class RealtimeCommunicationEngine:
             filters = message.payload.get("filters", {})
             
             # Create subscription
-            subscription_id = str(uuid.uuid4())
-            subscription = Subscription(
-                subscription_id=subscription_id,
-                connection_id=connection_id,
-                subscription_type=subscription_type,
-                filters=filters,
-                created_at=datetime.utcnow(),
-                last_update=datetime.utcnow()
-            )
-            
-            self.subscriptions[subscription_id] = subscription
-            self.connections[connection_id].subscriptions.add(subscription_type)
-            self.stats.subscription_count += 1
+            subscription_id = self._add_subscription(connection_id, subscription_type, filters)
             
             # Send confirmation
             response = RealtimeMessage(
@@ -387,17 +729,49 @@ class RealtimeCommunicationEngine:
         except ValueError:
             await self._send_error_message(connection_id, "Invalid subscription type")
     
+    def _add_subscription(self, connection_id: str, subscription_type: SubscriptionType,
+                          filters: Dict[str, Any]) -> str:
+        """Record a subscription and index it by type."""
+        subscription_id = str(uuid.uuid4())
+        self.subscriptions[subscription_id] = Subscription(
+            subscription_id=subscription_id,
+            connection_id=connection_id,
+            subscription_type=subscription_type,
+            filters=filters,
+            created_at=datetime.utcnow(),
+            last_update=datetime.utcnow()
+        )
+        
+        self.topic_index[subscription_type].setdefault(connection_id, set()).add(subscription_id)
+        self.connection_subscriptions.setdefault(connection_id, set()).add(subscription_id)
+        self.connections[connection_id].subscriptions.add(subscription_type)
+        self.stats.subscription_count += 1
+        return subscription_id
+    
+    def _remove_subscription(self, subscription_id: str) -> Subscription:
+        """Drop a subscription from the store and the fan-out index."""
+        subscription = self.subscriptions.pop(subscription_id)
+        connection_id = subscription.connection_id
+        
+        subscribers = self.topic_index[subscription.subscription_type]
+        subscription_ids = subscribers.get(connection_id, set())
+        subscription_ids.discard(subscription_id)
+        if not subscription_ids:
+            subscribers.pop(connection_id, None)
+            if connection_id in self.connections:
+                self.connections[connection_id].subscriptions.discard(subscription.subscription_type)
+        
+        self.connection_subscriptions.get(connection_id, set()).discard(subscription_id)
+        self.stats.subscription_count -= 1
+        return subscription
+    
     async def _handle_unsubscription(self, connection_id: str, message: RealtimeMessage) -> None:
         """Handle unsubscription request."""
         subscription_id = message.payload.get("subscription_id")
         
-        if subscription_id in self.subscriptions:
-            subscription = self.subscriptions[subscription_id]
-            
+        if subscription_id in self.subscriptions and self.subscriptions[subscription_id].connection_id == connection_id:
             # Remove subscription
-            del self.subscriptions[subscription_id]
-            self.connections[connection_id].subscriptions.discard(subscription.subscription_type)
-            self.stats.subscription_count -= 1
+            self._remove_subscription(subscription_id)
             
             # Send confirmation
             response = RealtimeMessage(
@@ -429,7 +803,7 @@ class RealtimeCommunicationEngine:
             await self._handle_client_registration(connection_id, message)
         else:
             # Forward to external command handler
-            await self.message_queue.put((connection_id, message))
+            await self._enqueue_message(connection_id, message)
     
     async def _handle_authentication(self, connection_id: str, message: RealtimeMessage) -> None:
         """Handle authentication request."""
@@ -513,8 +887,22 @@ class RealtimeCommunicationEngine:
     
     async def _handle_status_update(self, connection_id: str, message: RealtimeMessage) -> None:
         """Handle status update message."""
-        # Broadcast to subscribers
-        await self._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, message)
+        # Broadcast to subscribers through the dispatcher, which also reaches other processes
+        await self._enqueue_message(connection_id, message)
+    
+    @staticmethod
+    def _serialize_message(message: RealtimeMessage) -> str:
+        """Serialize a message to its JSON frame."""
+        message_data = asdict(message)
+        message_data["timestamp"] = message.timestamp.isoformat()
+        message_data["message_type"] = message.message_type.value
+        return json.dumps(message_data)
+    
+    def _coalesce_key(self, message: RealtimeMessage) -> Optional[str]:
+        """Key under which queued status updates supersede each other, if coalescing."""
+        if not self.coalesce_status_updates or message.message_type != MessageType.STATUS_UPDATE:
+            return None
+        return message.metadata.get("coalesce_key", message.source)
     
     async def _send_message_to_connection(self, connection_id: str, message: RealtimeMessage) -> bool:
         """Send message to specific connection."""
@@ -522,18 +910,53 @@ class RealtimeCommunicationEngine:
             return False
         
         try:
-            connection = self.connections[connection_id]
-            message_data = asdict(message)
-            message_data["timestamp"] = message.timestamp.isoformat()
-            message_data["message_type"] = message.message_type.value
-            
-            await connection.websocket.send(json.dumps(message_data))
-            self.stats.total_messages_sent += 1
-            return True
-            
+            frame = self._serialize_message(message)
         except Exception as e:
-            logger.error(f"Failed to send message to {connection_id}: {e}")
+            logger.error(f"Failed to serialize message for {connection_id}: {e}")
+            return False
+        
+        return self._enqueue_frame(connection_id, frame, self._coalesce_key(message))
+    
+    def _enqueue_frame(self, connection_id: str, frame: str, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a serialized frame for a connection, evicting it if its buffer is full."""
+        send_queue = self.send_queues.get(connection_id)
+        if send_queue is None:
             return False
+        
+        queued = send_queue.offer(frame, coalesce_key)
+        if queued is None:
+            self.stats.messages_coalesced += 1
+            return True
+        if not queued:
+            self._evict_slow_consumer(connection_id)
+        return queued
+    
+    def _fan_out(self, connection_ids, message: RealtimeMessage) -> int:
+        """Serialize once and queue the frame for every connection."""
+        frame = self._serialize_message(message)
+        coalesce_key = self._coalesce_key(message)
+        return sum(1 for connection_id in list(connection_ids)
+                   if self._enqueue_frame(connection_id, frame, coalesce_key))
+    
+    def _record_sent(self) -> None:
+        """Count a frame written by a send queue."""
+        self.stats.total_messages_sent += 1
+    
+    def _on_send_failure(self, connection_id: str, error: Exception) -> None:
+        """Drop a connection whose socket write failed."""
+        logger.error(f"Failed to send message to {connection_id}: {error}")
+        asyncio.create_task(self._cleanup_connection(connection_id))
+    
+    def _evict_slow_consumer(self, connection_id: str) -> None:
+        """Disconnect a client whose send buffer overflowed."""
+        send_queue = self.send_queues.pop(connection_id, None)
+        if send_queue is None:
+            return
+        
+        send_queue.close()
+        self.stats.slow_consumers_evicted += 1
+        logger.warning(f"Evicting slow consumer {connection_id}: {send_queue.max_pending} messages pending")
+        asyncio.create_task(self._cleanup_connection(connection_id))
     
     async def _send_error_message(self, connection_id: str, error_message: str) -> None:
         """Send error message to connection."""
@@ -550,60 +973,115 @@ class RealtimeCommunicationEngine:
         self.stats.error_count += 1
     
     async def _broadcast_to_subscribers(self, subscription_type: SubscriptionType, message: RealtimeMessage) -> int:
-        """Broadcast message to all subscribers of a type."""
+        """Broadcast message to all subscribers of a type, once per connection."""
+        recipients: Dict[str, Set[str]] = {}
+        for indexed_type in {subscription_type, SubscriptionType.ALL}:
+            for connection_id, subscription_ids in self.topic_index[indexed_type].items():
+                recipients.setdefault(connection_id, set()).update(subscription_ids)
+        
+        if not recipients:
+            return 0
+        
+        frame = self._serialize_message(message)
+        coalesce_key = self._coalesce_key(message)
+        now = datetime.utcnow()
         sent_count = 0
         
-        for subscription in self.subscriptions.values():
-            if subscription.subscription_type == subscription_type or subscription.subscription_type == SubscriptionType.ALL:
-                if await self._send_message_to_connection(subscription.connection_id, message):
-                    sent_count += 1
-                    subscription.message_count += 1
-                    subscription.last_update = datetime.utcnow()
+        for connection_id, subscription_ids in recipients.items():
+            if self._enqueue_frame(connection_id, frame, coalesce_key):
+                sent_count += 1
+                for subscription_id in subscription_ids:
+                    subscription = self.subscriptions.get(subscription_id)
+                    if subscription is not None:
+                        subscription.message_count += 1
+                        subscription.last_update = now
         
         return sent_count
     
-    async def _message_processor(self) -> None:
-        """Process queued messages."""
-        while self.is_running:
+    def _shard_for(self, connection_id: Optional[str], message: RealtimeMessage) -> int:
+        """Shard of a message: by destination for direct messages, else by sender."""
+        if message.message_type == MessageType.DIRECT_MESSAGE and message.destination:
+            routing_key = message.destination
+        else:
+            routing_key = connection_id or message.source or ""
+        return zlib.crc32(routing_key.encode("utf-8")) % self.dispatcher_shards
+    
+    async def _enqueue_message(self, connection_id: Optional[str], message: RealtimeMessage,
+                               publish: bool = True) -> None:
+        """Queue a message on its shard; publish=False for messages received from the bus."""
+        await self.shard_queues[self._shard_for(connection_id, message)].put((connection_id, message, publish))
+    
+    async def _message_processor(self, shard_index: int = 0) -> None:
+        """Process queued messages of one shard."""
+        queue = self.shard_queues[shard_index]
+        while True:
+            connection_id, message, publish = await queue.get()
             try:
-                connection_id, message = await asyncio.wait_for(self.message_queue.get(), timeout=1.0)
-                
-                # Process message based on type
-                if message.message_type == MessageType.BROADCAST:
-                    await self._handle_broadcast(message)
-                elif message.message_type == MessageType.DIRECT_MESSAGE:
-                    await self._handle_direct_message(message)
-                else:
-                    # Default: broadcast to relevant subscribers
-                    subscription_map = {
-                        MessageType.COMMAND: SubscriptionType.COMMAND_STATUS,
-                        MessageType.STATUS_UPDATE: SubscriptionType.AGENT_STATUS,
-                        MessageType.SYSTEM_ALERT: SubscriptionType.ERROR_ALERTS
-                    }
-                    
-                    sub_type = subscription_map.get(message.message_type, SubscriptionType.ALL)
-                    await self._broadcast_to_subscribers(sub_type, message)
-                
-            except asyncio.TimeoutError:
-                continue
+                await self._dispatch_message(message, publish)
+                self.shard_dispatch_counts[shard_index] += 1
             except Exception as e:
-                logger.error(f"Message processor error: {e}")
+                logger.error(f"Message processor error (shard {shard_index}): {e}")
+            finally:
+                queue.task_done()
+            
+            # Let send queue writers run between messages of a burst
+            await asyncio.sleep(0)
+    
+    async def _dispatch_message(self, message: RealtimeMessage, publish: bool = True) -> None:
+        """Deliver a message to local connections and, if publish, to the bus."""
+        # Process message based on type
+        if message.message_type == MessageType.BROADCAST:
+            await self._handle_broadcast(message)
+        elif message.message_type == MessageType.DIRECT_MESSAGE:
+            if await self._handle_direct_message(message):
+                # Delivered locally, no other process holds the destination
+                return
+        else:
+            # Default: broadcast to relevant subscribers
+            subscription_map = {
+                MessageType.COMMAND: SubscriptionType.COMMAND_STATUS,
+                MessageType.STATUS_UPDATE: SubscriptionType.AGENT_STATUS,
+                MessageType.SYSTEM_ALERT: SubscriptionType.ERROR_ALERTS
+            }
+            
+            sub_type = subscription_map.get(message.message_type, SubscriptionType.ALL)
+            await self._broadcast_to_subscribers(sub_type, message)
+        
+        if publish and self.message_bus:
+            await self.message_bus.publish(f"{self.engine_id} {self._serialize_message(message)}")
+    
+    async def _handle_bus_frame(self, frame: str) -> None:
+        """Queue a message published by another engine process."""
+        try:
+            origin, message_json = frame.split(" ", 1)
+            if origin == self.engine_id:
+                return
+            message = self._message_from_dict(json.loads(message_json))
+            await self._enqueue_message(None, message, publish=False)
+        except Exception as e:
+            logger.error(f"Invalid message bus frame: {e}")
+    
+    async def wait_until_dispatched(self) -> None:
+        """Wait until every shard queue has been processed."""
+        await asyncio.gather(*(queue.join() for queue in self.shard_queues))
     
     async def _handle_broadcast(self, message: RealtimeMessage) -> None:
         """Handle broadcast message."""
-        for connection_id in self.connections.keys():
-            await self._send_message_to_connection(connection_id, message)
+        self._fan_out(self.connections.keys(), message)
     
-    async def _handle_direct_message(self, message: RealtimeMessage) -> None:
-        """Handle direct message."""
+    async def _handle_direct_message(self, message: RealtimeMessage) -> bool:
+        """Handle direct message; returns True if the destination is connected here."""
         if message.destination:
             # Try direct connection ID first
             if message.destination in self.connections:
                 await self._send_message_to_connection(message.destination, message)
+                return True
             # Try client ID route
             elif message.destination in self.direct_routes:
                 connection_id = self.direct_routes[message.destination]
                 await self._send_message_to_connection(connection_id, message)
+                return True
+        return False
     
     async def _heartbeat_monitor(self) -> None:
         """Monitor connection heartbeats."""
@@ -649,19 +1127,19 @@ class RealtimeCommunicationEngine:
         if connection_id in self.connections:
             connection = self.connections[connection_id]
             
-            # Remove subscriptions
-            subscriptions_to_remove = [
-                sub_id for sub_id, sub in self.subscriptions.items()
-                if sub.connection_id == connection_id
-            ]
+            # Stop the writer
+            send_queue = self.send_queues.pop(connection_id, None)
+            if send_queue is not None:
+                send_queue.close()
             
-            for sub_id in subscriptions_to_remove:
-                del self.subscriptions[sub_id]
-                self.stats.subscription_count -= 1
+            # Remove subscriptions
+            for sub_id in list(self.connection_subscriptions.pop(connection_id, ())):
+                if sub_id in self.subscriptions:
+                    self._remove_subscription(sub_id)
             
             # Remove direct routes
             client_id = connection.client_id
-            if client_id in self.direct_routes:
+            if self.direct_routes.get(client_id) == connection_id:
                 del self.direct_routes[client_id]
             
             # Close WebSocket
@@ -678,7 +1156,7 @@ class RealtimeCommunicationEngine:
     
     async def send_message(self, message: RealtimeMessage) -> bool:
         """Send message through the communication layer."""
-        await self.message_queue.put((None, message))
+        await self._enqueue_message(None, message)
         return True
     
     async def broadcast_message(self, payload: Dict[str, Any], 
@@ -714,7 +1192,17 @@ class RealtimeCommunicationEngine:
             },
             "subscriptions": {
                 "total": len(self.subscriptions),
-                "by_type": {}
+                "by_type": {
+                    subscription_type.value: len(subscribers)
+                    for subscription_type, subscribers in self.topic_index.items() if subscribers
+                }
+            },
+            "pending_sends": sum(len(send_queue.pending) for send_queue in self.send_queues.values()),
+            "dispatcher": {
+                "shards": self.dispatcher_shards,
+                "queue_depths": [queue.qsize() for queue in self.shard_queues],
+                "dispatched": list(self.shard_dispatch_counts),
+                "message_bus": type(self.message_bus).__name__ if self.message_bus else None
             },
             "uptime_seconds": self.stats.uptime_seconds
         }
@@ -724,6 +1212,13 @@ class RealtimeCommunicationEngine:
         try:
             self.is_running = False
             
+            # Stop dispatcher and monitors
+            for task in self.background_tasks:
+                task.cancel()
+            self.background_tasks.clear()
+            if self.message_bus:
+                await self.message_bus.close()
+            
             # Close all connections
             for connection_id in list(self.connections.keys()):
                 await self._cleanup_connection(connection_id)
@@ -783,4 +1278,78 @@ class RealtimeCommunicationUtils:
         if not isinstance(port, int) or port < 1 or port > 65535:
             errors.append("Invalid port number")
         
+        dispatcher_shards = config.get("dispatcher_shards", 4)
+        if not isinstance(dispatcher_shards, int) or dispatcher_shards < 1:
+            errors.append("dispatcher_shards must be a positive integer")
+        
+        bus_config = config.get("message_bus")
+        if bus_config:
+            if bus_config.get("type", "redis") not in ("redis", "unix"):
+                errors.append("message_bus type must be 'redis' or 'unix'")
+            elif bus_config.get("type") == "unix" and not bus_config.get("path"):
+                errors.append("unix message bus requires a socket path")
+        
+        send_buffer_size = config.get("send_buffer_size", 256)
+        if not isinstance(send_buffer_size, int) or send_buffer_size < 1:
+            errors.append("send_buffer_size must be a positive integer")
+        
         return errors
+
+
+# ============================================================================
+# MULTI-PROCESS MODE
+# ============================================================================
+
+async def _serve_engine(communication_config: Dict[str, Any]) -> None:
+    engine = RealtimeCommunicationEngine(communication_config)
+    if not await engine.initialize_server():
+        return
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await engine.shutdown()
+
+
+def _run_engine_process(communication_config: Dict[str, Any]) -> None:
+    asyncio.run(_serve_engine(communication_config))
+
+
+def _run_broker_process(path: str) -> None:
+    asyncio.run(UnixSocketBroker(path).serve_forever())
+
+
+def start_engine_processes(communication_config: Dict[str, Any],
+                           process_count: int) -> List[multiprocessing.Process]:
+    """
+    Run the engine in several processes sharing one port and one message bus.
+    
+    Processes listen with SO_REUSEPORT so the kernel spreads connections
+    across them, and exchange dispatched messages over the configured bus.
+    A UNIX-socket broker process is started first for "unix" buses.
+    
+    Args:
+        communication_config: Engine configuration including "message_bus"
+        process_count: Number of engine processes
+    
+    Returns:
+        Started processes, broker first when one was started
+    """
+    if not communication_config.get("message_bus"):
+        raise ValueError("Multi-process mode requires a message_bus configuration")
+    
+    context = multiprocessing.get_context("spawn")
+    processes = []
+    
+    bus_config = communication_config["message_bus"]
+    if bus_config.get("type", "redis") == "unix":
+        processes.append(context.Process(target=_run_broker_process, args=(bus_config["path"],), daemon=True))
+    
+    process_config = {**communication_config, "reuse_port": True}
+    for _ in range(process_count):
+        processes.append(context.Process(target=_run_engine_process, args=(process_config,), daemon=True))
+    
+    for process in processes:
+        process.start()
+    
+    logger.info(f"Started {process_count} realtime engine processes on port {communication_config.get('port', 8765)}")
+    return processes
@@ -21,6 +21,8 @@ from .tokenizer import (
     extract_jaegis_entities
 )
 
+from .document_parser import SharedDocumentParser
+
 from .semantic_analyzer import (
     SemanticAnalysisEngine,
     SemanticVector,
@@ -29,6 +31,12 @@ from .semantic_analyzer import (
     SemanticUtils
 )
 
+from .embedding_service import (
+    EmbeddingService,
+    DiskVectorCache,
+    ConceptIndex
+)
+
 from .intent_recognizer import (
     IntentRecognitionEngine,
     IntentCategory,
@@ -81,6 +89,7 @@ __all__ = [
     "TokenizationResult",
     "quick_tokenize",
     "extract_jaegis_entities",
+    "SharedDocumentParser",
     
     # Semantic Analysis
     "SemanticAnalysisEngine",
@@ -88,6 +97,9 @@ __all__ = [
     "SemanticRelation", 
     "SemanticAnalysisResult",
     "SemanticUtils",
+    "EmbeddingService",
+    "DiskVectorCache",
+    "ConceptIndex",
     
     # Intent Recognition
     "IntentRecognitionEngine",
@@ -3,8 +3,11 @@ N.L.D.S. Advanced Tokenizer Implementation
 Advanced tokenization with Unicode support, multi-language handling, and preprocessing pipeline
 """
 
+import os
 import re
+import time
 import unicodedata
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -89,9 +92,19 @@ class AdvancedTokenizer:
     """
     Advanced tokenizer with Unicode support, multi-language handling,
     and comprehensive preprocessing pipeline for N.L.D.S.
+    
+    Single texts go through tokenize(); batch_tokenize() groups texts by
+    language and streams each group through spaCy's nlp.pipe, or through a
+    precompiled single-regex tokenizer when no spaCy pipeline is used.
     """
     
-    def __init__(self, default_language: LanguageCode = LanguageCode.ENGLISH):
+    # Characters per nlp.pipe batch used to size batches from average text length
+    PIPE_BATCH_CHARACTERS = 100000
+    MIN_PIPE_BATCH_SIZE = 16
+    MAX_PIPE_BATCH_SIZE = 1000
+    
+    def __init__(self, default_language: LanguageCode = LanguageCode.ENGLISH,
+                 token_type_cache_size: int = 65536):
         self.default_language = default_language
         
         # Initialize spaCy models
@@ -110,6 +123,23 @@ class AdvancedTokenizer:
         self.mention_pattern = re.compile(r'@\w+')
         self.number_pattern = re.compile(r'\b\d+(?:\.\d+)?\b')
         
+        # Single-pass regex tokenizer for the non-spaCy batch path; the
+        # matching group gives the token type for the unambiguous cases
+        self.fast_token_pattern = re.compile('|'.join([
+            f'(?P<{TokenType.URL.value}>{self.url_pattern.pattern})',
+            f'(?P<{TokenType.EMAIL.value}>{self.email_pattern.pattern})',
+            f'(?P<{TokenType.HASHTAG.value}>{self.hashtag_pattern.pattern})',
+            f'(?P<{TokenType.MENTION.value}>{self.mention_pattern.pattern})',
+            f'(?P<{TokenType.NUMBER.value}>{self.number_pattern.pattern})',
+            r'(?P<text>\w+|[^\w\s])'
+        ]))
+        self.sentence_boundary_pattern = re.compile(r'(?<=[.!?])\s+')
+        self.control_character_pattern = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+        self.whitespace_pattern = re.compile(r'\s+')
+        
+        # Token types of repeated surface forms are served from an LRU cache
+        self.cached_token_type = lru_cache(maxsize=token_type_cache_size)(self.classify_token_type)
+        
         # Unicode categories for classification
         self.punctuation_categories = {'Pc', 'Pd', 'Pe', 'Pf', 'Pi', 'Po', 'Ps'}
         self.symbol_categories = {'Sc', 'Sk', 'Sm', 'So'}
@@ -146,6 +176,8 @@ class AdvancedTokenizer:
                     self.spacy_models[lang] = German()
                 elif lang == LanguageCode.CHINESE:
                     self.spacy_models[lang] = Chinese()
+                # Blank pipelines need a sentencizer for doc.sents
+                self.spacy_models[lang].add_pipe("sentencizer")
     
     def _load_stop_words(self) -> Dict[str, Set[str]]:
         """Load stop words for supported languages."""
@@ -205,16 +237,17 @@ class AdvancedTokenizer:
         applied_steps.append("unicode_normalization")
         
         # 2. Remove or replace control characters
-        processed_text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', processed_text)
+        processed_text = self.control_character_pattern.sub('', processed_text)
         applied_steps.append("control_character_removal")
         
         # 3. Normalize whitespace
-        processed_text = re.sub(r'\s+', ' ', processed_text).strip()
+        processed_text = self.whitespace_pattern.sub(' ', processed_text).strip()
         applied_steps.append("whitespace_normalization")
         
         # 4. Handle special characters and emojis (preserve them)
-        # Convert emojis to text representation for better processing
-        emoji_text = emoji.demojize(processed_text)
+        # Convert emojis to text representation for better processing;
+        # ASCII text cannot contain emojis, so it skips the emoji scan
+        emoji_text = processed_text if processed_text.isascii() else emoji.demojize(processed_text)
         if emoji_text != processed_text:
             processed_text = emoji_text
             applied_steps.append("emoji_conversion")
@@ -277,7 +310,6 @@ class AdvancedTokenizer:
         Returns:
             TokenizationResult with comprehensive token information
         """
-        import time
         start_time = time.time()
         
         # Detect language if auto-detect is specified
@@ -297,27 +329,36 @@ class AdvancedTokenizer:
         # Process with spaCy
         doc = nlp(preprocessed_text)
         
+        # Calculate processing time
+        processing_time = (time.time() - start_time) * 1000
+        
+        result = self._result_from_doc(
+            doc, text, detected_lang, lang_confidence, preprocessing_steps, processing_time
+        )
+        
+        logger.debug(f"Tokenized {result.token_count} tokens in {processing_time:.2f}ms")
+        
+        return result
+    
+    def _result_from_doc(self, doc, text: str, detected_lang: str, lang_confidence: float,
+                         preprocessing_steps: List[str], processing_time: float) -> TokenizationResult:
+        """Build a TokenizationResult from a processed spaCy Doc."""
+        stop_words_set = self.stop_words.get(LanguageCode(detected_lang), set())
+        
         # Extract sentences
         sentences = [sent.text for sent in doc.sents]
         
         # Create tokens
         tokens = []
         for spacy_token in doc:
-            # Classify token type
-            token_type = self.classify_token_type(spacy_token.text)
-            
             # Normalize token text
             normalized_text = spacy_token.text.lower().strip()
             
-            # Check if it's a stop word
-            stop_words_set = self.stop_words.get(lang_enum, set())
-            is_stop_word = normalized_text in stop_words_set
-            
             # Create token object
             token = Token(
                 text=spacy_token.text,
                 normalized_text=normalized_text,
-                token_type=token_type,
+                token_type=self.cached_token_type(spacy_token.text),
                 start_pos=spacy_token.idx,
                 end_pos=spacy_token.idx + len(spacy_token.text),
                 language=detected_lang,
@@ -326,7 +367,7 @@ class AdvancedTokenizer:
                 pos_tag=spacy_token.pos_,
                 dependency=spacy_token.dep_,
                 entity_type=spacy_token.ent_type_ if spacy_token.ent_type_ else None,
-                is_stop_word=is_stop_word,
+                is_stop_word=normalized_text in stop_words_set,
                 is_alpha=spacy_token.is_alpha,
                 is_digit=spacy_token.is_digit,
                 is_punct=spacy_token.is_punct,
@@ -337,11 +378,7 @@ class AdvancedTokenizer:
             
             tokens.append(token)
         
-        # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
-        
-        # Create result
-        result = TokenizationResult(
+        return TokenizationResult(
             tokens=tokens,
             sentences=sentences,
             detected_language=detected_lang,
@@ -351,10 +388,73 @@ class AdvancedTokenizer:
             character_count=len(text),
             preprocessing_applied=preprocessing_steps
         )
+    
+    def fast_tokenize(self, text: str, language: LanguageCode = LanguageCode.AUTO_DETECT) -> TokenizationResult:
+        """
+        Tokenize with the precompiled single-regex tokenizer instead of spaCy.
         
-        logger.debug(f"Tokenized {len(tokens)} tokens in {processing_time:.2f}ms")
+        Tokens carry types, offsets and stop-word flags but no lemma, POS,
+        dependency or vector annotations.
         
-        return result
+        Args:
+            text: Input text to tokenize
+            language: Target language (auto-detect if not specified)
+            
+        Returns:
+            TokenizationResult without spaCy annotations
+        """
+        start_time = time.time()
+        
+        if language == LanguageCode.AUTO_DETECT:
+            detected_lang, lang_confidence = self.detect_language(text)
+        else:
+            detected_lang, lang_confidence = language.value, 1.0
+        
+        preprocessed_text, preprocessing_steps = self.preprocess_text(text)
+        
+        return self._regex_result(
+            preprocessed_text, text, detected_lang, lang_confidence, preprocessing_steps,
+            (time.time() - start_time) * 1000
+        )
+    
+    def _regex_result(self, preprocessed_text: str, text: str, detected_lang: str, lang_confidence: float,
+                      preprocessing_steps: List[str], processing_time: float) -> TokenizationResult:
+        """Build a TokenizationResult with the single-regex tokenizer."""
+        stop_words_set = self.stop_words.get(LanguageCode(detected_lang), set())
+        
+        tokens = []
+        for match in self.fast_token_pattern.finditer(preprocessed_text):
+            token_text = match.group()
+            group = match.lastgroup
+            token_type = self.cached_token_type(token_text) if group == "text" else TokenType(group)
+            normalized_text = token_text.lower()
+            
+            tokens.append(Token(
+                text=token_text,
+                normalized_text=normalized_text,
+                token_type=token_type,
+                start_pos=match.start(),
+                end_pos=match.end(),
+                language=detected_lang,
+                confidence=lang_confidence,
+                is_stop_word=normalized_text in stop_words_set,
+                is_alpha=token_text.isalpha(),
+                is_digit=token_text.isdigit(),
+                is_punct=token_type == TokenType.PUNCTUATION
+            ))
+        
+        sentences = [sentence for sentence in self.sentence_boundary_pattern.split(preprocessed_text) if sentence]
+        
+        return TokenizationResult(
+            tokens=tokens,
+            sentences=sentences,
+            detected_language=detected_lang,
+            language_confidence=lang_confidence,
+            processing_time_ms=processing_time,
+            token_count=len(tokens),
+            character_count=len(text),
+            preprocessing_applied=preprocessing_steps
+        )
     
     def tokenize_for_transformer(self, text: str) -> Dict[str, Any]:
         """Tokenize text for transformer model compatibility."""
@@ -381,16 +481,92 @@ class AdvancedTokenizer:
             "token_count": len(tokens)
         }
     
-    def batch_tokenize(self, texts: List[str], language: LanguageCode = LanguageCode.AUTO_DETECT) -> List[TokenizationResult]:
-        """Tokenize multiple texts in batch for efficiency."""
+    def batch_tokenize(self, texts: List[str], language: LanguageCode = LanguageCode.AUTO_DETECT,
+                       batch_size: Optional[int] = None, n_process: int = 1,
+                       use_spacy: bool = True) -> List[TokenizationResult]:
+        """
+        Tokenize multiple texts in batch for efficiency.
+        
+        Texts are grouped by detected language and each group is streamed
+        through that language's spaCy pipeline with nlp.pipe. Groups without
+        a spaCy pipeline, or every group when use_spacy is False, use the
+        precompiled single-regex tokenizer.
+        
+        Args:
+            texts: Input texts to tokenize
+            language: Target language (auto-detect per text if not specified)
+            batch_size: nlp.pipe batch size; sized from text length when None
+            n_process: spaCy worker processes (-1 for all cores)
+            use_spacy: Whether to use spaCy pipelines at all
+            
+        Returns:
+            TokenizationResult per text, in input order. processing_time_ms is
+            the batch time amortized over the texts.
+        """
+        start_time = time.time()
+        results: List[Optional[TokenizationResult]] = [None] * len(texts)
+        
+        # Detect language and preprocess once per text, then group by language
+        groups: Dict[str, List[int]] = {}
+        prepared = []
+        for index, text in enumerate(texts):
+            if language == LanguageCode.AUTO_DETECT:
+                detected_lang, lang_confidence = self.detect_language(text)
+            else:
+                detected_lang, lang_confidence = language.value, 1.0
+            
+            preprocessed_text, preprocessing_steps = self.preprocess_text(text)
+            prepared.append((preprocessed_text, detected_lang, lang_confidence, preprocessing_steps))
+            groups.setdefault(detected_lang, []).append(index)
         
-        results = []
-        for text in texts:
-            result = self.tokenize(text, language)
-            results.append(result)
+        for detected_lang, indices in groups.items():
+            nlp = self.spacy_models.get(LanguageCode(detected_lang)) if use_spacy else None
+            
+            if nlp is None:
+                for index in indices:
+                    preprocessed_text, _, lang_confidence, preprocessing_steps = prepared[index]
+                    results[index] = self._regex_result(
+                        preprocessed_text, texts[index], detected_lang, lang_confidence, preprocessing_steps, 0.0
+                    )
+                continue
+            
+            group_texts = [prepared[index][0] for index in indices]
+            group_batch_size = batch_size or self._pipe_batch_size(group_texts)
+            
+            docs = nlp.pipe(
+                group_texts,
+                batch_size=group_batch_size,
+                n_process=self._pipe_processes(len(group_texts), group_batch_size, n_process)
+            )
+            
+            for index, doc in zip(indices, docs):
+                _, _, lang_confidence, preprocessing_steps = prepared[index]
+                results[index] = self._result_from_doc(
+                    doc, texts[index], detected_lang, lang_confidence, preprocessing_steps, 0.0
+                )
+        
+        if texts:
+            amortized_time = (time.time() - start_time) * 1000 / len(texts)
+            for result in results:
+                result.processing_time_ms = amortized_time
+        
+        logger.debug(f"Batch tokenized {len(texts)} texts in {len(groups)} language groups")
         
         return results
     
+    def _pipe_batch_size(self, texts: List[str]) -> int:
+        """Batch size giving roughly PIPE_BATCH_CHARACTERS characters per batch."""
+        average_length = max(1, sum(len(text) for text in texts) // max(1, len(texts)))
+        return max(self.MIN_PIPE_BATCH_SIZE,
+                   min(self.MAX_PIPE_BATCH_SIZE, self.PIPE_BATCH_CHARACTERS // average_length))
+    
+    @staticmethod
+    def _pipe_processes(text_count: int, batch_size: int, n_process: int) -> int:
+        """Worker processes worth starting: at most one per full batch."""
+        if n_process == -1:
+            n_process = os.cpu_count() or 1
+        return max(1, min(n_process, text_count // batch_size))
+    
     def get_token_statistics(self, result: TokenizationResult) -> Dict[str, Any]:
         """Generate comprehensive token statistics."""
         
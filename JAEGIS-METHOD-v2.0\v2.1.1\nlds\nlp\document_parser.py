@@ -0,0 +1,235 @@
+"""
+N.L.D.S. Shared Document Parser
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Parse-once spaCy documents shared by the tokenizer, the NER processor and the
+logical and emotional analysis engines, with only the pipeline components
+their consumers need enabled and parsed docs cached by text hash.
+"""
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Iterable, Set
+import logging
+
+import spacy
+from spacy.lang.en import English
+from spacy.tokens import Doc
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# SHARED DOCUMENT PARSER
+# ============================================================================
+
+class SharedDocumentParser:
+    """
+    One spaCy pipeline and one parse per text for all NLDS engines.
+    
+    Consumers register the document attributes they read. Components no
+    registered consumer needs are disabled on the shared pipeline, and
+    sentence boundaries come from the cheaper senter when nothing needs the
+    dependency parse. Parsed docs are cached by a hash of the text and must
+    be treated as read-only by consumers.
+    """
+    
+    # Pipeline components providing each document attribute
+    ATTRIBUTE_COMPONENTS = {
+        "tokens": (),
+        "sents": (),  # Resolved to senter or parser in required_components
+        "dep": ("tok2vec", "parser"),
+        "pos": ("tok2vec", "tagger", "attribute_ruler"),
+        "lemma": ("tok2vec", "tagger", "attribute_ruler", "lemmatizer"),
+        "ents": ("tok2vec", "ner")
+    }
+    
+    # Document attributes each engine reads
+    CONSUMER_REQUIREMENTS = {
+        "tokenizer": {"tokens", "pos", "lemma"},
+        "logical_analysis": {"tokens", "sents"},
+        "emotional_analysis": set(),
+        "named_entity_recognition": {"ents"}
+    }
+    
+    # Components this parser may enable or disable; others are left as loaded
+    MANAGED_COMPONENTS = {"tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"}
+    
+    _shared_instance: Optional["SharedDocumentParser"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, model_name: str = "en_core_web_lg", nlp: Optional[Any] = None,
+                 cache_size: int = 1024):
+        """
+        Initialize shared document parser.
+        
+        Args:
+            model_name: spaCy pipeline to load when nlp is not given
+            nlp: Already loaded spaCy pipeline to share
+            cache_size: Maximum number of parsed docs kept
+        """
+        self.model_name = model_name
+        self.nlp = nlp if nlp is not None else self._load_model(model_name)
+        self.cache_size = cache_size
+        self.consumers: Dict[str, Set[str]] = {}
+        self.doc_cache: "OrderedDict[str, Doc]" = OrderedDict()
+        self.cache_lock = threading.Lock()
+        self.statistics = {"parses": 0, "cache_hits": 0, "parse_time_ms": 0.0}
+    
+    @classmethod
+    def shared(cls) -> "SharedDocumentParser":
+        """Return the process-wide parser the default engine factories share."""
+        if cls._shared_instance is None:
+            with cls._shared_lock:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
+    
+    def _load_model(self, model_name: str):
+        """Load the spaCy pipeline, falling back to a blank English one."""
+        try:
+            nlp = spacy.load(model_name)
+            logger.info(f"Loaded shared spaCy model: {model_name}")
+            return nlp
+        except OSError as e:
+            logger.warning(f"Could not load spaCy model {model_name}: {e}. Using blank English pipeline.")
+            nlp = English()
+            nlp.add_pipe("sentencizer")
+            return nlp
+    
+    def register(self, consumer: str, requirements: Optional[Iterable[str]] = None) -> None:
+        """
+        Register an engine and the document attributes it reads.
+        
+        Args:
+            consumer: Consumer name, e.g. "logical_analysis"
+            requirements: Attributes from ATTRIBUTE_COMPONENTS; defaults to the
+                consumer's CONSUMER_REQUIREMENTS entry, or every attribute for
+                unknown consumers
+        """
+        if requirements is None:
+            requirements = self.CONSUMER_REQUIREMENTS.get(consumer, self.ATTRIBUTE_COMPONENTS.keys())
+        
+        unknown = set(requirements) - self.ATTRIBUTE_COMPONENTS.keys()
+        if unknown:
+            raise ValueError(f"Unknown document attributes: {sorted(unknown)}")
+        
+        self.consumers[consumer] = set(requirements)
+        self._configure_pipeline()
+    
+    def required_components(self) -> Set[str]:
+        """Pipeline components needed by the union of registered consumers."""
+        attributes = set().union(*self.consumers.values()) if self.consumers else set()
+        available = set(self.nlp.component_names)
+        
+        needed = set()
+        for attribute in attributes:
+            needed.update(self.ATTRIBUTE_COMPONENTS[attribute])
+        
+        if "sents" in attributes and "parser" not in needed:
+            if "senter" in available:
+                needed.add("senter")
+            elif "parser" in available:
+                needed.update(("tok2vec", "parser"))
+        
+        return needed & available
+    
+    def _configure_pipeline(self) -> None:
+        """Enable needed managed components, disable the rest and drop stale docs."""
+        needed = self.required_components()
+        for name in self.nlp.component_names:
+            if name not in self.MANAGED_COMPONENTS:
+                continue
+            if name in needed and name in self.nlp.disabled:
+                self.nlp.enable_pipe(name)
+            elif name not in needed and name not in self.nlp.disabled:
+                self.nlp.disable_pipe(name)
+        
+        # Docs parsed with a different component set may lack attributes
+        with self.cache_lock:
+            self.doc_cache.clear()
+        
+        logger.info(f"Shared parser components: {self.nlp.pipe_names} (disabled: {self.nlp.disabled})")
+    
+    @staticmethod
+    def text_key(text: str) -> str:
+        """Cache key for a text."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def parse(self, text: str) -> Doc:
+        """
+        Return the parsed doc for text, parsing it at most once while cached.
+        
+        Args:
+            text: Input text
+        
+        Returns:
+            Shared spaCy Doc
+        """
+        key = self.text_key(text)
+        with self.cache_lock:
+            doc = self.doc_cache.get(key)
+            if doc is not None:
+                self.doc_cache.move_to_end(key)
+                self.statistics["cache_hits"] += 1
+                return doc
+        
+        start_time = time.perf_counter()
+        doc = self.nlp(text)
+        self._record_parse(key, doc, (time.perf_counter() - start_time) * 1000)
+        return doc
+    
+    def parse_batch(self, texts: List[str], batch_size: int = 64) -> List[Doc]:
+        """Parse texts with nlp.pipe, skipping those already cached."""
+        keys = [self.text_key(text) for text in texts]
+        docs: Dict[str, Doc] = {}
+        with self.cache_lock:
+            for key in keys:
+                if key in self.doc_cache:
+                    docs[key] = self.doc_cache[key]
+                    self.statistics["cache_hits"] += 1
+        
+        pending = {key: text for key, text in zip(keys, texts) if key not in docs}
+        if pending:
+            start_time = time.perf_counter()
+            parsed = list(self.nlp.pipe(pending.values(), batch_size=batch_size))
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            for key, doc in zip(pending, parsed):
+                docs[key] = doc
+                self._record_parse(key, doc, elapsed_ms / len(parsed))
+        
+        return [docs[key] for key in keys]
+    
+    def _record_parse(self, key: str, doc: Doc, elapsed_ms: float) -> None:
+        with self.cache_lock:
+            self.statistics["parses"] += 1
+            self.statistics["parse_time_ms"] += elapsed_ms
+            self.doc_cache[key] = doc
+            if len(self.doc_cache) > self.cache_size:
+                self.doc_cache.popitem(last=False)
+    
+    def to_bytes(self, doc: Doc) -> bytes:
+        """Serialize a doc compactly (no tensors) for process-pool stages."""
+        return doc.to_bytes(exclude=["tensor", "user_data"])
+    
+    def from_bytes(self, data: bytes) -> Doc:
+        """Restore a doc serialized with to_bytes against the shared vocab."""
+        return Doc(self.nlp.vocab).from_bytes(data)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Parse counts, cache hits and the estimated parse time saved."""
+        parses = self.statistics["parses"]
+        average_parse_ms = self.statistics["parse_time_ms"] / parses if parses else 0.0
+        return {
+            "parses": parses,
+            "cache_hits": self.statistics["cache_hits"],
+            "cached_docs": len(self.doc_cache),
+            "average_parse_ms": average_parse_ms,
+            "estimated_time_saved_ms": self.statistics["cache_hits"] * average_parse_ms,
+            "enabled_components": list(self.nlp.pipe_names),
+            "disabled_components": list(self.nlp.disabled),
+            "consumers": {name: sorted(attributes) for name, attributes in self.consumers.items()}
+        }
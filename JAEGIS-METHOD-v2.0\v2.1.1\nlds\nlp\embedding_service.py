@@ -0,0 +1,602 @@
+"""
+N.L.D.S. Embedding Service
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Batched sentence embedding with a bounded in-memory LRU and a content-hash
+keyed on-disk vector cache that is shared by every worker on the host.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Any, Callable, Sequence
+
+import numpy as np
+
+from ..optimization.micro_batcher import AsyncMicroBatcher
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# VECTOR HELPERS
+# ============================================================================
+
+def content_digest(text: str) -> bytes:
+    """Stable 16-byte content hash of a text, identical in every process."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row; all-zero rows are left as zeros."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores along the last axis, best first.
+    
+    Uses argpartition, so only the k selected scores are sorted.
+    """
+    n = scores.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.zeros(scores.shape[:-1] + (0,), dtype=np.intp)
+    
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n), scores.shape).copy()
+    
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+# ============================================================================
+# DISK VECTOR CACHE
+# ============================================================================
+
+class DiskVectorCache:
+    """
+    Fixed-size open-addressing hash table of vectors in memory-mapped files.
+    
+    Slots are addressed by content digest, so any process mapping the same
+    files sees vectors written by the others. Writes take an exclusive file
+    lock. When every probe slot is taken, the home slot is overwritten.
+    
+    Reads take no lock. Each slot has a sequence number that a writer makes
+    odd while it rewrites the slot and even again when done (a seqlock). A
+    read that sees an odd number, or a different number after copying the
+    vector, overlapped a write and is treated as a miss.
+    """
+    
+    MAX_PROBES = 8
+    
+    def __init__(self, cache_dir: str, name: str, dimension: int, capacity: int = 100000):
+        """
+        Initialize the disk cache, creating the files when they do not exist.
+        
+        Args:
+            cache_dir: Directory holding the cache files
+            name: Cache name (usually the model name)
+            dimension: Vector dimension
+            capacity: Number of slots
+        """
+        self.dimension = dimension
+        self.capacity = capacity
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        base_path = os.path.join(cache_dir, f"{slug}-{dimension}d-{capacity}")
+        self.path = base_path
+        
+        self._lock_file = open(f"{base_path}.lock", "a+b")
+        self._thread_lock = threading.Lock()
+        
+        with self._write_lock():
+            self.keys = self._open_memmap(f"{base_path}.keys", np.uint8, (capacity, 16))
+            self.vectors = self._open_memmap(f"{base_path}.vectors", np.float32, (capacity, dimension))
+            self.sequences = self._open_memmap(f"{base_path}.seq", np.uint64, (capacity,))
+    
+    @staticmethod
+    def _open_memmap(path: str, dtype, shape: Tuple[int, ...]) -> np.memmap:
+        mode = "r+" if os.path.exists(path) else "w+"
+        return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+    
+    def _write_lock(self):
+        return _FileLock(self._lock_file, self._thread_lock)
+    
+    def _probe(self, digest: bytes):
+        home = int.from_bytes(digest[:8], "little") % self.capacity
+        for offset in range(self.MAX_PROBES):
+            yield (home + offset) % self.capacity
+    
+    def get(self, digest: bytes) -> Optional[np.ndarray]:
+        """Vector stored under digest, or None (also when a concurrent write got in the way)."""
+        for slot in self._probe(digest):
+            sequence = int(self.sequences[slot])
+            if sequence & 1:
+                return None
+            
+            key = self.keys[slot].tobytes()
+            if key == digest:
+                vector = np.array(self.vectors[slot])
+                if int(self.sequences[slot]) != sequence:
+                    return None
+                return vector
+            if not any(key):
+                return None
+        return None
+    
+    def put_many(self, digests: Sequence[bytes], vectors: np.ndarray):
+        """Store vectors under their digests in one locked pass."""
+        with self._write_lock():
+            for digest, vector in zip(digests, vectors):
+                slot = self._find_slot(digest)
+                self.sequences[slot] += 1
+                self.keys[slot] = np.frombuffer(digest, dtype=np.uint8)
+                self.vectors[slot] = vector
+                self.sequences[slot] += 1
+    
+    def _find_slot(self, digest: bytes) -> int:
+        home = None
+        for slot in self._probe(digest):
+            if home is None:
+                home = slot
+            key = self.keys[slot].tobytes()
+            if key == digest or not any(key):
+                return slot
+        return home
+    
+    def flush(self):
+        """Flush the maps to disk."""
+        self.keys.flush()
+        self.vectors.flush()
+        self.sequences.flush()
+    
+    def close(self):
+        """Flush and release the cache files."""
+        self.flush()
+        self._lock_file.close()
+
+
+class _FileLock:
+    """Exclusive flock on the cache lock file, plus a thread lock for this process."""
+    
+    def __init__(self, lock_file, thread_lock: threading.Lock):
+        self.lock_file = lock_file
+        self.thread_lock = thread_lock
+    
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if fcntl is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if fcntl is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+        self.thread_lock.release()
+
+
+# ============================================================================
+# EMBEDDING SERVICE
+# ============================================================================
+
+class EmbeddingService:
+    """
+    Batched embedding front-end for a sentence encoder.
+    
+    Features:
+    - Concurrent async requests are micro-batched into one encode call
+    - Duplicate texts in a batch are encoded once
+    - Bounded in-memory LRU keyed by content hash
+    - Optional on-disk memmap cache shared across worker processes
+    - Pairwise similarity as one normalized matrix product
+    """
+    
+    def __init__(self, encode_batch: Callable[[List[str]], np.ndarray], model_name: str,
+                 dimension: Optional[int] = None, cache_size: int = 10000,
+                 cache_dir: Optional[str] = None, disk_capacity: int = 100000,
+                 max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        """
+        Initialize embedding service.
+        
+        Args:
+            encode_batch: Callable mapping a list of texts to an (n, d) array
+            model_name: Model name, used to name the disk cache
+            dimension: Embedding dimension; inferred from the first batch when None
+            cache_size: Maximum vectors kept in memory
+            cache_dir: Directory for the shared disk cache; disabled when None
+            disk_capacity: Number of slots in the disk cache
+            max_batch_size: Maximum texts per encode call
+            max_wait_ms: How long an async request waits for others to join its batch
+        """
+        self.encode_batch = encode_batch
+        self.model_name = model_name
+        self.dimension = dimension
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.disk_capacity = disk_capacity
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[DiskVectorCache] = None
+        
+        # Async micro-batching state
+        self._batcher = AsyncMicroBatcher(
+            self._embed_async_batch, max_batch_size, max_wait_ms, thread_name_prefix="embedding"
+        )
+        
+        self.statistics = {
+            "requests": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "encoded_texts": 0,
+            "encode_calls": 0,
+            "async_batches": 0
+        }
+        
+        if dimension is not None:
+            self._open_disk_cache(dimension)
+    
+    def _open_disk_cache(self, dimension: int):
+        self.dimension = dimension
+        if self.cache_dir is None or self._disk is not None:
+            return
+        try:
+            self._disk = DiskVectorCache(self.cache_dir, self.model_name, dimension, self.disk_capacity)
+            logger.info(f"Opened embedding disk cache at {self._disk.path}")
+        except OSError as e:
+            logger.warning(f"Embedding disk cache unavailable, using memory only: {e}")
+            self.cache_dir = None
+    
+    # ------------------------------------------------------------------------
+    # Synchronous API
+    # ------------------------------------------------------------------------
+    
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts, encoding only those not already cached.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            (len(texts), dimension) float32 array
+        """
+        texts = list(texts)
+        digests = [content_digest(text) for text in texts]
+        vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+        missing: Dict[bytes, List[int]] = {}
+        
+        with self._lock:
+            self.statistics["requests"] += len(texts)
+            for index, digest in enumerate(digests):
+                vector = self._memory.get(digest)
+                if vector is not None:
+                    self._memory.move_to_end(digest)
+                    vectors[index] = vector
+                    self.statistics["memory_hits"] += 1
+                else:
+                    missing.setdefault(digest, []).append(index)
+        
+        if missing and self._disk is not None:
+            found = {}
+            for digest in missing:
+                vector = self._disk.get(digest)
+                if vector is not None:
+                    found[digest] = vector
+            if found:
+                self._store(found)
+                self.statistics["disk_hits"] += len(found)
+                for digest, vector in found.items():
+                    for index in missing.pop(digest):
+                        vectors[index] = vector
+        
+        if missing:
+            pending = list(missing)
+            encoded = self._encode([texts[missing[digest][0]] for digest in pending])
+            if self._disk is not None:
+                self._disk.put_many(pending, encoded)
+            self._store(dict(zip(pending, encoded)))
+            for digest, vector in zip(pending, encoded):
+                for index in missing[digest]:
+                    vectors[index] = vector
+        
+        if not vectors:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+        return np.stack(vectors)
+    
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text."""
+        return self.embed_many([text])[0]
+    
+    def similarity_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity between every pair of texts.
+        
+        Args:
+            texts: Texts to compare
+        
+        Returns:
+            (n, n) float32 similarity matrix
+        """
+        normalized = normalize_rows(self.embed_many(texts))
+        return normalized @ normalized.T
+    
+    def similarity(self, text1: str, text2: str) -> float:
+        """Cosine similarity between two texts."""
+        return float(self.similarity_matrix([text1, text2])[0, 1])
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        chunks = []
+        for start in range(0, len(texts), self.max_batch_size):
+            batch = texts[start:start + self.max_batch_size]
+            encoded = np.asarray(self.encode_batch(batch), dtype=np.float32).reshape(len(batch), -1)
+            chunks.append(encoded)
+            self.statistics["encode_calls"] += 1
+        
+        encoded = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        self.statistics["encoded_texts"] += len(texts)
+        
+        if self._disk is None:
+            self._open_disk_cache(encoded.shape[1])
+        
+        return encoded
+    
+    def _store(self, vectors: Dict[bytes, np.ndarray]):
+        with self._lock:
+            for digest, vector in vectors.items():
+                # Copy so cached rows do not pin the whole batch array
+                self._memory[digest] = np.array(vector, dtype=np.float32)
+                self._memory.move_to_end(digest)
+            while len(self._memory) > self.cache_size:
+                self._memory.popitem(last=False)
+    
+    # ------------------------------------------------------------------------
+    # Async micro-batching API
+    # ------------------------------------------------------------------------
+    
+    async def aembed(self, text: str) -> np.ndarray:
+        """
+        Embed a text, batching it with other requests made within max_wait_ms.
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            Embedding vector
+        """
+        digest = content_digest(text)
+        with self._lock:
+            vector = self._memory.get(digest)
+            if vector is not None:
+                self._memory.move_to_end(digest)
+                self.statistics["requests"] += 1
+                self.statistics["memory_hits"] += 1
+                return vector
+        
+        return await self._batcher.submit(text)
+    
+    async def aembed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts without blocking the event loop."""
+        return await self._batcher.run(self.embed_many, list(texts))
+    
+    def _embed_async_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of queued async requests on the batch worker thread."""
+        self.statistics["async_batches"] += 1
+        return self.embed_many(texts)
+    
+    # ------------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------------
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache and batching statistics."""
+        requests = self.statistics["requests"]
+        hits = self.statistics["memory_hits"] + self.statistics["disk_hits"]
+        return {
+            **self.statistics,
+            "hit_rate": hits / requests if requests else 0.0,
+            "memory_entries": len(self._memory),
+            "cache_size": self.cache_size,
+            "disk_cache": self._disk.path if self._disk is not None else None,
+            "dimension": self.dimension
+        }
+    
+    def close(self):
+        """Flush the disk cache and stop the encoder thread."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+        self._batcher.close()
+
+
+# ============================================================================
+# CONCEPT INDEX
+# ============================================================================
+
+class ConceptIndex:
+    """
+    Pre-normalized concept embeddings for fast text-to-concept scoring.
+    
+    All concepts are stacked into one float32 matrix with unit-length rows;
+    each category is a contiguous block of rows. Scoring texts against every
+    concept is one matrix product, and top-k selection uses argpartition.
+    """
+    
+    def __init__(self, concepts: Dict[str, List[str]], matrix: np.ndarray):
+        """
+        Initialize concept index.
+        
+        Args:
+            concepts: Concept texts per category, in row order
+            matrix: (total concepts, d) embeddings; normalized here
+        """
+        self.concepts = {category: list(texts) for category, texts in concepts.items()}
+        self.matrix = normalize_rows(matrix)
+        
+        self.labels: List[Tuple[str, str]] = []
+        self.category_slices: Dict[str, slice] = {}
+        for category, texts in self.concepts.items():
+            start = len(self.labels)
+            self.labels.extend((category, text) for text in texts)
+            self.category_slices[category] = slice(start, len(self.labels))
+        
+        if self.matrix.shape[0] != len(self.labels):
+            raise ValueError(
+                f"Concept matrix has {self.matrix.shape[0]} rows for {len(self.labels)} concepts"
+            )
+    
+    @property
+    def dimension(self) -> int:
+        return self.matrix.shape[1]
+    
+    def category_matrix(self, category: str) -> np.ndarray:
+        """Normalized (n, d) embedding matrix of one category (a view, not a copy)."""
+        return self.matrix[self.category_slices[category]]
+    
+    def score(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of each vector against every concept.
+        
+        Args:
+            vectors: (m, d) or (d,) embeddings
+            
+        Returns:
+            (m, total concepts) similarity matrix
+        """
+        return normalize_rows(np.atleast_2d(vectors)) @ self.matrix.T
+    
+    def rank(self, vectors: np.ndarray, top_k: int = 5,
+             full_categories: Sequence[str] = ("domains",)) -> List[Dict[str, Any]]:
+        """
+        Score each vector and summarize its best-matching concepts.
+        
+        Args:
+            vectors: (m, d) or (d,) embeddings
+            top_k: Concepts kept per category and overall
+            full_categories: Categories whose every concept score is returned
+            
+        Returns:
+            Per vector: "top_concepts" (best overall, with category and score),
+            "category_scores" (top-k per category) and "full_scores" (every
+            concept of full_categories)
+        """
+        scores = self.score(vectors)
+        overall = top_k_indices(scores, top_k)
+        per_category = {
+            category: top_k_indices(scores[:, rows], top_k) + rows.start
+            for category, rows in self.category_slices.items()
+        }
+        
+        results = []
+        for row, row_scores in enumerate(scores):
+            result = {
+                "top_concepts": [
+                    {
+                        "text": self.labels[index][1],
+                        "category": self.labels[index][0],
+                        "score": float(row_scores[index])
+                    }
+                    for index in overall[row]
+                ],
+                "category_scores": {
+                    category: {self.labels[index][1]: float(row_scores[index]) for index in indices[row]}
+                    for category, indices in per_category.items()
+                },
+                "full_scores": {}
+            }
+            
+            for category in full_categories:
+                rows = self.category_slices.get(category)
+                if rows is not None:
+                    result["full_scores"][category] = dict(
+                        zip(self.concepts[category], row_scores[rows].tolist())
+                    )
+            
+            results.append(result)
+        
+        return results
+    
+    # ------------------------------------------------------------------------
+    # Building and persistence
+    # ------------------------------------------------------------------------
+    
+    @classmethod
+    def build(cls, concepts: Dict[str, List[str]], embedding_service: EmbeddingService,
+              cache_dir: Optional[str] = None) -> "ConceptIndex":
+        """
+        Load the index from cache_dir, or embed every concept in one batch.
+        
+        Args:
+            concepts: Concept texts per category
+            embedding_service: Service used when no persisted index matches
+            cache_dir: Directory holding persisted indexes; disabled when None
+            
+        Returns:
+            Concept index
+        """
+        path = None
+        if cache_dir is not None:
+            path = os.path.join(cache_dir, cls.cache_filename(embedding_service.model_name, concepts))
+            index = cls.load(path, concepts)
+            if index is not None:
+                logger.info(f"Loaded concept index from {path}")
+                return index
+        
+        texts = [text for category_texts in concepts.values() for text in category_texts]
+        index = cls(concepts, embedding_service.embed_many(texts))
+        
+        if path is not None:
+            try:
+                index.save(path)
+            except OSError as e:
+                logger.warning(f"Failed to persist concept index: {e}")
+        
+        return index
+    
+    @staticmethod
+    def cache_filename(model_name: str, concepts: Dict[str, List[str]]) -> str:
+        """File name keyed by model and concept lists, so edits invalidate it."""
+        fingerprint = hashlib.blake2b(
+            json.dumps({"model": model_name, "concepts": concepts}, sort_keys=True).encode("utf-8"),
+            digest_size=8
+        ).hexdigest()
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        return f"concepts-{slug}-{fingerprint}.npy"
+    
+    def save(self, path: str):
+        """Atomically write the normalized matrix as a .npy file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as handle:
+            np.save(handle, self.matrix)
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def load(cls, path: str, concepts: Dict[str, List[str]]) -> Optional["ConceptIndex"]:
+        """Index stored at path, or None when it is missing or does not match concepts."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(concepts, np.load(path))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable concept index {path}: {e}")
+            return None
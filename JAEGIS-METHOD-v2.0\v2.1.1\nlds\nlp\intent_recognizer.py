@@ -7,12 +7,13 @@ JAEGIS-specific intent categories, and contextual understanding.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Tuple, Any, Union, Sequence
 from dataclasses import dataclass
 from enum import Enum
 import logging
 import json
 import pickle
+import time
 from datetime import datetime
 import asyncio
 
@@ -29,6 +30,7 @@ import joblib
 # Local imports
 from .tokenizer import TokenizationResult
 from .semantic_analyzer import SemanticAnalysisResult
+from ..optimization.micro_batcher import AsyncMicroBatcher
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -137,14 +139,35 @@ class IntentRecognitionEngine:
     - Confidence scoring
     - Intent hierarchy and relationships
     - Real-time learning and adaptation
+    - Vectorized batch recognition with async micro-batching
     """
     
-    def __init__(self, model_path: Optional[str] = None):
+    FEATURE_SIZE = 100
+    
+    # Ensemble weights of the classifiers
+    ENSEMBLE_WEIGHTS = {
+        "neural_net": 0.4,
+        "random_forest": 0.3,
+        "logistic_regression": 0.3
+    }
+    
+    QUESTION_WORDS = ('what', 'how', 'why', 'when', 'where', 'who', 'which')
+    ACTION_VERBS = ('create', 'make', 'do', 'run', 'execute', 'build')
+    URGENCY_WORDS = ('urgent', 'asap', 'immediately', 'quickly', 'now')
+    COMMAND_INDICATORS = ('/jaegis', '/mode', '/squad', '/nlds')
+    
+    # Token type distribution columns of the token features
+    TOKEN_TYPE_COLUMNS = ('word', 'jaegis_entity', 'jaegis_command', 'number', 'punctuation')
+    
+    def __init__(self, model_path: Optional[str] = None,
+                 max_batch_size: int = 64, max_wait_ms: float = 2.0):
         """
         Initialize intent recognition engine.
         
         Args:
             model_path: Path to pre-trained model
+            max_batch_size: Maximum texts per batch of the async front end
+            max_wait_ms: How long an async request waits for others to join its batch
         """
         self.models = {}
         self.feature_extractors = {}
@@ -152,6 +175,23 @@ class IntentRecognitionEngine:
         self.jaegis_mappings = self._load_jaegis_mappings()
         self.context_weights = self._load_context_weights()
         
+        # Column of each intent in probability matrices
+        self.intent_list = list(IntentCategory)
+        self.intent_columns = {intent.value: i for i, intent in enumerate(self.intent_list)}
+        
+        # Async micro-batching state
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._batcher = AsyncMicroBatcher(
+            self._recognize_async_batch, max_batch_size, max_wait_ms, thread_name_prefix="intent"
+        )
+        
+        self.batch_statistics = {
+            "batches": 0,
+            "batched_texts": 0,
+            "async_batches": 0
+        }
+        
         # Initialize models
         self._initialize_models()
         
@@ -280,6 +320,8 @@ class IntentRecognitionEngine:
             hidden_size=64,
             num_classes=len(IntentCategory)
         )
+        # Inference only; disables dropout so predictions are deterministic
+        self.models["neural_net"].eval()
         
         # Random Forest Model
         self.models["random_forest"] = RandomForestClassifier(
@@ -328,7 +370,7 @@ class IntentRecognitionEngine:
         features.extend(self._extract_jaegis_features(text, tokenization_result))
         
         # Pad or truncate to fixed size
-        target_size = 100
+        target_size = self.FEATURE_SIZE
         if len(features) < target_size:
             features.extend([0.0] * (target_size - len(features)))
         else:
@@ -347,16 +389,13 @@ class IntentRecognitionEngine:
         features.append(len([c for c in text if c in '!?']))
         
         # Question indicators
-        question_words = ['what', 'how', 'why', 'when', 'where', 'who', 'which']
-        features.append(sum(1 for word in question_words if word in text.lower()))
+        features.append(sum(1 for word in self.QUESTION_WORDS if word in text.lower()))
         
         # Action indicators
-        action_verbs = ['create', 'make', 'do', 'run', 'execute', 'build']
-        features.append(sum(1 for verb in action_verbs if verb in text.lower()))
+        features.append(sum(1 for verb in self.ACTION_VERBS if verb in text.lower()))
         
         # Urgency indicators
-        urgency_words = ['urgent', 'asap', 'immediately', 'quickly', 'now']
-        features.append(sum(1 for word in urgency_words if word in text.lower()))
+        features.append(sum(1 for word in self.URGENCY_WORDS if word in text.lower()))
         
         return features
     
@@ -465,12 +504,158 @@ class IntentRecognitionEngine:
         features.append(min(task_count / 3, 1.0))
         
         # Command indicators
-        command_indicators = ['/jaegis', '/mode', '/squad', '/nlds']
-        command_score = sum(1 for indicator in command_indicators if indicator in text_lower)
-        features.append(min(command_score / len(command_indicators), 1.0))
+        command_score = sum(1 for indicator in self.COMMAND_INDICATORS if indicator in text_lower)
+        features.append(min(command_score / len(self.COMMAND_INDICATORS), 1.0))
         
         return features
     
+    # ------------------------------------------------------------------------
+    # Batch feature extraction
+    # ------------------------------------------------------------------------
+    
+    def extract_features_batch(self, texts: Sequence[str],
+                               tokenization_results: Sequence[TokenizationResult],
+                               semantic_results: Sequence[SemanticAnalysisResult]) -> np.ndarray:
+        """
+        Extract the feature matrix for many texts at once.
+        
+        Row i equals extract_features(texts[i], ...); every extractor works
+        on whole columns instead of building Python lists per text.
+        
+        Args:
+            texts: Input texts
+            tokenization_results: Tokenization result of each text
+            semantic_results: Semantic analysis result of each text
+            
+        Returns:
+            Feature matrix of shape (len(texts), FEATURE_SIZE)
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, self.FEATURE_SIZE), dtype=np.float32)
+        
+        lowered = np.array([text.lower() for text in texts], dtype=np.str_)
+        
+        blocks = [
+            self._text_feature_block(texts, lowered),
+            self._token_feature_block(tokenization_results),
+            self._semantic_feature_block(semantic_results),
+            self._pattern_feature_block(lowered),
+            self._jaegis_feature_block(lowered, tokenization_results)
+        ]
+        
+        matrix = np.zeros((len(texts), self.FEATURE_SIZE), dtype=np.float32)
+        column = 0
+        for block in blocks:
+            width = min(block.shape[1], self.FEATURE_SIZE - column)
+            matrix[:, column:column + width] = block[:, :width]
+            column += width
+        
+        return matrix
+    
+    @staticmethod
+    def _keyword_hits(lowered: np.ndarray, keywords: Sequence[str]) -> np.ndarray:
+        """Number of keywords contained in each lowercased text."""
+        hits = np.zeros(len(lowered), dtype=np.float64)
+        for keyword in keywords:
+            hits += np.char.find(lowered, keyword) >= 0
+        return hits
+    
+    def _text_feature_block(self, texts: List[str], lowered: np.ndarray) -> np.ndarray:
+        """Columns of _extract_text_features."""
+        originals = np.array(texts, dtype=np.str_)
+        return np.column_stack([
+            np.char.str_len(originals),
+            [len(text.split()) for text in texts],
+            [sum(map(str.isupper, text)) for text in texts],
+            np.char.count(originals, '!') + np.char.count(originals, '?'),
+            self._keyword_hits(lowered, self.QUESTION_WORDS),
+            self._keyword_hits(lowered, self.ACTION_VERBS),
+            self._keyword_hits(lowered, self.URGENCY_WORDS)
+        ]).astype(np.float64)
+    
+    def _token_feature_block(self, tokenization_results: Sequence[TokenizationResult]) -> np.ndarray:
+        """Columns of _extract_token_features, from one flat array of all tokens."""
+        count = len(tokenization_results)
+        block = np.zeros((count, 10), dtype=np.float64)
+        
+        token_counts = np.array([len(result.tokens) for result in tokenization_results], dtype=np.int64)
+        has_tokens = token_counts > 0
+        if not has_tokens.any():
+            return block
+        
+        type_codes = {value: i for i, value in enumerate(self.TOKEN_TYPE_COLUMNS)}
+        tokens = [token for result in tokenization_results for token in result.tokens]
+        owners = np.repeat(np.arange(count), token_counts)
+        codes = np.array([type_codes.get(token.token_type.value, -1) for token in tokens], dtype=np.int64)
+        lengths = np.array([len(token.text) for token in tokens], dtype=np.float64)
+        
+        # Token type distribution
+        typed = codes >= 0
+        type_counts = np.bincount(
+            owners[typed] * len(self.TOKEN_TYPE_COLUMNS) + codes[typed],
+            minlength=count * len(self.TOKEN_TYPE_COLUMNS)
+        ).reshape(count, len(self.TOKEN_TYPE_COLUMNS))
+        divisor = np.maximum(token_counts, 1)[:, None]
+        block[:, 0:5] = type_counts / divisor
+        
+        # Average token length
+        block[:, 5] = np.bincount(owners, weights=lengths, minlength=count) / divisor[:, 0]
+        
+        block[:, 6:10] = [
+            [
+                result.metadata.get('language_confidence', 0.5),
+                result.metadata.get('special_tokens_count', 0),
+                min(result.processing_time_ms / 1000, 1.0),
+                min(result.token_count / 100, 1.0)
+            ]
+            for result in tokenization_results
+        ]
+        
+        block[~has_tokens] = 0.0
+        return block
+    
+    def _semantic_feature_block(self, semantic_results: Sequence[SemanticAnalysisResult]) -> np.ndarray:
+        """Columns of _extract_semantic_features."""
+        return np.array(
+            [self._extract_semantic_features(result) for result in semantic_results],
+            dtype=np.float64
+        ).reshape(len(semantic_results), -1)
+    
+    def _pattern_feature_block(self, lowered: np.ndarray) -> np.ndarray:
+        """Columns of _extract_pattern_features."""
+        columns = [
+            np.minimum(self._keyword_hits(lowered, patterns) / len(patterns), 1.0)
+            for patterns in self.intent_patterns.values()
+        ][:15]
+        if not columns:
+            return np.zeros((len(lowered), 0), dtype=np.float64)
+        return np.column_stack(columns)
+    
+    def _jaegis_feature_block(self, lowered: np.ndarray,
+                              tokenization_results: Sequence[TokenizationResult]) -> np.ndarray:
+        """Columns of _extract_jaegis_features."""
+        count = len(tokenization_results)
+        token_counts = np.array([len(result.tokens) for result in tokenization_results], dtype=np.int64)
+        owners = np.repeat(np.arange(count), token_counts)
+        token_texts = np.array(
+            [token.text.lower() for result in tokenization_results for token in result.tokens],
+            dtype=np.str_
+        )
+        
+        def token_mentions(word: str) -> np.ndarray:
+            if not len(token_texts):
+                return np.zeros(count, dtype=np.float64)
+            return np.bincount(owners, weights=(np.char.find(token_texts, word) >= 0).astype(np.float64), minlength=count)
+        
+        return np.column_stack([
+            np.minimum(token_mentions('squad') / 5, 1.0),
+            np.minimum(token_mentions('mode') / 3, 1.0),
+            np.minimum(np.char.count(lowered, 'agent') / 3, 1.0),
+            np.minimum(np.char.count(lowered, 'task') / 3, 1.0),
+            np.minimum(self._keyword_hits(lowered, self.COMMAND_INDICATORS) / len(self.COMMAND_INDICATORS), 1.0)
+        ])
+    
     def predict_intent(self, features: np.ndarray, 
                       use_ensemble: bool = True) -> IntentPrediction:
         """
@@ -581,13 +766,12 @@ class IntentRecognitionEngine:
         model = self.models[model_name]
         
         try:
-            probabilities = model.predict_proba(features.reshape(1, -1))[0]
+            probabilities = self._sklearn_probabilities(features.reshape(1, -1), model_name)[0]
             predicted_class = model.predict(features.reshape(1, -1))[0]
             
             # Map to intent categories
-            intent_list = list(IntentCategory)
             prob_dict = {intent.value: float(probabilities[i]) 
-                        for i, intent in enumerate(intent_list)}
+                        for i, intent in enumerate(self.intent_list)}
             
             best_intent = IntentCategory(predicted_class)
             confidence = float(max(probabilities))
@@ -647,6 +831,118 @@ class IntentRecognitionEngine:
         else:
             return IntentConfidence.VERY_LOW
     
+    # ------------------------------------------------------------------------
+    # Batch prediction
+    # ------------------------------------------------------------------------
+    
+    def predict_intents_batch(self, features: np.ndarray) -> List[IntentPrediction]:
+        """
+        Ensemble prediction for a feature matrix.
+        
+        Each model runs once for the whole batch (one forward pass, one
+        predict_proba per scikit-learn model) and the weighted average is
+        taken over the stacked probability matrices.
+        
+        Args:
+            features: Feature matrix of shape (n, FEATURE_SIZE)
+            
+        Returns:
+            Intent prediction of each row
+        """
+        features = np.asarray(features, dtype=np.float32).reshape(-1, self.FEATURE_SIZE)
+        if not len(features):
+            return []
+        
+        probabilities = []
+        weights = []
+        models_used = []
+        
+        if "neural_net" in self.models:
+            probabilities.append(self._neural_net_probabilities(features))
+            weights.append(self.ENSEMBLE_WEIGHTS["neural_net"])
+            models_used.append("neural_net")
+        
+        for model_name in ("random_forest", "logistic_regression"):
+            if model_name in self.models and hasattr(self.models[model_name], 'predict_proba'):
+                try:
+                    probabilities.append(self._sklearn_probabilities(features, model_name))
+                except Exception as e:
+                    # Same substitution as _sklearn_predict, once for the batch
+                    logger.warning(f"Sklearn prediction failed: {e}")
+                    probabilities.append(self._pattern_based_probabilities(features))
+                weights.append(self.ENSEMBLE_WEIGHTS[model_name])
+                models_used.append(model_name)
+        
+        if not probabilities:
+            return self._predictions_from_probabilities(
+                self._pattern_based_probabilities(features),
+                {"model": "pattern_based"},
+                "pattern_fallback"
+            )
+        
+        weights = np.asarray(weights, dtype=np.float64)
+        combined = np.tensordot(weights / weights.sum(), np.stack(probabilities), axes=1)
+        
+        return self._predictions_from_probabilities(
+            combined,
+            {"ensemble": True, "models_used": models_used},
+            "ensemble"
+        )
+    
+    def _neural_net_probabilities(self, features: np.ndarray) -> np.ndarray:
+        """Softmax output of the neural network for a feature matrix."""
+        model = self.models["neural_net"]
+        
+        with torch.no_grad():
+            outputs = model(torch.from_numpy(np.ascontiguousarray(features, dtype=np.float32)))
+            return F.softmax(outputs, dim=1).numpy().astype(np.float64)
+    
+    def _sklearn_probabilities(self, features: np.ndarray, model_name: str) -> np.ndarray:
+        """Class probabilities of a scikit-learn model, in IntentCategory column order."""
+        model = self.models[model_name]
+        
+        class_probabilities = model.predict_proba(features)
+        columns = [self.intent_columns[IntentCategory(label).value] for label in model.classes_]
+        
+        probabilities = np.zeros((len(features), len(self.intent_list)), dtype=np.float64)
+        probabilities[:, columns] = class_probabilities
+        return probabilities
+    
+    def _pattern_based_probabilities(self, features: np.ndarray) -> np.ndarray:
+        """Probability rows of _pattern_based_predict for a feature matrix."""
+        conditions = [features[:, 4] > 0.5, features[:, 5] > 0.5, features[:, 6] > 0.5]
+        intents = np.select(conditions, [
+            self.intent_columns[IntentCategory.QUESTION.value],
+            self.intent_columns[IntentCategory.EXECUTE.value],
+            self.intent_columns[IntentCategory.HELP.value]
+        ], self.intent_columns[IntentCategory.UNKNOWN.value])
+        confidences = np.select(conditions, [0.7, 0.6, 0.6], 0.3)
+        
+        probabilities = np.full((len(features), len(self.intent_list)), 0.1, dtype=np.float64)
+        probabilities[np.arange(len(features)), intents] = confidences
+        return probabilities
+    
+    def _predictions_from_probabilities(self, probabilities: np.ndarray,
+                                        features: Dict[str, Any],
+                                        method: str) -> List[IntentPrediction]:
+        """Build one IntentPrediction per probability row."""
+        best = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(probabilities)), best]
+        intent_values = [intent.value for intent in self.intent_list]
+        
+        predictions = []
+        for row, index, confidence in zip(probabilities.tolist(), best.tolist(), confidences.tolist()):
+            predictions.append(IntentPrediction(
+                intent=self.intent_list[index],
+                confidence=confidence,
+                confidence_level=self._get_confidence_level(confidence),
+                probability_distribution=dict(zip(intent_values, row)),
+                features=dict(features),
+                metadata={"prediction_method": method}
+            ))
+        
+        return predictions
+    
     async def recognize_intent(self, text: str,
                              tokenization_result: TokenizationResult,
                              semantic_result: SemanticAnalysisResult,
@@ -663,7 +959,6 @@ class IntentRecognitionEngine:
         Returns:
             Complete intent recognition result
         """
-        import time
         start_time = time.time()
         
         try:
@@ -700,26 +995,124 @@ class IntentRecognitionEngine:
             
         except Exception as e:
             logger.error(f"Intent recognition failed: {e}")
+            return self._fallback_result(text, e, start_time)
+    
+    def _fallback_result(self, text: str, error: Exception,
+                         start_time: float) -> IntentRecognitionResult:
+        """Result returned when recognition fails."""
+        fallback_intent = IntentPrediction(
+            intent=IntentCategory.UNKNOWN,
+            confidence=0.0,
+            confidence_level=IntentConfidence.VERY_LOW,
+            probability_distribution={i.value: 0.0 for i in IntentCategory},
+            features={},
+            metadata={"error": str(error)}
+        )
+        
+        return IntentRecognitionResult(
+            text=text,
+            primary_intent=fallback_intent,
+            alternative_intents=[],
+            context_factors={},
+            jaegis_mapping={},
+            processing_time_ms=(time.time() - start_time) * 1000,
+            metadata={"error": str(error)}
+        )
+    
+    def recognize_intents_batch(self, texts: Sequence[str],
+                                tokenization_results: Sequence[TokenizationResult],
+                                semantic_results: Sequence[SemanticAnalysisResult],
+                                contexts: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+                                ) -> List[IntentRecognitionResult]:
+        """
+        Perform intent recognition for many texts with one pass per model.
+        
+        Args:
+            texts: Input texts
+            tokenization_results: Tokenization result of each text
+            semantic_results: Semantic analysis result of each text
+            contexts: Optional context of each text
             
-            # Return fallback result
-            fallback_intent = IntentPrediction(
-                intent=IntentCategory.UNKNOWN,
-                confidence=0.0,
-                confidence_level=IntentConfidence.VERY_LOW,
-                probability_distribution={i.value: 0.0 for i in IntentCategory},
-                features={},
-                metadata={"error": str(e)}
-            )
+        Returns:
+            Intent recognition result of each text, in input order
+        """
+        start_time = time.time()
+        texts = list(texts)
+        if contexts is None:
+            contexts = [None] * len(texts)
+        
+        if not (len(texts) == len(tokenization_results) == len(semantic_results) == len(contexts)):
+            raise ValueError("texts, tokenization_results, semantic_results and contexts must have the same length")
+        
+        if not texts:
+            return []
+        
+        try:
+            features = self.extract_features_batch(texts, tokenization_results, semantic_results)
+            predictions = self.predict_intents_batch(features)
             
-            return IntentRecognitionResult(
-                text=text,
-                primary_intent=fallback_intent,
-                alternative_intents=[],
-                context_factors={},
-                jaegis_mapping={},
-                processing_time_ms=(time.time() - start_time) * 1000,
-                metadata={"error": str(e)}
-            )
+            self.batch_statistics["batches"] += 1
+            self.batch_statistics["batched_texts"] += len(texts)
+            
+            results = []
+            processing_time = (time.time() - start_time) * 1000
+            timestamp = datetime.utcnow().isoformat()
+            
+            for text, row, primary_intent, context in zip(texts, features, predictions, contexts):
+                context_factors = self._analyze_context_factors(text, context)
+                results.append(IntentRecognitionResult(
+                    text=text,
+                    primary_intent=primary_intent,
+                    alternative_intents=self._generate_alternatives(row, primary_intent),
+                    context_factors=context_factors,
+                    jaegis_mapping=self._generate_jaegis_mapping(primary_intent, context_factors),
+                    processing_time_ms=processing_time,
+                    metadata={
+                        "feature_vector_size": len(row),
+                        "timestamp": timestamp,
+                        "context_provided": context is not None,
+                        "batch_size": len(texts)
+                    }
+                ))
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batch intent recognition failed: {e}")
+            return [self._fallback_result(text, e, start_time) for text in texts]
+    
+    # ------------------------------------------------------------------------
+    # Async micro-batching API
+    # ------------------------------------------------------------------------
+    
+    async def arecognize_intent(self, text: str,
+                                tokenization_result: TokenizationResult,
+                                semantic_result: SemanticAnalysisResult,
+                                context: Optional[Dict[str, Any]] = None) -> IntentRecognitionResult:
+        """
+        Recognize intent, batching the request with others made within max_wait_ms.
+        
+        Args:
+            text: Input text
+            tokenization_result: Tokenization results
+            semantic_result: Semantic analysis results
+            context: Optional context information
+            
+        Returns:
+            Complete intent recognition result
+        """
+        return await self._batcher.submit((text, tokenization_result, semantic_result, context))
+    
+    def _recognize_async_batch(self, requests: List[Tuple[str, TokenizationResult, SemanticAnalysisResult,
+                                                          Optional[Dict[str, Any]]]]) -> List[IntentRecognitionResult]:
+        """Recognize a batch of queued async requests on the batch worker thread."""
+        self.batch_statistics["async_batches"] += 1
+        texts, tokenization_results, semantic_results, contexts = (list(column) for column in zip(*requests))
+        return self.recognize_intents_batch(texts, tokenization_results, semantic_results, contexts)
+    
+    def close(self):
+        """Stop the batch worker thread."""
+        self._batcher.close()
     
     def _generate_alternatives(self, features: np.ndarray, 
                              primary_intent: IntentPrediction) -> List[IntentPrediction]:
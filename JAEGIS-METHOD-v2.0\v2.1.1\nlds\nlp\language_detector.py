@@ -7,8 +7,12 @@ support for international JAEGIS deployments.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+import time
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple, Any, Set
+from dataclasses import dataclass, replace
 from enum import Enum
 import logging
 from datetime import datetime
@@ -105,21 +109,69 @@ class LanguageDetector:
     - Statistical analysis with stopwords
     - JAEGIS command language handling
     - Confidence scoring and validation
+    - Cost-ordered cascade with memoized results
+    
+    The cascade runs the cheap stages first (JAEGIS context, script, stopword
+    bitmap) and only calls the model-based detectors while confidence stays
+    below the threshold; when none is confident, their weighted vote decides.
     """
     
-    def __init__(self):
-        """Initialize language detector."""
+    # Stages in cost order, as reported by get_cascade_statistics()
+    CASCADE_STAGES = [
+        "cache", "jaegis_context", "script", "stopwords",
+        "fasttext", "polyglot", "langdetect", "ensemble"
+    ]
+    
+    # Scripts used by exactly one supported language
+    SCRIPT_LANGUAGES = {
+        "cyrillic": "ru",
+        "arabic": "ar",
+        "chinese": "zh",
+        "japanese_hiragana": "ja",
+        "japanese_katakana": "ja",
+        "korean": "ko",
+        "devanagari": "hi"
+    }
+    
+    # Stopword share at which the stopword stage is fully trusted
+    STOPWORD_FULL_COVERAGE = 0.2
+    
+    def __init__(self, confidence_threshold: float = 0.8, cache_size: int = 10000,
+                 cache_prefix_chars: int = 256):
+        """
+        Initialize language detector.
+        
+        Args:
+            confidence_threshold: Stage confidence that ends the cascade
+            cache_size: Memoized detection results
+            cache_prefix_chars: Normalized text prefix length used as cache key
+        """
         self.models = {}
         self.language_families = self._load_language_families()
         self.script_patterns = self._load_script_patterns()
+        self.compiled_script_patterns = {
+            name: re.compile(pattern) for name, pattern in self.script_patterns.items()
+        }
+        self.word_pattern = re.compile(r'\b\w+\b')
+        self.squad_mode_pattern = re.compile(r'\b\w+-squad\b|\bmode-[1-5]\b')
         self.stopwords_cache = {}
         self.jaegis_keywords = self._load_jaegis_keywords()
         
+        self.confidence_threshold = confidence_threshold
+        self.cache_size = cache_size
+        self.cache_prefix_chars = cache_prefix_chars
+        self.detection_cache: "OrderedDict[bytes, LanguageDetectionResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.stage_statistics = {
+            stage: {"calls": 0, "resolved": 0, "time_ms": 0.0} for stage in self.CASCADE_STAGES
+        }
+        
         # Initialize detection models
         self._initialize_models()
         
         # Load stopwords for supported languages
         self._load_stopwords()
+        self._build_stopword_bitmap()
     
     def _load_language_families(self) -> Dict[str, LanguageFamily]:
         """Load language family mappings."""
@@ -219,6 +271,15 @@ class LanguageDetector:
         except Exception as e:
             logger.warning(f"Failed to load stopwords: {e}")
     
+    def _build_stopword_bitmap(self):
+        """Map each stopword to a bitmask of the languages that use it."""
+        self.stopword_languages = list(self.stopwords_cache)
+        self.stopword_bitmap: Dict[str, int] = {}
+        
+        for bit, lang_code in enumerate(self.stopword_languages):
+            for word in self.stopwords_cache[lang_code]:
+                self.stopword_bitmap[word] = self.stopword_bitmap.get(word, 0) | (1 << bit)
+    
     def detect_script(self, text: str) -> Tuple[str, float]:
         """
         Detect script type of text.
@@ -233,14 +294,18 @@ class LanguageDetector:
             return "unknown", 0.0
         
         script_scores = {}
-        total_chars = len([c for c in text if c.isalpha()])
+        total_chars = sum(1 for c in text if c.isalpha())
         
         if total_chars == 0:
             return "unknown", 0.0
         
+        # Every letter of an ASCII text is Latin
+        if text.isascii():
+            return "latin", 1.0
+        
         # Count characters for each script
-        for script_name, pattern in self.script_patterns.items():
-            matches = len(re.findall(pattern, text))
+        for script_name, pattern in self.compiled_script_patterns.items():
+            matches = len(pattern.findall(text))
             script_scores[script_name] = matches / total_chars
         
         # Find dominant script
@@ -340,47 +405,53 @@ class LanguageDetector:
         
         return "unknown", 0.0
     
-    def detect_with_stopwords(self, text: str) -> Tuple[str, float]:
+    def detect_with_stopwords(self, text: str, words: Optional[List[str]] = None) -> Tuple[str, float]:
         """
         Detect language using stopword analysis.
         
         Args:
             text: Input text
+            words: Lower-cased words of text, when already extracted
             
         Returns:
             Tuple of (language, confidence)
         """
-        if not self.stopwords_cache:
+        scores = self._score_stopwords(words if words is not None else self.word_pattern.findall(text.lower()))
+        if not scores:
             return "unknown", 0.0
         
-        words = re.findall(r'\b\w+\b', text.lower())
-        if len(words) < 5:  # Need minimum words for reliable detection
-            return "unknown", 0.0
-        
-        lang_scores = {}
-        
-        for lang_code, stopwords_set in self.stopwords_cache.items():
-            matches = sum(1 for word in words if word in stopwords_set)
-            lang_scores[lang_code] = matches / len(words)
-        
-        if lang_scores:
-            best_lang = max(lang_scores.items(), key=lambda x: x[1])
-            return best_lang[0], best_lang[1]
-        
-        return "unknown", 0.0
+        return scores[0]
+    
+    def _score_stopwords(self, words: List[str]) -> List[Tuple[str, float]]:
+        """Stopword share per language, best first, from one pass over the bitmap."""
+        if not self.stopword_languages or len(words) < 5:  # Need minimum words for reliable detection
+            return []
+        
+        counts = [0] * len(self.stopword_languages)
+        for mask, count in Counter(self.stopword_bitmap.get(word, 0) for word in words).items():
+            while mask:
+                lowest = mask & -mask
+                counts[lowest.bit_length() - 1] += count
+                mask ^= lowest
+        
+        scores = [(lang_code, count / len(words)) for lang_code, count in zip(self.stopword_languages, counts)]
+        scores.sort(key=lambda x: x[1], reverse=True)
+        return scores
     
-    def detect_jaegis_context(self, text: str) -> float:
+    def detect_jaegis_context(self, text: str, words: Optional[List[str]] = None) -> float:
         """
         Detect JAEGIS-specific context that indicates English.
         
         Args:
             text: Input text
+            words: Lower-cased words of text, when already extracted
             
         Returns:
             JAEGIS context score (0-1)
         """
         text_lower = text.lower()
-        words = re.findall(r'\b\w+\b', text_lower)
+        if words is None:
+            words = self.word_pattern.findall(text_lower)
         
         if not words:
             return 0.0
@@ -393,14 +464,19 @@ class LanguageDetector:
             jaegis_score += 0.3
         
         # Boost for squad/mode patterns
-        if re.search(r'\b\w+-squad\b', text_lower) or re.search(r'\bmode-[1-5]\b', text_lower):
+        if self.squad_mode_pattern.search(text_lower):
             jaegis_score += 0.2
         
         return min(jaegis_score, 1.0)
     
     def ensemble_detection(self, text: str) -> LanguageDetectionResult:
         """
-        Perform ensemble language detection using multiple methods.
+        Perform cascaded language detection using multiple methods.
+        
+        Stages run in cost order and the first one whose confidence reaches
+        confidence_threshold decides; otherwise the model-based detections
+        are combined by weighted voting. Results are memoized on a hash of
+        the normalized text prefix.
         
         Args:
             text: Input text
@@ -419,9 +495,37 @@ class LanguageDetector:
                 metadata={"text_length": len(text)}
             )
         
+        # Memoized result for the same normalized prefix
+        stage_start = time.perf_counter()
+        cache_key = self._cache_key(text)
+        with self._cache_lock:
+            cached = self.detection_cache.get(cache_key)
+            if cached is not None:
+                self.detection_cache.move_to_end(cache_key)
+        self._record_stage("cache", stage_start, cached is not None)
+        if cached is not None:
+            return replace(cached, metadata={**cached.metadata, "cache_hit": True})
+        
+        result = self._run_cascade(text)
+        
+        with self._cache_lock:
+            self.detection_cache[cache_key] = result
+            while len(self.detection_cache) > self.cache_size:
+                self.detection_cache.popitem(last=False)
+        
+        return result
+    
+    def _run_cascade(self, text: str) -> LanguageDetectionResult:
+        """Run the detection stages cheapest first until one is confident."""
+        # Words are extracted once and shared by the word-based stages
+        words = self.word_pattern.findall(text.lower())
+        
         # Check for JAEGIS context first
-        jaegis_score = self.detect_jaegis_context(text)
-        if jaegis_score > 0.3:  # Strong JAEGIS context
+        stage_start = time.perf_counter()
+        jaegis_score = self.detect_jaegis_context(text, words)
+        resolved = jaegis_score > 0.3  # Strong JAEGIS context
+        self._record_stage("jaegis_context", stage_start, resolved)
+        if resolved:
             return LanguageDetectionResult(
                 detected_language=SupportedLanguage.ENGLISH,
                 confidence=min(0.8 + jaegis_score * 0.2, 0.99),
@@ -432,32 +536,86 @@ class LanguageDetector:
                 metadata={"jaegis_score": jaegis_score}
             )
         
-        # Detect script type
+        # Detect script type; non-Latin scripts mostly identify the language
+        stage_start = time.perf_counter()
         script_type, script_confidence = self.detect_script(text)
+        script_language, language_confidence = self._script_language(text, script_type, script_confidence)
+        resolved = script_language is not None and language_confidence >= self.confidence_threshold
+        self._record_stage("script", stage_start, resolved)
         
-        # Run multiple detection methods
-        detections = {}
-        
-        # Langdetect
-        lang_ld, conf_ld, alts_ld = self.detect_with_langdetect(text)
-        if lang_ld != "unknown":
-            detections["langdetect"] = (lang_ld, conf_ld, 0.4)  # Weight
-        
-        # FastText
-        lang_ft, conf_ft = self.detect_with_fasttext(text)
-        if lang_ft != "unknown":
-            detections["fasttext"] = (lang_ft, conf_ft, 0.3)  # Weight
+        metadata = {
+            "script_confidence": script_confidence,
+            "jaegis_score": jaegis_score
+        }
         
-        # Polyglot
-        lang_pg, conf_pg = self.detect_with_polyglot(text)
-        if lang_pg != "unknown":
-            detections["polyglot"] = (lang_pg, conf_pg, 0.2)  # Weight
+        if resolved:
+            return self._stage_result(script_language, language_confidence, "script", script_type, metadata)
         
-        # Stopwords
-        lang_sw, conf_sw = self.detect_with_stopwords(text)
-        if lang_sw != "unknown":
+        # Stopword bitmap: confident when one language clearly dominates
+        stage_start = time.perf_counter()
+        stopword_scores = self._score_stopwords(words)
+        detections = {}
+        resolved = False
+        if stopword_scores and stopword_scores[0][1] > 0:
+            lang_sw, conf_sw = stopword_scores[0]
+            runner_up = stopword_scores[1][1] if len(stopword_scores) > 1 else 0.0
+            stage_confidence = (conf_sw / (conf_sw + runner_up)) * min(1.0, conf_sw / self.STOPWORD_FULL_COVERAGE)
             detections["stopwords"] = (lang_sw, conf_sw, 0.1)  # Weight
+            metadata["stopword_confidence"] = stage_confidence
+            resolved = stage_confidence >= self.confidence_threshold
+        self._record_stage("stopwords", stage_start, resolved)
+        
+        if resolved:
+            return self._stage_result(lang_sw, stage_confidence, "stopwords", script_type, metadata)
+        
+        # Model-based detectors, cheapest first
+        alts_ld = []
+        for stage, weight in (("fasttext", 0.3), ("polyglot", 0.2), ("langdetect", 0.4)):
+            stage_start = time.perf_counter()
+            if stage == "fasttext":
+                lang, conf = self.detect_with_fasttext(text)
+            elif stage == "polyglot":
+                lang, conf = self.detect_with_polyglot(text)
+            else:
+                lang, conf, alts_ld = self.detect_with_langdetect(text)
+            
+            resolved = lang != "unknown" and conf >= self.confidence_threshold
+            self._record_stage(stage, stage_start, resolved)
+            
+            if lang != "unknown":
+                detections[stage] = (lang, conf, weight)
+            if resolved:
+                alternatives = [] if stage != "langdetect" else self._supported_alternatives(alts_ld)
+                return self._stage_result(
+                    lang, conf, stage, script_type, {**metadata, "detections": detections}, alternatives
+                )
+        
+        stage_start = time.perf_counter()
+        result = self._vote(detections, script_type, metadata)
+        self._record_stage("ensemble", stage_start, True)
         
+        return result
+    
+    def _script_language(self, text: str, script_type: str,
+                         script_confidence: float) -> Tuple[Optional[str], float]:
+        """Language implied by the dominant script, with the share of letters supporting it."""
+        if script_type not in ("chinese", "japanese_hiragana", "japanese_katakana"):
+            return self.SCRIPT_LANGUAGES.get(script_type), script_confidence
+        
+        # Japanese mixes kanji with kana; kanji alone is Chinese
+        kana = sum(
+            len(self.compiled_script_patterns[name].findall(text))
+            for name in ("japanese_hiragana", "japanese_katakana")
+        )
+        if not kana:
+            return "zh", script_confidence
+        
+        han = len(self.compiled_script_patterns["chinese"].findall(text))
+        return "ja", (kana + han) / sum(1 for c in text if c.isalpha())
+    
+    def _vote(self, detections: Dict[str, Tuple[str, float, float]], script_type: str,
+              metadata: Dict[str, Any]) -> LanguageDetectionResult:
+        """Weighted vote over the collected detections."""
         # Ensemble voting
         if not detections:
             return LanguageDetectionResult(
@@ -467,7 +625,7 @@ class LanguageDetector:
                 language_family=LanguageFamily.UNKNOWN,
                 script_type=script_type,
                 processing_method="no_detection",
-                metadata={"script_confidence": script_confidence}
+                metadata={"script_confidence": metadata["script_confidence"]}
             )
         
         # Weighted voting
@@ -488,39 +646,82 @@ class LanguageDetector:
         detected_lang_code = best_lang[0]
         confidence = best_lang[1]
         
+        # Get alternatives
+        sorted_langs = sorted(lang_votes.items(), key=lambda x: x[1], reverse=True)[1:4]
+        
+        return self._stage_result(
+            detected_lang_code, confidence, "ensemble", script_type,
+            {**metadata, "detections": detections, "total_methods": len(detections)},
+            self._supported_alternatives(sorted_langs)
+        )
+    
+    def _stage_result(self, lang_code: str, confidence: float, method: str, script_type: str,
+                      metadata: Dict[str, Any],
+                      alternatives: Optional[List[Tuple[SupportedLanguage, float]]] = None) -> LanguageDetectionResult:
+        """Detection result for the stage that decided."""
         # Convert to SupportedLanguage enum
         try:
-            detected_language = SupportedLanguage(detected_lang_code)
+            detected_language = SupportedLanguage(lang_code)
         except ValueError:
             detected_language = SupportedLanguage.UNKNOWN
         
-        # Get alternatives
+        return LanguageDetectionResult(
+            detected_language=detected_language,
+            confidence=confidence,
+            alternative_languages=alternatives or [],
+            language_family=self.language_families.get(lang_code, LanguageFamily.UNKNOWN),
+            script_type=script_type,
+            processing_method=method,
+            metadata=metadata
+        )
+    
+    @staticmethod
+    def _supported_alternatives(candidates: List[Tuple[str, float]]) -> List[Tuple[SupportedLanguage, float]]:
         alternatives = []
-        sorted_langs = sorted(lang_votes.items(), key=lambda x: x[1], reverse=True)[1:4]
-        for lang_code, score in sorted_langs:
+        for lang_code, score in candidates:
             try:
-                alt_lang = SupportedLanguage(lang_code)
-                alternatives.append((alt_lang, score))
+                alternatives.append((SupportedLanguage(lang_code), score))
             except ValueError:
                 continue
+        return alternatives
+    
+    def _cache_key(self, text: str) -> bytes:
+        """Hash of the lower-cased, whitespace-collapsed text prefix."""
+        prefix = " ".join(text[:self.cache_prefix_chars * 2].lower().split())[:self.cache_prefix_chars]
+        return hashlib.blake2b(prefix.encode("utf-8"), digest_size=16).digest()
+    
+    def _record_stage(self, stage: str, start_time: float, resolved: bool):
+        statistics = self.stage_statistics[stage]
+        statistics["calls"] += 1
+        statistics["time_ms"] += (time.perf_counter() - start_time) * 1000
+        if resolved:
+            statistics["resolved"] += 1
+    
+    def get_cascade_statistics(self) -> Dict[str, Any]:
+        """
+        Per-stage calls, resolutions and timing of the detection cascade.
         
-        # Get language family
-        language_family = self.language_families.get(detected_lang_code, LanguageFamily.UNKNOWN)
-        
-        return LanguageDetectionResult(
-            detected_language=detected_language,
-            confidence=confidence,
-            alternative_languages=alternatives,
-            language_family=language_family,
-            script_type=script_type,
-            processing_method="ensemble",
-            metadata={
-                "detections": detections,
-                "script_confidence": script_confidence,
-                "jaegis_score": jaegis_score,
-                "total_methods": len(detections)
+        Returns:
+            Total requests and, per stage, how many requests it ran for, how
+            many it resolved, its share of all requests and its mean time
+        """
+        requests = self.stage_statistics["cache"]["calls"]
+        stages = {}
+        for stage in self.CASCADE_STAGES:
+            statistics = self.stage_statistics[stage]
+            stages[stage] = {
+                "calls": statistics["calls"],
+                "resolved": statistics["resolved"],
+                "resolved_share": statistics["resolved"] / requests if requests else 0.0,
+                "avg_time_ms": statistics["time_ms"] / statistics["calls"] if statistics["calls"] else 0.0
             }
-        )
+        
+        return {
+            "requests": requests,
+            "confidence_threshold": self.confidence_threshold,
+            "cache_entries": len(self.detection_cache),
+            "stages": stages
+        }
     
     async def detect_language(self, text: str) -> LanguageDetectionResult:
         """
@@ -8,6 +8,7 @@ squad names, mode numbers, command parameters, and domain-specific entities.
 
 import re
 import json
+import time
 from typing import Dict, List, Optional, Tuple, Any, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -24,6 +25,7 @@ from transformers import AutoTokenizer, AutoModelForTokenClassification, pipelin
 
 # Local imports
 from .tokenizer import TokenizationResult, Token
+from .document_parser import SharedDocumentParser
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -118,21 +120,47 @@ class NERProcessor:
     - Entity linking and normalization
     - Confidence scoring
     - Multi-model ensemble
+    - Single-scan rule automaton with model stages gated on rule coverage
     """
     
-    def __init__(self, model_name: str = "dbmdz/bert-large-cased-finetuned-conll03-english"):
+    STAGES = ("rules", "tokens", "spacy", "transformer", "merge")
+    
+    # Patterns whose character classes are meant literally
+    CASE_SENSITIVE_PATTERNS = {EntityType.CONFIGURATION_KEY.value}
+    
+    GAZETTEER_CONFIDENCE = 0.95
+    
+    def __init__(self, model_name: str = "dbmdz/bert-large-cased-finetuned-conll03-english",
+                 min_rule_coverage: float = 1.0,
+                 document_parser: Optional[SharedDocumentParser] = None):
         """
         Initialize NER processor.
         
         Args:
             model_name: Pre-trained NER model name
+            min_rule_coverage: Share of candidate entity words the rule-based
+                mentions must cover for the spaCy and transformer stages to be skipped
+            document_parser: Shared parser whose docs the spaCy stage reuses
         """
         self.model_name = model_name
+        self.document_parser = document_parser
+        self.min_rule_coverage = min_rule_coverage
         self.models = {}
         self.entity_patterns = self._load_entity_patterns()
         self.jaegis_entities = self._load_jaegis_entities()
         self.normalization_rules = self._load_normalization_rules()
         
+        # Capitalized words that do not start a sentence
+        self.candidate_pattern = re.compile(r'(?<![.!?]\s)(?<!^)\b[A-Z][\w-]*')
+        self._compile_rule_automaton()
+        
+        self.stage_statistics = {
+            stage: {"calls": 0, "time_ms": 0.0, "entities": 0}
+            for stage in self.STAGES
+        }
+        self.stage_statistics["requests"] = 0
+        self.stage_statistics["model_stages_skipped"] = 0
+        
         # Initialize models
         self._initialize_models()
     
@@ -228,7 +256,11 @@ class NERProcessor:
         """Initialize NER models."""
         try:
             # Load spaCy model
-            self.models["spacy"] = spacy.load("en_core_web_lg")
+            if self.document_parser is not None:
+                self.document_parser.register("named_entity_recognition")
+                self.models["spacy"] = self.document_parser.nlp
+            else:
+                self.models["spacy"] = spacy.load("en_core_web_lg")
             logger.info("Loaded spaCy NER model")
             
             # Load transformer model
@@ -244,46 +276,139 @@ class NERProcessor:
             logger.warning(f"Failed to load some NER models: {e}")
             # Fallback to basic spaCy
             try:
-                import spacy.cli
-                spacy.cli.download("en_core_web_sm")
+                from spacy.cli import download
+                download("en_core_web_sm")
                 self.models["spacy"] = spacy.load("en_core_web_sm")
             except:
                 logger.error("Failed to load any NER models")
     
-    def extract_pattern_entities(self, text: str) -> List[EntityMention]:
-        """Extract entities using regex patterns."""
-        entities = []
+    # ------------------------------------------------------------------------
+    # Rule automaton
+    # ------------------------------------------------------------------------
+    
+    def _compile_rule_automaton(self):
+        """
+        Compile the JAEGIS gazetteer and the entity patterns into one regex.
+        
+        Each rule is a named alternative; at any position the first matching
+        alternative wins, so gazetteer terms (longest first) come before the
+        patterns, which keep their priority order from _load_entity_patterns.
+        Call again after changing entity_patterns or jaegis_entities.
+        """
+        self.rules: List[Tuple[str, str, str]] = []
+        alternatives = []
+        
+        for category, terms in self.jaegis_entities.items():
+            ordered = sorted({term.lower() for term in terms}, key=len, reverse=True)
+            if ordered:
+                alternatives.append(r'\b(?:' + '|'.join(re.escape(term) for term in ordered) + r')\b')
+                self.rules.append(("jaegis_vocabulary", category, alternatives[-1]))
         
         for entity_type_str, pattern in self.entity_patterns.items():
-            entity_type = EntityType(entity_type_str)
+            if entity_type_str in self.CASE_SENSITIVE_PATTERNS:
+                alternatives.append(f'(?-i:{pattern})')
+            else:
+                alternatives.append(pattern)
+            self.rules.append(("pattern", entity_type_str, pattern))
+        
+        self.rule_automaton = re.compile(
+            '|'.join(f'(?P<rule{i}>{alternative})' for i, alternative in enumerate(alternatives)),
+            re.IGNORECASE
+        )
+    
+    def extract_rule_entities(self, text: str) -> List[EntityMention]:
+        """
+        Extract gazetteer and pattern entities in a single scan.
+        
+        Args:
+            text: Input text
             
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                entity_text = match.group().strip()
-                
-                # Normalize entity
-                normalized = self._normalize_entity(entity_text, entity_type)
-                
-                # Calculate confidence based on pattern specificity
-                confidence = self._calculate_pattern_confidence(entity_text, entity_type)
-                
+        Returns:
+            Non-overlapping rule-based mentions in text order
+        """
+        entities = []
+        
+        for match in self.rule_automaton.finditer(text):
+            method, key, pattern = self.rules[int(match.lastgroup[4:])]
+            entity_text = match.group()
+            
+            if method == "jaegis_vocabulary":
                 entity = EntityMention(
                     text=entity_text,
+                    entity_type=self._get_entity_type_from_category(key),
+                    start_pos=match.start(),
+                    end_pos=match.end(),
+                    confidence=self.GAZETTEER_CONFIDENCE,
+                    normalized_value=entity_text.lower(),
+                    metadata={
+                        "extraction_method": "jaegis_vocabulary",
+                        "category": key,
+                        "exact_match": True
+                    }
+                )
+            else:
+                entity_type = EntityType(key)
+                stripped = entity_text.strip()
+                entity = EntityMention(
+                    text=stripped,
                     entity_type=entity_type,
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    confidence=confidence,
-                    normalized_value=normalized,
+                    confidence=self._calculate_pattern_confidence(stripped, entity_type),
+                    normalized_value=self._normalize_entity(stripped, entity_type),
                     metadata={
                         "extraction_method": "pattern",
                         "pattern": pattern[:50] + "..." if len(pattern) > 50 else pattern
                     }
                 )
-                
-                entities.append(entity)
+            
+            entities.append(entity)
         
         return entities
     
+    def rule_coverage(self, text: str, entities: List[EntityMention]) -> float:
+        """
+        Share of candidate entity words covered by the given mentions.
+        
+        Candidates are capitalized words that do not start a sentence, the
+        words the spaCy and transformer models would label.
+        
+        Args:
+            text: Input text
+            entities: Rule-based mentions
+            
+        Returns:
+            Coverage between 0 and 1; 1.0 when the text has no candidates
+        """
+        candidates = [match.span() for match in self.candidate_pattern.finditer(text)]
+        if not candidates:
+            return 1.0
+        
+        # Union of the mention spans, then one pass over both sorted lists
+        spans = []
+        for start, end in sorted((entity.start_pos, entity.end_pos) for entity in entities):
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+        
+        covered = 0
+        index = 0
+        for start, end in candidates:
+            while index < len(spans) and spans[index][1] <= start:
+                index += 1
+            if index < len(spans) and spans[index][0] <= start and spans[index][1] >= end:
+                covered += 1
+        
+        return covered / len(candidates)
+    
+    def extract_pattern_entities(self, text: str) -> List[EntityMention]:
+        """Extract entities using regex patterns."""
+        return [
+            entity for entity in self.extract_rule_entities(text)
+            if entity.metadata["extraction_method"] == "pattern"
+        ]
+    
     def extract_spacy_entities(self, text: str) -> List[EntityMention]:
         """Extract entities using spaCy NER."""
         entities = []
@@ -292,8 +417,10 @@ class NERProcessor:
             return entities
         
         try:
-            nlp = self.models["spacy"]
-            doc = nlp(text)
+            if self.document_parser is not None:
+                doc = self.document_parser.parse(text)
+            else:
+                doc = self.models["spacy"](text)
             
             for ent in doc.ents:
                 # Map spaCy labels to our entity types
@@ -358,10 +485,20 @@ class NERProcessor:
     
     def extract_jaegis_entities(self, text: str, tokenization_result: TokenizationResult) -> List[EntityMention]:
         """Extract JAEGIS-specific entities."""
+        entities = self.extract_token_entities(tokenization_result)
+        
+        # Extract using JAEGIS vocabularies
+        entities.extend(
+            entity for entity in self.extract_rule_entities(text)
+            if entity.metadata["extraction_method"] == "jaegis_vocabulary"
+        )
+        
+        return entities
+    
+    def extract_token_entities(self, tokenization_result: TokenizationResult) -> List[EntityMention]:
+        """Extract JAEGIS entities already typed by the tokenizer."""
         entities = []
-        text_lower = text.lower()
         
-        # Extract from tokenization results first
         for token in tokenization_result.tokens:
             if token.token_type.value in ["jaegis_entity", "jaegis_command"]:
                 entity_type = self._classify_jaegis_entity(token.text)
@@ -382,37 +519,6 @@ class NERProcessor:
                 
                 entities.append(entity)
         
-        # Extract using JAEGIS vocabularies
-        for category, entity_list in self.jaegis_entities.items():
-            for entity_text in entity_list:
-                if entity_text.lower() in text_lower:
-                    # Find position in text
-                    start_pos = text_lower.find(entity_text.lower())
-                    if start_pos != -1:
-                        end_pos = start_pos + len(entity_text)
-                        
-                        # Determine entity type based on category
-                        entity_type = self._get_entity_type_from_category(category)
-                        
-                        # Calculate confidence based on exact match
-                        confidence = 0.95 if entity_text.lower() == text_lower[start_pos:end_pos] else 0.8
-                        
-                        entity = EntityMention(
-                            text=text[start_pos:end_pos],
-                            entity_type=entity_type,
-                            start_pos=start_pos,
-                            end_pos=end_pos,
-                            confidence=confidence,
-                            normalized_value=entity_text.lower(),
-                            metadata={
-                                "extraction_method": "jaegis_vocabulary",
-                                "category": category,
-                                "exact_match": entity_text.lower() == text_lower[start_pos:end_pos]
-                            }
-                        )
-                        
-                        entities.append(entity)
-        
         return entities
     
     def _normalize_entity(self, text: str, entity_type: EntityType) -> str:
@@ -493,34 +599,27 @@ class NERProcessor:
         return mapping.get(category, EntityType.UNKNOWN)
     
     def merge_entities(self, entity_lists: List[List[EntityMention]]) -> List[EntityMention]:
-        """Merge entities from multiple extraction methods."""
-        all_entities = []
-        for entity_list in entity_lists:
-            all_entities.extend(entity_list)
+        """
+        Merge entities from multiple extraction methods.
         
-        # Remove duplicates and overlaps
-        merged_entities = []
+        A single sweep over the mentions sorted by start position: the kept
+        mentions never overlap, so each mention only needs comparing with the
+        last kept one, which it replaces when it has higher confidence.
+        """
+        all_entities = [entity for entity_list in entity_lists for entity in entity_list]
+        
+        # Earlier lists win ties at the same start position (stable sort)
         all_entities.sort(key=lambda e: e.start_pos)
         
+        merged_entities = []
         for entity in all_entities:
-            # Check for overlaps with existing entities
-            overlaps = False
-            for existing in merged_entities:
-                if (entity.start_pos < existing.end_pos and 
-                    entity.end_pos > existing.start_pos):
-                    # Overlap detected - keep the one with higher confidence
-                    if entity.confidence > existing.confidence:
-                        merged_entities.remove(existing)
-                        merged_entities.append(entity)
-                    overlaps = True
-                    break
-            
-            if not overlaps:
+            if merged_entities and entity.start_pos < merged_entities[-1].end_pos:
+                # Overlap detected - keep the one with higher confidence
+                if entity.confidence > merged_entities[-1].confidence:
+                    merged_entities[-1] = entity
+            else:
                 merged_entities.append(entity)
         
-        # Sort by position
-        merged_entities.sort(key=lambda e: e.start_pos)
-        
         return merged_entities
     
     def filter_entities_by_confidence(self, entities: List[EntityMention], 
@@ -540,22 +639,32 @@ class NERProcessor:
         Returns:
             Complete NER result
         """
-        import time
         start_time = time.time()
+        self.stage_statistics["requests"] += 1
         
         try:
-            # Extract entities using different methods
-            pattern_entities = self.extract_pattern_entities(text)
-            spacy_entities = self.extract_spacy_entities(text)
-            transformer_entities = self.extract_transformer_entities(text)
-            jaegis_entities = self.extract_jaegis_entities(text, tokenization_result)
+            # Rule-based mentions: one automaton scan plus tokenizer entities
+            rule_entities = self._run_stage("rules", self.extract_rule_entities, text)
+            token_entities = self._run_stage("tokens", self.extract_token_entities, tokenization_result)
+            extraction_methods = ["rules", "tokens"]
+            
+            # Model stages only when the rules leave candidate words uncovered
+            coverage = self.rule_coverage(text, rule_entities + token_entities)
+            spacy_entities = []
+            transformer_entities = []
+            if coverage < self.min_rule_coverage:
+                spacy_entities = self._run_stage("spacy", self.extract_spacy_entities, text)
+                transformer_entities = self._run_stage("transformer", self.extract_transformer_entities, text)
+                extraction_methods.extend(["spacy", "transformer"])
+            else:
+                self.stage_statistics["model_stages_skipped"] += 1
             
             # Merge all entities
-            all_entities = self.merge_entities([
-                pattern_entities,
+            all_entities = self._run_stage("merge", self.merge_entities, [
+                rule_entities,
                 spacy_entities,
                 transformer_entities,
-                jaegis_entities
+                token_entities
             ])
             
             # Filter by confidence
@@ -593,7 +702,8 @@ class NERProcessor:
                 confidence_scores=confidence_scores,
                 processing_time_ms=processing_time,
                 metadata={
-                    "extraction_methods": ["pattern", "spacy", "transformer", "jaegis"],
+                    "extraction_methods": extraction_methods,
+                    "rule_coverage": coverage,
                     "total_entities_found": len(all_entities),
                     "entities_after_filtering": len(filtered_entities),
                     "jaegis_entities_count": len(jaegis_only),
@@ -613,6 +723,43 @@ class NERProcessor:
                 processing_time_ms=(time.time() - start_time) * 1000,
                 metadata={"error": str(e)}
             )
+    
+    def _run_stage(self, stage: str, extractor, *args) -> List[EntityMention]:
+        stage_start = time.perf_counter()
+        entities = extractor(*args)
+        
+        statistics = self.stage_statistics[stage]
+        statistics["calls"] += 1
+        statistics["time_ms"] += (time.perf_counter() - stage_start) * 1000
+        statistics["entities"] += len(entities)
+        
+        return entities
+    
+    def get_stage_statistics(self) -> Dict[str, Any]:
+        """
+        Per-stage calls, mentions and latency of entity recognition.
+        
+        Returns:
+            Total requests, how often the model stages were skipped and, per
+            stage, its call count, share of requests, mentions and mean time
+        """
+        requests = self.stage_statistics["requests"]
+        stages = {}
+        for stage in self.STAGES:
+            statistics = self.stage_statistics[stage]
+            stages[stage] = {
+                "calls": statistics["calls"],
+                "call_share": statistics["calls"] / requests if requests else 0.0,
+                "entities": statistics["entities"],
+                "avg_time_ms": statistics["time_ms"] / statistics["calls"] if statistics["calls"] else 0.0
+            }
+        
+        return {
+            "requests": requests,
+            "model_stages_skipped": self.stage_statistics["model_stages_skipped"],
+            "min_rule_coverage": self.min_rule_coverage,
+            "stages": stages
+        }
 
 
 # ============================================================================
@@ -23,12 +23,12 @@ from transformers import (
 )
 from sentence_transformers import SentenceTransformer
 import spacy
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import KMeans
 import faiss
 
 # Local imports
 from .tokenizer import TokenizationResult, Token, TokenType
+from .embedding_service import EmbeddingService, ConceptIndex
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -91,25 +91,37 @@ class SemanticAnalysisEngine:
     - Semantic similarity computation
     - Concept extraction and relationship mapping
     - JAEGIS domain-specific semantic understanding
-    - Caching for performance optimization
+    - Batched embedding with bounded memory and shared disk caches
     """
     
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    MODEL_CONFIDENCE = {
+        "sentence_transformer": 0.95,
+        "bert": 0.90,
+        "roberta": 0.92
+    }
+    
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 cache_size: int = 10000, cache_dir: Optional[str] = None):
         """
         Initialize semantic analysis engine.
         
         Args:
             model_name: Transformer model to use
+            cache_size: Embeddings kept in memory per model
+            cache_dir: Directory for the on-disk embedding and concept caches shared by workers
         """
         self.model_name = model_name
         self.models = {}
         self.tokenizers = {}
-        self.embeddings_cache = {}
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.embedding_services: Dict[str, EmbeddingService] = {}
         self.jaegis_concepts = self._load_jaegis_concepts()
-        self.concept_embeddings = {}
+        self.concept_index: Optional[ConceptIndex] = None
         
         # Initialize models
         self._initialize_models()
+        self._initialize_embedding_services()
         
         # Build concept embeddings
         self._build_concept_embeddings()
@@ -137,6 +149,36 @@ class SemanticAnalysisEngine:
             logger.error(f"Failed to load transformer models: {e}")
             raise
     
+    def _initialize_embedding_services(self):
+        """Create a batched, cached embedding service per model type."""
+        encoders = {
+            "sentence_transformer": (
+                self.sentence_model.encode, self.model_name,
+                self.sentence_model.get_sentence_embedding_dimension()
+            ),
+            "bert": (
+                lambda texts: self._encode_transformer_batch(self.bert_tokenizer, self.bert_model, texts),
+                "bert-base-uncased", self.bert_model.config.hidden_size
+            ),
+            "roberta": (
+                lambda texts: self._encode_transformer_batch(self.roberta_tokenizer, self.roberta_model, texts),
+                "roberta-base", self.roberta_model.config.hidden_size
+            )
+        }
+        
+        for model_type, (encode_batch, name, dimension) in encoders.items():
+            self.embedding_services[model_type] = EmbeddingService(
+                encode_batch, name,
+                dimension=dimension,
+                cache_size=self.cache_size,
+                cache_dir=self.cache_dir
+            )
+    
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding service of the primary sentence transformer."""
+        return self.embedding_services["sentence_transformer"]
+    
     def _load_jaegis_concepts(self) -> Dict[str, List[str]]:
         """Load JAEGIS-specific concepts and terminology."""
         return {
@@ -174,15 +216,10 @@ class SemanticAnalysisEngine:
         """Build embeddings for JAEGIS concepts."""
         logger.info("Building JAEGIS concept embeddings...")
         
-        for category, concepts in self.jaegis_concepts.items():
-            self.concept_embeddings[category] = {}
-            
-            for concept in concepts:
-                try:
-                    embedding = self.sentence_model.encode(concept)
-                    self.concept_embeddings[category][concept] = embedding
-                except Exception as e:
-                    logger.warning(f"Failed to create embedding for {concept}: {e}")
+        # Normalized float32 matrix per category, loaded from cache_dir when persisted
+        self.concept_index = ConceptIndex.build(
+            self.jaegis_concepts, self.embedding_service, self.cache_dir
+        )
         
         logger.info("JAEGIS concept embeddings built successfully")
     
@@ -197,74 +234,97 @@ class SemanticAnalysisEngine:
         Returns:
             SemanticVector with embeddings
         """
-        # Check cache first
-        cache_key = f"{model_type}:{hash(text)}"
-        if cache_key in self.embeddings_cache:
-            return self.embeddings_cache[cache_key]
+        return self.get_sentence_embeddings([text], model_type)[0]
+    
+    def get_sentence_embeddings(self, texts: List[str],
+                                model_type: str = "sentence_transformer") -> List[SemanticVector]:
+        """
+        Generate sentence-level embeddings for many texts in one encode call.
         
+        Args:
+            texts: Input texts
+            model_type: Type of model to use
+            
+        Returns:
+            SemanticVector per text
+        """
         try:
-            if model_type == "sentence_transformer":
-                embedding = self.sentence_model.encode(text)
-                confidence = 0.95
-                
-            elif model_type == "bert":
-                embedding = self._get_bert_embedding(text)
-                confidence = 0.90
-                
-            elif model_type == "roberta":
-                embedding = self._get_roberta_embedding(text)
-                confidence = 0.92
-                
-            else:
-                raise ValueError(f"Unknown model type: {model_type}")
-            
-            semantic_vector = SemanticVector(
-                vector=embedding,
-                dimension=len(embedding),
-                model_name=model_type,
-                confidence=confidence,
-                metadata={"text_length": len(text), "model": model_type}
-            )
+            service = self._get_embedding_service(model_type)
+            embeddings = service.embed_many(texts)
             
-            # Cache result
-            self.embeddings_cache[cache_key] = semantic_vector
+            return [
+                self._to_semantic_vector(text, embedding, model_type)
+                for text, embedding in zip(texts, embeddings)
+            ]
             
-            return semantic_vector
+        except Exception as e:
+            logger.error(f"Failed to generate embedding: {e}")
+            return [self._fallback_vector(model_type, e) for _ in texts]
+    
+    async def aget_sentence_embedding(self, text: str,
+                                      model_type: str = "sentence_transformer") -> SemanticVector:
+        """
+        Generate sentence-level embeddings, batched with concurrent requests.
+        
+        Args:
+            text: Input text
+            model_type: Type of model to use
+            
+        Returns:
+            SemanticVector with embeddings
+        """
+        try:
+            service = self._get_embedding_service(model_type)
+            embedding = await service.aembed(text)
+            return self._to_semantic_vector(text, embedding, model_type)
             
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
-            # Return zero vector as fallback
-            return SemanticVector(
-                vector=np.zeros(384),  # Default dimension
-                dimension=384,
-                model_name=model_type,
-                confidence=0.0,
-                metadata={"error": str(e)}
-            )
+            return self._fallback_vector(model_type, e)
+    
+    def _get_embedding_service(self, model_type: str) -> EmbeddingService:
+        if model_type not in self.embedding_services:
+            raise ValueError(f"Unknown model type: {model_type}")
+        return self.embedding_services[model_type]
+    
+    def _to_semantic_vector(self, text: str, embedding: np.ndarray, model_type: str) -> SemanticVector:
+        return SemanticVector(
+            vector=embedding,
+            dimension=len(embedding),
+            model_name=model_type,
+            confidence=self.MODEL_CONFIDENCE[model_type],
+            metadata={"text_length": len(text), "model": model_type}
+        )
+    
+    def _fallback_vector(self, model_type: str, error: Exception) -> SemanticVector:
+        # Return zero vector as fallback
+        return SemanticVector(
+            vector=np.zeros(384),  # Default dimension
+            dimension=384,
+            model_name=model_type,
+            confidence=0.0,
+            metadata={"error": str(error)}
+        )
     
     def _get_bert_embedding(self, text: str) -> np.ndarray:
         """Get BERT embeddings for text."""
-        inputs = self.bert_tokenizer(text, return_tensors="pt", 
-                                   truncation=True, max_length=512)
-        
-        with torch.no_grad():
-            outputs = self.bert_model(**inputs)
-            # Use [CLS] token embedding
-            embedding = outputs.last_hidden_state[:, 0, :].squeeze().numpy()
-        
-        return embedding
+        return self._encode_transformer_batch(self.bert_tokenizer, self.bert_model, [text])[0]
     
     def _get_roberta_embedding(self, text: str) -> np.ndarray:
         """Get RoBERTa embeddings for text."""
-        inputs = self.roberta_tokenizer(text, return_tensors="pt",
-                                      truncation=True, max_length=512)
+        return self._encode_transformer_batch(self.roberta_tokenizer, self.roberta_model, [text])[0]
+    
+    @staticmethod
+    def _encode_transformer_batch(tokenizer, model, texts: List[str]) -> np.ndarray:
+        """Encode a padded batch and return the first-token ([CLS] / <s>) embeddings."""
+        inputs = tokenizer(texts, return_tensors="pt", padding=True,
+                           truncation=True, max_length=512)
         
         with torch.no_grad():
-            outputs = self.roberta_model(**inputs)
-            # Use <s> token embedding (equivalent to [CLS])
-            embedding = outputs.last_hidden_state[:, 0, :].squeeze().numpy()
+            outputs = model(**inputs)
+            embeddings = outputs.last_hidden_state[:, 0, :].numpy()
         
-        return embedding
+        return embeddings
     
     def extract_concepts(self, text: str, tokenization_result: TokenizationResult) -> List[Dict[str, Any]]:
         """
@@ -306,18 +366,19 @@ class SemanticAnalysisEngine:
         """Extract JAEGIS-specific concepts."""
         concepts = []
         text_lower = text.lower()
+        scores = None
         
         for category, concept_list in self.jaegis_concepts.items():
-            for concept in concept_list:
+            rows = self.concept_index.category_slices[category]
+            
+            for offset, concept in enumerate(concept_list):
                 if concept.lower() in text_lower:
-                    # Calculate semantic similarity
-                    text_embedding = self.get_sentence_embedding(text)
-                    concept_embedding = self.concept_embeddings[category][concept]
+                    # Score the text against every concept once, on first match
+                    if scores is None:
+                        text_embedding = self.get_sentence_embedding(text)
+                        scores = self.concept_index.score(text_embedding.vector)[0]
                     
-                    similarity = cosine_similarity(
-                        text_embedding.vector.reshape(1, -1),
-                        concept_embedding.reshape(1, -1)
-                    )[0][0]
+                    similarity = scores[rows.start + offset]
                     
                     concepts.append({
                         "text": concept,
@@ -369,15 +430,7 @@ class SemanticAnalysisEngine:
             Similarity score (0-1)
         """
         try:
-            embedding1 = self.get_sentence_embedding(text1)
-            embedding2 = self.get_sentence_embedding(text2)
-            
-            similarity = cosine_similarity(
-                embedding1.vector.reshape(1, -1),
-                embedding2.vector.reshape(1, -1)
-            )[0][0]
-            
-            return float(similarity)
+            return self.embedding_service.similarity(text1, text2)
             
         except Exception as e:
             logger.error(f"Failed to compute similarity: {e}")
@@ -394,19 +447,35 @@ class SemanticAnalysisEngine:
             Domain relevance scores
         """
         text_embedding = self.get_sentence_embedding(text)
-        domain_scores = {}
+        domain_scores = self.concept_index.score(text_embedding.vector)[
+            0, self.concept_index.category_slices["domains"]
+        ]
         
-        for domain in self.jaegis_concepts["domains"]:
-            domain_embedding = self.concept_embeddings["domains"][domain]
-            
-            similarity = cosine_similarity(
-                text_embedding.vector.reshape(1, -1),
-                domain_embedding.reshape(1, -1)
-            )[0][0]
-            
-            domain_scores[domain] = float(similarity)
+        return dict(zip(self.jaegis_concepts["domains"], domain_scores.tolist()))
+    
+    def score_texts(self, texts: List[str], top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Score many texts against every JAEGIS concept in one matrix product.
         
-        return domain_scores
+        Args:
+            texts: Input texts
+            top_k: Concepts kept per category and overall
+            
+        Returns:
+            Per text: domain relevance, top-k similarity per category and
+            the top-k concepts overall
+        """
+        embeddings = self.embedding_service.embed_many(texts)
+        return [self._summarize_concept_scores(ranked)
+                for ranked in self.concept_index.rank(embeddings, top_k)]
+    
+    @staticmethod
+    def _summarize_concept_scores(ranked: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "domain_relevance": ranked["full_scores"].get("domains", {}),
+            "semantic_similarity": ranked["category_scores"],
+            "top_concepts": ranked["top_concepts"]
+        }
     
     def find_semantic_relations(self, concepts: List[Dict[str, Any]]) -> List[SemanticRelation]:
         """
@@ -419,39 +488,37 @@ class SemanticAnalysisEngine:
             List of semantic relations
         """
         relations = []
+        if len(concepts) < 2:
+            return relations
         
-        for i, concept1 in enumerate(concepts):
-            for j, concept2 in enumerate(concepts[i+1:], i+1):
-                try:
-                    # Compute semantic similarity
-                    similarity = self.compute_semantic_similarity(
-                        concept1["text"], concept2["text"]
-                    )
-                    
-                    if similarity > 0.7:  # High similarity threshold
-                        relation_type = "similar"
-                    elif similarity > 0.5:  # Medium similarity
-                        relation_type = "related"
-                    else:
-                        continue  # Skip low similarity
-                    
-                    relation = SemanticRelation(
-                        source=concept1["text"],
-                        target=concept2["text"],
-                        relation_type=relation_type,
-                        strength=similarity,
-                        confidence=min(concept1["confidence"], concept2["confidence"]),
-                        metadata={
-                            "source_type": concept1["type"],
-                            "target_type": concept2["type"]
-                        }
-                    )
-                    
-                    relations.append(relation)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to compute relation: {e}")
-                    continue
+        try:
+            # All pairwise similarities in one normalized matrix product
+            similarities = self.embedding_service.similarity_matrix([c["text"] for c in concepts])
+        except Exception as e:
+            logger.warning(f"Failed to compute relations: {e}")
+            return relations
+        
+        sources, targets = np.triu_indices(len(concepts), k=1)
+        strengths = similarities[sources, targets]
+        related = strengths > 0.5  # Medium similarity threshold
+        
+        for i, j, similarity in zip(sources[related], targets[related], strengths[related]):
+            concept1, concept2 = concepts[i], concepts[j]
+            similarity = float(similarity)
+            
+            relation = SemanticRelation(
+                source=concept1["text"],
+                target=concept2["text"],
+                relation_type="similar" if similarity > 0.7 else "related",
+                strength=similarity,
+                confidence=min(concept1["confidence"], concept2["confidence"]),
+                metadata={
+                    "source_type": concept1["type"],
+                    "target_type": concept2["type"]
+                }
+            )
+            
+            relations.append(relation)
         
         return relations
     
@@ -470,8 +537,8 @@ class SemanticAnalysisEngine:
         start_time = time.time()
         
         try:
-            # Generate embeddings
-            embeddings = self.get_sentence_embedding(text)
+            # Generate embeddings (batched with concurrent analyses)
+            embeddings = await self.aget_sentence_embedding(text)
             
             # Extract concepts
             concepts = self.extract_concepts(text, tokenization_result)
@@ -479,17 +546,12 @@ class SemanticAnalysisEngine:
             # Find semantic relations
             relations = self.find_semantic_relations(concepts)
             
-            # Compute domain relevance
-            domain_relevance = self.analyze_domain_relevance(text)
-            
-            # Compute semantic similarity with JAEGIS concepts
-            semantic_similarity = {}
-            for category, concept_list in self.jaegis_concepts.items():
-                category_scores = {}
-                for concept in concept_list[:5]:  # Limit for performance
-                    score = self.compute_semantic_similarity(text, concept)
-                    category_scores[concept] = score
-                semantic_similarity[category] = category_scores
+            # Domain relevance and top-5 concepts per category from one product
+            concept_scores = self._summarize_concept_scores(
+                self.concept_index.rank(embeddings.vector, top_k=5)[0]
+            )
+            domain_relevance = concept_scores["domain_relevance"]
+            semantic_similarity = concept_scores["semantic_similarity"]
             
             # Calculate overall confidence
             confidence_score = min(
@@ -513,6 +575,7 @@ class SemanticAnalysisEngine:
                     "model_name": self.model_name,
                     "concepts_count": len(concepts),
                     "relations_count": len(relations),
+                    "top_concepts": concept_scores["top_concepts"],
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
@@ -18,6 +18,9 @@ import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
 import logging
 
+# Local imports
+from .document_parser import SharedDocumentParser
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -94,15 +97,19 @@ class AdvancedTokenizer:
     - Performance optimization
     """
     
-    def __init__(self, language: str = "en", load_models: bool = True):
+    def __init__(self, language: str = "en", load_models: bool = True,
+                 document_parser: Optional[SharedDocumentParser] = None):
         """
         Initialize the advanced tokenizer.
         
         Args:
             language: Primary language code
             load_models: Whether to load spaCy models immediately
+            document_parser: Shared parser used for English text instead of a
+                separately loaded pipeline
         """
         self.language = language
+        self.document_parser = document_parser
         self.models = {}
         self.patterns = self._compile_patterns()
         
@@ -113,7 +120,11 @@ class AdvancedTokenizer:
         """Load spaCy language models."""
         try:
             # Load English model
-            self.models["en"] = spacy.load("en_core_web_lg")
+            if self.document_parser is not None:
+                self.document_parser.register("tokenizer")
+                self.models["en"] = self.document_parser.nlp
+            else:
+                self.models["en"] = spacy.load("en_core_web_lg")
             logger.info("Loaded English spaCy model")
             
             # Load multilingual model
@@ -122,9 +133,9 @@ class AdvancedTokenizer:
             
         except OSError as e:
             logger.warning(f"Could not load spaCy models: {e}")
-            # Fallback to basic models
-            self.models["en"] = English()
-            self.models["xx"] = MultiLanguage()
+            # Fallback to basic models for whichever failed to load
+            self.models.setdefault("en", English())
+            self.models.setdefault("xx", MultiLanguage())
     
     def _compile_patterns(self) -> Dict[str, re.Pattern]:
         """Compile regex patterns for token recognition."""
@@ -302,7 +313,10 @@ class AdvancedTokenizer:
         if not nlp:
             return self._fallback_tokenize(text, language)
         
-        doc = nlp(text)
+        if model_key == "en" and self.document_parser is not None:
+            doc = self.document_parser.parse(text)
+        else:
+            doc = nlp(text)
         tokens = []
         
         for token in doc:
@@ -491,7 +505,7 @@ class AdvancedTokenizer:
 # ============================================================================
 
 class TokenizerFactory:
-    """Factory for creating tokenizer instances."""
+    """Factory for creating tokenizer instances sharing the process-wide document parser."""
     
     _instances = {}
     
@@ -508,7 +522,9 @@ class TokenizerFactory:
             AdvancedTokenizer instance
         """
         if force_reload or language not in cls._instances:
-            cls._instances[language] = AdvancedTokenizer(language=language)
+            cls._instances[language] = AdvancedTokenizer(
+                language=language, document_parser=SharedDocumentParser.shared()
+            )
         
         return cls._instances[language]
     
@@ -0,0 +1,104 @@
+"""
+N.L.D.S. Async Micro-Batcher
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Async front end shared by the batched NLP engines (the embedding service and
+the intent recognizer): concurrent requests are collected for a few
+milliseconds and handed to a batch function on a single worker thread.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMicroBatcher:
+    """
+    Collects concurrent async requests into batches for a blocking batch function.
+    
+    A batch is dispatched once ``max_batch_size`` requests are pending or
+    ``max_wait_ms`` after its first request, whichever comes first. Batches
+    run on one worker thread so they reach the models one at a time and the
+    event loop is never blocked. If the batch function raises, every request
+    of that batch fails with the exception.
+    """
+    
+    def __init__(self, process_batch: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int = 64, max_wait_ms: float = 2.0,
+                 thread_name_prefix: str = "micro-batch"):
+        """
+        Initialize the micro-batcher.
+        
+        Args:
+            process_batch: Blocking callable mapping a list of requests to results in the same order
+            max_batch_size: Maximum requests per batch
+            max_wait_ms: How long a request waits for others to join its batch
+            thread_name_prefix: Name prefix of the worker thread
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.thread_name_prefix = thread_name_prefix
+        
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    async def submit(self, request: Any) -> Any:
+        """Queue one request and wait for its result from the next batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / 1000, self._flush_pending)
+        
+        return await future
+    
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call on the worker thread, serialized with the batches."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+    
+    def close(self):
+        """Stop the worker thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def _flush_pending(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        try:
+            results = await self.run(self.process_batch, [request for request, _ in batch])
+        except Exception as e:
+            logger.error(f"{self.thread_name_prefix} batch failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.thread_name_prefix)
+        return self._executor
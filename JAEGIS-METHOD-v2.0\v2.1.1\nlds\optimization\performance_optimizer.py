@@ -8,15 +8,22 @@ import time
 import logging
 import psutil
 import gc
-from typing import Dict, List, Any, Optional, Tuple
+import math
+import threading
+import unicodedata
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 import statistics
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import redis
 import json
+import zlib
 import hashlib
 
+from .segmented_lru import SegmentedLRUCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +104,69 @@ class OptimizationResult:
     timestamp: float
 
 
+class NLPResultCache:
+    """
+    In-process L1 for NLP results in front of Redis.
+    
+    A thread-safe segmented LRU bounded by entry count and by the serialized
+    size of its values, with a TTL per entry. Cached objects are shared with
+    callers and must be treated as read-only.
+    """
+    
+    def __init__(self, max_bytes: int, max_entries: int = 10000):
+        self._cache = SegmentedLRUCache(max_bytes, max_entries)
+        self._lock = threading.Lock()
+        self._lookups = {"hits": 0, "misses": 0}
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    @property
+    def max_bytes(self) -> int:
+        return self._cache.max_bytes
+    
+    @property
+    def max_entries(self) -> int:
+        return self._cache.max_entries
+    
+    @property
+    def current_bytes(self) -> int:
+        return self._cache.bytes_used
+    
+    @property
+    def statistics(self) -> Dict[str, int]:
+        return {**self._lookups, **self._cache.statistics}
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired."""
+        with self._lock:
+            value = self._cache.get(key)
+            self._lookups["misses" if value is None else "hits"] += 1
+            return value
+    
+    def put(self, key: str, value: Any, size: int, ttl_seconds: int):
+        """Store a value of the given serialized size, evicting LRU entries as needed."""
+        with self._lock:
+            self._cache.put(key, value, size, ttl_seconds)
+    
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every entry whose key starts with prefix; returns the number dropped."""
+        with self._lock:
+            keys = [key for key in self._cache.keys() if key.startswith(prefix)]
+            for key in keys:
+                self._cache.pop(key)
+            return len(keys)
+    
+    def resize(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None):
+        """Change the limits, evicting immediately when they shrink."""
+        with self._lock:
+            self._cache.resize(max_bytes, max_entries)
+    
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
 class PerformanceOptimizer:
     """
     N.L.D.S. Performance Optimization System
@@ -109,12 +179,20 @@ class PerformanceOptimizer:
     - Predictive scaling
     """
     
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
+    # Two-byte header of cached payloads: serialization format, compression.
+    # Only JSON is written or read; Redis contents are never unpickled.
+    FORMAT_MARKERS = {"json": b"j"}
+    COMPRESSED = b"z"
+    UNCOMPRESSED = b"-"
+    
+    def __init__(self, redis_client: Optional[redis.Redis] = None, auto_start: bool = True):
         self.redis_client = redis_client or redis.Redis(host='localhost', port=6379, db=0)
         
         # Performance tracking
         self.metrics_history: deque = deque(maxlen=1000)
         self.optimization_history: List[OptimizationResult] = []
+        self.request_latencies: deque = deque(maxlen=1000)
+        self.request_completions: deque = deque(maxlen=100000)
         
         # Configuration
         self.config = {
@@ -125,7 +203,18 @@ class PerformanceOptimizer:
             "cache_hit_ratio_target": 0.85,
             "optimization_interval": 60,  # seconds
             "metrics_collection_interval": 5,  # seconds
-            "performance_window": 300  # 5 minutes
+            "performance_window": 300,  # 5 minutes
+            "throughput_window": 60,  # seconds
+            "optimization_settle_seconds": 5,
+            "l1_cache_max_mb": 64,
+            "l1_cache_limit_mb": 512,
+            "l1_cache_max_entries": 10000,
+            "compression_threshold_bytes": 1024,
+            "compression_level": 6,
+            "min_worker_threads": 2,
+            "max_worker_threads": 32,
+            "queue_depth_per_worker": 10,
+            "connections_per_worker": 2
         }
         
         # Optimization rules
@@ -134,9 +223,34 @@ class PerformanceOptimizer:
         # Cache configurations
         self.cache_configs = self._initialize_cache_configs()
         
+        # L1 result cache and the model version of each cache type
+        self.l1_cache = NLPResultCache(
+            max_bytes=self.config["l1_cache_max_mb"] * 1024 * 1024,
+            max_entries=self.config["l1_cache_max_entries"]
+        )
+        self.model_versions: Dict[str, str] = defaultdict(lambda: "0")
+        self.cache_statistics = {
+            "lookups": 0,
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "compressed_writes": 0,
+            "bytes_before_compression": 0,
+            "bytes_written": 0,
+            "invalidations": 0
+        }
+        
+        # Managed worker pool for CPU-bound NLP work
+        self.worker_count = self.config["min_worker_threads"]
+        self.worker_pool = ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix="nlds-worker")
+        self._queued_tasks = 0
+        self._queue_lock = threading.Lock()
+        
         # Start background optimization
-        asyncio.create_task(self._performance_monitor())
-        asyncio.create_task(self._optimization_engine())
+        if auto_start:
+            asyncio.create_task(self._performance_monitor())
+            asyncio.create_task(self._optimization_engine())
         
         logger.info("Performance Optimizer initialized")
     
@@ -171,7 +285,7 @@ class PerformanceOptimizer:
                 name="CPU Usage Optimization",
                 description="Reduce CPU load when usage is high",
                 resource_type=ResourceType.CPU,
-                trigger_condition="cpu_usage_percent > 0.80",
+                trigger_condition="cpu_usage_percent > 80",
                 optimization_action="enable_request_throttling",
                 expected_improvement=0.20,
                 risk_level="medium"
@@ -230,7 +344,7 @@ class PerformanceOptimizer:
                 ttl_seconds=86400,  # 24 hours
                 eviction_policy=CacheStrategy.LFU,
                 compression_enabled=True,
-                serialization_format="pickle"
+                serialization_format="json"
             ),
             
             "conversation_context": CacheConfiguration(
@@ -269,7 +383,7 @@ class PerformanceOptimizer:
         memory_info = psutil.virtual_memory()
         memory_usage_mb = memory_info.used / (1024 * 1024)
         
-        # Application metrics (simulated - would integrate with actual monitoring)
+        # Application metrics, measured where the optimizer sees the work
         response_time_ms = await self._get_average_response_time()
         throughput_rps = await self._get_current_throughput()
         cache_hit_ratio = await self._get_cache_hit_ratio()
@@ -295,6 +409,9 @@ class PerformanceOptimizer:
     async def _get_average_response_time(self) -> float:
         """Get average response time from recent metrics."""
         
+        if self.request_latencies:
+            return statistics.mean(list(self.request_latencies)[-100:])
+        
         if len(self.metrics_history) < 5:
             return 320.0  # Default baseline
         
@@ -304,13 +421,18 @@ class PerformanceOptimizer:
     async def _get_current_throughput(self) -> float:
         """Get current throughput in requests per second."""
         
+        if self.request_completions:
+            window = self.config["throughput_window"]
+            cutoff = time.time() - window
+            return sum(1 for completed_at in self.request_completions if completed_at >= cutoff) / window
+        
         # Simulate throughput calculation
         base_throughput = 850.0
         
         # Adjust based on CPU usage
         if len(self.metrics_history) > 0:
             latest = self.metrics_history[-1]
-            cpu_factor = max(0.5, 1.0 - (latest.cpu_usage_percent - 0.5))
+            cpu_factor = max(0.5, 1.0 - (latest.cpu_usage_percent / 100 - 0.5))
             return base_throughput * cpu_factor
         
         return base_throughput
@@ -318,6 +440,10 @@ class PerformanceOptimizer:
     async def _get_cache_hit_ratio(self) -> float:
         """Get current cache hit ratio."""
         
+        if self.cache_statistics["lookups"]:
+            hits = self.cache_statistics["l1_hits"] + self.cache_statistics["l2_hits"]
+            return hits / self.cache_statistics["lookups"]
+        
         try:
             # Get cache statistics from Redis
             info = self.redis_client.info()
@@ -347,8 +473,7 @@ class PerformanceOptimizer:
     async def _get_queue_depth(self) -> int:
         """Get current queue depth."""
         
-        # Simulate queue depth
-        return 25
+        return self._queued_tasks
     
     async def optimize_performance(self, optimization_level: OptimizationLevel = OptimizationLevel.BALANCED) -> List[OptimizationResult]:
         """Perform performance optimization based on current metrics."""
@@ -418,25 +543,25 @@ class PerformanceOptimizer:
         
         # Apply optimization based on action
         if rule.optimization_action == "enable_aggressive_caching":
-            await self._enable_aggressive_caching()
+            await self._enable_aggressive_caching(before_metrics)
         
         elif rule.optimization_action == "optimize_cache_strategy":
-            await self._optimize_cache_strategy()
+            await self._optimize_cache_strategy(before_metrics)
         
         elif rule.optimization_action == "enable_request_throttling":
-            await self._enable_request_throttling()
+            await self._enable_request_throttling(before_metrics)
         
         elif rule.optimization_action == "trigger_garbage_collection":
-            await self._trigger_garbage_collection()
+            await self._trigger_garbage_collection(before_metrics)
         
         elif rule.optimization_action == "optimize_connection_pooling":
-            await self._optimize_connection_pooling()
+            await self._optimize_connection_pooling(before_metrics)
         
         elif rule.optimization_action == "increase_worker_threads":
-            await self._increase_worker_threads()
+            await self._increase_worker_threads(before_metrics)
         
         # Wait for optimization to take effect
-        await asyncio.sleep(5)
+        await asyncio.sleep(self.config["optimization_settle_seconds"])
         
         # Collect after metrics
         after_metrics = await self.collect_performance_metrics()
@@ -481,7 +606,7 @@ class PerformanceOptimizer:
         
         return 0.0
     
-    async def _enable_aggressive_caching(self):
+    async def _enable_aggressive_caching(self, metrics: PerformanceMetrics):
         """Enable aggressive caching strategies."""
         
         # Increase cache sizes and TTL
@@ -489,9 +614,13 @@ class PerformanceOptimizer:
             config.max_size_mb = int(config.max_size_mb * 1.5)
             config.ttl_seconds = int(config.ttl_seconds * 1.2)
         
-        logger.info("Enabled aggressive caching")
+        # Grow the L1 in proportion to how far response time is over target
+        overshoot = metrics.response_time_ms / self.config["target_response_time_ms"]
+        self._resize_l1_cache(self.config["l1_cache_max_mb"] * min(max(overshoot, 1.0), 2.0))
+        
+        logger.info(f"Enabled aggressive caching (L1 {self.config['l1_cache_max_mb']}MB)")
     
-    async def _optimize_cache_strategy(self):
+    async def _optimize_cache_strategy(self, metrics: PerformanceMetrics):
         """Optimize cache strategy based on usage patterns."""
         
         # Switch to more efficient eviction policies
@@ -499,31 +628,116 @@ class PerformanceOptimizer:
             if config.eviction_policy == CacheStrategy.LRU:
                 config.eviction_policy = CacheStrategy.ADAPTIVE
         
-        logger.info("Optimized cache strategy")
+        # Capacity misses: the L1 is evicting live entries, so give it room
+        l1_statistics = self.l1_cache.statistics
+        if l1_statistics["evictions"] > l1_statistics["expirations"]:
+            self._resize_l1_cache(self.config["l1_cache_max_mb"] * 1.5)
+            self.l1_cache.resize(max_entries=int(self.l1_cache.max_entries * 1.5))
+        
+        logger.info(f"Optimized cache strategy (hit ratio {metrics.cache_hit_ratio:.2f})")
     
-    async def _enable_request_throttling(self):
+    async def _enable_request_throttling(self, metrics: PerformanceMetrics):
         """Enable request throttling to reduce CPU load."""
         
-        # This would integrate with the actual request handling system
-        logger.info("Enabled request throttling")
+        # Fewer workers compete for the CPU; excess work waits in the queue
+        self.resize_worker_pool(math.floor(self.worker_count * 0.75))
+        logger.info(f"Enabled request throttling ({self.worker_count} workers)")
     
-    async def _trigger_garbage_collection(self):
+    async def _trigger_garbage_collection(self, metrics: PerformanceMetrics):
         """Trigger garbage collection to free memory."""
         
+        # Release L1 memory before collecting
+        self._resize_l1_cache(self.config["l1_cache_max_mb"] / 2)
+        
         gc.collect()
         logger.info("Triggered garbage collection")
     
-    async def _optimize_connection_pooling(self):
+    async def _optimize_connection_pooling(self, metrics: PerformanceMetrics):
         """Optimize database connection pooling."""
         
-        # This would adjust connection pool settings
+        # Every worker may hold Redis connections; make sure the pool has room
+        pool = getattr(self.redis_client, "connection_pool", None)
+        target = self.worker_count * self.config["connections_per_worker"]
+        if pool is not None and getattr(pool, "max_connections", target) < target:
+            pool.max_connections = target
+        
+        # Throughput is short while work is waiting and the CPU has headroom
+        if metrics.queue_depth > 0 and metrics.cpu_usage_percent / 100 < self.config["max_cpu_usage"]:
+            self.resize_worker_pool(self.worker_count + 1)
+        
         logger.info("Optimized connection pooling")
     
-    async def _increase_worker_threads(self):
+    async def _increase_worker_threads(self, metrics: PerformanceMetrics):
         """Increase worker thread count to handle queue depth."""
         
-        # This would adjust worker thread configuration
-        logger.info("Increased worker threads")
+        if metrics.cpu_usage_percent / 100 >= self.config["max_cpu_usage"]:
+            logger.info("Worker threads not increased: CPU saturated")
+            return
+        
+        extra_workers = math.ceil(metrics.queue_depth / self.config["queue_depth_per_worker"])
+        self.resize_worker_pool(self.worker_count + extra_workers)
+        logger.info(f"Increased worker threads to {self.worker_count}")
+    
+    def _resize_l1_cache(self, max_mb: float):
+        max_mb = min(max(max_mb, 1), self.config["l1_cache_limit_mb"])
+        self.config["l1_cache_max_mb"] = max_mb
+        self.l1_cache.resize(max_bytes=int(max_mb * 1024 * 1024))
+    
+    # ------------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------------
+    
+    def resize_worker_pool(self, worker_count: int) -> int:
+        """
+        Resize the worker pool within the configured bounds.
+        
+        Running and queued tasks finish on the previous pool's threads.
+        
+        Args:
+            worker_count: Requested number of worker threads
+            
+        Returns:
+            Worker count after resizing
+        """
+        worker_count = min(max(worker_count, self.config["min_worker_threads"]),
+                           self.config["max_worker_threads"])
+        if worker_count != self.worker_count:
+            previous_pool = self.worker_pool
+            self.worker_pool = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="nlds-worker")
+            previous_pool.shutdown(wait=False)
+            self.worker_count = worker_count
+        
+        return self.worker_count
+    
+    async def run_in_worker(self, func: Callable, *args) -> Any:
+        """
+        Run CPU-bound work on the managed pool, tracking queue depth and latency.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            
+        Returns:
+            Result of func
+        """
+        start_time = time.perf_counter()
+        with self._queue_lock:
+            self._queued_tasks += 1
+        
+        def run():
+            with self._queue_lock:
+                self._queued_tasks -= 1
+            return func(*args)
+        
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.worker_pool, run)
+        finally:
+            self.record_request((time.perf_counter() - start_time) * 1000)
+    
+    def record_request(self, duration_ms: float):
+        """Record a completed request for response time and throughput metrics."""
+        self.request_latencies.append(duration_ms)
+        self.request_completions.append(time.time())
     
     async def _performance_monitor(self):
         """Background performance monitoring task."""
@@ -576,7 +790,7 @@ class PerformanceOptimizer:
         target_achievement = {
             "response_time": avg_response_time <= targets["response_time_ms"],
             "throughput": avg_throughput >= targets["throughput_rps"],
-            "cpu_usage": avg_cpu_usage <= targets["cpu_usage"],
+            "cpu_usage": avg_cpu_usage / 100 <= targets["cpu_usage"],
             "memory_usage": avg_memory_usage <= targets["memory_usage_mb"],
             "cache_hit_ratio": avg_cache_hit_ratio >= targets["cache_hit_ratio"]
         }
@@ -596,46 +810,146 @@ class PerformanceOptimizer:
             "recent_optimizations": len([opt for opt in self.optimization_history if time.time() - opt.timestamp < 3600])
         }
     
+    # ------------------------------------------------------------------------
+    # Tiered NLP result cache
+    # ------------------------------------------------------------------------
+    
+    def nlp_cache_key(self, input_text: str, cache_type: str = "nlp_analysis") -> str:
+        """
+        Cache key for an NLP result.
+        
+        The text is NFC-normalized with whitespace collapsed, so formatting
+        variants share an entry, and the key carries the model version of the
+        cache type, so results of a replaced model are never served.
+        """
+        normalized = " ".join(unicodedata.normalize("NFC", input_text).split())
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{cache_type}:{self.model_versions[cache_type]}:{digest}"
+    
+    def _encode_result(self, result: Dict[str, Any], config: CacheConfiguration) -> Tuple[bytes, int]:
+        """Serialize as JSON and, for large payloads, compress; returns payload and raw size."""
+        body = json.dumps(result, separators=(",", ":")).encode("utf-8")
+        
+        raw_size = len(body)
+        marker = self.FORMAT_MARKERS["json"]
+        if config.compression_enabled and raw_size >= self.config["compression_threshold_bytes"]:
+            return marker + self.COMPRESSED + zlib.compress(body, self.config["compression_level"]), raw_size
+        
+        return marker + self.UNCOMPRESSED + body, raw_size
+    
+    def _decode_result(self, payload: bytes) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Decompress and parse a payload; returns the result and its raw size."""
+        marker, compression, body = payload[:1], payload[1:2], payload[2:]
+        if marker != self.FORMAT_MARKERS["json"]:
+            # Written in a format that is no longer read (e.g. pickle): a miss
+            return None, 0
+        
+        if compression == self.COMPRESSED:
+            body = zlib.decompress(body)
+        return json.loads(body), len(body)
+    
     async def cache_nlp_result(self, input_text: str, result: Dict[str, Any], cache_type: str = "nlp_analysis"):
-        """Cache NLP analysis result."""
+        """Cache NLP analysis result in the L1 and in Redis."""
         
-        cache_key = f"{cache_type}:{hashlib.md5(input_text.encode()).hexdigest()}"
+        cache_key = self.nlp_cache_key(input_text, cache_type)
         config = self.cache_configs.get(cache_type)
         
         if config:
             try:
-                serialized_result = json.dumps(result) if config.serialization_format == "json" else str(result)
+                payload, raw_size = self._encode_result(result, config)
                 
+                self.l1_cache.put(cache_key, result, raw_size, config.ttl_seconds)
                 self.redis_client.setex(
                     cache_key,
                     config.ttl_seconds,
-                    serialized_result
+                    payload
                 )
                 
+                self.cache_statistics["writes"] += 1
+                self.cache_statistics["bytes_before_compression"] += raw_size
+                self.cache_statistics["bytes_written"] += len(payload)
+                if payload[1:2] == self.COMPRESSED:
+                    self.cache_statistics["compressed_writes"] += 1
+                
                 logger.debug(f"Cached NLP result for key: {cache_key}")
                 
             except Exception as e:
                 logger.error(f"Failed to cache NLP result: {e}")
     
     async def get_cached_nlp_result(self, input_text: str, cache_type: str = "nlp_analysis") -> Optional[Dict[str, Any]]:
-        """Retrieve cached NLP analysis result."""
+        """Retrieve cached NLP analysis result, from the L1 first and then Redis."""
         
-        cache_key = f"{cache_type}:{hashlib.md5(input_text.encode()).hexdigest()}"
+        cache_key = self.nlp_cache_key(input_text, cache_type)
+        self.cache_statistics["lookups"] += 1
+        
+        result = self.l1_cache.get(cache_key)
+        if result is not None:
+            self.cache_statistics["l1_hits"] += 1
+            return result
         
         try:
             cached_result = self.redis_client.get(cache_key)
             
             if cached_result:
-                config = self.cache_configs.get(cache_type)
-                if config and config.serialization_format == "json":
-                    return json.loads(cached_result)
-                else:
-                    return eval(cached_result)  # Use with caution in production
+                result, raw_size = self._decode_result(cached_result)
+            
+            if result is not None:
+                # Promote to the L1 for the rest of the entry's lifetime, sized like writes
+                ttl = self.redis_client.ttl(cache_key)
+                if ttl and ttl > 0:
+                    self.l1_cache.put(cache_key, result, raw_size, ttl)
+                
+                self.cache_statistics["l2_hits"] += 1
+                return result
             
         except Exception as e:
             logger.error(f"Failed to retrieve cached result: {e}")
         
+        self.cache_statistics["misses"] += 1
         return None
+    
+    def invalidate_model(self, cache_type: str, model_version: str) -> int:
+        """
+        Invalidate cached results after a model reload.
+        
+        Switching the version makes every key of the old model unreachable;
+        L1 entries are dropped now and Redis entries expire with their TTL.
+        
+        Args:
+            cache_type: Cache type the reloaded model writes to
+            model_version: Version of the newly loaded model
+            
+        Returns:
+            Number of L1 entries dropped
+        """
+        previous_version = self.model_versions[cache_type]
+        if previous_version == model_version:
+            return 0
+        
+        self.model_versions[cache_type] = model_version
+        dropped = self.l1_cache.invalidate_prefix(f"{cache_type}:{previous_version}:")
+        self.cache_statistics["invalidations"] += 1
+        
+        logger.info(f"Invalidated {cache_type} cache: model {previous_version} -> {model_version}")
+        return dropped
+    
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """Tiered cache hit rates, compression ratio and L1 occupancy."""
+        lookups = self.cache_statistics["lookups"]
+        raw_bytes = self.cache_statistics["bytes_before_compression"]
+        
+        return {
+            **self.cache_statistics,
+            "l1_hit_ratio": self.cache_statistics["l1_hits"] / lookups if lookups else 0.0,
+            "hit_ratio": (self.cache_statistics["l1_hits"] + self.cache_statistics["l2_hits"]) / lookups if lookups else 0.0,
+            "compression_ratio": self.cache_statistics["bytes_written"] / raw_bytes if raw_bytes else 1.0,
+            "l1_entries": len(self.l1_cache),
+            "l1_bytes": self.l1_cache.current_bytes,
+            "l1_max_bytes": self.l1_cache.max_bytes,
+            "l1_evictions": self.l1_cache.statistics["evictions"],
+            "worker_count": self.worker_count,
+            "model_versions": dict(self.model_versions)
+        }
 
 
 # Example usage
@@ -0,0 +1,239 @@
+"""
+N.L.D.S. Segmented LRU Cache
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Byte-bounded segmented LRU (SLRU) cache used by the in-process cache tiers:
+the translation memory cache, the NLP result L1 and the P.I.T.C.E.S.
+caching layer L1.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+
+class SegmentedLRUCache:
+    """
+    Byte-bounded segmented LRU cache with a TTL per entry.
+    
+    New entries land in the probation segment and move to the protected
+    segment on their second hit, so one-off entries never push out
+    frequently reused ones. Protected overflow is demoted back to the
+    most-recently-used end of probation, and victims are taken from the
+    least-recently-used end of probation first.
+    
+    With track_frequency, accesses are also counted in an aging counter table
+    (TinyLFU-style), and puts with admission_check admit a new entry only
+    when it is more popular than the entry it would displace.
+    
+    Byte totals are running sums and every operation is O(1) amortized. The
+    cache is not thread-safe; callers hold their own lock.
+    """
+    
+    MAX_FREQUENCY = 15
+    
+    def __init__(self, max_bytes: int, max_entries: Optional[int] = None,
+                 protected_ratio: float = 0.8, track_frequency: bool = False):
+        """
+        Initialize the segmented LRU cache.
+        
+        Args:
+            max_bytes: Total byte budget across both segments
+            max_entries: Maximum number of entries (unbounded when None)
+            protected_ratio: Share of the byte budget reserved for the protected segment
+            track_frequency: Count accesses for admission checks
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.protected_ratio = protected_ratio
+        self.track_frequency = track_frequency
+        
+        # key -> [value, size_bytes, expires_at (monotonic)]
+        self.probation: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self.protected: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self.bytes_used = 0
+        self.protected_bytes = 0
+        
+        # Aging frequency table; counters are halved every sample period
+        self.frequency: Dict[str, int] = {}
+        self._sample_period = max((max_entries or 0) * 10, 100)
+        self._samples = 0
+        
+        self.statistics = {"evictions": 0, "expirations": 0, "promotions": 0}
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.protected or key in self.probation
+    
+    def __len__(self) -> int:
+        return len(self.protected) + len(self.probation)
+    
+    def keys(self) -> List[str]:
+        """Return all cached keys."""
+        return list(self.protected) + list(self.probation)
+    
+    def record_access(self, key: str):
+        """Count an access to ``key`` in the frequency table."""
+        self.frequency[key] = min(self.frequency.get(key, 0) + 1, self.MAX_FREQUENCY)
+        self._samples += 1
+        
+        if self._samples >= self._sample_period:
+            # Halve all counters so stale popularity fades out
+            self.frequency = {k: count >> 1 for k, count in self.frequency.items() if count > 1}
+            self._samples = 0
+    
+    def get(self, key: str, now: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        if self.track_frequency:
+            self.record_access(key)
+        
+        segment = self.protected if key in self.protected else self.probation
+        entry = segment.get(key)
+        if entry is None:
+            return None
+        
+        if entry[2] <= (time.monotonic() if now is None else now):
+            self._remove(key)
+            self.statistics["expirations"] += 1
+            return None
+        
+        if segment is self.protected:
+            segment.move_to_end(key)
+        else:
+            # Second hit: promote into the protected segment
+            del self.probation[key]
+            self.protected[key] = entry
+            self.protected_bytes += entry[1]
+            self.statistics["promotions"] += 1
+            self._rebalance()
+        
+        return entry[0]
+    
+    def put(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        ttl_seconds: float,
+        admission_check: bool = False
+    ) -> Optional[List[Tuple[str, Any]]]:
+        """
+        Insert or replace an entry, evicting victims to stay within the limits.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Approximate size of the value in bytes
+            ttl_seconds: Time to live
+            admission_check: Only admit if more frequent than the eviction victim
+        
+        Returns:
+            Evicted (key, value) pairs, or None if the entry was not admitted.
+            A value larger than ``max_bytes`` also drops any existing entry
+            for ``key``, which would otherwise be served stale; one refused
+            by the admission check leaves the existing entry in place.
+        """
+        if size > self.max_bytes:
+            if key in self:
+                self._remove(key)
+            return None
+        
+        replaced = self.protected.get(key) or self.probation.get(key)
+        
+        if admission_check and self._needs_eviction(size, replaced):
+            victim_key = self._victim_key(exclude=key)
+            if victim_key is not None and self.frequency.get(key, 0) <= self.frequency.get(victim_key, 0):
+                return None
+        
+        # Only replace the current entry once the new value is admitted
+        if replaced is not None:
+            self._remove(key)
+        
+        evicted = []
+        while self and self._needs_eviction(size):
+            victim_key = self._victim_key()
+            evicted.append((victim_key, self._remove(victim_key)))
+        self.statistics["evictions"] += len(evicted)
+        
+        self.probation[key] = [value, size, time.monotonic() + ttl_seconds]
+        self.bytes_used += size
+        
+        return evicted
+    
+    def pop(self, key: str) -> Optional[Any]:
+        """Remove ``key`` and return its value."""
+        if key not in self:
+            return None
+        return self._remove(key)
+    
+    def expire(self, now: Optional[float] = None) -> List[str]:
+        """Drop expired entries and return their keys."""
+        now = time.monotonic() if now is None else now
+        expired = [
+            key for segment in (self.probation, self.protected)
+            for key, entry in segment.items() if entry[2] <= now
+        ]
+        for key in expired:
+            self._remove(key)
+        self.statistics["expirations"] += len(expired)
+        return expired
+    
+    def resize(self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None) -> List[Tuple[str, Any]]:
+        """Change the limits, evicting down to them; returns evicted (key, value) pairs."""
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if max_entries is not None:
+            self.max_entries = max_entries
+        
+        evicted = []
+        while self and self._needs_eviction(0, incoming_entries=0):
+            victim_key = self._victim_key()
+            evicted.append((victim_key, self._remove(victim_key)))
+        self.statistics["evictions"] += len(evicted)
+        
+        self._rebalance()
+        return evicted
+    
+    def clear(self):
+        """Drop all entries, keeping the frequency table."""
+        self.probation.clear()
+        self.protected.clear()
+        self.bytes_used = 0
+        self.protected_bytes = 0
+    
+    def _needs_eviction(self, incoming_size: int, replaced: Optional[List[Any]] = None,
+                        incoming_entries: int = 1) -> bool:
+        """Check whether adding ``incoming_size`` bytes, replacing ``replaced``, exceeds a limit."""
+        freed_bytes, freed_entries = (replaced[1], 1) if replaced is not None else (0, 0)
+        if self.bytes_used - freed_bytes + incoming_size > self.max_bytes:
+            return True
+        return (self.max_entries is not None and
+                len(self) - freed_entries + incoming_entries > self.max_entries)
+    
+    def _victim_key(self, exclude: Optional[str] = None) -> Optional[str]:
+        """Return the next eviction candidate (probation LRU first), skipping ``exclude``."""
+        for segment in (self.probation, self.protected):
+            candidates = iter(segment)
+            candidate = next(candidates, None)
+            if candidate is not None and candidate == exclude:
+                candidate = next(candidates, None)
+            if candidate is not None:
+                return candidate
+        return None
+    
+    def _remove(self, key: str) -> Any:
+        """Remove an entry from whichever segment holds it."""
+        entry = self.protected.pop(key, None)
+        if entry is not None:
+            self.protected_bytes -= entry[1]
+        else:
+            entry = self.probation.pop(key)
+        self.bytes_used -= entry[1]
+        return entry[0]
+    
+    def _rebalance(self):
+        """Demote protected LRU entries to probation while protected is over its share."""
+        limit = self.max_bytes * self.protected_ratio
+        while self.protected_bytes > limit and len(self.protected) > 1:
+            key, entry = self.protected.popitem(last=False)
+            self.protected_bytes -= entry[1]
+            self.probation[key] = entry
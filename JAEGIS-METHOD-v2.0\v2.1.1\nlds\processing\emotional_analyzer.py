@@ -28,6 +28,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 from ..nlp.tokenizer import TokenizationResult
 from ..nlp.semantic_analyzer import SemanticAnalysisResult
 from ..nlp.context_extractor import ContextExtractionResult
+from ..nlp.document_parser import SharedDocumentParser
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -143,8 +144,15 @@ class EmotionalAnalysisEngine:
     - Response tone adaptation
     """
     
-    def __init__(self):
-        """Initialize emotional analysis engine."""
+    def __init__(self, document_parser: Optional[SharedDocumentParser] = None):
+        """
+        Initialize emotional analysis engine.
+        
+        Args:
+            document_parser: Shared parser providing the spaCy pipeline instead
+                of loading a separate copy
+        """
+        self.document_parser = document_parser
         self.sentiment_analyzers = {}
         self.emotion_models = {}
         self.emotional_lexicons = self._load_emotional_lexicons()
@@ -181,8 +189,12 @@ class EmotionalAnalysisEngine:
             
             # spaCy for linguistic features
             try:
-                import spacy
-                self.nlp = spacy.load("en_core_web_lg")
+                if self.document_parser is not None:
+                    self.document_parser.register("emotional_analysis")
+                    self.nlp = self.document_parser.nlp
+                else:
+                    import spacy
+                    self.nlp = spacy.load("en_core_web_lg")
                 logger.info("Loaded spaCy model for emotional analysis")
             except Exception as e:
                 logger.warning(f"Failed to load spaCy model: {e}")
@@ -27,6 +27,7 @@ from ..nlp.tokenizer import TokenizationResult
 from ..nlp.semantic_analyzer import SemanticAnalysisResult
 from ..nlp.intent_recognizer import IntentRecognitionResult, IntentCategory
 from ..nlp.context_extractor import ContextExtractionResult
+from ..nlp.document_parser import SharedDocumentParser
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -141,8 +142,15 @@ class LogicalAnalysisEngine:
     - JAEGIS-specific logical patterns
     """
     
-    def __init__(self):
-        """Initialize logical analysis engine."""
+    def __init__(self, document_parser: Optional[SharedDocumentParser] = None):
+        """
+        Initialize logical analysis engine.
+        
+        Args:
+            document_parser: Shared parser whose docs are reused instead of
+                loading and running a separate spaCy pipeline
+        """
+        self.document_parser = document_parser
         self.nlp = None
         self.matcher = None
         self.logical_patterns = self._load_logical_patterns()
@@ -156,7 +164,11 @@ class LogicalAnalysisEngine:
     def _initialize_nlp(self):
         """Initialize NLP components for logical analysis."""
         try:
-            self.nlp = spacy.load("en_core_web_lg")
+            if self.document_parser is not None:
+                self.document_parser.register("logical_analysis")
+                self.nlp = self.document_parser.nlp
+            else:
+                self.nlp = spacy.load("en_core_web_lg")
             self.matcher = Matcher(self.nlp.vocab)
             
             # Add logical patterns to matcher
@@ -167,6 +179,12 @@ class LogicalAnalysisEngine:
         except Exception as e:
             logger.error(f"Failed to initialize NLP components: {e}")
     
+    def _parse(self, text: str):
+        """Parse text, reusing the shared doc when a document parser is set."""
+        if self.document_parser is not None:
+            return self.document_parser.parse(text)
+        return self.nlp(text)
+    
     def _load_logical_patterns(self) -> Dict[str, List[Dict]]:
         """Load logical reasoning patterns."""
         return {
@@ -286,10 +304,11 @@ class LogicalAnalysisEngine:
         if not self.nlp:
             return requirements
         
-        doc = self.nlp(text)
+        doc = self._parse(text)
         
         # Extract sentences for requirement analysis
-        sentences = [sent.text.strip() for sent in doc.sents]
+        spans = list(doc.sents)
+        sentences = [sent.text.strip() for sent in spans]
         
         for i, sentence in enumerate(sentences):
             # Classify requirement type
@@ -303,7 +322,7 @@ class LogicalAnalysisEngine:
                 dependencies = self._extract_dependencies(sentence, sentences)
                 
                 # Extract conditions
-                conditions = self._extract_conditions(sentence)
+                conditions = self._extract_conditions(sentence, spans[i])
                 
                 # Extract acceptance criteria
                 acceptance_criteria = self._extract_acceptance_criteria(sentence)
@@ -384,20 +403,17 @@ class LogicalAnalysisEngine:
         
         return dependencies
     
-    def _extract_conditions(self, text: str) -> List[str]:
-        """Extract conditions from text."""
+    def _extract_conditions(self, text: str, doclike=None) -> List[str]:
+        """Extract conditions from text, matching on an already parsed doc or span if given."""
         conditions = []
         
         # Use spaCy matcher to find conditional patterns
         if self.nlp and self.matcher:
-            doc = self.nlp(text)
-            matches = self.matcher(doc)
+            if doclike is None:
+                doclike = self._parse(text)
             
-            for match_id, start, end in matches:
-                span = doc[start:end]
-                label = self.nlp.vocab.strings[match_id]
-                
-                if "conditional" in label:
+            for span in self.matcher(doclike, as_spans=True):
+                if "conditional" in span.label_:
                     conditions.append(span.text)
         
         return conditions
@@ -465,7 +481,7 @@ class LogicalAnalysisEngine:
         if not self.nlp:
             return LogicalStructure(premises, conclusions, logical_flow, 0.0, 0.0)
         
-        doc = self.nlp(text)
+        doc = self._parse(text)
         
         # Extract logical statements
         for sent in doc.sents:
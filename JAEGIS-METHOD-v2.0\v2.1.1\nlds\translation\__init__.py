@@ -71,6 +71,14 @@ from .translation_optimizer import (
     CacheEntry,
     PerformanceMetrics,
     OptimizationResult,
+    SegmentedLRUCache,
+    StageExecutor,
+    PipelineStage,
+    StageGraph,
+    StageGraphResult,
+    EngineMethodCall,
+    build_dimensional_analysis_graph,
+    build_component_graph,
     TranslationOptimizationUtils
 )
 
@@ -140,5 +148,13 @@ __all__ = [
     "CacheEntry",
     "PerformanceMetrics",
     "OptimizationResult",
+    "SegmentedLRUCache",
+    "StageExecutor",
+    "PipelineStage",
+    "StageGraph",
+    "StageGraphResult",
+    "EngineMethodCall",
+    "build_dimensional_analysis_graph",
+    "build_component_graph",
     "TranslationOptimizationUtils"
 ]
@@ -10,12 +10,12 @@ import time
 import asyncio
 import hashlib
 import pickle
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, List, Optional, Tuple, Any, Set, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import threading
 from functools import lru_cache, wraps
 import redis
@@ -31,6 +31,7 @@ from .mode_selector import ModeSelectionResult
 from .squad_selector import SquadSelectionResult
 from .confidence_validator import ConfidenceValidationResult
 from .alternative_generator import AlternativeGenerationResult
+from ..optimization.segmented_lru import SegmentedLRUCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -64,6 +65,13 @@ class ProcessingMode(Enum):
     ADAPTIVE = "adaptive"     # Adaptive based on load
 
 
+class StageExecutor(Enum):
+    """Where a pipeline stage runs."""
+    INLINE = "inline"    # Awaited on the event loop
+    THREAD = "thread"    # Thread pool, for blocking or GIL-releasing work
+    PROCESS = "process"  # Process pool, for CPU-bound work (inputs are pickled)
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata."""
@@ -90,6 +98,32 @@ class PerformanceMetrics:
     optimization_savings_ms: float
 
 
+@dataclass
+class PipelineStage:
+    """
+    Declarative pipeline stage.
+    
+    Dependencies name graph inputs or other stages and are passed to func as
+    keyword arguments of the same name.
+    """
+    name: str
+    func: Callable[..., Any]
+    dependencies: List[str] = field(default_factory=list)
+    executor: StageExecutor = StageExecutor.INLINE
+    cacheable: bool = True
+    version: str = "1"
+
+
+@dataclass
+class StageGraphResult:
+    """Result of one stage graph execution."""
+    results: Dict[str, Any]
+    stage_times_ms: Dict[str, float]
+    cached_stages: List[str]
+    total_time_ms: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class OptimizationResult:
     """Translation optimization result."""
@@ -103,6 +137,236 @@ class OptimizationResult:
     metadata: Dict[str, Any]
 
 
+# ============================================================================
+# PIPELINE STAGE GRAPH
+# ============================================================================
+
+def _call_stage_function(func: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+    """Run a stage function outside the event loop, driving coroutines to completion."""
+    result = func(**kwargs)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+class EngineMethodCall:
+    """
+    Picklable call of an analysis engine method.
+    
+    The engine is constructed once per process on first use, so the same
+    stage declaration runs inline, in a worker thread or in a worker process
+    without shipping loaded models across process boundaries. Engines built
+    with share_document_parser get the process-wide SharedDocumentParser, so
+    all of them in a process reuse one spaCy pipeline and one parse per text.
+    """
+    
+    _engines: Dict[type, Any] = {}
+    _engines_lock = threading.Lock()
+    
+    def __init__(self, engine_class: type, method_name: str, share_document_parser: bool = False):
+        self.engine_class = engine_class
+        self.method_name = method_name
+        self.share_document_parser = share_document_parser
+    
+    def __call__(self, **kwargs) -> Any:
+        engine = self._engines.get(self.engine_class)
+        if engine is None:
+            with self._engines_lock:
+                engine = self._engines.get(self.engine_class)
+                if engine is None:
+                    engine = self._engines[self.engine_class] = self._create_engine()
+        return getattr(engine, self.method_name)(**kwargs)
+    
+    def _create_engine(self) -> Any:
+        if self.share_document_parser:
+            from ..nlp.document_parser import SharedDocumentParser
+            return self.engine_class(document_parser=SharedDocumentParser.shared())
+        return self.engine_class()
+
+
+class StageGraph:
+    """
+    Dependency graph of pipeline stages.
+    
+    Stages are validated and topologically ordered once at construction.
+    Names that are not stages are graph inputs supplied per request.
+    """
+    
+    def __init__(self, stages: List[PipelineStage]):
+        """
+        Initialize stage graph.
+        
+        Args:
+            stages: Stage declarations
+            
+        Raises:
+            ValueError: On duplicate stage names or dependency cycles
+        """
+        self.stages: Dict[str, PipelineStage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate pipeline stage: {stage.name}")
+            self.stages[stage.name] = stage
+        
+        self.inputs: Set[str] = {
+            dependency for stage in stages for dependency in stage.dependencies
+            if dependency not in self.stages
+        }
+        self.order = self._topological_order()
+    
+    def _topological_order(self) -> List[str]:
+        """Order stages so every stage follows its dependencies (Kahn's algorithm)."""
+        pending = {
+            name: {d for d in stage.dependencies if d in self.stages}
+            for name, stage in self.stages.items()
+        }
+        dependents: Dict[str, List[str]] = {name: [] for name in self.stages}
+        for name, dependencies in pending.items():
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+        
+        ready = [name for name, dependencies in pending.items() if not dependencies]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in dependents[name]:
+                pending[dependent].discard(name)
+                if not pending[dependent]:
+                    ready.append(dependent)
+        
+        if len(order) != len(self.stages):
+            cyclic = sorted(set(self.stages) - set(order))
+            raise ValueError(f"Pipeline stage dependencies form a cycle: {cyclic}")
+        return order
+    
+    def stage_keys(self, input_digests: Dict[str, str]) -> Dict[str, str]:
+        """
+        Derive a cache key per stage from the input digests.
+        
+        A stage key hashes the stage name, version and the keys of its
+        dependencies, so keys are known before any stage runs and no
+        intermediate result has to be hashed.
+        """
+        keys = dict(input_digests)
+        for name in self.order:
+            stage = self.stages[name]
+            digest = hashlib.blake2b(f"{name}:{stage.version}".encode("utf-8"), digest_size=16)
+            for dependency in sorted(stage.dependencies):
+                digest.update(f"|{dependency}={keys[dependency]}".encode("utf-8"))
+            keys[name] = digest.hexdigest()
+        return {name: keys[name] for name in self.order}
+
+
+def build_dimensional_analysis_graph(cpu_executor: StageExecutor = StageExecutor.PROCESS,
+                                     extra_stages: Optional[List[PipelineStage]] = None) -> StageGraph:
+    """
+    Declare the logical, emotional, creative and synthesis stages.
+    
+    Logical and emotional analysis are independent and run concurrently;
+    creative interpretation waits for the logical result. Downstream stages
+    (validation, mode and squad selection, command generation) need request
+    state such as the cognitive state and are appended via extra_stages.
+    
+    Args:
+        cpu_executor: Executor for the CPU-bound analysis stages
+        extra_stages: Additional stages depending on these results
+        
+    Returns:
+        Stage graph with inputs text, semantic_result, intent_result and context_result
+    """
+    from ..processing.logical_analyzer import LogicalAnalysisEngine
+    from ..processing.emotional_analyzer import EmotionalAnalysisEngine
+    from ..processing.creative_interpreter import CreativeInterpretationEngine
+    from ..processing.dimensional_synthesizer import DimensionalSynthesisEngine
+    
+    stages = [
+        PipelineStage(
+            "logical_result",
+            EngineMethodCall(LogicalAnalysisEngine, "analyze_logical_structure", share_document_parser=True),
+            ["text", "semantic_result", "intent_result", "context_result"],
+            cpu_executor
+        ),
+        PipelineStage(
+            "emotional_result",
+            EngineMethodCall(EmotionalAnalysisEngine, "analyze_emotional_context", share_document_parser=True),
+            ["text", "semantic_result", "context_result"],
+            cpu_executor
+        ),
+        PipelineStage(
+            "creative_result",
+            EngineMethodCall(CreativeInterpretationEngine, "analyze_creative_potential"),
+            ["text", "semantic_result", "intent_result", "logical_result"],
+            cpu_executor
+        ),
+        PipelineStage(
+            "synthesis_result",
+            EngineMethodCall(DimensionalSynthesisEngine, "synthesize_dimensions"),
+            ["text", "logical_result", "emotional_result", "creative_result"]
+        )
+    ]
+    return StageGraph(stages + list(extra_stages or []))
+
+
+class _ComponentCall:
+    """Adapt a translation component function, ``func(text)`` or ``func(text, results)``, to a stage."""
+    
+    def __init__(self, name: str, func: Callable[..., Any], pass_results: bool = False,
+                 failure_result: bool = False):
+        self.name = name
+        self.func = func
+        self.pass_results = pass_results
+        self.failure_result = failure_result
+    
+    def __call__(self, text: str, **results) -> Any:
+        try:
+            return self.func(text, results) if self.pass_results else self.func(text)
+        except Exception as e:
+            if not self.failure_result:
+                raise
+            logger.error(f"Parallel component {self.name} failed: {e}")
+            return None
+
+
+def build_component_graph(processing_functions: Dict[str, Callable[..., Any]],
+                          parallel_components: List[str]) -> StageGraph:
+    """
+    Declare translation components as a stage graph.
+    
+    Parallel components take the text only and run concurrently; a failing
+    one yields None. The remaining components run in declaration order after
+    all parallel components, and dimensional synthesis and command generation
+    also receive the earlier results as a dictionary.
+    
+    Args:
+        processing_functions: Component functions by name
+        parallel_components: Names of components that only need the text
+        
+    Returns:
+        Stage graph with the single input text
+    """
+    parallel = [name for name in processing_functions if name in parallel_components]
+    stages = [
+        PipelineStage(name, _ComponentCall(name, processing_functions[name], failure_result=True),
+                      ["text"], StageExecutor.THREAD, cacheable=False)
+        for name in parallel
+    ]
+    
+    earlier = list(parallel)
+    for name, func in processing_functions.items():
+        if name in parallel_components:
+            continue
+        pass_results = name in ("dimensional_synthesis", "command_generation")
+        stages.append(PipelineStage(
+            name, _ComponentCall(name, func, pass_results),
+            ["text"] + (earlier if pass_results else earlier[-1:]),
+            StageExecutor.THREAD, cacheable=False
+        ))
+        earlier.append(name)
+    
+    return StageGraph(stages)
+
+
 # ============================================================================
 # TRANSLATION OPTIMIZATION ENGINE
 # ============================================================================
@@ -136,8 +400,11 @@ class TranslationOptimizationEngine:
         self.optimization_level = optimization_level
         self.max_workers = max_workers
         
+        # Performance monitoring settings (cache budget depends on them)
+        self.optimization_settings = self._load_optimization_settings()
+        
         # Caching setup
-        self.memory_cache = {}
+        self.memory_cache = SegmentedLRUCache(self.optimization_settings["max_cache_size_mb"] * 1024 * 1024)
         self.cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
         self.cache_lock = threading.RLock()
         
@@ -153,11 +420,11 @@ class TranslationOptimizationEngine:
         
         # Parallel processing setup
         self.thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+        self.process_pool: Optional[ProcessPoolExecutor] = None
         self.processing_stats = {"parallel_tasks": 0, "sequential_tasks": 0}
         
         # Performance monitoring
         self.performance_history = []
-        self.optimization_settings = self._load_optimization_settings()
         self.component_benchmarks = {}
         
         # Adaptive optimization
@@ -222,7 +489,7 @@ class TranslationOptimizationEngine:
                 "enabled": True,
                 "cache_types": [CacheType.MEMORY, CacheType.REDIS],
                 "cache_key_strategies": ["content_hash", "semantic_hash", "intent_hash"],
-                "eviction_policy": "lru_with_frequency"
+                "eviction_policy": "segmented_lru"
             },
             "parallel_processing": {
                 "enabled": True,
@@ -269,37 +536,49 @@ class TranslationOptimizationEngine:
     
     def get_from_cache(self, cache_key: str) -> Optional[Any]:
         """Retrieve item from cache with statistics tracking."""
-        # Try memory cache first
+        value = self._get_from_memory(cache_key)
+        if value is None and self.redis_client:
+            value = self._get_from_redis(cache_key)
+        
+        if value is None:
+            self.cache_stats["misses"] += 1
+        return value
+    
+    async def aget_from_cache(self, cache_key: str) -> Optional[Any]:
+        """Async get_from_cache: memory hits are served inline, the Redis read and unpickling run on a worker thread."""
+        value = self._get_from_memory(cache_key)
+        if value is None and self.redis_client:
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(self.thread_pool, self._get_from_redis, cache_key)
+        
+        if value is None:
+            self.cache_stats["misses"] += 1
+        return value
+    
+    def _get_from_memory(self, cache_key: str) -> Optional[Any]:
+        """Look up the memory cache, counting a hit."""
         with self.cache_lock:
-            if cache_key in self.memory_cache:
-                entry = self.memory_cache[cache_key]
+            entry = self.memory_cache.get(cache_key)
+            if entry is not None:
+                entry.last_accessed = datetime.utcnow()
+                entry.access_count += 1
+                self.cache_stats["hits"] += 1
+                return entry.value
+        return None
+    
+    def _get_from_redis(self, cache_key: str) -> Optional[Any]:
+        """Look up Redis, counting a hit and keeping the value in memory."""
+        try:
+            cached_data = self.redis_client.get(cache_key)
+            if cached_data:
+                value = pickle.loads(cached_data)
+                self.cache_stats["hits"] += 1
                 
-                # Check TTL
-                if datetime.utcnow() - entry.created_at < timedelta(seconds=entry.ttl_seconds):
-                    entry.last_accessed = datetime.utcnow()
-                    entry.access_count += 1
-                    self.cache_stats["hits"] += 1
-                    return entry.value
-                else:
-                    # Expired entry
-                    del self.memory_cache[cache_key]
-                    self.cache_stats["evictions"] += 1
-        
-        # Try Redis cache
-        if self.redis_client:
-            try:
-                cached_data = self.redis_client.get(cache_key)
-                if cached_data:
-                    value = pickle.loads(cached_data)
-                    self.cache_stats["hits"] += 1
-                    
-                    # Store in memory cache for faster access
-                    self.store_in_cache(cache_key, value, ttl_seconds=300)  # 5 min memory cache
-                    return value
-            except Exception as e:
-                logger.warning(f"Redis cache retrieval failed: {e}")
-        
-        self.cache_stats["misses"] += 1
+                # Keep in memory for faster access; the payload is already in Redis
+                self._store_in_memory(cache_key, value, len(cached_data), ttl_seconds=300)  # 5 min memory cache
+                return value
+        except Exception as e:
+            logger.warning(f"Redis cache retrieval failed: {e}")
         return None
     
     def store_in_cache(self, cache_key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
@@ -307,64 +586,43 @@ class TranslationOptimizationEngine:
         if ttl_seconds is None:
             ttl_seconds = self.optimization_settings["cache_ttl_seconds"]
         
-        # Calculate size
+        # Serialize once, outside the lock; the same bytes size the entry and go to Redis
         try:
-            size_bytes = len(pickle.dumps(value))
-        except:
-            size_bytes = 1024  # Estimate
+            serialized_value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            serialized_value = None
+        
+        size_bytes = len(serialized_value) if serialized_value is not None else 1024  # Estimate
+        self._store_in_memory(cache_key, value, size_bytes, ttl_seconds)
         
-        # Create cache entry
+        # Store in Redis cache
+        if self.redis_client and serialized_value is not None:
+            try:
+                self.redis_client.setex(cache_key, ttl_seconds, serialized_value)
+            except Exception as e:
+                logger.warning(f"Redis cache storage failed: {e}")
+    
+    async def astore_in_cache(self, cache_key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """Async store_in_cache: pickling and the Redis write run on a worker thread."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.thread_pool, self.store_in_cache, cache_key, value, ttl_seconds)
+    
+    def _store_in_memory(self, cache_key: str, value: Any, size_bytes: int, ttl_seconds: int) -> None:
+        """Insert an already sized value into the memory cache."""
+        now = datetime.utcnow()
         entry = CacheEntry(
             key=cache_key,
             value=value,
-            created_at=datetime.utcnow(),
-            last_accessed=datetime.utcnow(),
+            created_at=now,
+            last_accessed=now,
             access_count=1,
             ttl_seconds=ttl_seconds,
             size_bytes=size_bytes
         )
         
-        # Store in memory cache
         with self.cache_lock:
-            # Check memory limit
-            current_size = sum(e.size_bytes for e in self.memory_cache.values())
-            max_size = self.optimization_settings["max_cache_size_mb"] * 1024 * 1024
-            
-            if current_size + size_bytes > max_size:
-                self._evict_cache_entries()
-            
-            self.memory_cache[cache_key] = entry
-        
-        # Store in Redis cache
-        if self.redis_client:
-            try:
-                serialized_value = pickle.dumps(value)
-                self.redis_client.setex(cache_key, ttl_seconds, serialized_value)
-            except Exception as e:
-                logger.warning(f"Redis cache storage failed: {e}")
-    
-    def _evict_cache_entries(self) -> None:
-        """Evict cache entries using LRU with frequency policy."""
-        if not self.memory_cache:
-            return
-        
-        # Calculate eviction scores (LRU + frequency)
-        current_time = datetime.utcnow()
-        eviction_scores = {}
-        
-        for key, entry in self.memory_cache.items():
-            age_hours = (current_time - entry.last_accessed).total_seconds() / 3600
-            frequency_score = entry.access_count / max(age_hours, 0.1)
-            eviction_scores[key] = frequency_score
-        
-        # Sort by eviction score (lower = more likely to evict)
-        sorted_entries = sorted(eviction_scores.items(), key=lambda x: x[1])
-        
-        # Evict bottom 25% of entries
-        evict_count = max(1, len(sorted_entries) // 4)
-        for key, _ in sorted_entries[:evict_count]:
-            del self.memory_cache[key]
-            self.cache_stats["evictions"] += 1
+            evicted = self.memory_cache.put(cache_key, entry, size_bytes, ttl_seconds)
+            self.cache_stats["evictions"] += len(evicted or [])
     
     def execute_parallel_tasks(self, tasks: List[Tuple[callable, tuple]]) -> List[Any]:
         """Execute tasks in parallel with load balancing."""
@@ -396,6 +654,123 @@ class TranslationOptimizationEngine:
         self.processing_stats["parallel_tasks"] += len(tasks)
         return results
     
+    async def execute_stage_graph(self, graph: StageGraph, inputs: Dict[str, Any],
+                                  outputs: Optional[List[str]] = None) -> StageGraphResult:
+        """
+        Execute a stage graph, running each stage as soon as its dependencies finish.
+        
+        Intermediate results are handed to dependent stages as in-memory
+        objects; only process-pool stages pickle their arguments, and cache
+        reads and writes that pickle or reach Redis run on worker threads. Cacheable
+        stages are looked up by a key derived from the input hashes before
+        their dependencies are resolved, so a cache hit also skips every
+        upstream stage that nothing else needs.
+        
+        Args:
+            graph: Stage graph to execute
+            inputs: Graph input values by name
+            outputs: Stages to resolve (defaults to all stages)
+            
+        Returns:
+            Stage graph result with per-stage latency
+        """
+        start_time = time.perf_counter()
+        missing = graph.inputs - inputs.keys()
+        if missing:
+            raise ValueError(f"Missing pipeline inputs: {sorted(missing)}")
+        
+        stage_keys = graph.stage_keys({name: self._digest_input(inputs[name]) for name in graph.inputs})
+        loop = asyncio.get_running_loop()
+        tasks: Dict[str, asyncio.Future] = {}
+        stage_times: Dict[str, float] = {}
+        cached_stages: List[str] = []
+        
+        def resolve(name: str) -> Any:
+            if name in inputs:
+                future = loop.create_future()
+                future.set_result(inputs[name])
+                return future
+            if name not in tasks:
+                tasks[name] = asyncio.ensure_future(run_stage(graph.stages[name]))
+            return tasks[name]
+        
+        async def run_stage(stage: PipelineStage) -> Any:
+            cache_key = f"stage:{stage.name}:{stage_keys[stage.name]}"
+            if stage.cacheable:
+                lookup_start = time.perf_counter()
+                cached = await self.aget_from_cache(cache_key)
+                if cached is not None:
+                    stage_times[stage.name] = (time.perf_counter() - lookup_start) * 1000
+                    cached_stages.append(stage.name)
+                    return cached
+            
+            values = await asyncio.gather(*(resolve(d) for d in stage.dependencies))
+            kwargs = dict(zip(stage.dependencies, values))
+            
+            stage_start = time.perf_counter()
+            try:
+                result = await self._run_stage(stage, kwargs, loop)
+            except Exception as e:
+                logger.error(f"Pipeline stage {stage.name} failed: {e}")
+                raise
+            stage_times[stage.name] = (time.perf_counter() - stage_start) * 1000
+            self._record_component_time(stage.name, stage_times[stage.name])
+            
+            if stage.cacheable and result is not None:
+                await self.astore_in_cache(cache_key, result)
+            return result
+        
+        requested = outputs if outputs is not None else graph.order
+        try:
+            values = await asyncio.gather(*(resolve(name) for name in requested))
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        
+        self.processing_stats["parallel_tasks"] += len(tasks) - len(cached_stages)
+        
+        return StageGraphResult(
+            results=dict(zip(requested, values)),
+            stage_times_ms=stage_times,
+            cached_stages=cached_stages,
+            total_time_ms=(time.perf_counter() - start_time) * 1000,
+            metadata={"stages_run": len(tasks) - len(cached_stages), "stages_cached": len(cached_stages)}
+        )
+    
+    async def _run_stage(self, stage: PipelineStage, kwargs: Dict[str, Any],
+                         loop: asyncio.AbstractEventLoop) -> Any:
+        """Run one stage on its declared executor."""
+        if stage.executor == StageExecutor.THREAD:
+            return await loop.run_in_executor(self.thread_pool, _call_stage_function, stage.func, kwargs)
+        
+        if stage.executor == StageExecutor.PROCESS:
+            if self.process_pool is None:
+                self.process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return await loop.run_in_executor(self.process_pool, _call_stage_function, stage.func, kwargs)
+        
+        result = stage.func(**kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+    
+    def _digest_input(self, value: Any) -> str:
+        """Hash a graph input for stage cache keys."""
+        if isinstance(value, str):
+            data = value.encode("utf-8")
+        else:
+            try:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                data = repr(value).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    def _record_component_time(self, component_name: str, execution_time: float) -> None:
+        """Append a component timing, keeping the last 100 measurements."""
+        benchmarks = self.component_benchmarks.setdefault(component_name, [])
+        benchmarks.append(execution_time)
+        if len(benchmarks) > 100:
+            del benchmarks[:-100]
+    
     def measure_component_performance(self, component_name: str):
         """Decorator to measure component performance."""
         def decorator(func):
@@ -406,14 +781,7 @@ class TranslationOptimizationEngine:
                 execution_time = (time.time() - start_time) * 1000
                 
                 # Update component benchmarks
-                if component_name not in self.component_benchmarks:
-                    self.component_benchmarks[component_name] = []
-                
-                self.component_benchmarks[component_name].append(execution_time)
-                
-                # Keep only recent measurements (last 100)
-                if len(self.component_benchmarks[component_name]) > 100:
-                    self.component_benchmarks[component_name] = self.component_benchmarks[component_name][-100:]
+                self._record_component_time(component_name, execution_time)
                 
                 return result
             return wrapper
@@ -493,6 +861,44 @@ class TranslationOptimizationEngine:
             "component_times": component_times
         }
     
+    async def _execute_translation_graph(self, text: str,
+                                         processing_functions: Dict[str, callable]) -> Dict[str, Any]:
+        """
+        Async optimize_translation_pipeline: components run as a stage graph.
+        
+        The combined results are cached under the same semantic hash key, but
+        independent components overlap on worker threads and nothing blocks
+        the event loop.
+        """
+        start_time = time.time()
+        
+        cache_key = self.generate_cache_key(text, "semantic_hash")
+        cached_result = await self.aget_from_cache(cache_key)
+        if cached_result:
+            logger.debug(f"Cache hit for key: {cache_key[:8]}...")
+            return {
+                "results": cached_result,
+                "cache_hit": True,
+                "total_time_ms": (time.time() - start_time) * 1000,
+                "component_times": {"cache_retrieval": (time.time() - start_time) * 1000}
+            }
+        
+        parallel_processing = self.optimization_strategies["parallel_processing"]
+        graph = build_component_graph(
+            processing_functions,
+            parallel_processing["parallel_components"] if parallel_processing["enabled"] else []
+        )
+        graph_result = await self.execute_stage_graph(graph, {"text": text})
+        
+        await self.astore_in_cache(cache_key, graph_result.results)
+        
+        return {
+            "results": graph_result.results,
+            "cache_hit": False,
+            "total_time_ms": (time.time() - start_time) * 1000,
+            "component_times": graph_result.stage_times_ms
+        }
+    
     def calculate_performance_metrics(self, execution_data: Dict[str, Any]) -> PerformanceMetrics:
         """Calculate comprehensive performance metrics."""
         total_time = execution_data["total_time_ms"]
@@ -509,7 +915,7 @@ class TranslationOptimizationEngine:
         parallel_efficiency = parallel_tasks / max(total_tasks, 1)
         
         # Memory usage (simplified estimation)
-        memory_usage_mb = sum(entry.size_bytes for entry in self.memory_cache.values()) / (1024 * 1024)
+        memory_usage_mb = self.memory_cache.bytes_used / (1024 * 1024)
         
         # CPU utilization (estimated based on parallel processing)
         cpu_utilization = min(parallel_efficiency * self.max_workers / 4, 1.0)
@@ -604,7 +1010,7 @@ class TranslationOptimizationEngine:
         
         try:
             # Execute optimized pipeline
-            execution_data = self.optimize_translation_pipeline(text, processing_functions)
+            execution_data = await self._execute_translation_graph(text, processing_functions)
             
             # Calculate performance metrics
             metrics = self.calculate_performance_metrics(execution_data)
@@ -727,7 +1133,9 @@ class TranslationOptimizationEngine:
                 "total_misses": self.cache_stats["misses"],
                 "hit_rate": self.cache_stats["hits"] / max(self.cache_stats["hits"] + self.cache_stats["misses"], 1),
                 "evictions": self.cache_stats["evictions"],
+                "expirations": self.memory_cache.statistics["expirations"],
                 "memory_cache_entries": len(self.memory_cache),
+                "memory_cache_bytes": self.memory_cache.bytes_used,
                 "redis_available": self.redis_client is not None
             },
             "processing_statistics": {
@@ -753,8 +1161,10 @@ class TranslationOptimizationEngine:
     
     def cleanup_resources(self) -> None:
         """Cleanup optimization resources."""
-        # Shutdown thread pool
+        # Shutdown worker pools
         self.thread_pool.shutdown(wait=True)
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=True)
         
         # Clear caches
         with self.cache_lock:
@@ -79,10 +79,16 @@ class CachingConfig:
     """Enhanced caching configuration."""
     enabled: bool = True
     l1_cache_size_limit: int = 1000
+    l1_max_bytes: int = 64 * 1024 * 1024
+    l1_protected_ratio: float = 0.8
     l2_cache_enabled: bool = True
     vector_cache_enabled: bool = True
     cache_warming_enabled: bool = True
     default_ttl_seconds: int = 3600
+    write_back_flush_interval: int = 5
+    write_back_max_batch: int = 500
+    refresh_ahead_ratio: float = 0.8
+    refresh_min_accesses: int = 2
     priority_ttl_multipliers: Dict[str, float] = None
     cache_strategies: Dict[str, str] = None
     compression_enabled: bool = True
@@ -117,6 +123,14 @@ class StreamsConfig:
     block_timeout: int = 1000  # milliseconds
     max_retries: int = 3
     retry_delay: int = 5  # seconds
+    handler_concurrency: int = 1
+    claim_idle_ms: int = 60000  # milliseconds
+    claim_interval: int = 30  # seconds
+    payload_encoding: str = "json"  # json | msgpack
+    compression_threshold: int = 1024  # bytes
+    publish_batching: bool = False
+    publish_linger_ms: int = 5
+    publish_max_batch: int = 500
     dead_letter_queue_enabled: bool = True
     stream_retention_hours: int = 24
     consumer_timeout: int = 300  # seconds
@@ -147,6 +161,8 @@ class ClusterConfig:
     decode_responses: bool = True
     cluster_require_full_coverage: bool = False
     reinitialize_steps: int = 10
+    max_redirects: int = 5
+    migration_batch_size: int = 100
     
     def __post_init__(self):
         if self.startup_nodes is None:
@@ -204,6 +220,10 @@ class ContextEngineConfig:
     cleanup_interval_hours: int = 24
     index_maintenance_interval_minutes: int = 30
     max_context_age_days: int = 30
+    enable_prefetching: bool = True
+    prefetch_depth: int = 10
+    prefetch_max_entries: int = 256
+    prefetch_max_bytes: int = 16 * 1024 * 1024
 
 
 class RedisIntegrationConfig:
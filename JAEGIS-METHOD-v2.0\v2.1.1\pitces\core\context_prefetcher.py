@@ -0,0 +1,311 @@
+"""
+P.I.T.C.E.S. Framework - Context Prefetcher
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component Integration
+
+This module implements predictive context prefetching: paused tasks are ranked by
+how soon they are likely to resume, using the preemption dependency graph and the
+triage queue order, and their contexts are loaded ahead of time into a bounded
+warm cache so that resuming a task does not wait on storage I/O.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Tuple
+from uuid import UUID
+
+import networkx as nx
+
+from .models import Priority
+
+
+logger = logging.getLogger(__name__)
+
+
+class ContextPrefetcher:
+    """
+    Predictive prefetcher for task contexts likely to resume next.
+    
+    A paused task is expected to resume sooner when:
+    - it, or a queued task that (transitively) depends on it, is near the head
+      of the triage queues;
+    - none of its own dependencies are still active or paused;
+    - it has a higher priority, or was preempted earlier.
+    
+    Prefetched contexts live in a warm cache bounded by entries and bytes. An
+    entry is consumed when the task's context is loaded; the time its load took
+    at prefetch time is recorded as resume latency saved.
+    """
+    
+    def __init__(
+        self,
+        loader: Callable[[UUID], Awaitable[Optional[Dict[str, Any]]]],
+        config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the context prefetcher.
+        
+        Args:
+            loader: Coroutine function loading a task context from storage
+            config: Prefetch configuration
+        """
+        self.loader = loader
+        self.config = {**self._get_default_config(), **(config or {})}
+        
+        # Scheduling sources, attached once the task scheduler exists
+        self.preemption_manager = None
+        self.triage_system = None
+        
+        # Warm cache: task_id -> (context, size_bytes, load_seconds)
+        self.warm_cache: "OrderedDict[UUID, Tuple[Dict[str, Any], int, float]]" = OrderedDict()
+        self.bytes_used = 0
+        
+        # Invalidation tick per task, so loads started before a save are not
+        # cached; ticks older than every load still in flight are pruned
+        self.generations: Dict[UUID, int] = {}
+        self._clock = 0
+        self._loads_in_flight: Dict[int, int] = {}  # start tick -> load count
+        
+        # Contexts are consumed from synchronous resume paths, possibly off the event loop
+        self._lock = threading.Lock()
+        
+        self.metrics = {
+            'prefetches': 0,
+            'prefetch_failures': 0,
+            'prefetch_hits': 0,
+            'prefetch_misses': 0,
+            'wasted_prefetches': 0,
+            'stale_prefetches_dropped': 0,
+            'warm_cache_evictions': 0,
+            'resume_latency_saved_seconds': 0.0
+        }
+    
+    def attach(self, preemption_manager: Any, triage_system: Any = None):
+        """
+        Attach the scheduler state used for resume prediction.
+        
+        Args:
+            preemption_manager: PreemptionManager holding paused tasks and the dependency graph
+            triage_system: Optional TriageSystem whose queue order drives prediction
+        """
+        self.preemption_manager = preemption_manager
+        self.triage_system = triage_system
+    
+    def predict_resume_order(self) -> List[UUID]:
+        """
+        Rank paused tasks by how soon they are likely to resume.
+        
+        Returns:
+            Paused task IDs, most likely to resume first
+        """
+        manager = self.preemption_manager
+        if manager is None:
+            return []
+        
+        with manager._lock:
+            paused_tasks = list(manager.paused_tasks.items())
+            active_ids = set(manager.active_tasks)
+            graph = manager.dependency_graph.copy()
+        
+        if not paused_tasks:
+            return []
+        
+        queue_order = self._get_queue_order()
+        queue_rank = {task_id: rank for rank, task_id in enumerate(queue_order)}
+        horizon = len(queue_order)
+        paused_ids = {task_id for task_id, _ in paused_tasks}
+        
+        scores = {}
+        for preemption_order, (task_id, task) in enumerate(paused_tasks):
+            rank = queue_rank.get(task_id, horizon)
+            blocked = False
+            
+            if graph.has_node(task_id):
+                # Edges point from a task to its dependencies, so ancestors are dependents
+                for dependent_id in nx.ancestors(graph, task_id):
+                    rank = min(rank, queue_rank.get(dependent_id, horizon))
+                
+                blocked = any(
+                    dependency_id in paused_ids or dependency_id in active_ids
+                    for dependency_id in graph.successors(task_id)
+                )
+            
+            priority = task.priority.value if isinstance(task.priority, Priority) else Priority.LOW.value
+            scores[task_id] = (blocked, rank, priority, preemption_order)
+        
+        return sorted(scores, key=scores.get)
+    
+    async def prefetch(self, task_ids: List[UUID]) -> Dict[UUID, bool]:
+        """
+        Load contexts into the warm cache concurrently.
+        
+        Args:
+            task_ids: Task identifiers to prefetch
+        
+        Returns:
+            Dictionary mapping task IDs to whether their context is now warm
+        """
+        semaphore = asyncio.Semaphore(self.config['prefetch_concurrency'])
+        
+        async def prefetch_one(task_id: UUID) -> bool:
+            if task_id in self.warm_cache:
+                return True
+            
+            with self._lock:
+                started = self._clock
+                self._loads_in_flight[started] = self._loads_in_flight.get(started, 0) + 1
+            
+            try:
+                async with semaphore:
+                    load_start = time.perf_counter()
+                    context_data = await self.loader(task_id)
+                    load_seconds = time.perf_counter() - load_start
+                
+                if context_data is None:
+                    return False
+                
+                return self._store(task_id, context_data, load_seconds, started)
+            finally:
+                self._finish_load(started)
+        
+        results = await asyncio.gather(
+            *(prefetch_one(task_id) for task_id in task_ids), return_exceptions=True
+        )
+        
+        prefetch_results = {}
+        for task_id, result in zip(task_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to prefetch context {task_id}: {result}")
+                self.metrics['prefetch_failures'] += 1
+                prefetch_results[task_id] = False
+            else:
+                prefetch_results[task_id] = result
+        
+        return prefetch_results
+    
+    def take(self, task_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Consume a prefetched context, recording a hit or a miss.
+        
+        Misses are only counted for paused tasks (i.e. resumes) when a
+        preemption manager is attached, so bulk loads do not skew the hit rate.
+        
+        Args:
+            task_id: Task identifier
+        
+        Returns:
+            Prefetched context or None
+        """
+        with self._lock:
+            entry = self.warm_cache.pop(task_id, None)
+            if entry is not None:
+                self.bytes_used -= entry[1]
+        
+        if entry is not None:
+            self.metrics['prefetch_hits'] += 1
+            self.metrics['resume_latency_saved_seconds'] += entry[2]
+            return entry[0]
+        
+        if self.preemption_manager is None or task_id in self.preemption_manager.paused_tasks:
+            self.metrics['prefetch_misses'] += 1
+        return None
+    
+    def invalidate(self, task_id: UUID):
+        """Drop a warm entry whose stored context has changed, and any load still in flight."""
+        with self._lock:
+            if self._loads_in_flight:
+                self._clock += 1
+                self.generations[task_id] = self._clock
+            entry = self.warm_cache.pop(task_id, None)
+            if entry is not None:
+                self.bytes_used -= entry[1]
+                self.metrics['wasted_prefetches'] += 1
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get prefetch metrics.
+        
+        Returns:
+            Prefetch metrics including hit rate and resume latency saved
+        """
+        lookups = self.metrics['prefetch_hits'] + self.metrics['prefetch_misses']
+        
+        return {
+            **self.metrics,
+            'prefetch_hit_rate': self.metrics['prefetch_hits'] / lookups * 100.0 if lookups else 0.0,
+            'average_resume_latency_saved_ms': (
+                self.metrics['resume_latency_saved_seconds'] / lookups * 1000 if lookups else 0.0
+            ),
+            'warm_cache_entries': len(self.warm_cache),
+            'warm_cache_bytes': self.bytes_used
+        }
+    
+    def _finish_load(self, started: int):
+        """Retire a load started at tick ``started`` and prune ticks no load can see."""
+        with self._lock:
+            remaining = self._loads_in_flight.pop(started) - 1
+            if remaining:
+                self._loads_in_flight[started] = remaining
+            
+            oldest = min(self._loads_in_flight, default=self._clock)
+            self.generations = {
+                task_id: tick for task_id, tick in self.generations.items() if tick > oldest
+            }
+    
+    def _store(
+        self, task_id: UUID, context_data: Dict[str, Any], load_seconds: float, started: int = 0
+    ) -> bool:
+        """Insert a context into the warm cache, evicting the oldest entries to stay in bounds."""
+        size = len(json.dumps(context_data, default=str))
+        if size > self.config['prefetch_max_bytes']:
+            return False
+        
+        with self._lock:
+            if self.generations.get(task_id, 0) > started:
+                # The context was saved while this load was in flight
+                self.metrics['stale_prefetches_dropped'] += 1
+                return False
+            
+            if task_id in self.warm_cache:
+                return True
+            
+            while self.warm_cache and (
+                len(self.warm_cache) >= self.config['prefetch_max_entries']
+                or self.bytes_used + size > self.config['prefetch_max_bytes']
+            ):
+                _, (_, evicted_size, _) = self.warm_cache.popitem(last=False)
+                self.bytes_used -= evicted_size
+                self.metrics['warm_cache_evictions'] += 1
+                self.metrics['wasted_prefetches'] += 1
+            
+            self.warm_cache[task_id] = (context_data, size, load_seconds)
+            self.bytes_used += size
+        
+        self.metrics['prefetches'] += 1
+        return True
+    
+    def _get_queue_order(self) -> List[UUID]:
+        """Task IDs in the order the triage system will dequeue them."""
+        triage = self.triage_system
+        if triage is None:
+            return []
+        
+        with triage._lock:
+            return [
+                task.id
+                for priority in sorted(triage.queues, key=lambda p: p.value)
+                for task in triage.queues[priority]
+            ]
+    
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Get default prefetch configuration."""
+        return {
+            'prefetch_depth': 10,
+            'prefetch_concurrency': 4,
+            'prefetch_max_entries': 256,
+            'prefetch_max_bytes': 16 * 1024 * 1024,
+            'prefetch_interval': 5  # seconds
+        }
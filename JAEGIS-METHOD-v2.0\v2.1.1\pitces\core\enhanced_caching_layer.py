@@ -7,15 +7,18 @@ priority-based TTL management, and intelligent cache warming for optimal perform
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Awaitable
 from dataclasses import asdict
 from uuid import UUID
 from enum import Enum
 
+from nlds.optimization.segmented_lru import SegmentedLRUCache
+
 from .redis_vector_engine import RedisVectorEngine
 from .models import Task, ProjectSpecs, Priority, TaskStatus, WorkflowType, GapAnalysisResult
 from .exceptions import PITCESError, ErrorCodes
@@ -41,6 +44,16 @@ class CacheLevel(Enum):
     L4_PERSISTENT = "l4_persistent"
 
 
+# Cache key prefixes mapped to the data types used for TTL and strategy lookup
+CACHE_KEY_DATA_TYPES = {
+    'workflow_decision': 'workflow_decisions',
+    'task_context': 'task_contexts',
+    'gap_analysis': 'gap_analyses',
+    'agent_state': 'agent_states',
+    'nlds_embedding': 'nlds_embeddings'
+}
+
+
 class EnhancedCachingLayer:
     """
     Advanced caching layer with vector embeddings and intelligent strategies.
@@ -63,10 +76,15 @@ class EnhancedCachingLayer:
             config: Caching configuration
         """
         self.vector_engine = vector_engine
-        self.config = config or self._get_default_config()
+        self.config = {**self._get_default_config(), **(config or {})}
         
         # Multi-tier cache storage
-        self.l1_cache: Dict[str, Any] = {}  # In-memory cache
+        self.l1_cache = SegmentedLRUCache(
+            max_bytes=self.config['l1_max_bytes'],
+            max_entries=self.config['l1_cache_size_limit'],
+            protected_ratio=self.config['l1_protected_ratio'],
+            track_frequency=True
+        )  # In-memory cache
         self.l2_cache = vector_engine.async_redis_client  # Redis cache
         
         # Cache strategies by data type
@@ -112,16 +130,128 @@ class EnhancedCachingLayer:
             'vector_hits': 0,
             'vector_misses': 0,
             'cache_evictions': 0,
+            'l1_admission_rejections': 0,
+            'single_flight_waits': 0,
+            'write_back_flushes': 0,
+            'refresh_ahead_operations': 0,
             'warming_operations': 0,
             'average_retrieval_time': 0.0,
             'hit_ratio': 0.0
         }
         
-        # Cache consistency tracking
+        # Per-level hit/miss counts and lookup latency
+        self.level_metrics = {
+            level.value: {'hits': 0, 'misses': 0, 'total_time': 0.0}
+            for level in (CacheLevel.L1_MEMORY, CacheLevel.L2_REDIS, CacheLevel.L3_VECTOR)
+        }
+        
+        # Per data type hit/miss counts driving TTL adjustment
+        self.type_metrics: Dict[str, Dict[str, int]] = {}
+        
+        # Cache consistency tracking (write-back queue of dirty entries)
         self.consistency_tracker = {}
         
+        # Single-flight loads: cache key -> future shared by concurrent callers
+        self._inflight_loads: Dict[str, asyncio.Future] = {}
+        
+        # Refresh-ahead schedule: heap of (due_time, cache_key) plus latest deadlines
+        self._refresh_heap: List[Tuple[float, str]] = []
+        self._refresh_deadlines: Dict[str, float] = {}
+        self._refresh_ttls: Dict[str, timedelta] = {}
+        self.refresh_loaders: Dict[str, Callable[[str], Awaitable[Optional[Dict[str, Any]]]]] = {
+            'task_context': self._load_task_context_for_refresh
+        }
+        
+        # Original TTLs bound the range of usage-based TTL adjustments
+        self._original_ttls = dict(self.base_ttl_strategies)
+        
+        # Background tasks
+        self.background_tasks: List[asyncio.Task] = []
+        
         logger.info("EnhancedCachingLayer initialized")
     
+    async def initialize(self) -> bool:
+        """
+        Start the write-back flusher and refresh-ahead scheduler.
+        
+        Returns:
+            True if initialization successful
+        """
+        try:
+            self.background_tasks.append(asyncio.create_task(self._background_write_back()))
+            self.background_tasks.append(asyncio.create_task(self._background_refresh_ahead()))
+            
+            for key_prefix, data_type in CACHE_KEY_DATA_TYPES.items():
+                if self.cache_strategies.get(data_type) == CacheStrategy.REFRESH_AHEAD and \
+                        key_prefix not in self.refresh_loaders:
+                    logger.warning(
+                        f"No refresh loader registered for {key_prefix}; "
+                        f"{data_type} entries are written through without refresh-ahead"
+                    )
+            
+            logger.info("Started background tasks for enhanced caching layer")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Enhanced caching layer initialization failed: {e}")
+            return False
+    
+    async def shutdown(self):
+        """Stop background tasks and flush pending write-back entries."""
+        for task in self.background_tasks:
+            task.cancel()
+        self.background_tasks.clear()
+        
+        while await self.flush_write_back():
+            pass
+    
+    def register_refresh_loader(
+        self,
+        data_type: str,
+        loader: Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+    ):
+        """
+        Register the source-of-truth loader used to refresh entries ahead of expiry.
+        
+        Args:
+            data_type: Cache key prefix (e.g. 'gap_analysis')
+            loader: Coroutine function taking a cache key and returning fresh data
+        """
+        self.refresh_loaders[data_type] = loader
+    
+    async def flush_write_back(self) -> int:
+        """
+        Write all dirty write-back entries to L2 in one pipeline.
+        
+        Returns:
+            Number of entries flushed
+        """
+        dirty_keys = [
+            key for key, entry in self.consistency_tracker.items() if entry['dirty']
+        ][:self.config['write_back_max_batch']]
+        
+        if not dirty_keys:
+            return 0
+        
+        entries = {key: self.consistency_tracker[key] for key in dirty_keys}
+        
+        pipe = self.l2_cache.pipeline(transaction=False)
+        for cache_key, entry in entries.items():
+            self._queue_l2_write(pipe, cache_key, entry['serialized'], entry['ttl'])
+        
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Write-back flush failed: {e}")
+            return 0
+        
+        # Keep entries that were rewritten while the pipeline was in flight
+        for cache_key, entry in entries.items():
+            if self.consistency_tracker.get(cache_key) is entry:
+                del self.consistency_tracker[cache_key]
+        
+        return len(dirty_keys)
+    
     async def get_workflow_decision_cached(
         self, 
         project_specs: ProjectSpecs,
@@ -142,55 +272,32 @@ class EnhancedCachingLayer:
         start_time = time.time()
         cache_key = self._generate_cache_key('workflow_decision', project_specs)
         
-        try:
-            # L1 Cache (Memory) - Fastest
-            if cache_key in self.l1_cache:
-                self.cache_metrics['l1_hits'] += 1
-                logger.debug(f"L1 cache hit for workflow decision: {cache_key}")
-                return self.l1_cache[cache_key]
-            
-            self.cache_metrics['l1_misses'] += 1
-            
-            # L2 Cache (Redis) - Fast
-            cached_data = await self.l2_cache.hgetall(f"cache:{cache_key}")
-            if cached_data:
-                self.cache_metrics['l2_hits'] += 1
-                
-                # Promote to L1 cache
-                decision_data = json.loads(cached_data['data'])
-                self.l1_cache[cache_key] = decision_data
-                
-                logger.debug(f"L2 cache hit for workflow decision: {cache_key}")
-                return decision_data
+        async def load_similar_decision() -> Optional[Dict[str, Any]]:
+            # L3 Cache (Vector Similarity) - Intelligent
+            similar_decisions = await self.vector_engine.find_similar_workflow_decisions(
+                project_specs, top_k=1, similarity_threshold=similarity_threshold
+            )
+            if not similar_decisions:
+                return None
             
-            self.cache_metrics['l2_misses'] += 1
+            best_match = similar_decisions[0]
             
-            # L3 Cache (Vector Similarity) - Intelligent
-            if use_similarity:
-                similar_decisions = await self.vector_engine.find_similar_workflow_decisions(
-                    project_specs, top_k=1, similarity_threshold=similarity_threshold
-                )
-                
-                if similar_decisions:
-                    self.cache_metrics['vector_hits'] += 1
-                    best_match = similar_decisions[0]
-                    
-                    # Cache the similar decision for future use
-                    await self._cache_workflow_decision(
-                        cache_key, best_match, 
-                        ttl=self._calculate_ttl('workflow_decisions')
-                    )
-                    
-                    logger.debug(f"Vector similarity hit for workflow decision: {cache_key}")
-                    return best_match
-                
-                self.cache_metrics['vector_misses'] += 1
+            # Cache the similar decision for future use
+            await self._cache_workflow_decision(
+                cache_key, best_match, 
+                ttl=self._calculate_ttl('workflow_decisions')
+            )
+            return best_match
+        
+        try:
+            decision_data = await self._get_cached(
+                cache_key, load_similar_decision if use_similarity else None
+            )
             
-            # Cache miss - no data found
             retrieval_time = time.time() - start_time
             self._update_average_retrieval_time(retrieval_time)
             
-            return None
+            return decision_data
             
         except Exception as e:
             logger.error(f"Failed to retrieve cached workflow decision: {e}")
@@ -269,41 +376,21 @@ class EnhancedCachingLayer:
         start_time = time.time()
         cache_key = f"task_context:{task_id}"
         
-        try:
-            # L1 Cache check
-            if cache_key in self.l1_cache:
-                self.cache_metrics['l1_hits'] += 1
-                return self.l1_cache[cache_key]
-            
-            self.cache_metrics['l1_misses'] += 1
-            
-            # L2 Cache check
-            cached_data = await self.l2_cache.hgetall(f"cache:{cache_key}")
-            if cached_data:
-                self.cache_metrics['l2_hits'] += 1
-                
-                context_data = json.loads(cached_data['data'])
-                
-                # Promote to L1
-                self.l1_cache[cache_key] = context_data
-                
-                return context_data
-            
-            self.cache_metrics['l2_misses'] += 1
-            
+        async def load_task_context() -> Optional[Dict[str, Any]]:
             # Vector engine retrieval
             context_data = await self.vector_engine.retrieve_task_context_vector(task_id)
-            
             if context_data:
-                self.cache_metrics['vector_hits'] += 1
-                
                 # Cache for future use
                 await self._cache_task_context(cache_key, context_data)
-                
-                return context_data
+            return context_data
+        
+        try:
+            context_data = await self._get_cached(cache_key, load_task_context)
             
-            self.cache_metrics['vector_misses'] += 1
-            return None
+            retrieval_time = time.time() - start_time
+            self._update_average_retrieval_time(retrieval_time)
+            
+            return context_data
             
         except Exception as e:
             logger.error(f"Failed to retrieve cached task context: {e}")
@@ -396,14 +483,11 @@ class EnhancedCachingLayer:
             ttl = self._calculate_ttl('gap_analyses')
             strategy = self.cache_strategies['gap_analyses']
             
+            # Refresh-ahead scheduling happens inside the strategy
             success = await self._execute_cache_strategy(
                 strategy, cache_key, cached_analysis, ttl
             )
             
-            # Schedule refresh-ahead if needed
-            if strategy == CacheStrategy.REFRESH_AHEAD:
-                await self._schedule_refresh_ahead(cache_key, ttl)
-            
             return success
             
         except Exception as e:
@@ -514,9 +598,24 @@ class EnhancedCachingLayer:
                  self.cache_metrics['vector_hits']) / total_requests
             )
         
+        levels = {}
+        for level, metrics in self.level_metrics.items():
+            lookups = metrics['hits'] + metrics['misses']
+            levels[level] = {
+                'hits': metrics['hits'],
+                'misses': metrics['misses'],
+                'hit_ratio': metrics['hits'] / lookups if lookups else 0.0,
+                'average_latency_ms': metrics['total_time'] / lookups * 1000 if lookups else 0.0
+            }
+        
         return {
             **self.cache_metrics,
+            'levels': levels,
             'l1_cache_size': len(self.l1_cache),
+            'l1_cache_bytes': self.l1_cache.bytes_used,
+            'l1_protected_entries': len(self.l1_cache.protected),
+            'write_back_pending': len(self.consistency_tracker),
+            'refresh_ahead_scheduled': len(self._refresh_deadlines),
             'total_requests': total_requests,
             'cache_efficiency': self.cache_metrics['hit_ratio'] * 100,
             'warming_patterns_count': len(self.warming_patterns),
@@ -572,6 +671,137 @@ class EnhancedCachingLayer:
             logger.error(f"Cache strategy execution failed: {e}")
             return False
     
+    async def _get_cached(
+        self,
+        cache_key: str,
+        loader: Optional[Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a key through L1 and L2, falling back to ``loader``.
+        
+        Concurrent misses for the same key share a single L2 read and loader
+        call (single-flight), so a cold hot-key cannot stampede Redis or the
+        vector engine.
+        """
+        # L1 Cache (Memory) - Fastest
+        lookup_start = time.perf_counter()
+        value = self.l1_cache.get(cache_key)
+        self._record_level(CacheLevel.L1_MEMORY, cache_key, value is not None, lookup_start)
+        if value is not None:
+            return value
+        
+        async def load_from_lower_levels() -> Optional[Dict[str, Any]]:
+            # L2 Cache (Redis) - Fast
+            lookup_start = time.perf_counter()
+            cached_data = await self.l2_cache.hgetall(f"cache:{cache_key}")
+            self._record_level(CacheLevel.L2_REDIS, cache_key, bool(cached_data), lookup_start)
+            
+            if cached_data:
+                value = json.loads(cached_data['data'])
+                
+                # Promote to L1 only if the key is hotter than the L1 victim
+                await self._store_l1(
+                    cache_key, value, len(cached_data['data']),
+                    self._remaining_ttl(cached_data), admission_check=True
+                )
+                return value
+            
+            if loader is None:
+                return None
+            
+            # L3 (vector engine) or other source of truth
+            lookup_start = time.perf_counter()
+            value = await loader()
+            self._record_level(CacheLevel.L3_VECTOR, cache_key, value is not None, lookup_start)
+            return value
+        
+        return await self._load_single_flight(cache_key, load_from_lower_levels)
+    
+    def _record_level(self, level: CacheLevel, cache_key: str, hit: bool, lookup_start: float):
+        """Record a hit or miss and its latency for a cache level."""
+        metrics = self.level_metrics[level.value]
+        metrics['hits' if hit else 'misses'] += 1
+        metrics['total_time'] += time.perf_counter() - lookup_start
+        
+        # Keep the legacy counters in cache_metrics in step
+        prefix = {
+            CacheLevel.L1_MEMORY: 'l1',
+            CacheLevel.L2_REDIS: 'l2',
+            CacheLevel.L3_VECTOR: 'vector'
+        }[level]
+        self.cache_metrics[f"{prefix}_{'hits' if hit else 'misses'}"] += 1
+        
+        if level != CacheLevel.L3_VECTOR:
+            type_metrics = self.type_metrics.setdefault(
+                cache_key.split(':', 1)[0], {'hits': 0, 'misses': 0}
+            )
+            if hit:
+                type_metrics['hits'] += 1
+            elif level == CacheLevel.L2_REDIS:
+                type_metrics['misses'] += 1
+    
+    async def _store_l1(
+        self,
+        cache_key: str,
+        data: Dict[str, Any],
+        size: int,
+        ttl: timedelta,
+        admission_check: bool = False
+    ) -> bool:
+        """Insert into L1, demoting evicted dirty entries to L2."""
+        evicted = self.l1_cache.put(
+            cache_key, data, size, ttl.total_seconds(), admission_check=admission_check
+        )
+        
+        if evicted is None:
+            self.cache_metrics['l1_admission_rejections'] += 1
+            return False
+        
+        if evicted:
+            self.cache_metrics['cache_evictions'] += len(evicted)
+            await self._demote_entries([key for key, _ in evicted])
+        
+        return True
+    
+    async def _demote_entries(self, cache_keys: List[str]):
+        """Persist dirty write-back entries that are leaving L1."""
+        dirty_keys = [
+            key for key in cache_keys
+            if self.consistency_tracker.get(key, {}).get('dirty')
+        ]
+        if not dirty_keys:
+            return
+        
+        pipe = self.l2_cache.pipeline(transaction=False)
+        for cache_key in dirty_keys:
+            entry = self.consistency_tracker.pop(cache_key)
+            self._queue_l2_write(pipe, cache_key, entry['serialized'], entry['ttl'])
+        await pipe.execute()
+    
+    def _queue_l2_write(self, pipe: Any, cache_key: str, serialized: str, ttl: timedelta):
+        """Queue the L2 hash write and expiry for a cache entry on a pipeline or client."""
+        return [
+            pipe.hset(
+                f"cache:{cache_key}",
+                mapping={
+                    'data': serialized,
+                    'timestamp': datetime.now().isoformat(),
+                    'ttl': str(ttl.total_seconds())
+                }
+            ),
+            pipe.expire(f"cache:{cache_key}", int(ttl.total_seconds()))
+        ]
+    
+    def _remaining_ttl(self, cached_data: Dict[str, Any]) -> timedelta:
+        """Estimate the remaining TTL of an L2 entry from its stored metadata."""
+        try:
+            ttl_seconds = float(cached_data['ttl'])
+            written_at = datetime.fromisoformat(cached_data['timestamp'])
+            remaining = ttl_seconds - (datetime.now() - written_at).total_seconds()
+            return timedelta(seconds=max(remaining, 1.0))
+        except (KeyError, ValueError, TypeError):
+            return timedelta(seconds=self.config['l1_default_ttl'])
+    
     async def _write_through_cache(
         self, 
         cache_key: str, 
@@ -579,18 +809,16 @@ class EnhancedCachingLayer:
         ttl: timedelta
     ) -> bool:
         """Write-through caching strategy."""
-        # Write to both L1 and L2 simultaneously
-        self.l1_cache[cache_key] = data
+        serialized = json.dumps(data)
         
-        await self.l2_cache.hset(
-            f"cache:{cache_key}",
-            mapping={
-                'data': json.dumps(data),
-                'timestamp': datetime.now().isoformat(),
-                'ttl': str(ttl.total_seconds())
-            }
-        )
-        await self.l2_cache.expire(f"cache:{cache_key}", int(ttl.total_seconds()))
+        # Write to both L1 and L2 simultaneously; an older L1 copy must not
+        # outlive a value L1 refused
+        if not await self._store_l1(cache_key, data, len(serialized), ttl):
+            self.l1_cache.pop(cache_key)
+        
+        pipe = self.l2_cache.pipeline(transaction=False)
+        self._queue_l2_write(pipe, cache_key, serialized, ttl)
+        await pipe.execute()
         
         return True
     
@@ -601,17 +829,31 @@ class EnhancedCachingLayer:
         ttl: timedelta
     ) -> bool:
         """Write-back caching strategy."""
-        # Write to L1 immediately, L2 later
-        self.l1_cache[cache_key] = data
+        serialized = json.dumps(data)
         
-        # Mark for later write-back
+        # Mark for later write-back; the background flusher or an L1
+        # eviction persists it to L2
         self.consistency_tracker[cache_key] = {
-            'data': data,
+            'serialized': serialized,
             'ttl': ttl,
             'dirty': True,
             'last_access': datetime.now()
         }
         
+        # Write to L1 immediately, L2 later
+        if not await self._store_l1(cache_key, data, len(serialized), ttl):
+            # L1 refused the value, so readers would fall through to the old
+            # L2 copy until the next flush; persist it now instead
+            self.l1_cache.pop(cache_key)
+            del self.consistency_tracker[cache_key]
+            pipe = self.l2_cache.pipeline(transaction=False)
+            self._queue_l2_write(pipe, cache_key, serialized, ttl)
+            await pipe.execute()
+            return True
+        
+        if len(self.consistency_tracker) >= self.config['write_back_max_batch']:
+            await self.flush_write_back()
+        
         return True
     
     async def _write_around_cache(
@@ -621,16 +863,12 @@ class EnhancedCachingLayer:
         ttl: timedelta
     ) -> bool:
         """Write-around caching strategy."""
-        # Write directly to L2, bypass L1
-        await self.l2_cache.hset(
-            f"cache:{cache_key}",
-            mapping={
-                'data': json.dumps(data),
-                'timestamp': datetime.now().isoformat(),
-                'ttl': str(ttl.total_seconds())
-            }
-        )
-        await self.l2_cache.expire(f"cache:{cache_key}", int(ttl.total_seconds()))
+        # Write directly to L2, bypass L1 (and drop any stale L1 copy)
+        self.l1_cache.pop(cache_key)
+        
+        pipe = self.l2_cache.pipeline(transaction=False)
+        self._queue_l2_write(pipe, cache_key, json.dumps(data), ttl)
+        await pipe.execute()
         
         return True
     
@@ -651,10 +889,11 @@ class EnhancedCachingLayer:
         ttl: timedelta
     ) -> bool:
         """Refresh-ahead caching strategy."""
-        # Write to cache and schedule refresh
+        # Write to cache and schedule refresh; without a loader for the key
+        # type there is nothing to refresh from, so it is write-through only
         success = await self._write_through_cache(cache_key, data, ttl)
         
-        if success:
+        if success and cache_key.split(':', 1)[0] in self.refresh_loaders:
             await self._schedule_refresh_ahead(cache_key, ttl)
         
         return success
@@ -662,11 +901,109 @@ class EnhancedCachingLayer:
     async def _schedule_refresh_ahead(self, cache_key: str, ttl: timedelta):
         """Schedule refresh-ahead operation."""
         # Schedule refresh at 80% of TTL
-        refresh_time = ttl.total_seconds() * 0.8
+        refresh_time = ttl.total_seconds() * self.config['refresh_ahead_ratio']
+        due_time = time.monotonic() + refresh_time
+        
+        # Rescheduling supersedes older heap entries for the same key
+        self._refresh_deadlines[cache_key] = due_time
+        self._refresh_ttls[cache_key] = ttl
+        heapq.heappush(self._refresh_heap, (due_time, cache_key))
         
-        # This would be implemented with a background task scheduler
         logger.debug(f"Scheduled refresh-ahead for {cache_key} in {refresh_time}s")
     
+    async def _run_due_refreshes(self) -> int:
+        """Reload entries whose refresh-ahead deadline has passed and that are still in demand."""
+        refreshed = 0
+        now = time.monotonic()
+        
+        while self._refresh_heap and self._refresh_heap[0][0] <= now:
+            due_time, cache_key = heapq.heappop(self._refresh_heap)
+            if self._refresh_deadlines.get(cache_key) != due_time:
+                continue  # superseded by a later schedule
+            
+            del self._refresh_deadlines[cache_key]
+            ttl = self._refresh_ttls.pop(cache_key)
+            
+            # Cold entries are left to expire instead of being refreshed
+            if self.l1_cache.frequency.get(cache_key, 0) < self.config['refresh_min_accesses']:
+                continue
+            
+            loader = self.refresh_loaders.get(cache_key.split(':', 1)[0])
+            if loader is None:
+                continue
+            
+            try:
+                data = await self._load_single_flight(cache_key, lambda: loader(cache_key))
+                if data:
+                    await self._refresh_ahead_cache(cache_key, data, ttl)
+                    refreshed += 1
+            except Exception as e:
+                logger.warning(f"Refresh-ahead failed for {cache_key}: {e}")
+        
+        self.cache_metrics['refresh_ahead_operations'] += refreshed
+        return refreshed
+    
+    async def _load_single_flight(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Run ``loader`` unless a load for ``cache_key`` is already in flight."""
+        inflight = self._inflight_loads.get(cache_key)
+        if inflight is not None:
+            self.cache_metrics['single_flight_waits'] += 1
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_loads[cache_key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Waiters see the same failure as the leader
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight_loads.pop(cache_key, None)
+    
+    async def _load_task_context_for_refresh(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Reload a task context from the vector engine for refresh-ahead."""
+        return await self.vector_engine.retrieve_task_context_vector(UUID(cache_key.split(':', 1)[1]))
+    
+    async def _background_write_back(self):
+        """Background task flushing dirty write-back entries to L2."""
+        while True:
+            try:
+                await asyncio.sleep(self.config['write_back_flush_interval'])
+                
+                flushed = await self.flush_write_back()
+                if flushed:
+                    self.cache_metrics['write_back_flushes'] += 1
+                    logger.debug(f"Flushed {flushed} write-back entries")
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Write-back flush error: {e}")
+    
+    async def _background_refresh_ahead(self):
+        """Background task refreshing entries ahead of their TTL expiry."""
+        while True:
+            try:
+                await asyncio.sleep(self.config['refresh_check_interval'])
+                await self._run_due_refreshes()
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Refresh-ahead error: {e}")
+    
     async def _cache_workflow_decision(
         self, 
         cache_key: str, 
@@ -698,46 +1035,130 @@ class EnhancedCachingLayer:
     
     async def _warm_workflow_patterns(self) -> int:
         """Warm cache with workflow decision patterns."""
-        # This would implement workflow pattern warming
-        return 0
+        return await self._warm_prefix('workflow_decision', 'frequent_workflows')
     
     async def _warm_task_patterns(self) -> int:
         """Warm cache with task context patterns."""
-        # This would implement task pattern warming
-        return 0
+        return await self._warm_prefix('task_context', 'common_task_patterns')
     
     async def _warm_gap_patterns(self) -> int:
         """Warm cache with gap analysis patterns."""
-        # This would implement gap analysis pattern warming
-        return 0
+        return await self._warm_prefix('gap_analysis', 'popular_gap_analyses')
     
     async def _warm_agent_patterns(self) -> int:
         """Warm cache with agent coordination patterns."""
-        # This would implement agent pattern warming
-        return 0
+        return await self._warm_prefix('agent_state', 'active_agent_states')
+    
+    async def _warm_prefix(self, key_prefix: str, pattern_name: str) -> int:
+        """Load the most frequently requested keys of one data type from L2 into L1."""
+        hot_keys = sorted(
+            (
+                key for key, count in self.l1_cache.frequency.items()
+                if key.startswith(f"{key_prefix}:") and key not in self.l1_cache
+            ),
+            key=lambda key: self.l1_cache.frequency[key],
+            reverse=True
+        )[:self.config['warming_batch_size']]
+        
+        self.warming_patterns[pattern_name] = hot_keys
+        return await self._load_into_l1(hot_keys)
+    
+    async def _load_into_l1(self, cache_keys: List[str]) -> int:
+        """Fetch keys from L2 in one pipeline and admit them into L1."""
+        if not cache_keys:
+            return 0
+        
+        pipe = self.l2_cache.pipeline(transaction=False)
+        for cache_key in cache_keys:
+            pipe.hgetall(f"cache:{cache_key}")
+        results = await pipe.execute()
+        
+        loaded = 0
+        for cache_key, cached_data in zip(cache_keys, results):
+            if not cached_data:
+                continue
+            if await self._store_l1(
+                cache_key, json.loads(cached_data['data']), len(cached_data['data']),
+                self._remaining_ttl(cached_data), admission_check=True
+            ):
+                loaded += 1
+        
+        return loaded
     
     async def _analyze_cache_usage(self) -> Dict[str, Any]:
         """Analyze cache usage patterns."""
+        access_frequency = dict(sorted(
+            self.l1_cache.frequency.items(), key=lambda item: item[1], reverse=True
+        )[:100])
+        
+        data_types = {}
+        for key_prefix, metrics in self.type_metrics.items():
+            lookups = metrics['hits'] + metrics['misses']
+            data_types[key_prefix] = {
+                **metrics,
+                'lookups': lookups,
+                'hit_ratio': metrics['hits'] / lookups if lookups else 0.0
+            }
+        
         return {
-            'access_frequency': {},
-            'data_types': {},
+            'access_frequency': access_frequency,
+            'data_types': data_types,
             'time_patterns': {}
         }
     
     async def _evict_lru_entries(self) -> int:
         """Evict least recently used entries from L1 cache."""
-        # Implement LRU eviction logic
-        return 0
+        # Expired entries go first; dirty ones are still owed to L2 but their
+        # TTL has lapsed there as well, so they are simply dropped
+        expired = self.l1_cache.expire()
+        for cache_key in expired:
+            self.consistency_tracker.pop(cache_key, None)
+        
+        # Shrink back under the entry limit if the configuration was lowered
+        evicted = [key for key, _ in self.l1_cache.resize()]
+        await self._demote_entries(evicted)
+        
+        self.cache_metrics['cache_evictions'] += len(expired) + len(evicted)
+        return len(expired) + len(evicted)
     
     async def _promote_frequent_entries(self) -> int:
         """Promote frequently accessed entries to L1."""
-        # Implement promotion logic
-        return 0
+        candidates = [
+            key for key, count in self.l1_cache.frequency.items()
+            if count >= self.config['promotion_min_accesses'] and key not in self.l1_cache
+        ]
+        return await self._load_into_l1(candidates[:self.config['warming_batch_size']])
     
     async def _adjust_ttl_strategies(self, usage_patterns: Dict[str, Any]) -> int:
         """Adjust TTL strategies based on usage patterns."""
-        # Implement TTL adjustment logic
-        return 0
+        adjustments = 0
+        
+        for key_prefix, stats in usage_patterns.get('data_types', {}).items():
+            data_type = CACHE_KEY_DATA_TYPES.get(key_prefix)
+            if data_type not in self.base_ttl_strategies:
+                continue
+            if stats['lookups'] < self.config['ttl_adjustment_min_lookups']:
+                continue
+            
+            original = self._original_ttls[data_type].total_seconds()
+            current = self.base_ttl_strategies[data_type].total_seconds()
+            
+            # Well-reused data lives longer; data that mostly misses expires sooner
+            if stats['hit_ratio'] >= 0.8:
+                adjusted = min(current * 1.25, original * 4)
+            elif stats['hit_ratio'] <= 0.3:
+                adjusted = max(current * 0.8, original * 0.25)
+            else:
+                continue
+            
+            if adjusted != current:
+                self.base_ttl_strategies[data_type] = timedelta(seconds=adjusted)
+                adjustments += 1
+        
+        # Start a fresh observation window
+        self.type_metrics.clear()
+        
+        return adjustments
     
     async def _optimize_cache_strategies(self, usage_patterns: Dict[str, Any]) -> int:
         """Optimize cache strategies based on patterns."""
@@ -781,6 +1202,17 @@ class EnhancedCachingLayer:
         """Get default caching configuration."""
         return {
             'l1_cache_size_limit': 1000,
+            'l1_max_bytes': 64 * 1024 * 1024,
+            'l1_protected_ratio': 0.8,
+            'l1_default_ttl': 300,  # seconds, for L2 entries without metadata
+            'write_back_flush_interval': 5,  # seconds
+            'write_back_max_batch': 500,
+            'refresh_ahead_ratio': 0.8,
+            'refresh_check_interval': 10,  # seconds
+            'refresh_min_accesses': 2,
+            'promotion_min_accesses': 3,
+            'warming_batch_size': 50,
+            'ttl_adjustment_min_lookups': 100,
             'l2_cache_enabled': True,
             'vector_cache_enabled': True,
             'cache_warming_enabled': True,
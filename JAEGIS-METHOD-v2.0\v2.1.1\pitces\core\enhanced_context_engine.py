@@ -9,6 +9,7 @@ integration, distributed caching, and intelligent context retrieval for the P.I.
 import asyncio
 import json
 import logging
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -20,6 +21,7 @@ from .exceptions import PITCESError, ErrorCodes
 from .context_engine import ContextEngine
 from .redis_vector_engine import RedisVectorEngine
 from .enhanced_caching_layer import EnhancedCachingLayer
+from .context_prefetcher import ContextPrefetcher
 
 
 logger = logging.getLogger(__name__)
@@ -33,7 +35,7 @@ class EnhancedContextEngine(ContextEngine):
     - Vector-based context similarity search
     - Multi-tier caching with Redis integration
     - Distributed context persistence
-    - Intelligent context preloading
+    - Intelligent context preloading (predictive resume prefetching)
     - Advanced compression and optimization
     - Real-time context synchronization
     - Performance monitoring and analytics
@@ -60,7 +62,7 @@ class EnhancedContextEngine(ContextEngine):
         
         self.vector_engine = vector_engine
         self.caching_layer = caching_layer
-        self.config = config or self._get_default_config()
+        self.config = {**self._get_default_config(), **(config or {})}
         
         # Enhanced metrics
         self.enhanced_metrics = {
@@ -76,6 +78,11 @@ class EnhancedContextEngine(ContextEngine):
         # Context indexing for fast retrieval
         self.context_index: Dict[str, Dict[str, Any]] = {}
         
+        # Predictive prefetching of contexts likely to resume next
+        self.prefetcher = ContextPrefetcher(self._load_context_from_storage, self.config)
+        self._prefetch_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Background tasks
         self.background_tasks: List[asyncio.Task] = []
         
@@ -89,6 +96,9 @@ class EnhancedContextEngine(ContextEngine):
             True if initialization successful
         """
         try:
+            self._loop = asyncio.get_running_loop()
+            self._prefetch_event = asyncio.Event()
+            
             # Initialize vector engine if available
             if self.vector_engine:
                 await self.vector_engine.initialize()
@@ -111,6 +121,67 @@ class EnhancedContextEngine(ContextEngine):
             logger.error(f"Enhanced Context Engine initialization failed: {e}")
             return False
     
+    def attach_task_scheduling(self, preemption_manager: Any, triage_system: Any = None):
+        """
+        Attach the preemption manager and triage system that drive context prefetching.
+        
+        The preemption manager takes this engine as its context store, so it is
+        attached after construction rather than passed to the constructor.
+        
+        Args:
+            preemption_manager: PreemptionManager holding paused tasks and the dependency graph
+            triage_system: Optional TriageSystem whose queue order drives prediction
+        """
+        self.prefetcher.attach(preemption_manager, triage_system)
+        self._request_prefetch()
+    
+    def load_task_context(self, task_id: UUID) -> Optional[Dict[str, Any]]:
+        """
+        Load task context, serving prefetched contexts from the warm cache.
+        
+        Args:
+            task_id: UUID of task to load
+        
+        Returns:
+            Optional[Dict]: Task context data or None if not found
+        """
+        context_data = self.prefetcher.take(task_id)
+        if context_data is not None:
+            return context_data
+        
+        return super().load_task_context(task_id)
+    
+    def save_task_context(self, task: Task) -> bool:
+        """
+        Save task context and invalidate any stale prefetched copy.
+        
+        Args:
+            task: Task object to serialize and save
+        
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        success = super().save_task_context(task)
+        
+        # A save usually follows a preemption, which changes what resumes next
+        self.prefetcher.invalidate(task.id)
+        self._request_prefetch()
+        
+        return success
+    
+    async def prefetch_likely_resumes(self) -> Dict[UUID, bool]:
+        """
+        Prefetch the contexts of the paused tasks most likely to resume next.
+        
+        Returns:
+            Dictionary mapping task IDs to prefetch success status
+        """
+        predicted = self.prefetcher.predict_resume_order()[:self.config['prefetch_depth']]
+        if not predicted:
+            return {}
+        
+        return await self.preload_contexts(predicted, strategy='predictive')
+    
     async def save_task_context_enhanced(
         self, 
         task: Task, 
@@ -268,24 +339,36 @@ class EnhancedContextEngine(ContextEngine):
         """
         Preload multiple contexts for performance optimization.
         
+        The 'cached' strategy loads each context through the enhanced path,
+        filling the caching layer. The 'predictive' strategy puts the predicted
+        resumes first and loads raw contexts concurrently into the prefetch warm
+        cache served by load_task_context.
+        
         Args:
             task_ids: List of task identifiers to preload
-            strategy: Preloading strategy
+            strategy: Preloading strategy ('cached' or 'predictive')
             
         Returns:
             Dictionary mapping task IDs to preload success status
         """
         try:
-            preload_results = {}
-            
-            # Batch preload contexts
-            for task_id in task_ids:
-                try:
-                    context_data = await self.load_task_context_enhanced(task_id)
-                    preload_results[task_id] = context_data is not None
-                except Exception as e:
-                    logger.error(f"Failed to preload context {task_id}: {e}")
-                    preload_results[task_id] = False
+            if strategy == 'predictive':
+                predicted = self.prefetcher.predict_resume_order()[:self.config['prefetch_depth']]
+                task_ids = predicted + [task_id for task_id in task_ids if task_id not in predicted]
+                
+                # Load concurrently into the bounded warm cache
+                preload_results = await self.prefetcher.prefetch(task_ids)
+            else:
+                preload_results = {}
+                
+                # Batch preload contexts
+                for task_id in task_ids:
+                    try:
+                        context_data = await self.load_task_context_enhanced(task_id)
+                        preload_results[task_id] = context_data is not None
+                    except Exception as e:
+                        logger.error(f"Failed to preload context {task_id}: {e}")
+                        preload_results[task_id] = False
             
             successful_preloads = sum(preload_results.values())
             self.enhanced_metrics['preload_operations'] += 1
@@ -368,6 +451,7 @@ class EnhancedContextEngine(ContextEngine):
                 'caching_layer_available': self.caching_layer is not None,
                 'cache_hit_ratio': self._calculate_cache_hit_ratio()
             },
+            'prefetch': self.prefetcher.get_metrics(),
             'storage_distribution': {
                 'local_contexts': len(list(self.storage_path.glob("task_*.json"))),
                 'indexed_contexts': len(self.context_index),
@@ -441,6 +525,11 @@ class EnhancedContextEngine(ContextEngine):
             sync_task = asyncio.create_task(self._background_synchronization())
             self.background_tasks.append(sync_task)
             
+            # Predictive prefetch task
+            if self.config.get('enable_prefetching', True):
+                prefetch_task = asyncio.create_task(self._background_prefetch())
+                self.background_tasks.append(prefetch_task)
+            
             logger.info("Started background tasks for enhanced context engine")
             
         except Exception as e:
@@ -511,21 +600,10 @@ class EnhancedContextEngine(ContextEngine):
     async def _rebuild_context_index(self):
         """Rebuild context index from storage."""
         try:
-            new_index = {}
-            
-            for context_file in self.storage_path.glob("task_*.json"):
-                try:
-                    task_id = context_file.stem.replace('task_', '')
-                    stat = context_file.stat()
-                    
-                    new_index[task_id] = {
-                        'timestamp': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'size_bytes': stat.st_size,
-                        'rebuilt': True
-                    }
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to index {context_file}: {e}")
+            # Directory scan runs off the event loop
+            new_index = await asyncio.get_running_loop().run_in_executor(
+                None, self._scan_context_index
+            )
             
             self.context_index = new_index
             await self._save_context_index()
@@ -535,6 +613,63 @@ class EnhancedContextEngine(ContextEngine):
         except Exception as e:
             logger.error(f"Failed to rebuild context index: {e}")
     
+    def _scan_context_index(self) -> Dict[str, Dict[str, Any]]:
+        """Scan storage once, keeping existing index entries for files that still exist."""
+        new_index = {}
+        
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('task_') and entry.name.endswith('.json')):
+                    continue
+                
+                task_id = entry.name[len('task_'):-len('.json')]
+                existing = self.context_index.get(task_id)
+                if existing and not existing.get('rebuilt'):
+                    new_index[task_id] = existing
+                    continue
+                
+                try:
+                    stat = entry.stat()
+                    new_index[task_id] = {
+                        'timestamp': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                        'size_bytes': stat.st_size,
+                        'rebuilt': True
+                    }
+                except OSError as e:
+                    logger.warning(f"Failed to index {entry.path}: {e}")
+        
+        return new_index
+    
+    async def _load_context_from_storage(self, task_id: UUID) -> Optional[Dict[str, Any]]:
+        """Load a context from local storage without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, ContextEngine.load_task_context, self, task_id
+        )
+    
+    def _request_prefetch(self):
+        """Wake the background prefetcher; safe to call from any thread."""
+        if self._loop is not None and self._prefetch_event is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._prefetch_event.set)
+    
+    async def _background_prefetch(self):
+        """Background task prefetching contexts of tasks likely to resume next."""
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._prefetch_event.wait(), timeout=self.config['prefetch_interval']
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._prefetch_event.clear()
+                
+                await self.prefetch_likely_resumes()
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Background prefetch error: {e}")
+    
     def _calculate_cache_hit_ratio(self) -> float:
         """Calculate cache hit ratio."""
         total_requests = self.enhanced_metrics['cache_hits'] + self.enhanced_metrics['cache_misses']
@@ -551,5 +686,11 @@ class EnhancedContextEngine(ContextEngine):
             'enable_compression': True,
             'sync_interval_hours': 2,
             'cleanup_interval_hours': 24,
-            'index_maintenance_interval_minutes': 30
+            'index_maintenance_interval_minutes': 30,
+            'enable_prefetching': True,
+            'prefetch_depth': 10,
+            'prefetch_concurrency': 4,
+            'prefetch_max_entries': 256,
+            'prefetch_max_bytes': 16 * 1024 * 1024,
+            'prefetch_interval': 5  # seconds
         }
@@ -19,6 +19,8 @@ from .enhanced_caching_layer import EnhancedCachingLayer
 from .redis_streams_manager import RedisStreamsManager
 from .redis_cluster_manager import RedisClusterManager
 from .enhanced_context_engine import EnhancedContextEngine
+from .preemption_manager import PreemptionManager
+from .triage_system import TriageSystem
 from .models import Task, ProjectSpecs, WorkflowType, Priority
 from .exceptions import PITCESError, ErrorCodes
 
@@ -71,6 +73,10 @@ class EnhancedPITCESController(PITCESController):
         self.cluster_manager: Optional[RedisClusterManager] = None
         self.enhanced_context_engine: Optional[EnhancedContextEngine] = None
         
+        # Task scheduling state backed by the enhanced context engine
+        self.preemption_manager: Optional[PreemptionManager] = None
+        self.triage_system: Optional[TriageSystem] = None
+        
         # Enhanced metrics
         self.enhanced_metrics = {
             'vector_decisions': 0,
@@ -85,6 +91,7 @@ class EnhancedPITCESController(PITCESController):
         # Performance tracking
         self.performance_baseline = {}
         self.optimization_history = []
+        self._optimization_task: Optional[asyncio.Task] = None
         
         self._initialized = True
         logger.info("EnhancedPITCESController initialized with Redis vector integration")
@@ -121,7 +128,7 @@ class EnhancedPITCESController(PITCESController):
             
             # Start background optimization
             if self.enhanced_config.get('enable_background_optimization', True):
-                asyncio.create_task(self._background_optimization())
+                self._optimization_task = asyncio.create_task(self._background_optimization())
             
             logger.info("Enhanced P.I.T.C.E.S. features initialization completed")
             return True
@@ -130,6 +137,20 @@ class EnhancedPITCESController(PITCESController):
             logger.error(f"Enhanced features initialization failed: {e}")
             return False
     
+    async def shutdown_enhanced_features(self):
+        """Stop background work and flush buffered stream messages and write-back cache entries."""
+        if self._optimization_task:
+            self._optimization_task.cancel()
+            self._optimization_task = None
+        
+        if self.streams_manager:
+            await self.streams_manager.shutdown()
+        
+        if self.caching_layer:
+            await self.caching_layer.shutdown()
+        
+        logger.info("Enhanced P.I.T.C.E.S. features shut down")
+    
     async def select_workflow_enhanced(
         self, 
         project_specs: Union[Dict[str, Any], ProjectSpecs],
@@ -499,6 +520,7 @@ class EnhancedPITCESController(PITCESController):
             
             caching_config = self.enhanced_config.get('caching_layer', {})
             self.caching_layer = EnhancedCachingLayer(self.vector_engine, caching_config)
+            await self.caching_layer.initialize()
             
             logger.info("Enhanced Caching Layer initialized successfully")
             
@@ -570,6 +592,13 @@ class EnhancedPITCESController(PITCESController):
                 logger.warning("Enhanced context engine initialization failed")
                 self.enhanced_context_engine = None
             else:
+                # Paused tasks are stored through the enhanced engine, whose
+                # prefetcher predicts resumes from the same scheduling state
+                self.preemption_manager = PreemptionManager(self.enhanced_context_engine)
+                self.triage_system = TriageSystem()
+                self.enhanced_context_engine.attach_task_scheduling(
+                    self.preemption_manager, self.triage_system
+                )
                 logger.info("Enhanced Context Engine initialized successfully")
                 
         except Exception as e:
@@ -697,7 +726,8 @@ class EnhancedPITCESController(PITCESController):
             },
             'streams_manager': {
                 'batch_size': 10,
-                'block_timeout': 1000
+                'block_timeout': 1000,
+                'handler_concurrency': 8
             },
             'cluster_manager': {
                 'nodes': [],
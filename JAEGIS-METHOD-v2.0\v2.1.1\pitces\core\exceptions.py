@@ -280,6 +280,10 @@ class ErrorCodes:
     MISSING_CONFIG = "CF001"
     INVALID_CONFIG_VALUE = "CF002"
     CONFIG_VALIDATION_FAILURE = "CF003"
+    
+    # Redis cluster errors
+    CLUSTER_COMMAND_FAILURE = "RC001"
+    CLUSTER_SLOT_UNCOVERED = "RC002"
 
 
 def create_error_with_context(
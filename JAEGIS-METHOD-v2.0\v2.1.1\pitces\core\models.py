@@ -43,6 +43,10 @@ class WorkflowMode(Enum):
     CI_AR = "CI_AR"
 
 
+# Name used by the controllers and the Redis integration modules
+WorkflowType = WorkflowMode
+
+
 class PhaseStatus(Enum):
     """Sequential workflow phase status."""
     NOT_STARTED = auto()
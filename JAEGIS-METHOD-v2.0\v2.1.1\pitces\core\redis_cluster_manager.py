@@ -10,6 +10,7 @@ import asyncio
 import json
 import logging
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass
@@ -18,7 +19,9 @@ from enum import Enum
 import redis
 import redis.asyncio as aioredis
 from redis.cluster import RedisCluster
-from redis.asyncio.cluster import RedisCluster as AsyncRedisCluster
+from redis.asyncio.cluster import RedisCluster as AsyncRedisCluster, ClusterParser
+from redis.crc import key_slot, REDIS_CLUSTER_HASH_SLOTS
+from redis.exceptions import AskError, MovedError
 
 from .exceptions import PITCESError, ErrorCodes
 
@@ -70,6 +73,11 @@ class ClusterNode:
     def slot_count(self) -> int:
         """Get number of slots assigned to this node."""
         return sum(end - start + 1 for start, end in self.slots)
+    
+    @property
+    def address(self) -> str:
+        """Node address in ``host:port`` form, as used in redirect errors."""
+        return f"{self.host}:{self.port}"
 
 
 class RedisClusterManager:
@@ -95,7 +103,7 @@ class RedisClusterManager:
             config: Cluster management configuration
         """
         self.cluster_nodes = cluster_nodes
-        self.config = config or self._get_default_config()
+        self.config = {**self._get_default_config(), **(config or {})}
         
         # Cluster clients
         self.cluster_client: Optional[RedisCluster] = None
@@ -106,6 +114,12 @@ class RedisClusterManager:
         self.master_nodes: Dict[str, ClusterNode] = {}
         self.replica_nodes: Dict[str, ClusterNode] = {}
         
+        # Slot routing table: slot -> owning master address ("host:port")
+        self.slot_owners: List[Optional[str]] = [None] * REDIS_CLUSTER_HASH_SLOTS
+        
+        # Per-node async clients used for pipelined routing, keyed by address
+        self.node_clients: Dict[str, aioredis.Redis] = {}
+        
         # Performance metrics
         self.cluster_metrics = {
             'total_nodes': 0,
@@ -119,7 +133,12 @@ class RedisClusterManager:
             'memory_usage': {},
             'connection_pool_stats': {},
             'command_latencies': {},
-            'throughput_metrics': {}
+            'throughput_metrics': {},
+            'pipelined_commands': 0,
+            'node_pipelines': 0,
+            'moved_redirects': 0,
+            'ask_redirects': 0,
+            'topology_refreshes': 0
         }
         
         # Monitoring and optimization
@@ -235,11 +254,8 @@ class RedisClusterManager:
             
             if target_node and target_node in self.cluster_topology:
                 # Execute on specific node
-                node = self.cluster_topology[target_node]
-                node_client = redis.Redis(host=node.host, port=node.port)
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, getattr(node_client, command.lower()), *args
-                )
+                node_client = self._get_node_client(self.cluster_topology[target_node].address)
+                result = await getattr(node_client, command.lower())(*args, **kwargs)
             else:
                 # Execute on cluster (automatic routing)
                 result = await getattr(self.async_cluster_client, command.lower())(*args, **kwargs)
@@ -257,6 +273,154 @@ class RedisClusterManager:
                 error_code=ErrorCodes.CLUSTER_COMMAND_FAILURE
             )
     
+    def get_key_slot(self, key: Any) -> int:
+        """
+        Compute the cluster hash slot of a key (CRC16 with hash tag support).
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Hash slot in the range 0-16383
+        """
+        return key_slot(key.encode() if isinstance(key, str) else key)
+    
+    def get_node_for_key(self, key: Any) -> Optional[str]:
+        """
+        Get the address of the master owning a key's slot in the local routing table.
+        
+        Args:
+            key: Redis key
+            
+        Returns:
+            Owning master address in ``host:port`` form, or None if unknown
+        """
+        return self.slot_owners[self.get_key_slot(key)]
+    
+    async def execute_cluster_pipeline(
+        self,
+        commands: List[Tuple[Any, ...]],
+        raise_on_error: bool = True
+    ) -> List[Any]:
+        """
+        Execute single-key commands as per-node pipelines issued in parallel.
+        
+        Commands are grouped by the master owning each key's hash slot, sent as
+        one pipeline per node, and the results reassembled in input order.
+        MOVED redirects update the routing table (and trigger a topology
+        refresh); ASK redirects are retried once against the importing node.
+        
+        Args:
+            commands: Tuples of ``(command, key, *args)``, e.g. ``('SET', 'k', 'v')``
+            raise_on_error: Raise on the first command error instead of returning it
+            
+        Returns:
+            Results in the same order as ``commands``
+        """
+        start_time = time.time()
+        results: List[Any] = [None] * len(commands)
+        pending = list(range(len(commands)))
+        ask_targets: Dict[int, str] = {}
+        
+        if pending and not any(self.slot_owners):
+            await self._refresh_slot_routing()
+        
+        for _ in range(self.config['max_redirects'] + 1):
+            if not pending:
+                break
+            
+            # Group commands by owning node
+            node_batches: Dict[str, List[int]] = defaultdict(list)
+            for index in pending:
+                address = ask_targets.get(index) or self.get_node_for_key(commands[index][1])
+                if address is None:
+                    raise PITCESError(
+                        f"No node owns slot {self.get_key_slot(commands[index][1])}",
+                        error_code=ErrorCodes.CLUSTER_SLOT_UNCOVERED
+                    )
+                node_batches[address].append(index)
+            
+            batch_results = await asyncio.gather(*(
+                self._execute_node_pipeline(
+                    address, [commands[i] for i in indices], [i in ask_targets for i in indices]
+                )
+                for address, indices in node_batches.items()
+            ), return_exceptions=True)
+            
+            pending = []
+            ask_targets = {}
+            refresh_needed = False
+            
+            for (address, indices), node_result in zip(node_batches.items(), batch_results):
+                if isinstance(node_result, Exception):
+                    # Node unreachable: retry its commands after a topology refresh
+                    logger.warning(f"Pipeline to {address} failed: {node_result}")
+                    self._close_node_client(address)
+                    for index in indices:
+                        results[index] = node_result
+                    pending.extend(indices)
+                    refresh_needed = True
+                    continue
+                
+                for index, result in zip(indices, node_result):
+                    results[index] = result
+                    
+                    # MovedError subclasses AskError, so it must be checked first
+                    if isinstance(result, MovedError):
+                        self.cluster_metrics['moved_redirects'] += 1
+                        self.slot_owners[result.slot_id] = f"{result.host}:{result.port}"
+                        pending.append(index)
+                        refresh_needed = True
+                    elif isinstance(result, AskError):
+                        self.cluster_metrics['ask_redirects'] += 1
+                        ask_targets[index] = f"{result.host}:{result.port}"
+                        pending.append(index)
+            
+            if refresh_needed:
+                await self._refresh_slot_routing()
+        
+        self.cluster_metrics['pipelined_commands'] += len(commands)
+        self._update_command_latency('PIPELINE', time.time() - start_time)
+        
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise PITCESError(
+                        f"Cluster pipeline failed: {str(result)}",
+                        error_code=ErrorCodes.CLUSTER_COMMAND_FAILURE
+                    )
+        
+        return results
+    
+    async def multi_get(self, keys: List[str]) -> List[Any]:
+        """
+        Get many keys across slots with one pipeline per owning node.
+        
+        Args:
+            keys: Keys to fetch
+            
+        Returns:
+            Values in the same order as ``keys`` (None for missing keys)
+        """
+        return await self.execute_cluster_pipeline([('GET', key) for key in keys])
+    
+    async def multi_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set many keys across slots with one pipeline per owning node.
+        
+        Args:
+            mapping: Key to value mapping
+            ttl: Optional expiry in seconds
+            
+        Returns:
+            True if every key was set
+        """
+        expiry = ('EX', ttl) if ttl else ()
+        results = await self.execute_cluster_pipeline([
+            ('SET', key, value, *expiry) for key, value in mapping.items()
+        ])
+        return all(results)
+    
     async def rebalance_cluster_slots(self) -> Dict[str, Any]:
         """
         Rebalance cluster slots for optimal distribution.
@@ -289,7 +453,8 @@ class RedisClusterManager:
                 'status': 'completed',
                 'migrations_executed': len(migration_results),
                 'migration_results': migration_results,
-                'new_distribution': await self._calculate_slot_distribution()
+                'keys_migrated': sum(result.get('keys_migrated', 0) for result in migration_results),
+                'new_distribution': self._calculate_slot_distribution()
             }
             
         except Exception as e:
@@ -502,7 +667,7 @@ class RedisClusterManager:
             self.master_nodes.clear()
             self.replica_nodes.clear()
             
-            for line in nodes_info.split('\n'):
+            for line in self._cluster_nodes_lines(nodes_info):
                 if not line.strip():
                     continue
                 
@@ -515,6 +680,8 @@ class RedisClusterManager:
                     elif node.is_replica:
                         self.replica_nodes[node.node_id] = node
             
+            self._rebuild_slot_routing()
+            
             # Update metrics
             self.cluster_metrics['total_nodes'] = len(self.cluster_topology)
             self.cluster_metrics['master_nodes'] = len(self.master_nodes)
@@ -537,9 +704,8 @@ class RedisClusterManager:
                 return None
             
             node_id = parts[0]
-            host_port = parts[1].split(':')
-            host = host_port[0]
-            port = int(host_port[1])
+            host, port = parts[1].split('@')[0].rsplit(':', 1)
+            port = int(port)
             flags = parts[2].split(',')
             master_id = parts[3] if parts[3] != '-' else None
             ping_sent = int(parts[4])
@@ -558,6 +724,8 @@ class RedisClusterManager:
             # Parse slot ranges
             slots = []
             for slot_info in parts[8:]:
+                if slot_info.startswith('['):
+                    continue  # slot in migration/import, owned by the listed node until it completes
                 if '-' in slot_info:
                     start, end = map(int, slot_info.split('-'))
                     slots.append((start, end))
@@ -731,24 +899,265 @@ class RedisClusterManager:
     
     async def _plan_slot_migrations(self, slot_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Plan slot migrations for rebalancing."""
-        # This would implement slot migration planning logic
-        return []
+        owned_slots = {
+            node_id: [slot for start, end in node.slots for slot in range(start, end + 1)]
+            for node_id, node in self.master_nodes.items()
+        }
+        target_counts = self._calculate_target_slot_counts(owned_slots)
+        
+        # Only donors' slots can move, so only they need key counts
+        key_counts: Dict[int, int] = {}
+        for node_id, slots in owned_slots.items():
+            if len(slots) <= target_counts[node_id]:
+                continue
+            
+            pipe = self._get_node_client(self.master_nodes[node_id].address).pipeline(transaction=False)
+            for slot in slots:
+                pipe.execute_command('CLUSTER COUNTKEYSINSLOT', slot)
+            key_counts.update(zip(slots, await pipe.execute()))
+        
+        return self._compute_rebalance_plan(owned_slots, key_counts)
+    
+    def _calculate_target_slot_counts(self, owned_slots: Dict[str, List[int]]) -> Dict[str, int]:
+        """Even slot targets per master; the remainder goes to the currently largest masters."""
+        total_slots = sum(len(slots) for slots in owned_slots.values())
+        base, remainder = divmod(total_slots, len(owned_slots))
+        
+        by_size = sorted(owned_slots, key=lambda node_id: len(owned_slots[node_id]), reverse=True)
+        return {
+            node_id: base + (1 if rank < remainder else 0)
+            for rank, node_id in enumerate(by_size)
+        }
+    
+    def _compute_rebalance_plan(
+        self,
+        owned_slots: Dict[str, List[int]],
+        key_counts: Dict[int, int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute a slot migration plan that balances masters while moving the fewest keys.
+        
+        Only masters above their target give up slots, and each gives up exactly
+        its surplus, which is the minimum number of slot moves. Among its slots a
+        donor gives up the ones holding the fewest keys.
+        
+        Args:
+            owned_slots: Master node ID to the slots it owns
+            key_counts: Slot to number of keys stored in it
+            
+        Returns:
+            Migrations as dicts with slot, source_node, target_node and key_count
+        """
+        if not owned_slots:
+            return []
+        
+        target_counts = self._calculate_target_slot_counts(owned_slots)
+        
+        outgoing: List[Tuple[int, str]] = []
+        for node_id, slots in owned_slots.items():
+            surplus = len(slots) - target_counts[node_id]
+            if surplus > 0:
+                lightest = sorted(slots, key=lambda slot: (key_counts.get(slot, 0), slot))[:surplus]
+                outgoing.extend((slot, node_id) for slot in lightest)
+        
+        deficits = [
+            [node_id, target_counts[node_id] - len(slots)]
+            for node_id, slots in owned_slots.items()
+            if len(slots) < target_counts[node_id]
+        ]
+        
+        plan = []
+        for slot, source_node in sorted(outgoing):
+            recipient = deficits[0]
+            plan.append({
+                'slot': slot,
+                'source_node': source_node,
+                'target_node': recipient[0],
+                'key_count': key_counts.get(slot, 0)
+            })
+            recipient[1] -= 1
+            if recipient[1] == 0:
+                deficits.pop(0)
+        
+        return plan
     
     async def _execute_slot_migrations(self, migration_plan: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Execute planned slot migrations."""
-        # This would implement slot migration execution
-        return []
+        migration_results = []
+        
+        for migration in migration_plan:
+            slot = migration['slot']
+            source = self.master_nodes[migration['source_node']]
+            target = self.master_nodes[migration['target_node']]
+            source_client = self._get_node_client(source.address)
+            target_client = self._get_node_client(target.address)
+            keys_migrated = 0
+            
+            try:
+                await target_client.execute_command('CLUSTER SETSLOT', slot, 'IMPORTING', source.node_id)
+                await source_client.execute_command('CLUSTER SETSLOT', slot, 'MIGRATING', target.node_id)
+                
+                while True:
+                    keys = await source_client.execute_command(
+                        'CLUSTER GETKEYSINSLOT', slot, self.config['migration_batch_size']
+                    )
+                    if not keys:
+                        break
+                    
+                    await source_client.execute_command(
+                        'MIGRATE', target.host, target.port, '', 0,
+                        self.config['slot_migration_timeout'], 'KEYS', *keys
+                    )
+                    keys_migrated += len(keys)
+                
+                # Finalize ownership on the target first, then everywhere else
+                await target_client.execute_command('CLUSTER SETSLOT', slot, 'NODE', target.node_id)
+                await source_client.execute_command('CLUSTER SETSLOT', slot, 'NODE', target.node_id)
+                for node_id, node in self.master_nodes.items():
+                    if node_id not in (source.node_id, target.node_id):
+                        await self._get_node_client(node.address).execute_command(
+                            'CLUSTER SETSLOT', slot, 'NODE', target.node_id
+                        )
+                
+                self.slot_owners[slot] = target.address
+                migration_results.append({**migration, 'keys_migrated': keys_migrated, 'status': 'completed'})
+                
+            except Exception as e:
+                logger.error(f"Migration of slot {slot} failed: {e}")
+                migration_results.append({
+                    **migration, 'keys_migrated': keys_migrated, 'status': 'failed', 'error': str(e)
+                })
+        
+        await self._refresh_slot_routing()
+        return migration_results
     
     async def _handle_master_failover(self, failed_master_id: str) -> Dict[str, Any]:
         """Handle master node failover."""
-        # This would implement master failover logic
-        return {'status': 'completed', 'new_master': 'replica_promoted'}
+        candidates = [
+            replica for replica in self.replica_nodes.values()
+            if replica.master_id == failed_master_id
+            and replica.link_state == 'connected'
+            and 'fail' not in replica.flags
+        ]
+        
+        if not candidates:
+            return {'status': 'failed', 'error': 'no_healthy_replica'}
+        
+        # Promote the replica with the most replicated data
+        offsets = {}
+        for replica in candidates:
+            try:
+                info = await self._get_node_client(replica.address).info('replication')
+                offsets[replica.node_id] = int(info.get('slave_repl_offset', 0))
+            except Exception as e:
+                logger.warning(f"Could not read replication offset of {replica.node_id}: {e}")
+        
+        if not offsets:
+            return {'status': 'failed', 'error': 'replicas_unreachable'}
+        
+        new_master_id = max(offsets, key=offsets.get)
+        new_master = self.replica_nodes[new_master_id]
+        
+        # FORCE: the failed master cannot take part in a coordinated failover
+        await self._get_node_client(new_master.address).execute_command('CLUSTER FAILOVER', 'FORCE')
+        self._close_node_client(self.cluster_topology[failed_master_id].address)
+        
+        return {'status': 'completed', 'new_master': new_master_id}
     
     async def _handle_replica_failover(self, failed_replica_id: str) -> Dict[str, Any]:
         """Handle replica node failover."""
-        # This would implement replica failover logic
+        replica = self.cluster_topology.get(failed_replica_id)
+        if replica:
+            self._close_node_client(replica.address)
+        
         return {'status': 'completed', 'action': 'replica_removed'}
     
+    def _get_node_client(self, address: str) -> aioredis.Redis:
+        """
+        Get or create the pooled async client for a node address.
+        
+        The cluster parser turns MOVED/ASK error replies into MovedError and
+        AskError, which execute_cluster_pipeline relies on to follow redirects.
+        """
+        client = self.node_clients.get(address)
+        if client is None:
+            host, port = address.rsplit(':', 1)
+            client = aioredis.Redis.from_pool(aioredis.ConnectionPool(
+                host=host,
+                port=int(port),
+                decode_responses=True,
+                max_connections=self.config['max_connections_per_node'],
+                parser_class=ClusterParser
+            ))
+            self.node_clients[address] = client
+        return client
+    
+    def _close_node_client(self, address: str):
+        """Drop the client of a node that failed or left the cluster."""
+        client = self.node_clients.pop(address, None)
+        if client is not None:
+            asyncio.create_task(client.close())
+    
+    async def _execute_node_pipeline(
+        self,
+        address: str,
+        commands: List[Tuple[Any, ...]],
+        asking: List[bool]
+    ) -> List[Any]:
+        """Send commands to one node as a single pipeline; redirects come back as results."""
+        pipe = self._get_node_client(address).pipeline(transaction=False)
+        for command, ask in zip(commands, asking):
+            if ask:
+                pipe.execute_command('ASKING')
+            pipe.execute_command(*command)
+        
+        self.cluster_metrics['node_pipelines'] += 1
+        raw_results = await pipe.execute(raise_on_error=False)
+        
+        # Strip the replies to ASKING
+        results = []
+        raw_iter = iter(raw_results)
+        for ask in asking:
+            if ask:
+                next(raw_iter)
+            results.append(next(raw_iter))
+        return results
+    
+    async def _refresh_slot_routing(self):
+        """Refresh topology and the slot routing table after a redirect or node failure."""
+        self.cluster_metrics['topology_refreshes'] += 1
+        await self._discover_cluster_topology()
+    
+    def _rebuild_slot_routing(self):
+        """Rebuild the slot routing table from the discovered master slot ranges."""
+        slot_owners: List[Optional[str]] = [None] * REDIS_CLUSTER_HASH_SLOTS
+        for node in self.master_nodes.values():
+            for start, end in node.slots:
+                slot_owners[start:end + 1] = [node.address] * (end - start + 1)
+        self.slot_owners = slot_owners
+        
+        # Close clients of nodes that left the cluster
+        known_addresses = {node.address for node in self.cluster_topology.values()}
+        for address in list(self.node_clients):
+            if address not in known_addresses:
+                self._close_node_client(address)
+    
+    def _cluster_nodes_lines(self, nodes_info: Any) -> List[str]:
+        """Normalize CLUSTER NODES output (raw text or redis-py's parsed dict) to lines."""
+        if isinstance(nodes_info, str):
+            return nodes_info.split('\n')
+        
+        lines = []
+        for address, info in nodes_info.items():
+            link_state = 'connected' if info.get('connected') else 'disconnected'
+            slots = ' '.join('-'.join(map(str, slot_range)) for slot_range in info.get('slots', []))
+            lines.append(
+                f"{info['node_id']} {address} {info['flags']} {info['master_id']} "
+                f"{info['last_ping_sent']} {info['last_pong_rcvd']} {info['epoch']} "
+                f"{link_state} {slots}"
+            )
+        return lines
+    
     async def _analyze_memory_usage(self) -> Dict[str, Any]:
         """Analyze memory usage patterns."""
         return {'total_memory': 0, 'used_memory': 0, 'fragmentation': 0}
@@ -806,5 +1215,8 @@ class RedisClusterManager:
             'health_check_interval': 30,
             'optimization_interval': 3600,
             'failover_timeout': 15,
-            'slot_migration_timeout': 30000
+            'slot_migration_timeout': 30000,
+            'migration_batch_size': 100,
+            'max_redirects': 5,
+            'max_connections_per_node': 50
         }
@@ -10,16 +10,27 @@ import asyncio
 import json
 import logging
 import time
+import inspect
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from dataclasses import asdict
 from uuid import UUID, uuid4
 from enum import Enum
 
 import redis.asyncio as aioredis
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .models import Task, Priority, TaskStatus, WorkflowType
-from .exceptions import PITCESError, ErrorCodes
+from .exceptions import PITCESError, ConfigurationError, ErrorCodes
 
 
 logger = logging.getLogger(__name__)
@@ -54,6 +65,54 @@ class MessagePriority(Enum):
     LOW = 4
 
 
+class PayloadEncoding(Enum):
+    """Wire encodings for stream message payloads."""
+    JSON = "json"        # one stream field per message attribute, nested values as JSON
+    MSGPACK = "msgpack"  # single msgpack field, zstd-compressed above a size threshold
+
+
+# Field markers of binary-encoded stream entries
+ENCODING_FIELD = 'enc'
+PAYLOAD_FIELD = 'data'
+MSGPACK_MARKER = 'mp'
+MSGPACK_ZSTD_MARKER = 'mpz'
+
+# msgpack extension types for values that JSON-encoded entries carry as strings
+MSGPACK_EXT_DATETIME = 1  # naive datetime, signed microseconds since the epoch
+MSGPACK_EXT_UUID = 2      # UUID, 16 raw bytes
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for datetimes and UUIDs nested in message attributes."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _msgpack_default(value: Any) -> Any:
+    """msgpack fallback packing datetimes and UUIDs as extension types."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return value.isoformat()
+        microseconds = (value - _EPOCH) // timedelta(microseconds=1)
+        return msgpack.ExtType(MSGPACK_EXT_DATETIME, microseconds.to_bytes(8, 'big', signed=True))
+    if isinstance(value, UUID):
+        return msgpack.ExtType(MSGPACK_EXT_UUID, value.bytes)
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Restore extension types packed by ``_msgpack_default``."""
+    if code == MSGPACK_EXT_DATETIME:
+        return _EPOCH + timedelta(microseconds=int.from_bytes(data, 'big', signed=True))
+    if code == MSGPACK_EXT_UUID:
+        return UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+
 class RedisStreamsManager:
     """
     Redis Streams manager for real-time task queue management and event processing.
@@ -76,7 +135,23 @@ class RedisStreamsManager:
             config: Streams configuration
         """
         self.redis_client = redis_client
-        self.config = config or self._get_default_config()
+        self.config = {**self._get_default_config(), **(config or {})}
+        
+        # Payload encoding; binary payloads need a connection that does not
+        # decode responses, so stream traffic goes through stream_client
+        self.payload_encoding = PayloadEncoding(self.config['payload_encoding'])
+        if self.payload_encoding == PayloadEncoding.MSGPACK:
+            if msgpack is None:
+                raise ConfigurationError(
+                    "msgpack payload encoding requires the 'msgpack' package",
+                    error_code=ErrorCodes.INVALID_CONFIG_VALUE
+                )
+            self.stream_client = self._create_binary_client(redis_client)
+        else:
+            self.stream_client = redis_client
+        
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
         
         # Stream configurations
         self.stream_configs = {
@@ -134,9 +209,23 @@ class RedisStreamsManager:
             'consumer_lag': {},
             'processing_times': {},
             'stream_lengths': {},
-            'dead_letter_count': 0
+            'dead_letter_count': 0,
+            'messages_reclaimed': 0,
+            'pending_messages': {},
+            'stream_throughput': {}
         }
         
+        # Per-stream throughput measurement windows
+        self._throughput_windows: Dict[str, Dict[str, float]] = {}
+        
+        # Publisher-side batching: pending (fields, future) pairs per stream
+        self._publish_buffers: Dict[StreamType, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._publish_flush_tasks: Dict[StreamType, asyncio.Task] = {}
+        self._publish_send_tasks: Set[asyncio.Task] = set()
+        self._monitor_task: Optional[asyncio.Task] = None
+        self.publish_metrics: Dict[str, Dict[str, Any]] = {}
+        self._publish_windows: Dict[str, Dict[str, float]] = {}
+        
         # Dead letter queue
         self.dead_letter_stream = "pitces:dead_letter_queue"
         
@@ -158,7 +247,7 @@ class RedisStreamsManager:
             await self._create_dead_letter_queue()
             
             # Start background monitoring
-            asyncio.create_task(self._monitor_streams())
+            self._monitor_task = asyncio.create_task(self._monitor_streams())
             
             logger.info("Redis Streams initialization completed")
             return True
@@ -188,11 +277,11 @@ class RedisStreamsManager:
             message_data = {
                 'message_type': 'task_priority',
                 'task_id': str(task.id),
-                'task_data': json.dumps(task.to_dict()),
+                'task_data': task.to_dict(),
                 'current_priority': task.priority.name,
                 'new_priority': priority_change.name if priority_change else task.priority.name,
-                'context': json.dumps(context or {}),
-                'timestamp': datetime.now().isoformat(),
+                'context': context or {},
+                'timestamp': datetime.now(),
                 'source': 'triage_system'
             }
             
@@ -234,8 +323,8 @@ class RedisStreamsManager:
                 'message_type': 'task_preemption',
                 'task_id': str(task_id),
                 'preemption_type': preemption_type,
-                'context_data': json.dumps(context_data),
-                'timestamp': datetime.now().isoformat(),
+                'context_data': context_data,
+                'timestamp': datetime.now(),
                 'source': 'preemption_manager'
             }
             
@@ -276,10 +365,10 @@ class RedisStreamsManager:
         try:
             message_data = {
                 'message_type': 'workflow_decision',
-                'project_specs': json.dumps(project_specs),
+                'project_specs': project_specs,
                 'workflow_type': workflow_type.value,
-                'decision_context': json.dumps(decision_context),
-                'timestamp': datetime.now().isoformat(),
+                'decision_context': decision_context,
+                'timestamp': datetime.now(),
                 'source': 'workflow_selector'
             }
             
@@ -319,10 +408,10 @@ class RedisStreamsManager:
         try:
             message_data = {
                 'message_type': 'gap_analysis',
-                'project_specs': json.dumps(project_specs),
-                'analysis_results': json.dumps(analysis_results),
-                'recommendations': json.dumps(recommendations),
-                'timestamp': datetime.now().isoformat(),
+                'project_specs': project_specs,
+                'analysis_results': analysis_results,
+                'recommendations': recommendations,
+                'timestamp': datetime.now(),
                 'source': 'gap_analysis_squad'
             }
             
@@ -364,8 +453,8 @@ class RedisStreamsManager:
                 'message_type': 'agent_coordination',
                 'agent_tier': agent_tier,
                 'coordination_type': coordination_type,
-                'coordination_data': json.dumps(coordination_data),
-                'timestamp': datetime.now().isoformat(),
+                'coordination_data': coordination_data,
+                'timestamp': datetime.now(),
                 'source': 'agent_system'
             }
             
@@ -411,7 +500,7 @@ class RedisStreamsManager:
                 'text_input': text_input,
                 'processing_type': processing_type,
                 'confidence_threshold': confidence_threshold,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(),
                 'source': 'nlds_tier_0'
             }
             
@@ -452,9 +541,9 @@ class RedisStreamsManager:
             message_data = {
                 'message_type': 'system_event',
                 'event_type': event_type,
-                'event_data': json.dumps(event_data),
+                'event_data': event_data,
                 'severity': severity,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.now(),
                 'source': 'pitces_framework'
             }
             
@@ -488,16 +577,24 @@ class RedisStreamsManager:
         stream_type: StreamType,
         consumer_group: ConsumerGroup,
         consumer_name: str,
-        message_handler: Callable[[Dict[str, Any]], bool]
+        message_handler: Callable[[Dict[str, Any]], bool],
+        concurrency: Optional[int] = None
     ) -> bool:
         """
         Start a consumer for a specific stream.
         
+        Messages of each XREADGROUP batch are handled concurrently (bounded by
+        ``concurrency``) and settled with a single pipelined round-trip.
+        Coroutine handlers are awaited directly; plain callables run in the
+        default executor.
+        
         Args:
             stream_type: Type of stream to consume
             consumer_group: Consumer group name
             consumer_name: Unique consumer identifier
-            message_handler: Function to handle messages
+            message_handler: Function or coroutine function to handle messages
+            concurrency: Maximum in-flight handler calls for this consumer
+                (defaults to the ``handler_concurrency`` setting)
             
         Returns:
             True if consumer started successfully
@@ -512,9 +609,13 @@ class RedisStreamsManager:
             # Register message handler
             self.message_handlers[stream_type].append(message_handler)
             
+            concurrency = max(1, concurrency or self.config['handler_concurrency'])
+            
             # Start consumer task
             consumer_task = asyncio.create_task(
-                self._consume_messages(stream_type, consumer_group, consumer_name, message_handler)
+                self._consume_messages(
+                    stream_type, consumer_group, consumer_name, message_handler, concurrency
+                )
             )
             
             self.active_consumers[consumer_key] = {
@@ -522,6 +623,7 @@ class RedisStreamsManager:
                 'stream_type': stream_type,
                 'consumer_group': consumer_group,
                 'consumer_name': consumer_name,
+                'concurrency': concurrency,
                 'start_time': datetime.now(),
                 'messages_processed': 0,
                 'last_activity': datetime.now()
@@ -608,6 +710,7 @@ class RedisStreamsManager:
                         'stream_type': info['stream_type'].value,
                         'consumer_group': info['consumer_group'].value,
                         'consumer_name': info['consumer_name'],
+                        'concurrency': info['concurrency'],
                         'messages_processed': info['messages_processed'],
                         'uptime_seconds': (datetime.now() - info['start_time']).total_seconds(),
                         'last_activity': info['last_activity'].isoformat()
@@ -620,6 +723,46 @@ class RedisStreamsManager:
             logger.error(f"Failed to get stream metrics: {e}")
             return self.stream_metrics
     
+    async def flush_publish_buffers(self):
+        """Flush all buffered messages immediately and wait for batches already in flight."""
+        for stream_type in list(self._publish_buffers):
+            task = self._publish_flush_tasks.pop(stream_type, None)
+            if task and task is not asyncio.current_task():
+                task.cancel()
+            await self._flush_stream_buffer(stream_type)
+        
+        if self._publish_send_tasks:
+            await asyncio.gather(*self._publish_send_tasks, return_exceptions=True)
+    
+    async def shutdown(self):
+        """Stop consumers and monitoring, then flush buffered and in-flight publishes."""
+        for info in list(self.active_consumers.values()):
+            await self.stop_consumer(info['stream_type'], info['consumer_group'], info['consumer_name'])
+        
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+        
+        await self.flush_publish_buffers()
+        logger.info("RedisStreamsManager shut down")
+    
+    def get_publish_metrics(self) -> Dict[str, Any]:
+        """
+        Get publisher throughput and payload size metrics per stream.
+        
+        Returns:
+            Dictionary keyed by stream name with message rate and bytes per message
+        """
+        return {
+            'payload_encoding': self.payload_encoding.value,
+            'batching_enabled': self.config['publish_batching'],
+            'streams': {name: dict(metrics) for name, metrics in self.publish_metrics.items()}
+        }
+    
     async def _publish_message(
         self, 
         stream_type: StreamType,
@@ -632,42 +775,253 @@ class RedisStreamsManager:
             enhanced_message = {
                 **message_data,
                 'priority': priority.value,
-                'message_id': str(uuid4()),
-                'published_at': datetime.now().isoformat()
+                'message_id': uuid4(),
+                'published_at': datetime.now()
             }
+            fields = self._encode_message(enhanced_message)
+            
+            if self.config['publish_batching']:
+                return await self._enqueue_publish(stream_type, fields)
             
             # Get stream configuration
             stream_config = self.stream_configs[stream_type]
             
             # Publish to stream with max length limit
-            message_id = await self.redis_client.xadd(
+            message_id = await self.stream_client.xadd(
                 stream_type.value,
-                enhanced_message,
+                fields,
                 maxlen=stream_config['max_length'],
                 approximate=True
             )
             
             self.stream_metrics['messages_published'] += 1
+            self._update_publish_metrics(stream_type, [fields])
             
-            return message_id
+            return self._to_str(message_id)
             
         except Exception as e:
             logger.error(f"Failed to publish message to {stream_type.value}: {e}")
             raise
     
+    async def _enqueue_publish(self, stream_type: StreamType, fields: Dict[str, Any]) -> str:
+        """Buffer a message until its stream's batch is flushed and return its stream ID."""
+        future = asyncio.get_running_loop().create_future()
+        buffer = self._publish_buffers.setdefault(stream_type, [])
+        buffer.append((fields, future))
+        
+        if len(buffer) >= self.config['publish_max_batch']:
+            # Full batch: send now instead of waiting for the latency window
+            task = self._publish_flush_tasks.pop(stream_type, None)
+            if task:
+                task.cancel()
+            send_task = asyncio.create_task(
+                self._send_publish_batch(stream_type, self._publish_buffers.pop(stream_type))
+            )
+            self._publish_send_tasks.add(send_task)
+            send_task.add_done_callback(self._on_publish_batch_done)
+        elif stream_type not in self._publish_flush_tasks:
+            self._publish_flush_tasks[stream_type] = asyncio.create_task(
+                self._flush_after_linger(stream_type)
+            )
+        
+        return await future
+    
+    def _on_publish_batch_done(self, task: asyncio.Task):
+        """Forget a finished batch send and log it if it failed outside the pipeline."""
+        self._publish_send_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Publish batch task failed: {task.exception()}")
+    
+    async def _flush_after_linger(self, stream_type: StreamType):
+        """Flush a stream buffer once the configured latency window has elapsed."""
+        try:
+            await asyncio.sleep(self.config['publish_linger_ms'] / 1000)
+        except asyncio.CancelledError:
+            return
+        self._publish_flush_tasks.pop(stream_type, None)
+        await self._flush_stream_buffer(stream_type)
+    
+    async def _flush_stream_buffer(self, stream_type: StreamType):
+        """Send all buffered messages of a stream."""
+        batch = self._publish_buffers.pop(stream_type, [])
+        if batch:
+            await self._send_publish_batch(stream_type, batch)
+    
+    async def _send_publish_batch(
+        self,
+        stream_type: StreamType,
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ):
+        """Send buffered messages as one pipelined XADD batch and resolve their futures."""
+        stream_config = self.stream_configs[stream_type]
+        pipe = self.stream_client.pipeline(transaction=False)
+        for fields, _ in batch:
+            pipe.xadd(
+                stream_type.value,
+                fields,
+                maxlen=stream_config['max_length'],
+                approximate=True
+            )
+        
+        try:
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.error(f"Failed to flush publish batch to {stream_type.value}: {e}")
+            results = [e] * len(batch)
+        
+        published = []
+        for (fields, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(self._to_str(result))
+                published.append(fields)
+        
+        self.stream_metrics['messages_published'] += len(published)
+        if published:
+            self._update_publish_metrics(stream_type, published)
+    
+    def _encode_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Encode a message into stream fields using the configured payload encoding."""
+        if self.payload_encoding == PayloadEncoding.MSGPACK:
+            data = msgpack.packb(message, default=_msgpack_default, use_bin_type=True)
+            marker = MSGPACK_MARKER
+            if self._zstd_compressor and len(data) >= self.config['compression_threshold']:
+                data = self._zstd_compressor.compress(data)
+                marker = MSGPACK_ZSTD_MARKER
+            
+            return {ENCODING_FIELD: marker, PAYLOAD_FIELD: data}
+        
+        return {key: self._field_value(value) for key, value in message.items()}
+    
+    @staticmethod
+    def _field_value(value: Any) -> Any:
+        """Stream field value of a message attribute in the JSON encoding."""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=_json_default)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+    
+    def _decode_fields(self, fields: Dict[Any, Any]) -> Dict[str, Any]:
+        """
+        Decode stream fields regardless of the encoding they were published with.
+        
+        Both encodings yield the same shape: string keys and string values, with
+        nested structures as JSON strings, datetimes in ISO format and UUIDs in
+        canonical form, exactly as Redis returns JSON-encoded entries.
+        """
+        fields = {self._to_str(key): value for key, value in fields.items()}
+        marker = self._to_str(fields.get(ENCODING_FIELD))
+        
+        if marker not in (MSGPACK_MARKER, MSGPACK_ZSTD_MARKER):
+            return {key: self._to_str(value) for key, value in fields.items()}
+        
+        data = fields[PAYLOAD_FIELD]
+        if marker == MSGPACK_ZSTD_MARKER:
+            if self._zstd_decompressor is None:
+                raise ConfigurationError(
+                    "zstd-compressed stream payload received without the 'zstandard' package",
+                    error_code=ErrorCodes.MISSING_CONFIG
+                )
+            data = self._zstd_decompressor.decompress(data)
+        
+        payload = msgpack.unpackb(data, raw=False, ext_hook=_msgpack_ext_hook)
+        decoded = {}
+        for key, value in payload.items():
+            value = self._to_str(self._field_value(value))
+            decoded[key] = value if isinstance(value, str) else str(value)
+        return decoded
+    
+    def _update_publish_metrics(self, stream_type: StreamType, published: List[Dict[str, Any]]):
+        """Update publisher message rate and payload size metrics."""
+        stream_name = stream_type.value
+        now = time.time()
+        
+        if stream_name not in self.publish_metrics:
+            self.publish_metrics[stream_name] = {
+                'messages': 0,
+                'batches': 0,
+                'bytes': 0,
+                'bytes_per_message': 0.0,
+                'messages_per_second': 0.0,
+                'average_batch_size': 0.0
+            }
+            self._publish_windows[stream_name] = {'start': now, 'messages': 0}
+        
+        payload_bytes = 0
+        for fields in published:
+            for key, value in fields.items():
+                payload_bytes += len(key) + (len(value) if isinstance(value, (str, bytes)) else len(str(value)))
+        
+        metrics = self.publish_metrics[stream_name]
+        metrics['messages'] += len(published)
+        metrics['batches'] += 1
+        metrics['bytes'] += payload_bytes
+        metrics['bytes_per_message'] = metrics['bytes'] / metrics['messages']
+        metrics['average_batch_size'] = metrics['messages'] / metrics['batches']
+        
+        window = self._publish_windows[stream_name]
+        window['messages'] += len(published)
+        elapsed = now - window['start']
+        if elapsed >= 1.0:
+            metrics['messages_per_second'] = window['messages'] / elapsed
+            window['start'] = now
+            window['messages'] = 0
+    
+    @staticmethod
+    def _to_str(value: Any) -> Any:
+        """Decode bytes returned by a raw (non-decoding) Redis connection."""
+        return value.decode() if isinstance(value, bytes) else value
+    
+    @staticmethod
+    def _create_binary_client(redis_client: aioredis.Redis) -> aioredis.Redis:
+        """Create a client sharing the connection settings of ``redis_client`` without response decoding."""
+        pool = redis_client.connection_pool
+        connection_kwargs = {**pool.connection_kwargs, 'decode_responses': False}
+        return aioredis.Redis(
+            connection_pool=type(pool)(
+                connection_class=pool.connection_class,
+                max_connections=pool.max_connections,
+                **connection_kwargs
+            )
+        )
+    
     async def _consume_messages(
         self, 
         stream_type: StreamType,
         consumer_group: ConsumerGroup,
         consumer_name: str,
-        message_handler: Callable[[Dict[str, Any]], bool]
+        message_handler: Callable[[Dict[str, Any]], bool],
+        concurrency: int = 1
     ):
-        """Consume messages from Redis Stream."""
+        """Consume messages from Redis Stream in concurrently processed batches."""
+        semaphore = asyncio.Semaphore(concurrency)
+        claim_cursor = '0-0'
+        last_claim = 0.0
+        
         try:
             while True:
                 try:
+                    # Recover entries left pending by dead or stalled consumers
+                    if (self.config['claim_idle_ms'] and
+                            time.monotonic() - last_claim >= self.config['claim_interval']):
+                        last_claim = time.monotonic()
+                        claim_cursor, claimed = await self._claim_stale_messages(
+                            stream_type, consumer_group, consumer_name, claim_cursor
+                        )
+                        if claimed:
+                            await self._process_batch(
+                                stream_type, consumer_group, consumer_name,
+                                claimed, message_handler, semaphore
+                            )
+                    
                     # Read messages from stream
-                    messages = await self.redis_client.xreadgroup(
+                    messages = await self.stream_client.xreadgroup(
                         consumer_group.value,
                         consumer_name,
                         {stream_type.value: '>'},
@@ -675,60 +1029,137 @@ class RedisStreamsManager:
                         block=self.config['block_timeout']
                     )
                     
-                    for stream, msgs in messages:
-                        for msg_id, fields in msgs:
-                            start_time = time.time()
-                            
-                            try:
-                                # Process message
-                                success = await self._process_message(
-                                    stream_type, msg_id, fields, message_handler
-                                )
-                                
-                                if success:
-                                    # Acknowledge message
-                                    await self.redis_client.xack(
-                                        stream_type.value,
-                                        consumer_group.value,
-                                        msg_id
-                                    )
-                                    self.stream_metrics['messages_acknowledged'] += 1
-                                else:
-                                    # Move to dead letter queue
-                                    await self._move_to_dead_letter_queue(
-                                        stream_type, msg_id, fields, "Processing failed"
-                                    )
-                                    self.stream_metrics['messages_failed'] += 1
-                                
-                                # Update metrics
-                                processing_time = time.time() - start_time
-                                self._update_processing_time(stream_type, processing_time)
-                                
-                                # Update consumer activity
-                                consumer_key = f"{stream_type.value}:{consumer_group.value}:{consumer_name}"
-                                if consumer_key in self.active_consumers:
-                                    self.active_consumers[consumer_key]['messages_processed'] += 1
-                                    self.active_consumers[consumer_key]['last_activity'] = datetime.now()
-                                
-                            except Exception as e:
-                                logger.error(f"Message processing error: {e}")
-                                await self._move_to_dead_letter_queue(
-                                    stream_type, msg_id, fields, str(e)
-                                )
-                                self.stream_metrics['messages_failed'] += 1
-                    
-                    self.stream_metrics['messages_consumed'] += len(msgs) if messages else 0
+                    for stream, msgs in messages or []:
+                        await self._process_batch(
+                            stream_type, consumer_group, consumer_name,
+                            msgs, message_handler, semaphore
+                        )
                     
                 except asyncio.CancelledError:
                     logger.info(f"Consumer cancelled: {consumer_name}")
                     break
                 except Exception as e:
                     logger.error(f"Consumer error: {e}")
-                    await asyncio.sleep(5)  # Wait before retrying
+                    await asyncio.sleep(self.config['retry_delay'])  # Wait before retrying
                     
         except Exception as e:
             logger.error(f"Consumer {consumer_name} failed: {e}")
     
+    async def _process_batch(
+        self,
+        stream_type: StreamType,
+        consumer_group: ConsumerGroup,
+        consumer_name: str,
+        msgs: List[Tuple[str, Dict[str, Any]]],
+        message_handler: Callable[[Dict[str, Any]], bool],
+        semaphore: asyncio.Semaphore
+    ):
+        """Run handlers for a batch concurrently and settle the results in one pipeline."""
+        if not msgs:
+            return
+        
+        async def handle(msg_id: Any, raw_fields: Dict[Any, Any]) -> Tuple[str, Dict[str, Any], Optional[str]]:
+            msg_id = self._to_str(msg_id)
+            try:
+                fields = self._decode_fields(raw_fields)
+            except Exception as e:
+                logger.error(f"Message decoding error: {e}")
+                return msg_id, {'undecodable_fields': repr(raw_fields)}, f"Payload decode failed: {e}"
+            
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    success = await self._process_message(
+                        stream_type, msg_id, fields, message_handler
+                    )
+                    error_reason = None if success else "Processing failed"
+                except Exception as e:
+                    logger.error(f"Message processing error: {e}")
+                    error_reason = str(e)
+                
+                self._update_processing_time(stream_type, time.time() - start_time)
+                return msg_id, fields, error_reason
+        
+        results = await asyncio.gather(*(handle(msg_id, fields) for msg_id, fields in msgs))
+        
+        await self._settle_batch(stream_type, consumer_group, results)
+        
+        self.stream_metrics['messages_consumed'] += len(results)
+        self._update_throughput(stream_type, results)
+        
+        # Update consumer activity
+        consumer_key = f"{stream_type.value}:{consumer_group.value}:{consumer_name}"
+        if consumer_key in self.active_consumers:
+            self.active_consumers[consumer_key]['messages_processed'] += len(results)
+            self.active_consumers[consumer_key]['last_activity'] = datetime.now()
+    
+    async def _settle_batch(
+        self,
+        stream_type: StreamType,
+        consumer_group: ConsumerGroup,
+        results: List[Tuple[str, Dict[str, Any], Optional[str]]]
+    ):
+        """Acknowledge processed messages and dead-letter failures in a single round-trip."""
+        pipe = self.stream_client.pipeline(transaction=False)
+        failed_at = datetime.now().isoformat()
+        failed_count = 0
+        
+        for msg_id, fields, error_reason in results:
+            if error_reason is not None:
+                pipe.xadd(
+                    self.dead_letter_stream,
+                    self._build_dead_letter_entry(stream_type, msg_id, fields, error_reason, failed_at),
+                    maxlen=1000,
+                    approximate=True
+                )
+                failed_count += 1
+        
+        # Failed messages are acknowledged too once they are in the dead letter
+        # queue, otherwise stale-entry recovery would redeliver them forever
+        pipe.xack(stream_type.value, consumer_group.value, *[msg_id for msg_id, _, _ in results])
+        
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to settle batch for {stream_type.value}: {e}")
+            return
+        
+        self.stream_metrics['messages_acknowledged'] += len(results) - failed_count
+        self.stream_metrics['messages_failed'] += failed_count
+        self.stream_metrics['dead_letter_count'] += failed_count
+    
+    async def _claim_stale_messages(
+        self,
+        stream_type: StreamType,
+        consumer_group: ConsumerGroup,
+        consumer_name: str,
+        start_id: str
+    ) -> Tuple[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Claim entries idle longer than ``claim_idle_ms`` via XAUTOCLAIM."""
+        try:
+            response = await self.stream_client.xautoclaim(
+                stream_type.value,
+                consumer_group.value,
+                consumer_name,
+                min_idle_time=self.config['claim_idle_ms'],
+                start_id=start_id,
+                count=self.config['batch_size']
+            )
+        except Exception as e:
+            logger.debug(f"Failed to claim stale messages for {stream_type.value}: {e}")
+            return start_id, []
+        
+        next_id, claimed = self._to_str(response[0]), response[1]
+        
+        # Entries deleted from the stream while pending come back without fields
+        claimed = [(msg_id, fields) for msg_id, fields in claimed if fields]
+        self.stream_metrics['messages_reclaimed'] += len(claimed)
+        
+        if claimed:
+            logger.info(f"Reclaimed {len(claimed)} stale messages on {stream_type.value}")
+        
+        return next_id, claimed
+    
     async def _process_message(
         self, 
         stream_type: StreamType,
@@ -747,8 +1178,11 @@ class RedisStreamsManager:
                 'priority': int(fields.get('priority', MessagePriority.MEDIUM.value))
             }
             
-            # Call message handler
-            success = await asyncio.get_event_loop().run_in_executor(
+            # Native async handlers skip the executor hop
+            if inspect.iscoroutinefunction(message_handler):
+                return await message_handler(message_data)
+            
+            success = await asyncio.get_running_loop().run_in_executor(
                 None, message_handler, message_data
             )
             
@@ -805,13 +1239,9 @@ class RedisStreamsManager:
     ):
         """Move failed message to dead letter queue."""
         try:
-            dead_letter_data = {
-                'original_stream': stream_type.value,
-                'original_message_id': msg_id,
-                'original_fields': json.dumps(fields),
-                'error_reason': error_reason,
-                'failed_at': datetime.now().isoformat()
-            }
+            dead_letter_data = self._build_dead_letter_entry(
+                stream_type, msg_id, fields, error_reason, datetime.now().isoformat()
+            )
             
             await self.redis_client.xadd(
                 self.dead_letter_stream,
@@ -825,6 +1255,23 @@ class RedisStreamsManager:
         except Exception as e:
             logger.error(f"Failed to move message to dead letter queue: {e}")
     
+    def _build_dead_letter_entry(
+        self,
+        stream_type: StreamType,
+        msg_id: str,
+        fields: Dict[str, Any],
+        error_reason: str,
+        failed_at: str
+    ) -> Dict[str, Any]:
+        """Build the dead letter queue entry for a failed message from its decoded fields."""
+        return {
+            'original_stream': stream_type.value,
+            'original_message_id': self._to_str(msg_id),
+            'original_fields': json.dumps(fields, default=str),
+            'error_reason': error_reason,
+            'failed_at': failed_at
+        }
+    
     async def _monitor_streams(self):
         """Background task to monitor stream health."""
         while True:
@@ -855,6 +1302,9 @@ class RedisStreamsManager:
                     lag = group.get('lag', 0)
                     
                     self.stream_metrics['consumer_lag'][f"{stream_type.value}:{group_name}"] = lag
+                    self.stream_metrics['pending_messages'][f"{stream_type.value}:{group_name}"] = (
+                        group.get('pending', 0)
+                    )
                     
             except Exception as e:
                 logger.debug(f"Failed to get consumer lag for {stream_type.value}: {e}")
@@ -914,6 +1364,46 @@ class RedisStreamsManager:
         metrics['message_count'] += 1
         metrics['average_time'] = metrics['total_time'] / metrics['message_count']
     
+    def _update_throughput(
+        self,
+        stream_type: StreamType,
+        results: List[Tuple[str, Dict[str, Any], Optional[str]]]
+    ):
+        """Update per-stream throughput and delivery lag metrics."""
+        stream_name = stream_type.value
+        now = time.time()
+        
+        if stream_name not in self.stream_metrics['stream_throughput']:
+            self.stream_metrics['stream_throughput'][stream_name] = {
+                'messages': 0,
+                'batches': 0,
+                'messages_per_second': 0.0,
+                'average_batch_size': 0.0,
+                'delivery_lag_ms': 0.0
+            }
+            self._throughput_windows[stream_name] = {'start': now, 'messages': 0}
+        
+        metrics = self.stream_metrics['stream_throughput'][stream_name]
+        metrics['messages'] += len(results)
+        metrics['batches'] += 1
+        metrics['average_batch_size'] = metrics['messages'] / metrics['batches']
+        
+        # Stream IDs carry the publish time in milliseconds; the newest entry of
+        # the batch tells how far behind the producers this consumer is
+        last_id = results[-1][0]
+        try:
+            metrics['delivery_lag_ms'] = max(0.0, now * 1000 - int(last_id.split('-')[0]))
+        except (ValueError, AttributeError):
+            pass
+        
+        window = self._throughput_windows[stream_name]
+        window['messages'] += len(results)
+        elapsed = now - window['start']
+        if elapsed >= 1.0:
+            metrics['messages_per_second'] = window['messages'] / elapsed
+            window['start'] = now
+            window['messages'] = 0
+    
     def _calculate_processing_rates(self) -> Dict[str, float]:
         """Calculate message processing rates."""
         rates = {}
@@ -933,6 +1423,14 @@ class RedisStreamsManager:
             'block_timeout': 1000,  # 1 second
             'max_retries': 3,
             'retry_delay': 5,
+            'handler_concurrency': 1,
+            'claim_idle_ms': 60000,  # reclaim entries pending for over 1 minute
+            'claim_interval': 30,  # seconds between XAUTOCLAIM sweeps
+            'payload_encoding': PayloadEncoding.JSON.value,
+            'compression_threshold': 1024,  # bytes; zstd applies to larger msgpack payloads
+            'publish_batching': False,
+            'publish_linger_ms': 5,  # latency window for coalescing XADDs
+            'publish_max_batch': 500,
             'enable_monitoring': True,
             'cleanup_interval': 3600  # 1 hour
         }
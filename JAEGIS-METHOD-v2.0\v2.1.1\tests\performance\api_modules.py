@@ -0,0 +1,29 @@
+"""
+N.L.D.S. API Module Loading for Tests
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Loads single nlds.api submodules for the performance tests. The package
+__init__ builds the whole application, which needs every N.L.D.S. engine;
+when that import fails, a bare nlds.api package is registered so the
+requested submodule can still be imported on its own.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+
+API_PACKAGE_PATH = Path(__file__).resolve().parents[2] / "nlds" / "api"
+
+
+def import_api_module(name: str):
+    """Import nlds.api.<name> even when the package __init__ cannot load the full application."""
+    try:
+        return importlib.import_module(f"nlds.api.{name}")
+    except Exception:
+        if "nlds.api" not in sys.modules:
+            package = types.ModuleType("nlds.api")
+            package.__path__ = [str(API_PACKAGE_PATH)]
+            sys.modules["nlds.api"] = package
+        return importlib.import_module(f"nlds.api.{name}")
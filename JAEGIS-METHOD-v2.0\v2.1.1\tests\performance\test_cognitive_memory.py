@@ -0,0 +1,201 @@
+"""
+Cognitive Memory Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Availability scoring through the keyword-indexed MemorySystem against
+scanning every working and short-term memory per option as memory grows,
+bounded capacity and eviction, lazy timestamp-based decay, and the bias
+lookups over recent and successful decisions.
+"""
+
+import pytest
+import math
+import random
+import time
+from datetime import datetime, timedelta
+
+from nlds.cognitive.cognitive_model import (
+    CognitiveModelingEngine, CognitiveDecision, MemorySystem, MemoryItem, MemoryType
+)
+
+
+VOCABULARY = [
+    "deploy", "rollback", "review", "budget", "staffing", "release", "gateway", "risk",
+    "audit", "cache", "schema", "latency", "vendor", "incident", "migration", "quota"
+]
+
+OPTION_COUNT = 200
+
+
+def _contents(rng: random.Random, count: int):
+    return [" ".join(rng.choice(VOCABULARY) for _ in range(8)) for _ in range(count)]
+
+
+def _options(rng: random.Random, count: int):
+    return [" ".join(rng.sample(VOCABULARY, rng.randint(1, 2))) for _ in range(count)]
+
+
+def _engine(short_term_capacity: int = 50) -> CognitiveModelingEngine:
+    engine = CognitiveModelingEngine("user-1")
+    engine.cognitive_parameters["short_term_memory_capacity"] = float(short_term_capacity)
+    engine.memory_systems = engine._initialize_memory_systems()
+    return engine
+
+
+def _legacy_availability(engine, option: str) -> float:
+    """Previous scoring: substring scan of every working and short-term memory."""
+    base_score = 0.5
+    for item in engine.memory_systems[MemoryType.WORKING_MEMORY]:
+        if isinstance(item.content, str) and option.lower() in item.content.lower():
+            base_score += 0.3
+    short_term = engine.memory_systems[MemoryType.SHORT_TERM_MEMORY]
+    for item in short_term:
+        if isinstance(item.content, str) and option.lower() in item.content.lower():
+            base_score += 0.2 * short_term.strength(item)
+    return min(base_score, 1.0)
+
+
+def _item(content: str, last_accessed: datetime, memory_type=MemoryType.SHORT_TERM_MEMORY) -> MemoryItem:
+    return MemoryItem(
+        content=content, memory_type=memory_type, strength=1.0, recency=1.0, frequency=1,
+        emotional_valence=0.0, associations=[], created_at=last_accessed, last_accessed=last_accessed
+    )
+
+
+def _decision(text: str, confidence: float = 0.8) -> CognitiveDecision:
+    return CognitiveDecision(
+        decision=text, confidence=confidence, reasoning_path=[], biases_applied=[], processing_time=0.0,
+        alternatives_considered=[], emotional_influence=0.4, logical_influence=0.4, intuitive_influence=0.2
+    )
+
+
+class TestDecisionScoring:
+    """Availability scoring cost against memory size."""
+    
+    @pytest.mark.performance
+    def test_scoring_cost_is_flat_in_memory_size(self):
+        """Indexed scoring time does not grow with the number of memories."""
+        rng = random.Random(3)
+        options = _options(rng, OPTION_COUNT)
+        timings = {}
+        
+        for size in (100, 1000, 10000):
+            engine = _engine(short_term_capacity=size)
+            for content in _contents(rng, size):
+                engine.update_memory(content, MemoryType.SHORT_TERM_MEMORY)
+            for content in _contents(rng, 7):
+                engine.update_memory(content, MemoryType.WORKING_MEMORY)
+            
+            start_time = time.perf_counter()
+            legacy = [_legacy_availability(engine, option) for option in options]
+            legacy_ms = (time.perf_counter() - start_time) * 1000
+            
+            start_time = time.perf_counter()
+            indexed = [engine._calculate_availability_score(option) for option in options]
+            indexed_ms = (time.perf_counter() - start_time) * 1000
+            
+            assert indexed == pytest.approx(legacy)
+            timings[size] = (legacy_ms, indexed_ms)
+        
+        print(f"\nAvailability scoring of {OPTION_COUNT} options: " + ", ".join(
+            f"{size} memories scan {legacy_ms:.1f} ms / indexed {indexed_ms:.1f} ms"
+            for size, (legacy_ms, indexed_ms) in timings.items()
+        ))
+        
+        assert timings[10000][1] < timings[100][1] * 3
+        assert timings[10000][1] < timings[10000][0] / 10
+    
+    def test_recency_and_confirmation_windows(self):
+        """Recent and successful decision windows reproduce the history scans."""
+        engine = _engine()
+        decisions = [_decision(f"deploy release {index}", confidence=0.5 + 0.05 * (index % 10)) for index in range(30)]
+        for decision in decisions:
+            engine._record_decision(decision)
+        
+        history = list(engine.decision_history)[-5:]
+        legacy_weight = sum(
+            (len(history) - i) / len(history) * 0.2
+            for i, decision in enumerate(reversed(history)) if "release 2" in decision.decision.lower()
+        )
+        successful = [d for d in engine.decision_history if d.confidence > 0.7][-10:]
+        
+        assert engine._calculate_recency_weight("release 2", list(engine.recent_decision_texts)) == \
+            pytest.approx(legacy_weight)
+        assert [words for words in engine.successful_decision_words] == \
+            [d.decision.lower().split()[:3] for d in successful]
+        assert engine._matches_successful_pattern("release 28")
+        assert not engine._matches_successful_pattern("audit")
+
+
+class TestBoundedMemory:
+    """Capacity, eviction and keyword lookups."""
+    
+    def test_capacities_and_eviction(self):
+        """Working memory keeps the newest items and short-term memory stays at capacity."""
+        engine = _engine()
+        for index in range(20):
+            engine.update_memory(f"working item {index}", MemoryType.WORKING_MEMORY)
+        for index in range(80):
+            engine.update_memory(f"short term item {index}", MemoryType.SHORT_TERM_MEMORY)
+        
+        working = engine.memory_systems[MemoryType.WORKING_MEMORY]
+        short_term = engine.memory_systems[MemoryType.SHORT_TERM_MEMORY]
+        
+        assert [item.content for item in working] == [f"working item {index}" for index in range(13, 20)]
+        assert working[-1].content == "working item 19"
+        assert len(short_term) == 50 and short_term.get_statistics()["evicted"] == 30
+        assert short_term.match_count("item 3") == 0 and short_term.match_count("item 79") == 1
+        assert short_term.get_statistics()["heap_entries"] <= 2 * len(short_term) + 16
+    
+    def test_phrases_match_whole_words(self):
+        """Lookups match whole-word phrases, including phrases longer than the indexed length."""
+        memory = MemorySystem(MemoryType.SEMANTIC_MEMORY)
+        now = datetime.utcnow()
+        memory.add(_item("Roll back the gateway release before the audit", now), now)
+        memory.add(_item("Gateway releases need a rollback plan", now), now)
+        
+        assert memory.match_count("gateway", now) == 2
+        assert memory.match_count("release", now) == 1
+        assert memory.match_count("the gateway release before the audit", now) == 1
+        assert memory.match_count("the gateway release after the audit", now) == 0
+        assert [item.content for item in memory.lookup("rollback plan", now)] == ["Gateway releases need a rollback plan"]
+        assert memory.strength_sum("", now) == 0.0
+
+
+class TestLazyDecay:
+    """Decay computed from timestamps on read."""
+    
+    def test_strength_is_computed_on_read(self):
+        """Stored strengths stay untouched; current strength and sums decay with age."""
+        memory = MemorySystem(MemoryType.SHORT_TERM_MEMORY, capacity=50)
+        now = datetime.utcnow()
+        fresh = memory.add(_item("deploy gateway", now), now)
+        older = memory.add(_item("deploy cache", now - timedelta(hours=10)), now)
+        memory.add(_item("deploy schema", now - timedelta(hours=30)), now)
+        
+        assert len(memory) == 2 and memory.get_statistics()["expired"] == 1
+        assert older.strength == 1.0
+        assert memory.strength(older, now) == pytest.approx(math.exp(-1.0))
+        assert memory.recency(fresh, now) == pytest.approx(1.0)
+        assert memory.strength_sum("deploy", now) == pytest.approx(1.0 + math.exp(-1.0))
+        
+        later = now + timedelta(hours=14)
+        assert memory.strength_sum("deploy", later) == pytest.approx(math.exp(-1.4))
+        assert memory.match_count("cache", later) == 0
+    
+    def test_weights_survive_epoch_rebases(self):
+        """Running sums stay accurate over hundreds of simulated hours."""
+        memory = MemorySystem(MemoryType.SHORT_TERM_MEMORY, capacity=100)
+        rng = random.Random(8)
+        start = datetime(2025, 1, 1)
+        
+        for step in range(2000):
+            now = start + timedelta(hours=step * 0.5)
+            memory.add(_item(" ".join(rng.sample(VOCABULARY, 3)), now - timedelta(hours=rng.random())), now)
+            if step % 97 == 0:
+                for word in VOCABULARY[:4]:
+                    expected = sum(memory.strength(item, now) for item in memory.lookup(word, now))
+                    assert memory.strength_sum(word, now) == pytest.approx(expected)
+        
+        assert memory.get_statistics()["epoch_rebases"] > 0
+        assert memory.get_statistics()["expired"] > 0
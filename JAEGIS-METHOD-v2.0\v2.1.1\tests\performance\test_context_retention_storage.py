@@ -0,0 +1,305 @@
+"""
+Context Retention Storage Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Bytes per stored context item with binary zstd blobs and per-type trained
+dictionaries against the previous JSON + gzip + base64 text encoding, and
+retrieval latency of batched multi-session queries against one query per
+session.
+"""
+
+import pytest
+import base64
+import gzip
+import json
+import random
+import time
+from unittest.mock import Mock
+
+import fakeredis
+from sqlalchemy import Text, text
+from sqlalchemy.dialects import mysql, postgresql
+
+from nlds.cognitive.context_retention import (
+    ContextRetentionEngine, ContextCodec, ContextType, RetentionPriority, CompressionLevel,
+    ContextItemDB, ContextDictionaryDB, LEGACY_TEXT_COLUMNS
+)
+
+
+SESSION_COUNT = 50
+ITEMS_PER_SESSION = 40
+
+USER_STATES = ["focused", "frustrated", "curious", "confident", "confused"]
+EMPATHY_TRIGGERS = ["deadline", "error", "retry", "blocked", "success"]
+
+
+def _emotional_context(rng: random.Random) -> dict:
+    return {
+        "user_state": rng.choice(USER_STATES),
+        "sentiment_polarity": round(rng.uniform(-1, 1), 3),
+        "urgency_level": round(rng.random(), 3),
+        "empathy_triggers": rng.sample(EMPATHY_TRIGGERS, 2)
+    }
+
+
+def _legacy_size(content) -> int:
+    """Size of the previous encoding: JSON, gzip level 1, base64 text."""
+    compressed = gzip.compress(json.dumps(content, default=str).encode("utf-8"), compresslevel=1)
+    return len(base64.b64encode(compressed))
+
+
+def _engine(**parameters) -> ContextRetentionEngine:
+    engine = ContextRetentionEngine("user-1", database_url="sqlite://")
+    engine.redis_client = None
+    engine.retention_parameters.update(parameters)
+    return engine
+
+
+def _populate(engine, rng: random.Random):
+    session_ids = []
+    for session_index in range(SESSION_COUNT):
+        engine.create_session(f"session-{session_index}")
+        session_ids.append(engine.active_session.session_id)
+        for _ in range(ITEMS_PER_SESSION):
+            engine.store_context(
+                ContextType.EMOTIONAL_CONTEXT, _emotional_context(rng),
+                RetentionPriority.HIGH, relevance_score=round(rng.random(), 3)
+            )
+    return session_ids
+
+
+class TestBinaryStorage:
+    """Bytes per stored item."""
+    
+    @pytest.mark.performance
+    def test_trained_dictionary_reduces_bytes_per_item(self):
+        """Items stored after dictionary training are far smaller than base64 gzip text."""
+        rng = random.Random(7)
+        engine = _engine()
+        engine.codec.training_samples = 200
+        engine.create_session("session-bytes")
+        
+        contents = [_emotional_context(rng) for _ in range(600)]
+        for content in contents:
+            engine.store_context(ContextType.EMOTIONAL_CONTEXT, content, RetentionPriority.HIGH)
+        
+        stored = engine.db_session.query(ContextItemDB).all()
+        trained = [len(item.content_data) for item in stored][-200:]
+        legacy = [_legacy_size(content) for content in contents][-200:]
+        binary_bytes = sum(trained) / len(trained)
+        legacy_bytes = sum(legacy) / len(legacy)
+        
+        print(f"\nBytes per item: base64 gzip {legacy_bytes:.1f}, zstd + trained dictionary {binary_bytes:.1f}")
+        
+        assert engine.db_session.query(ContextDictionaryDB).count() == 1
+        assert binary_bytes < legacy_bytes / 2
+    
+    def test_items_decode_across_dictionary_retrain(self):
+        """Blobs written before and after a retrain both decode."""
+        rng = random.Random(3)
+        codec = ContextCodec(dictionary_size=4096, training_samples=100)
+        
+        before = _emotional_context(rng)
+        before_blob = codec.encode(before, ContextType.EMOTIONAL_CONTEXT)
+        for _ in range(100):
+            codec.encode(_emotional_context(rng), ContextType.EMOTIONAL_CONTEXT)
+        first_dict = codec.active_dictionaries[ContextType.EMOTIONAL_CONTEXT]
+        
+        middle = _emotional_context(rng)
+        middle_blob = codec.encode(middle, ContextType.EMOTIONAL_CONTEXT)
+        codec.train(ContextType.EMOTIONAL_CONTEXT,
+                    [json.dumps(_emotional_context(rng)).encode() for _ in range(100)])
+        
+        assert codec.active_dictionaries[ContextType.EMOTIONAL_CONTEXT] != first_dict
+        assert codec.decode(before_blob) == before
+        assert codec.decode(middle_blob) == middle
+        assert codec.decode(codec.encode({"a": 1}, level=0)) == {"a": 1}
+    
+    def test_dictionaries_are_reloaded(self, tmp_path):
+        """A new engine on the same database decodes dictionary-compressed items."""
+        database_url = f"sqlite:///{tmp_path / 'context.db'}"
+        rng = random.Random(5)
+        writer = ContextRetentionEngine("user-1", database_url=database_url)
+        writer.redis_client = None
+        writer.codec.training_samples = 150
+        writer.create_session("session-reload")
+        for _ in range(200):
+            item = writer.store_context(ContextType.EMOTIONAL_CONTEXT, _emotional_context(rng),
+                                        RetentionPriority.HIGH, relevance_score=0.9)
+        
+        reader = ContextRetentionEngine("user-1", database_url=database_url)
+        reader.redis_client = None
+        
+        assert reader.retrieve_context(item_id=item.item_id)[0].content == item.content
+    
+    def test_dictionary_trained_by_another_engine_is_reloaded(self, tmp_path):
+        """An engine started before a dictionary was trained loads it for an unknown id."""
+        database_url = f"sqlite:///{tmp_path / 'context.db'}"
+        rng = random.Random(9)
+        reader = ContextRetentionEngine("user-1", database_url=database_url)
+        reader.redis_client = None
+        
+        writer = ContextRetentionEngine("user-1", database_url=database_url)
+        writer.redis_client = None
+        writer.codec.training_samples = 150
+        writer.create_session("session-reload")
+        for _ in range(200):
+            item = writer.store_context(ContextType.EMOTIONAL_CONTEXT, _emotional_context(rng),
+                                        RetentionPriority.HIGH, relevance_score=0.9)
+        
+        assert reader.codec.dictionaries == {}
+        assert reader.retrieve_context(item_id=item.item_id)[0].content == item.content
+    
+    def test_engines_of_all_users_share_one_dictionary_per_type(self, tmp_path):
+        """A type trained by one user's engine is adopted by the others instead of retrained."""
+        database_url = f"sqlite:///{tmp_path / 'context.db'}"
+        rng = random.Random(13)
+        engines = [ContextRetentionEngine(user_id, database_url=database_url) for user_id in ("alice", "bob")]
+        for engine in engines:
+            engine.redis_client = None
+            engine.codec.training_samples = 150
+            engine.create_session(f"session-{engine.user_id}")
+            for _ in range(200):
+                engine.store_context(ContextType.EMOTIONAL_CONTEXT, _emotional_context(rng), RetentionPriority.HIGH)
+        
+        alice, bob = engines
+        assert alice.db_session.query(ContextDictionaryDB).count() == 1
+        assert bob.codec.active_dictionaries == alice.codec.active_dictionaries
+    
+    def test_undecodable_items_are_kept(self, tmp_path):
+        """Items whose dictionary is gone come back without content instead of disappearing."""
+        database_url = f"sqlite:///{tmp_path / 'context.db'}"
+        rng = random.Random(17)
+        writer = ContextRetentionEngine("user-1", database_url=database_url)
+        writer.redis_client = None
+        writer.codec.training_samples = 150
+        writer.create_session("session-lost")
+        for _ in range(200):
+            item = writer.store_context(ContextType.EMOTIONAL_CONTEXT, _emotional_context(rng),
+                                        RetentionPriority.HIGH, relevance_score=0.9)
+        writer.db_session.query(ContextDictionaryDB).delete()
+        writer.db_session.commit()
+        
+        reader = ContextRetentionEngine("user-1", database_url=database_url)
+        reader.redis_client = None
+        contexts = reader.retrieve_context(item_id=item.item_id)
+        
+        assert [context.item_id for context in contexts] == [item.item_id]
+        assert contexts[0].content is None
+        assert "Unknown compression dictionary" in contexts[0].metadata["decode_error"]
+        assert reader.db_session.query(ContextItemDB).count() == 200
+    
+    def test_legacy_text_items_still_decode(self, tmp_path):
+        """Items stored as base64 gzip text, or as its UTF-8 bytes after migration, decode."""
+        database_url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        writer = ContextRetentionEngine("user-1", database_url=database_url)
+        writer.redis_client = None
+        writer.create_session("session-legacy")
+        items = [
+            writer.store_context(ContextType.USER_PREFERENCES, {"theme": theme},
+                                 RetentionPriority.HIGH, relevance_score=0.9)
+            for theme in ("dark", "light")
+        ]
+        
+        legacy_text = base64.b64encode(gzip.compress(json.dumps({"theme": "legacy"}).encode("utf-8"))).decode("ascii")
+        with writer.engine.begin() as connection:
+            for item, data in zip(items, (legacy_text, legacy_text.encode("utf-8"))):
+                connection.execute(
+                    text("UPDATE context_items SET content_data = :data WHERE item_id = :item_id"),
+                    {"data": data, "item_id": item.item_id}
+                )
+        
+        reader = ContextRetentionEngine("user-1", database_url=database_url)
+        reader.redis_client = None
+        
+        for item in items:
+            assert reader.retrieve_context(item_id=item.item_id)[0].content == {"theme": "legacy"}
+
+
+class TestLegacyColumnMigration:
+    """Conversion of text content columns on server databases."""
+    
+    @pytest.mark.parametrize("column_type, migrated", [
+        (mysql.LONGBLOB(), False),
+        (mysql.LONGTEXT(), True),
+        (postgresql.BYTEA(), False),
+        (Text(), True),
+    ])
+    def test_only_text_columns_are_altered(self, monkeypatch, column_type, migrated):
+        """Reflected binary columns are left alone, text columns are converted."""
+        statements = []
+        connection = Mock(execute=lambda statement: statements.append(str(statement)))
+        engine = _engine()
+        engine.engine = Mock(dialect=Mock())
+        engine.engine.dialect.name = "mysql"
+        engine.engine.begin.return_value.__enter__ = Mock(return_value=connection)
+        engine.engine.begin.return_value.__exit__ = Mock(return_value=False)
+        inspector = Mock()
+        inspector.get_columns.side_effect = lambda table_name: [
+            {"name": LEGACY_TEXT_COLUMNS[table_name], "type": column_type}
+        ]
+        monkeypatch.setattr("nlds.cognitive.context_retention.inspect", lambda bind: inspector)
+        
+        engine._migrate_legacy_columns()
+        
+        assert len(statements) == (len(LEGACY_TEXT_COLUMNS) if migrated else 0)
+
+
+class TestBatchRetrieval:
+    """Multi-session retrieval latency and SQL-side ranking."""
+    
+    @pytest.mark.performance
+    def test_batch_retrieval_latency(self):
+        """One ranked query for all sessions beats one query per session."""
+        rng = random.Random(11)
+        engine = _engine()
+        session_ids = _populate(engine, rng)
+        
+        start_time = time.perf_counter()
+        per_session = {
+            session_id: engine.retrieve_contexts([session_id], max_items_per_session=5)[session_id]
+            for session_id in session_ids
+        }
+        per_session_ms = (time.perf_counter() - start_time) * 1000
+        
+        start_time = time.perf_counter()
+        batched = engine.retrieve_contexts(session_ids, max_items_per_session=5)
+        batched_ms = (time.perf_counter() - start_time) * 1000
+        
+        print(f"\nRetrieval for {SESSION_COUNT} sessions: per-session queries {per_session_ms:.1f} ms, "
+              f"one batched query {batched_ms:.1f} ms")
+        
+        assert {sid: {c.item_id for c in items} for sid, items in batched.items()} == \
+            {sid: {c.item_id for c in items} for sid, items in per_session.items()}
+        assert batched_ms < per_session_ms
+    
+    def test_ranking_and_filtering_happen_in_sql(self):
+        """Items come back above the threshold, most relevant first, with access recorded."""
+        engine = _engine()
+        engine.create_session("session-rank")
+        for score in (0.2, 0.9, 0.5, 0.7):
+            engine.store_context(ContextType.USER_PREFERENCES, {"score": score},
+                                 RetentionPriority.HIGH, relevance_score=score)
+        engine.store_context(ContextType.INTENT_HISTORY, {"score": 1.0},
+                             RetentionPriority.HIGH, relevance_score=1.0)
+        
+        contexts = engine.retrieve_context(ContextType.USER_PREFERENCES, relevance_threshold=0.4, max_items=2)
+        
+        assert [context.content["score"] for context in contexts] == [0.9, 0.7]
+        assert [item.access_count for item in engine.db_session.query(ContextItemDB).filter(
+            ContextItemDB.relevance_score.in_([0.9, 0.7]))] == [2, 2]
+    
+    def test_redis_cache_round_trips_binary_items(self):
+        """Cached items keep their type and priority and decode from bytes."""
+        engine = ContextRetentionEngine("user-1", database_url="sqlite://")
+        engine.redis_client = fakeredis.FakeRedis()
+        engine.create_session("session-cache")
+        item = engine.store_context(ContextType.DECISION_PATTERNS, {"decision": "deploy"},
+                                    RetentionPriority.CRITICAL, relevance_score=0.8)
+        
+        cached = engine.retrieve_context(item_id=item.item_id)
+        
+        assert cached[0].content == {"decision": "deploy"}
+        assert cached[0].context_type == ContextType.DECISION_PATTERNS
+        assert cached[0].priority == RetentionPriority.CRITICAL
+        assert cached[0].compression_level == CompressionLevel.LOW
@@ -0,0 +1,203 @@
+"""
+Distributed Rate Limiting Tests for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Checks the Redis-backed RateLimitingEngine against a local Redis server:
+limits shared across workers, atomic multi-rule checks, the near-cache
+overshoot bound, and near-cache throughput. Also checks the local fallback
+while Redis is down: backing off from Redis and splitting limits across
+workers.
+"""
+
+import pytest
+import time
+from unittest.mock import AsyncMock, Mock
+
+import redis
+import redis.asyncio as aioredis
+
+from api_modules import import_api_module
+
+
+rate_limiting = import_api_module("rate_limiting")
+RateLimitingEngine = rate_limiting.RateLimitingEngine
+RateLimitRule = rate_limiting.RateLimitRule
+RateLimitScope = rate_limiting.RateLimitScope
+RateLimitAlgorithm = rate_limiting.RateLimitAlgorithm
+
+
+REDIS_URL = "redis://localhost:6379/15"
+
+
+@pytest.fixture
+async def redis_client():
+    """Async Redis client on a scratch database; skips when Redis is unavailable."""
+    client = aioredis.from_url(REDIS_URL)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Local Redis server not available")
+    
+    await client.flushdb()
+    yield client
+    await client.flushdb()
+    await client.close()
+
+
+def _make_engine(*rules: RateLimitRule, near_cache_ratio: float = 0.0, **kwargs) -> RateLimitingEngine:
+    """Engine sharing the scratch database, with only the given rules."""
+    engine = RateLimitingEngine(REDIS_URL, near_cache_ratio=near_cache_ratio, **kwargs)
+    engine.rules = {rule.rule_id: rule for rule in rules}
+    return engine
+
+
+def _make_request(client_ip: str = "10.0.0.1") -> Mock:
+    request = Mock()
+    request.client.host = client_ip
+    request.method = "POST"
+    request.url.path = "/process"
+    return request
+
+
+def _rule(rule_id: str, scope: RateLimitScope, algorithm: RateLimitAlgorithm,
+          requests_per_window: int, priority: int = 1) -> RateLimitRule:
+    return RateLimitRule(
+        rule_id=rule_id,
+        scope=scope,
+        algorithm=algorithm,
+        requests_per_window=requests_per_window,
+        window_size_seconds=60,
+        priority=priority
+    )
+
+
+class TestDistributedRateLimiting:
+    """Redis-backed rate limiting checks."""
+    
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", [
+        RateLimitAlgorithm.SLIDING_WINDOW,
+        RateLimitAlgorithm.TOKEN_BUCKET,
+        RateLimitAlgorithm.FIXED_WINDOW
+    ])
+    async def test_limit_is_shared_across_workers(self, redis_client, algorithm):
+        """Two engines (workers) together allow exactly the configured limit."""
+        rule = _rule("ip_limit", RateLimitScope.IP, algorithm, 100)
+        workers = [_make_engine(rule), _make_engine(rule)]
+        request = _make_request()
+        
+        allowed = 0
+        for i in range(150):
+            result = await workers[i % 2].check_rate_limits(request)
+            allowed += result.allowed
+        
+        assert allowed == 100
+        assert result.rate_limit_status.retry_after_seconds >= 1
+    
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_rules_are_checked_atomically_in_one_round_trip(self, redis_client):
+        """A request rejected by one rule consumes nothing from the others."""
+        user_rule = _rule("user_limit", RateLimitScope.USER, RateLimitAlgorithm.TOKEN_BUCKET, 5)
+        ip_rule = _rule("ip_limit", RateLimitScope.IP, RateLimitAlgorithm.SLIDING_WINDOW, 3, priority=2)
+        engine = _make_engine(user_rule, ip_rule)
+        user_info = {"user_id": "alice"}
+        
+        results = [await engine.check_rate_limits(_make_request(), user_info) for _ in range(4)]
+        
+        assert [result.allowed for result in results] == [True, True, True, False]
+        assert results[-1].rate_limit_status.rule_id == "ip_limit"
+        assert engine.backend.statistics["round_trips"] == 4
+        
+        # The user bucket still has the two tokens the rejected request did not take
+        result = await engine.check_rate_limits(_make_request("10.0.0.2"), user_info)
+        assert result.allowed
+        assert result.rate_limit_status.rule_id == "user_limit"
+        assert result.rate_limit_status.requests_remaining == 1
+    
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_near_cache_overshoot_is_bounded(self, redis_client):
+        """Leased allowances save round-trips and overshoot by at most one lease per worker."""
+        rule = _rule("ip_limit", RateLimitScope.IP, RateLimitAlgorithm.SLIDING_WINDOW, 1000)
+        workers = [_make_engine(rule, near_cache_ratio=0.1) for _ in range(4)]
+        request = _make_request()
+        
+        allowed = 0
+        for i in range(2000):
+            result = await workers[i % 4].check_rate_limits(request)
+            allowed += result.allowed
+        
+        round_trips = sum(worker.backend.statistics["round_trips"] for worker in workers)
+        
+        assert 1000 <= allowed <= 1000 + 4 * 100
+        assert round_trips < 2000
+    
+    @pytest.mark.performance
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_near_cache_throughput(self, redis_client):
+        """The near-cache decides most requests without a Redis round-trip."""
+        rule = _rule("ip_limit", RateLimitScope.IP, RateLimitAlgorithm.SLIDING_WINDOW, 1000000)
+        request = _make_request()
+        
+        elapsed = {}
+        for ratio in (0.0, 0.1):
+            engine = _make_engine(rule, near_cache_ratio=ratio)
+            start_time = time.perf_counter()
+            for _ in range(2000):
+                await engine.check_rate_limits(request)
+            elapsed[ratio] = time.perf_counter() - start_time
+        
+        print(f"\nround-trip per request: {2000 / elapsed[0.0]:.0f} checks/s")
+        print(f"near-cache:             {2000 / elapsed[0.1]:.0f} checks/s")
+        
+        assert elapsed[0.1] < elapsed[0.0]
+
+
+class TestRedisOutage:
+    """Local fallback checks; Redis failures are simulated."""
+    
+    @staticmethod
+    def _fail_redis(engine: RateLimitingEngine) -> AsyncMock:
+        failing_check = AsyncMock(side_effect=redis.ConnectionError("Connection refused"))
+        engine._check_distributed_limits = failing_check
+        return failing_check
+    
+    @pytest.mark.asyncio
+    async def test_failed_redis_is_skipped_until_backoff_expires(self):
+        """Only the first request after a failure pays the Redis round-trip."""
+        rule = _rule("ip_limit", RateLimitScope.IP, RateLimitAlgorithm.SLIDING_WINDOW, 100)
+        engine = _make_engine(rule, redis_retry_seconds=1.0)
+        failing_check = self._fail_redis(engine)
+        request = _make_request()
+        
+        for _ in range(10):
+            assert (await engine.check_rate_limits(request)).allowed
+        
+        assert failing_check.await_count == 1
+        assert engine.get_statistics()["backend"]["using_local_limits"]
+        
+        # Once the backoff expires Redis is tried again, and the next backoff doubles
+        engine.redis_retry_at = 0.0
+        await engine.check_rate_limits(request)
+        
+        assert failing_check.await_count == 2
+        assert engine.redis_failures == 2
+        assert engine.redis_retry_at - time.monotonic() == pytest.approx(2.0, abs=0.5)
+    
+    @pytest.mark.asyncio
+    async def test_local_fallback_splits_limits_across_workers(self):
+        """Workers falling back to local limits together allow about the configured limit."""
+        rule = _rule("ip_limit", RateLimitScope.IP, RateLimitAlgorithm.SLIDING_WINDOW, 100)
+        workers = [_make_engine(rule, worker_count=4) for _ in range(4)]
+        request = _make_request()
+        
+        allowed = 0
+        for worker in workers:
+            self._fail_redis(worker)
+            for _ in range(50):
+                allowed += (await worker.check_rate_limits(request)).allowed
+        
+        assert allowed == 100
@@ -0,0 +1,192 @@
+"""
+Metrics Collector Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Microbenchmarks the per-record cost of the API MetricsCollector in
+nanoseconds, and checks histogram accuracy, thread-shard merging, counter
+rates and the Prometheus text exposition.
+
+Timings are printed for reference; assertions only compare costs measured
+in the same run, so they hold on loaded machines.
+"""
+
+import pytest
+import math
+import random
+import threading
+import time
+
+from api_modules import import_api_module
+
+
+monitoring = import_api_module("monitoring")
+MetricsCollector = monitoring.MetricsCollector
+StreamingHistogram = monitoring.StreamingHistogram
+
+
+RECORD_ITERATIONS = 200000
+REPEATS = 3
+
+
+def _ns_per_record(record, iterations: int = RECORD_ITERATIONS) -> float:
+    """Best-of-REPEATS average wall-clock cost of one call to record, in nanoseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter_ns()
+        for i in range(iterations):
+            record(i)
+        timings.append((time.perf_counter_ns() - start_time) / iterations)
+    return min(timings)
+
+
+def _ms_per_query(query, queries: int = 100) -> float:
+    """Best-of-REPEATS average wall-clock cost of one query, in milliseconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        for _ in range(queries):
+            query()
+        timings.append((time.perf_counter() - start_time) * 1000 / queries)
+    return min(timings)
+
+
+class TestMetricsRecordingCost:
+    """Per-record cost microbenchmarks."""
+    
+    @pytest.mark.performance
+    def test_record_cost_in_nanoseconds(self):
+        """Recording cost does not grow with history."""
+        collector = MetricsCollector()
+        labels = {"endpoint": "/process", "method": "POST"}
+        
+        counter_ns = _ns_per_record(lambda i: collector.record_counter("total_requests"))
+        labeled_counter_ns = _ns_per_record(lambda i: collector.record_counter("requests", 1.0, labels))
+        timer_ns = _ns_per_record(lambda i: collector.record_timer("request_duration", i % 5000 / 10.0, labels))
+        gauge_ns = _ns_per_record(lambda i: collector.record_gauge("active_requests", i))
+        
+        # A second pass after a million samples costs the same as the first
+        later_timer_ns = _ns_per_record(lambda i: collector.record_timer("request_duration", i % 5000 / 10.0, labels))
+        
+        print(f"\ncounter:         {counter_ns:.0f} ns/record")
+        print(f"labeled counter: {labeled_counter_ns:.0f} ns/record")
+        print(f"timer:           {timer_ns:.0f} ns/record")
+        print(f"gauge:           {gauge_ns:.0f} ns/record")
+        
+        print(f"timer, later:    {later_timer_ns:.0f} ns/record")
+        
+        assert later_timer_ns < timer_ns * 2
+        assert collector.get_counter("total_requests") == RECORD_ITERATIONS * REPEATS
+    
+    @pytest.mark.performance
+    def test_stats_query_cost_is_independent_of_sample_count(self):
+        """Percentile queries walk buckets rather than sorting samples."""
+        small, large = MetricsCollector(), MetricsCollector()
+        for i in range(RECORD_ITERATIONS):
+            if i < 1000:
+                small.record_timer("request_duration", random.lognormvariate(3, 1))
+            large.record_timer("request_duration", random.lognormvariate(3, 1))
+        
+        small_ms = _ms_per_query(lambda: small.get_timer_stats("request_duration"))
+        large_ms = _ms_per_query(lambda: large.get_timer_stats("request_duration"))
+        
+        print(f"\ntimer stats: {small_ms:.3f} ms/query over 1000 samples, "
+              f"{large_ms:.3f} ms/query over {RECORD_ITERATIONS} samples")
+        
+        assert large.get_timer_stats("request_duration")["count"] == RECORD_ITERATIONS
+        # Sorting 200x the samples would cost well over 200x; bucket walks stay flat
+        assert large_ms < small_ms * 5
+
+
+class TestStreamingHistogram:
+    """Histogram accuracy and merging checks."""
+    
+    def test_percentiles_within_bucket_error(self):
+        """Estimated percentiles stay within 1% of the exact sample percentiles."""
+        values = [random.lognormvariate(4, 1.5) for _ in range(50000)]
+        histogram = StreamingHistogram()
+        for value in values:
+            histogram.record(value)
+        
+        sorted_values = sorted(values)
+        for percentile in (50, 90, 95, 99):
+            exact = sorted_values[math.ceil(len(values) * percentile / 100) - 1]
+            assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.01)
+        
+        assert histogram.get_stats()["min"] == min(values)
+        assert histogram.get_stats()["max"] == max(values)
+    
+    def test_merged_histograms_match_combined_recording(self):
+        """Merging two histograms gives the same buckets as recording into one."""
+        left, right, combined = StreamingHistogram(), StreamingHistogram(), StreamingHistogram()
+        for i in range(1, 2001):
+            (left if i % 2 else right).record(i * 0.37)
+            combined.record(i * 0.37)
+        
+        left.merge(right)
+        
+        assert left.counts == combined.counts
+        assert left.count == combined.count
+        assert left.percentile(99) == combined.percentile(99)
+
+
+class TestMetricsCollector:
+    """Collector sharding, trend and exposition checks."""
+    
+    def test_counters_recorded_on_many_threads_are_exact(self):
+        """Per-thread counter shards sum to the exact total on read."""
+        collector = MetricsCollector()
+        
+        def record():
+            for _ in range(10000):
+                collector.record_counter("requests", 1.0, {"endpoint": "/analyze"})
+        
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert collector.get_counter("requests") == 80000
+        assert collector.get_counter("requests", {"endpoint": "/analyze"}) == 80000
+        assert collector.get_metric_trend("requests", minutes=5)[-1]["sum"] == 80000
+    
+    def test_rate_weights_the_bucket_straddling_the_window(self, monkeypatch):
+        """A one-minute rate over one-minute buckets includes the overlapping part of the previous bucket."""
+        clock = [6000.0]
+        monkeypatch.setattr(monitoring.time, "time", lambda: clock[0])
+        collector = MetricsCollector(trend_bucket_seconds=60)
+        
+        collector.record_counter("total_requests", 120)
+        clock[0] = 6075.0
+        collector.record_counter("total_requests", 30)
+        
+        # Window [6015, 6075]: 45/60 of the previous bucket plus the current one
+        assert collector.get_rate("total_requests", 60) == pytest.approx((0.75 * 120 + 30) / 60)
+        # Inside the current bucket only the overlapping share of its 15 s counts
+        assert collector.get_rate("total_requests", 5) == pytest.approx(30 * 5 / 15 / 5)
+    
+    def test_label_sets_are_bounded(self):
+        """Label sets beyond max_metrics are folded into the unlabeled series."""
+        collector = MetricsCollector(max_metrics=10)
+        for i in range(20):
+            collector.record_counter("requests", 1.0, {"user": str(i)})
+        
+        summary = collector.get_metrics_summary()
+        assert summary["label_sets"] == 10
+        assert summary["dropped_label_sets"] == 10
+        assert collector.get_counter("requests") == 20
+    
+    def test_prometheus_exposition(self):
+        """Counters, gauges and timers render as Prometheus families."""
+        collector = MetricsCollector()
+        collector.record_counter("total_requests", 3)
+        collector.record_gauge("active_requests", 2)
+        collector.record_timer("request_duration", 12.5, {"endpoint": "/process"})
+        
+        exposition = collector.export_prometheus()
+        
+        assert "# TYPE nlds_total_requests_total counter\nnlds_total_requests_total 3.0\n" in exposition
+        assert "# TYPE nlds_active_requests gauge\nnlds_active_requests 2.0\n" in exposition
+        assert "# TYPE nlds_request_duration summary" in exposition
+        assert 'nlds_request_duration{endpoint="/process",quantile="0.99"} 12.5' in exposition
+        assert 'nlds_request_duration_count{endpoint="/process"} 1' in exposition
@@ -0,0 +1,180 @@
+"""
+Middleware Stack Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Load-tests the legacy BaseHTTPMiddleware stack against the single-pass
+RequestPipelineMiddleware on /health and /process, comparing requests per
+second and p99 latency, and checks that both stacks produce the same headers.
+"""
+
+import pytest
+import asyncio
+import statistics
+import time
+from typing import Dict, Any
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from api_modules import import_api_module
+
+
+middleware = import_api_module("middleware")
+MetricsCollector = import_api_module("monitoring").MetricsCollector
+RequestLoggingMiddleware = middleware.RequestLoggingMiddleware
+RateLimitMiddleware = middleware.RateLimitMiddleware
+SecurityMiddleware = middleware.SecurityMiddleware
+CustomCORSMiddleware = middleware.CustomCORSMiddleware
+MetricsMiddleware = middleware.MetricsMiddleware
+RequestPipelineMiddleware = middleware.RequestPipelineMiddleware
+
+
+REQUEST_COUNT = 2000
+CONCURRENCY = 50
+HIGH_LIMIT = 1000000
+
+
+def _build_app(stack: str, default_limit: int = HIGH_LIMIT) -> FastAPI:
+    """Minimal app with /health and /process behind the given middleware stack."""
+    app = FastAPI()
+    
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+    
+    @app.post("/process")
+    async def process(payload: Dict[str, Any]):
+        await asyncio.sleep(0)
+        return {"success": True, "enhanced_input": payload.get("input_text", "")}
+    
+    @app.get("/fail")
+    async def fail():
+        raise RuntimeError("boom")
+    
+    @app.get("/unavailable")
+    async def unavailable():
+        return JSONResponse({"status": "unavailable"}, status_code=503)
+    
+    if stack == "legacy":
+        app.add_middleware(MetricsMiddleware)
+        app.add_middleware(CustomCORSMiddleware)
+        app.add_middleware(SecurityMiddleware)
+        app.add_middleware(RateLimitMiddleware, default_limit=default_limit)
+        app.add_middleware(RequestLoggingMiddleware, log_level="WARNING")
+    else:
+        app.add_middleware(RequestPipelineMiddleware, default_limit=default_limit, log_level="WARNING")
+    
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+async def _load_test(app: FastAPI, method: str, path: str) -> Dict[str, float]:
+    """Drive REQUEST_COUNT requests with CONCURRENCY workers; returns rps and p99 (ms)."""
+    latencies = []
+    payload = {"input_text": "Analyze market trends for renewable energy"}
+    
+    async with _client(app) as client:
+        async def worker(count: int):
+            for _ in range(count):
+                start_time = time.perf_counter()
+                if method == "GET":
+                    response = await client.get(path)
+                else:
+                    response = await client.post(path, json=payload)
+                latencies.append((time.perf_counter() - start_time) * 1000)
+                assert response.status_code == 200
+        
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker(REQUEST_COUNT // CONCURRENCY) for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start_time
+    
+    return {
+        "rps": len(latencies) / elapsed,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98]
+    }
+
+
+class TestMiddlewareStackPerformance:
+    """Legacy stack vs. single-pass pipeline load tests."""
+    
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,path", [("GET", "/health"), ("POST", "/process")])
+    async def test_pipeline_outperforms_legacy_stack(self, method, path):
+        """The single-pass pipeline serves more requests per second than the five-layer stack."""
+        legacy = await _load_test(_build_app("legacy"), method, path)
+        pipeline = await _load_test(_build_app("pipeline"), method, path)
+        
+        print(f"\n{method} {path}")
+        print(f"legacy:   {legacy['rps']:.0f} req/s, p99 {legacy['p99_ms']:.2f}ms")
+        print(f"pipeline: {pipeline['rps']:.0f} req/s, p99 {pipeline['p99_ms']:.2f}ms")
+        
+        assert pipeline["rps"] > legacy["rps"]
+
+
+class TestRequestPipeline:
+    """Behavioural parity checks for RequestPipelineMiddleware."""
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_adds_the_same_headers_as_the_legacy_stack(self):
+        """Security, CORS, tracing and rate limit headers match the legacy stack."""
+        request_headers = {"Origin": "https://app.jaegis.ai", "X-Request-ID": "req-123"}
+        
+        responses = {}
+        for stack in ("legacy", "pipeline"):
+            async with _client(_build_app(stack)) as client:
+                responses[stack] = await client.post(
+                    "/process", json={"input_text": "test"}, headers=request_headers
+                )
+        
+        for name in [
+            "x-content-type-options", "x-frame-options", "x-xss-protection",
+            "strict-transport-security", "content-security-policy",
+            "access-control-allow-origin", "access-control-allow-credentials",
+            "x-request-id", "x-api-version", "x-ratelimit-limit", "x-ratelimit-remaining"
+        ]:
+            assert responses["pipeline"].headers[name] == responses["legacy"].headers[name], name
+        
+        assert responses["pipeline"].headers["x-request-id"] == "req-123"
+        assert responses["pipeline"].headers["x-response-time"].endswith("ms")
+        assert responses["pipeline"].json() == responses["legacy"].json()
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_rate_limits_preflights_and_errors(self):
+        """Limits are enforced once, preflights short-circuit and errors become 500 JSON."""
+        app = _build_app("pipeline", default_limit=3)
+        
+        async with _client(app) as client:
+            statuses = [(await client.post("/process", json={})).status_code for _ in range(4)]
+            health = await client.get("/health")
+            preflight = await client.options("/process", headers={
+                "Origin": "https://app.jaegis.ai",
+                "Access-Control-Request-Method": "POST"
+            })
+            failure = await client.get("/fail", headers={"Authorization": "Bearer other-client"})
+        
+        assert statuses == [200, 200, 200, 429]
+        assert health.status_code == 200
+        assert preflight.status_code == 200
+        assert preflight.headers["access-control-allow-origin"] == "https://app.jaegis.ai"
+        assert failure.status_code == 500
+        assert failure.json()["error"]["request_id"] == failure.headers["x-request-id"]
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_records_request_errors(self):
+        """Exceptions and 5xx responses are counted as request_errors, other statuses are not."""
+        app = _build_app("pipeline")
+        app.state.metrics_collector = MetricsCollector()
+        
+        async with _client(app) as client:
+            statuses = [
+                (await client.get(path)).status_code
+                for path in ("/health", "/fail", "/unavailable", "/missing")
+            ]
+        
+        assert statuses == [200, 500, 503, 404]
+        assert app.state.metrics_collector.get_counter("request_errors") == 2
@@ -0,0 +1,251 @@
+"""
+OpenRouter Client Pool Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Runs OpenRouterIntegrationEngine against a local mock OpenAI-compatible
+server: connection reuse, per-request latency and queue wait under per-key
+concurrency limits, in-flight deduplication, the response cache,
+RequestPriority ordering of queued calls, and timed-out or cancelled calls
+leaving the queue.
+"""
+
+import pytest
+import asyncio
+import json
+import statistics
+from collections import Counter
+
+from nlds.integration.openrouter_integration import (
+    OpenRouterIntegrationEngine, OpenRouterUtils, ModelCategory, RequestPriority
+)
+
+
+class MockOpenAIServer:
+    """Minimal keep-alive HTTP/1.1 server speaking the OpenAI chat completions API."""
+    
+    def __init__(self, delay_seconds: float = 0.01):
+        self.delay_seconds = delay_seconds
+        self.server = None
+        self.url = None
+        self.connections = 0
+        self.completions = []  # (api key, prompt) in arrival order
+        self.active = Counter()
+        self.max_active = Counter()
+        self.release = None  # optional asyncio.Event gating responses
+    
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/api/v1"
+    
+    async def close(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+    
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, value = line.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                
+                status, response = await self._route(method, path, headers, body)
+                data = json.dumps(response).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: keep-alive\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _route(self, method, path, headers, body):
+        if method == "GET" and path.endswith("/models"):
+            return 200, {"data": [{"id": "mock/chat-model", "name": "Mock Chat", "pricing": {"prompt": 0.002}}]}
+        
+        api_key = headers["authorization"].split(" ", 1)[1]
+        prompt = json.loads(body)["messages"][0]["content"]
+        self.completions.append((api_key, prompt))
+        self.active[api_key] += 1
+        self.max_active[api_key] = max(self.max_active[api_key], self.active[api_key])
+        try:
+            if self.release is not None:
+                await self.release.wait()
+            await asyncio.sleep(self.delay_seconds)
+        finally:
+            self.active[api_key] -= 1
+        return 200, {
+            "choices": [{"message": {"role": "assistant", "content": f"echo: {prompt}"}}],
+            "usage": {"total_tokens": 12}
+        }
+
+
+@pytest.fixture
+async def server():
+    mock_server = MockOpenAIServer()
+    await mock_server.start()
+    yield mock_server
+    await mock_server.close()
+
+
+async def _engine(server, api_keys=("key-a", "key-b"), **config) -> OpenRouterIntegrationEngine:
+    engine = OpenRouterIntegrationEngine({
+        "base_url": server.url,
+        "api_keys": [{"key": key, "provider": "other"} for key in api_keys],
+        **config
+    })
+    assert await engine.initialize_integration()
+    return engine
+
+
+def _request(prompt: str, priority: RequestPriority = RequestPriority.NORMAL):
+    return OpenRouterUtils.create_model_request(prompt, ModelCategory.CHAT_MODEL, priority=priority)
+
+
+class TestPooledClient:
+    """Connection reuse, latency and queue wait."""
+    
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_latency_and_queue_wait_under_key_limits(self, server):
+        """Concurrent requests reuse pooled connections and respect per-key limits."""
+        engine = await _engine(server, per_key_concurrency=4)
+        connections_after_discovery = server.connections
+        
+        results = await asyncio.gather(*(engine.make_model_request(_request(f"prompt {i}")) for i in range(64)))
+        
+        latencies = sorted(result.metadata["latency_ms"] for result in results)
+        waits = sorted(result.metadata["queue_wait_ms"] for result in results)
+        print(f"\n64 requests, 2 keys x 4 slots: latency p50 {statistics.median(latencies):.1f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95)]:.1f} ms; queue wait p50 {statistics.median(waits):.1f} ms, "
+              f"max {waits[-1]:.1f} ms; {server.connections} connections")
+        
+        assert all(result.success for result in results)
+        assert max(server.max_active.values()) <= 4
+        assert set(server.max_active) == {"key-a", "key-b"}
+        assert server.connections - connections_after_discovery <= 8
+        assert engine.client_pool.get_statistics()["http_requests"] == 64
+        await engine.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_one_connection(self, server):
+        """Keep-alive sessions serve sequential calls over a single connection."""
+        engine = await _engine(server)
+        
+        for i in range(20):
+            assert (await engine.make_model_request(_request(f"sequential {i}"))).success
+        
+        assert server.connections == 1
+        await engine.cleanup()
+
+
+class TestDeduplicationAndCache:
+    """In-flight deduplication and response caching."""
+    
+    @pytest.mark.asyncio
+    async def test_identical_inflight_prompts_share_one_call(self, server):
+        """Concurrent identical requests reach the server once."""
+        engine = await _engine(server)
+        
+        results = await asyncio.gather(*(engine.make_model_request(_request("same prompt")) for _ in range(20)))
+        
+        assert len(server.completions) == 1
+        assert all(result.model_response.response_text == "echo: same prompt" for result in results)
+        assert sum(result.metadata["deduplicated"] for result in results) == 19
+        assert sum(result.model_response.cost_incurred for result in results) == pytest.approx(12 / 1000 * 0.002)
+        await engine.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_is_served_from_cache(self, server):
+        """A completed response is reused for the same model, prompt and parameters."""
+        engine = await _engine(server)
+        
+        first = await engine.make_model_request(_request("cached prompt"))
+        second = await engine.make_model_request(_request("cached prompt"))
+        changed = await engine.make_model_request(
+            OpenRouterUtils.create_model_request("cached prompt", ModelCategory.CHAT_MODEL, temperature=0.1)
+        )
+        
+        assert not first.metadata["cache_hit"] and second.metadata["cache_hit"]
+        assert second.model_response.response_text == first.model_response.response_text
+        assert not changed.metadata["cache_hit"]
+        assert len(server.completions) == 2
+        assert engine.usage_statistics["cache_hits"] == 1
+        await engine.cleanup()
+
+
+class TestPriorityQueue:
+    """RequestPriority ordering of queued calls."""
+    
+    @pytest.mark.asyncio
+    async def test_queued_calls_dispatch_by_priority(self, server):
+        """With the only key busy, a later CRITICAL call runs before earlier LOW calls."""
+        engine = await _engine(server, api_keys=("key-a",), per_key_concurrency=1)
+        server.release = asyncio.Event()
+        
+        blocker = asyncio.create_task(engine.make_model_request(_request("blocker")))
+        await asyncio.sleep(0.05)
+        queued = [
+            asyncio.create_task(engine.make_model_request(_request(f"low {i}", RequestPriority.LOW)))
+            for i in range(3)
+        ]
+        queued.append(asyncio.create_task(engine.make_model_request(_request("urgent", RequestPriority.CRITICAL))))
+        await asyncio.sleep(0.05)
+        
+        server.release.set()
+        await asyncio.gather(blocker, *queued)
+        
+        assert [prompt for _, prompt in server.completions] == ["blocker", "urgent", "low 0", "low 1", "low 2"]
+        assert engine.client_pool.get_statistics()["max_queue_wait_ms"] > 0
+        await engine.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_queue_wait_counts_against_the_timeout(self, server):
+        """A call stuck behind a busy key times out within its budget and leaves the queue."""
+        engine = await _engine(server, api_keys=("key-a",), per_key_concurrency=1)
+        server.release = asyncio.Event()
+        blocker = asyncio.create_task(engine.make_model_request(_request("blocker")))
+        await asyncio.sleep(0.05)
+        
+        request = _request("queued")
+        request.timeout_seconds = 0.1
+        result = await asyncio.wait_for(engine.make_model_request(request), 1.0)
+        
+        assert not result.success
+        assert engine.client_pool.get_statistics()["queued"] == 0
+        
+        server.release.set()
+        await blocker
+        assert [prompt for _, prompt in server.completions] == ["blocker"]
+        await engine.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_calls_leave_the_queue(self, server):
+        """Cancelling a queued request removes its call before it is dispatched."""
+        engine = await _engine(server, api_keys=("key-a",), per_key_concurrency=1)
+        server.release = asyncio.Event()
+        blocker = asyncio.create_task(engine.make_model_request(_request("blocker")))
+        await asyncio.sleep(0.05)
+        
+        queued = asyncio.create_task(engine.make_model_request(_request("cancelled")))
+        await asyncio.sleep(0.05)
+        assert engine.client_pool.get_statistics()["queued"] == 1
+        
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert engine.client_pool.get_statistics()["queued"] == 0
+        
+        server.release.set()
+        await blocker
+        assert [prompt for _, prompt in server.completions] == ["blocker"]
+        await engine.cleanup()
@@ -0,0 +1,192 @@
+"""
+Realtime Broadcast Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Broadcast fan-out of the RealtimeCommunicationEngine against 10k simulated
+local websocket clients: subscriber lookup through the topic index, one
+serialization per message, bounded per-connection send queues with
+slow-consumer eviction, and coalescing of status updates.
+"""
+
+import pytest
+import asyncio
+import json
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+from nlds.integration.realtime_communication import (
+    RealtimeCommunicationEngine, RealtimeMessage, MessageType, SubscriptionType
+)
+
+
+CLIENT_COUNT = 10000
+BROADCAST_COUNT = 5
+
+
+class SimulatedWebSocket:
+    """Local websocket stand-in that records frames and yields on each send."""
+    
+    def __init__(self, block: bool = False):
+        self.frames = []
+        self.block = block
+        self.closed = False
+    
+    async def send(self, frame: str) -> None:
+        if self.block:
+            await asyncio.Event().wait()
+        await asyncio.sleep(0)
+        self.frames.append(frame)
+    
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _engine(**config) -> RealtimeCommunicationEngine:
+    return RealtimeCommunicationEngine({"auth_enabled": False, **config})
+
+
+def _connect(engine, count, subscription_type=SubscriptionType.AGENT_STATUS, **websocket_options):
+    connection_ids = []
+    for _ in range(count):
+        connection_id = engine._register_connection(SimulatedWebSocket(**websocket_options))
+        engine._add_subscription(connection_id, subscription_type, {})
+        connection_ids.append(connection_id)
+    return connection_ids
+
+
+def _status(source: str = "agent-1", **payload) -> RealtimeMessage:
+    return RealtimeMessage(
+        message_id=f"{source}-{time.perf_counter_ns()}",
+        message_type=MessageType.STATUS_UPDATE,
+        timestamp=datetime.utcnow(),
+        source=source,
+        destination=None,
+        payload=payload
+    )
+
+
+async def _drain(engine, connection_ids=None) -> None:
+    send_queues = [engine.send_queues[cid] for cid in connection_ids if cid in engine.send_queues] \
+        if connection_ids is not None else list(engine.send_queues.values())
+    await asyncio.gather(*(send_queue.drain() for send_queue in send_queues))
+
+
+async def _shutdown(engine) -> None:
+    for send_queue in engine.send_queues.values():
+        send_queue.close()
+    await asyncio.sleep(0)
+
+
+class TestBroadcastFanOut:
+    """Broadcast throughput with 10k local clients."""
+    
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_broadcast_to_10k_clients(self):
+        """Each broadcast is serialized once and delivered to every subscriber."""
+        engine = _engine()
+        connection_ids = _connect(engine, CLIENT_COUNT)
+        _connect(engine, 100, SubscriptionType.ERROR_ALERTS)
+        
+        with patch("nlds.integration.realtime_communication.json.dumps", wraps=json.dumps) as dumps:
+            start_time = time.perf_counter()
+            for index in range(BROADCAST_COUNT):
+                sent = await engine._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, _status(step=index))
+                assert sent == CLIENT_COUNT
+            enqueue_ms = (time.perf_counter() - start_time) * 1000
+            await _drain(engine)
+            total_ms = (time.perf_counter() - start_time) * 1000
+        
+        deliveries = CLIENT_COUNT * BROADCAST_COUNT
+        print(f"\n{BROADCAST_COUNT} broadcasts x {CLIENT_COUNT} clients: enqueue {enqueue_ms:.1f} ms, "
+              f"delivered in {total_ms:.1f} ms ({deliveries / total_ms * 1000:.0f} msg/s)")
+        
+        assert dumps.call_count == BROADCAST_COUNT
+        assert engine.stats.total_messages_sent == deliveries
+        assert all(len(engine.connections[cid].websocket.frames) == BROADCAST_COUNT for cid in connection_ids)
+        await _shutdown(engine)
+    
+    @pytest.mark.asyncio
+    async def test_all_subscription_receives_once(self):
+        """A connection subscribed to a type and to ALL gets one copy per message."""
+        engine = _engine()
+        connection_id = _connect(engine, 1)[0]
+        engine._add_subscription(connection_id, SubscriptionType.ALL, {})
+        
+        sent = await engine._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, _status())
+        await _drain(engine)
+        
+        assert sent == 1
+        assert len(engine.connections[connection_id].websocket.frames) == 1
+        assert all(subscription.message_count == 1 for subscription in engine.subscriptions.values())
+        await _shutdown(engine)
+
+
+class TestSlowConsumers:
+    """Bounded send buffers and eviction."""
+    
+    @pytest.mark.asyncio
+    async def test_slow_consumer_is_evicted(self):
+        """A client that stops reading is dropped without delaying the others."""
+        engine = _engine(send_buffer_size=4)
+        fast_ids = _connect(engine, 50)
+        slow_id = _connect(engine, 1, block=True)[0]
+        
+        for index in range(10):
+            await engine._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, _status(step=index))
+            await _drain(engine, fast_ids)
+        await asyncio.sleep(0)
+        
+        assert slow_id not in engine.connections
+        assert engine.stats.slow_consumers_evicted == 1
+        assert slow_id not in engine.topic_index[SubscriptionType.AGENT_STATUS]
+        assert all(len(engine.connections[cid].websocket.frames) == 10 for cid in fast_ids)
+        await _shutdown(engine)
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_clears_index(self):
+        """Closing a connection removes its subscriptions from the topic index."""
+        engine = _engine()
+        connection_id = _connect(engine, 1)[0]
+        
+        await engine._cleanup_connection(connection_id)
+        
+        assert engine.subscriptions == {}
+        assert engine.topic_index[SubscriptionType.AGENT_STATUS] == {}
+        assert engine.send_queues == {}
+        assert engine.stats.subscription_count == 0
+
+
+class TestStatusCoalescing:
+    """Coalescing of queued status updates."""
+    
+    @pytest.mark.asyncio
+    async def test_queued_status_updates_collapse_to_latest(self):
+        """Pending updates from one source are replaced by the newest one."""
+        engine = _engine(coalesce_status_updates=True)
+        connection_id = _connect(engine, 1)[0]
+        
+        for step in range(20):
+            await engine._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, _status(step=step))
+        await engine._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, _status("agent-2", step=0))
+        await _drain(engine)
+        
+        frames = [json.loads(frame) for frame in engine.connections[connection_id].websocket.frames]
+        assert [(frame["source"], frame["payload"]["step"]) for frame in frames] == [("agent-1", 19), ("agent-2", 0)]
+        assert engine.stats.messages_coalesced == 19
+        await _shutdown(engine)
+    
+    @pytest.mark.asyncio
+    async def test_coalescing_is_off_by_default(self):
+        """Every status update is delivered unless coalescing is enabled."""
+        engine = _engine()
+        connection_id = _connect(engine, 1)[0]
+        
+        for step in range(5):
+            await engine._broadcast_to_subscribers(SubscriptionType.AGENT_STATUS, _status(step=step))
+        await _drain(engine)
+        
+        assert len(engine.connections[connection_id].websocket.frames) == 5
+        assert engine.stats.messages_coalesced == 0
+        await _shutdown(engine)
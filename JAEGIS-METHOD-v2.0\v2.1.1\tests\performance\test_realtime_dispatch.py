@@ -0,0 +1,363 @@
+"""
+Realtime Dispatch Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Message rate of the sharded RealtimeCommunicationEngine dispatcher over a
+real UNIX-socket message bus against the number of shard workers and engine
+processes, per-key ordering across shards, and delivery, large frames and
+reconnects between engines sharing the bus.
+"""
+
+import pytest
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from datetime import datetime
+
+from nlds.integration.realtime_communication import (
+    RealtimeCommunicationEngine, RealtimeMessage, MessageType, SubscriptionType,
+    UnixSocketBroker, UnixSocketMessageBus, _run_broker_process
+)
+
+
+MESSAGE_COUNT = 2000
+SOURCE_COUNT = 200
+
+# Subscriber connections split evenly across 1, 2, 3 or 4 engine processes
+BUS_CONNECTION_COUNT = 240
+BUS_MESSAGE_COUNT = 1000
+BUS_ROUNDS = 3
+
+
+class SimulatedWebSocket:
+    """Local websocket stand-in that records frames."""
+    
+    def __init__(self):
+        self.frames = []
+    
+    async def send(self, frame: str) -> None:
+        self.frames.append(frame)
+    
+    async def close(self) -> None:
+        pass
+
+
+def _engine(**config) -> RealtimeCommunicationEngine:
+    return RealtimeCommunicationEngine({"auth_enabled": False, **config})
+
+
+def _connect(engine, subscription_type=SubscriptionType.AGENT_STATUS) -> str:
+    connection_id = engine._register_connection(SimulatedWebSocket())
+    engine._add_subscription(connection_id, subscription_type, {})
+    return connection_id
+
+
+def _message(message_type=MessageType.STATUS_UPDATE, source="agent-1", destination=None, **payload):
+    return RealtimeMessage(
+        message_id=f"{source}-{time.perf_counter_ns()}",
+        message_type=message_type,
+        timestamp=datetime.utcnow(),
+        source=source,
+        destination=destination,
+        payload=payload
+    )
+
+
+def _frames(engine, connection_id):
+    return [json.loads(frame) for frame in engine.connections[connection_id].websocket.frames]
+
+
+async def _drain(engine) -> None:
+    await engine.wait_until_dispatched()
+    await asyncio.gather(*(send_queue.drain() for send_queue in engine.send_queues.values()))
+
+
+async def _wait_for_frames(engine, connection_id, count: int, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while len(engine.connections[connection_id].websocket.frames) < count and time.perf_counter() < deadline:
+        await asyncio.sleep(0.001)
+    await _drain(engine)
+
+
+async def _dispatch_rate(shards: int, path: str) -> float:
+    """End-to-end rate from a sharded engine to a second engine through a broker."""
+    broker = UnixSocketBroker(path)
+    await broker.start()
+    bus_config = {"message_bus": {"type": "unix", "path": path}}
+    engine, receiver = _engine(dispatcher_shards=shards, **bus_config), _engine(**bus_config)
+    for _ in range(20):
+        _connect(engine)
+    remote = _connect(receiver)
+    await engine.start_dispatcher()
+    await receiver.start_dispatcher()
+    
+    start_time = time.perf_counter()
+    for index in range(MESSAGE_COUNT):
+        await engine.send_message(_message(source=f"agent-{index % SOURCE_COUNT}", step=index))
+    await _drain(engine)
+    await _wait_for_frames(receiver, remote, MESSAGE_COUNT)
+    elapsed = time.perf_counter() - start_time
+    
+    assert len(receiver.connections[remote].websocket.frames) == MESSAGE_COUNT
+    await engine.shutdown()
+    await receiver.shutdown()
+    await broker.close()
+    return MESSAGE_COUNT / elapsed
+
+
+def _bus_publisher_worker(path: str, barrier, message_count: int) -> None:
+    async def run() -> None:
+        engine = _engine(message_bus={"type": "unix", "path": path})
+        await engine.start_dispatcher()
+        await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+        # Give the broker a moment to register the last subscriber connections
+        await asyncio.sleep(0.1)
+        
+        for index in range(message_count):
+            await engine.send_message(_message(source=f"agent-{index % SOURCE_COUNT}", step=index))
+        await _drain(engine)
+        await engine.shutdown()
+    
+    asyncio.run(run())
+
+
+def _bus_subscriber_worker(path: str, barrier, results, connection_count: int, message_count: int) -> None:
+    async def run():
+        engine = _engine(message_bus={"type": "unix", "path": path})
+        connections = [_connect(engine) for _ in range(connection_count)]
+        await engine.start_dispatcher()
+        await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+        
+        def delivered() -> int:
+            return sum(len(engine.connections[connection].websocket.frames) for connection in connections)
+        
+        expected = connection_count * message_count
+        deadline = time.perf_counter() + 120
+        first_frame_time = None
+        while delivered() < expected and time.perf_counter() < deadline:
+            if first_frame_time is None and delivered():
+                first_frame_time = time.perf_counter()
+            await asyncio.sleep(0.001)
+        await _drain(engine)
+        elapsed = time.perf_counter() - (first_frame_time or time.perf_counter())
+        
+        count = delivered()
+        await engine.shutdown()
+        return count, elapsed
+    
+    results.put(asyncio.run(run()))
+
+
+def _bus_fan_out_rate(path: str, process_count: int) -> float:
+    """Frames per second delivered by engine processes sharing the subscriber connections."""
+    context = multiprocessing.get_context("spawn")
+    broker = context.Process(target=_run_broker_process, args=(path,), daemon=True)
+    broker.start()
+    
+    barrier = context.Barrier(process_count + 1)
+    results = context.Queue()
+    connections_per_process = BUS_CONNECTION_COUNT // process_count
+    subscribers = [
+        context.Process(
+            target=_bus_subscriber_worker,
+            args=(path, barrier, results, connections_per_process, BUS_MESSAGE_COUNT)
+        )
+        for _ in range(process_count)
+    ]
+    publisher = context.Process(target=_bus_publisher_worker, args=(path, barrier, BUS_MESSAGE_COUNT))
+    try:
+        for process in subscribers:
+            process.start()
+        publisher.start()
+        outcomes = [results.get(timeout=180) for _ in subscribers]
+        for process in (*subscribers, publisher):
+            process.join(timeout=30)
+    finally:
+        broker.terminate()
+        broker.join()
+    
+    assert [count for count, _ in outcomes] == [connections_per_process * BUS_MESSAGE_COUNT] * process_count
+    return BUS_CONNECTION_COUNT * BUS_MESSAGE_COUNT / max(elapsed for _, elapsed in outcomes)
+
+
+class TestDispatchScaling:
+    """Message rate against dispatcher workers and processes."""
+    
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_message_rate_by_shard_count(self, tmp_path):
+        """Every message crosses the bus at each shard count; sharding costs little on its own."""
+        rates = {
+            shards: await _dispatch_rate(shards, str(tmp_path / f"shards-{shards}.sock"))
+            for shards in (1, 2, 4, 8)
+        }
+        
+        print(f"\nEnd-to-end rate over the UNIX-socket bus ({os.cpu_count()} CPUs): " +
+              ", ".join(f"{shards} shards {rate:.0f} msg/s" for shards, rate in rates.items()))
+        
+        # Bus writes only wait when the socket buffer is full, so shards have
+        # no round trips to overlap here; they must not slow dispatch down
+        assert min(rates.values()) > max(rates.values()) / 3
+    
+    @pytest.mark.performance
+    def test_message_rate_by_process_count(self, tmp_path):
+        """Fan-out rate of engine processes splitting the subscribers over the UNIX-socket bus."""
+        cpu_count = os.cpu_count() or 1
+        process_counts = sorted({1, 2, min(cpu_count, 4)})
+        
+        # Best of several rounds; the processes compete for cores with the test runner
+        rates = {
+            process_count: max(
+                _bus_fan_out_rate(str(tmp_path / f"processes-{process_count}-{round_index}.sock"), process_count)
+                for round_index in range(BUS_ROUNDS)
+            )
+            for process_count in process_counts
+        }
+        
+        print(f"\nFan-out rate over the UNIX-socket bus ({cpu_count} CPUs): " +
+              ", ".join(f"{count} processes {rate:.0f} frames/s" for count, rate in rates.items()))
+        
+        # Every process parses every bus frame but only serves its share of the
+        # connections, so the rate grows with the cores left after the broker and
+        # publisher; on a machine without spare cores it must at least hold up
+        spare_cpus = max(cpu_count - 2, 1)
+        for process_count, rate in rates.items():
+            assert rate > rates[1] * min(process_count, spare_cpus) / 2
+
+
+class TestShardedDispatch:
+    """Routing of messages across shards."""
+    
+    @pytest.mark.asyncio
+    async def test_direct_messages_keep_per_destination_order(self):
+        """Messages to one destination are delivered in send order."""
+        engine = _engine(dispatcher_shards=8)
+        destinations = [_connect(engine) for _ in range(10)]
+        await engine.start_dispatcher()
+        
+        for step in range(50):
+            for destination in destinations:
+                await engine.send_message(
+                    _message(MessageType.DIRECT_MESSAGE, destination=destination, step=step)
+                )
+        await _drain(engine)
+        
+        for destination in destinations:
+            assert [frame["payload"]["step"] for frame in _frames(engine, destination)] == list(range(50))
+        assert sum(1 for count in engine.shard_dispatch_counts if count) > 1
+        await engine.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_incoming_status_updates_reach_subscribers(self):
+        """Client status updates are dispatched through the shards."""
+        engine = _engine()
+        subscriber = _connect(engine)
+        publisher = _connect(engine, SubscriptionType.ERROR_ALERTS)
+        await engine.start_dispatcher()
+        
+        await engine._process_incoming_message(
+            publisher, json.dumps({"message_type": "status_update", "payload": {"state": "ready"}})
+        )
+        await _drain(engine)
+        
+        assert [frame["payload"] for frame in _frames(engine, subscriber)] == [{"state": "ready"}]
+        await engine.shutdown()
+
+
+class TestUnixSocketBus:
+    """Engines sharing subscriptions through a UNIX-socket broker."""
+    
+    @pytest.mark.asyncio
+    async def test_engines_share_messages_through_broker(self, tmp_path):
+        """Subscribers on one engine receive messages dispatched by another."""
+        path = str(tmp_path / "realtime.sock")
+        broker = UnixSocketBroker(path)
+        await broker.start()
+        
+        bus_config = {"message_bus": {"type": "unix", "path": path}}
+        first, second = _engine(**bus_config), _engine(**bus_config)
+        local = _connect(first)
+        remote = _connect(second)
+        await first.start_dispatcher()
+        await second.start_dispatcher()
+        
+        await first.send_message(_message(step=1))
+        await first.send_message(_message(MessageType.DIRECT_MESSAGE, destination=remote, step=2))
+        await first.send_message(_message(MessageType.DIRECT_MESSAGE, destination=local, step=3))
+        
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(second.connections[remote].websocket.frames) == 2:
+                break
+        await _drain(first)
+        await _drain(second)
+        
+        assert [frame["payload"]["step"] for frame in _frames(second, remote)] == [1, 2]
+        assert [frame["payload"]["step"] for frame in _frames(first, local)] == [1, 3]
+        
+        await first.shutdown()
+        await second.shutdown()
+        await broker.close()
+    
+    @pytest.mark.asyncio
+    async def test_frames_larger_than_the_stream_limit(self, tmp_path):
+        """Frames over the 64 KiB StreamReader line limit are relayed intact."""
+        path = str(tmp_path / "realtime.sock")
+        broker = UnixSocketBroker(path)
+        await broker.start()
+        
+        bus_config = {"message_bus": {"type": "unix", "path": path}}
+        first, second = _engine(**bus_config), _engine(**bus_config)
+        _connect(first)
+        remote = _connect(second)
+        await first.start_dispatcher()
+        await second.start_dispatcher()
+        
+        await first.send_message(_message(step=1, blob="x" * 70_000))
+        await first.send_message(_message(step=2))
+        await _drain(first)
+        await _wait_for_frames(second, remote, 2, timeout=5.0)
+        
+        frames = _frames(second, remote)
+        assert [frame["payload"]["step"] for frame in frames] == [1, 2]
+        assert len(frames[0]["payload"]["blob"]) == 70_000
+        
+        await first.shutdown()
+        await second.shutdown()
+        await broker.close()
+    
+    @pytest.mark.asyncio
+    async def test_bus_reconnects_after_broker_restart(self, tmp_path):
+        """The listener survives a lost broker connection and resumes delivery."""
+        path = str(tmp_path / "realtime.sock")
+        broker = UnixSocketBroker(path)
+        await broker.start()
+        
+        received = []
+        async def on_frame(frame: str) -> None:
+            received.append(frame)
+        
+        listener, publisher = UnixSocketMessageBus(path), UnixSocketMessageBus(path)
+        await listener.start(on_frame)
+        await publisher.start(on_frame=lambda frame: asyncio.sleep(0))
+        while len(broker.clients) < 2:
+            await asyncio.sleep(0.01)
+        
+        await broker.close()
+        broker = UnixSocketBroker(path)
+        await broker.start()
+        
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            await publisher.publish("after restart")
+            if received:
+                break
+        
+        assert received and set(received) == {"after restart"}
+        assert not listener.listener.done()
+        
+        await listener.close()
+        await publisher.close()
+        await broker.close()
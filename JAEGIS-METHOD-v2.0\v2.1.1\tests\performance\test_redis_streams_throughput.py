@@ -0,0 +1,293 @@
+"""
+Redis Streams Throughput Benchmarks for P.I.T.C.E.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Benchmarks the RedisStreamsManager consumer and publisher against a local
+Redis server: serial vs. concurrent consumers, and individual vs. batched,
+JSON vs. msgpack publishing.
+"""
+
+import pytest
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Dict, Any
+from uuid import uuid4
+
+aioredis = pytest.importorskip("redis.asyncio")
+
+from pitces.core.redis_streams_manager import (
+    RedisStreamsManager, StreamType, ConsumerGroup, PayloadEncoding
+)
+
+
+REDIS_URL = "redis://localhost:6379/15"
+MESSAGE_COUNT = 5000
+PUBLISH_CONCURRENCY = 64
+
+
+@pytest.fixture
+async def redis_client():
+    """Async Redis client on a scratch database; skips when Redis is unavailable."""
+    client = aioredis.from_url(REDIS_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Local Redis server not available")
+    
+    await client.flushdb()
+    yield client
+    await client.flushdb()
+    await client.close()
+
+
+async def _run_consumer(
+    redis_client: aioredis.Redis,
+    handler,
+    concurrency: int,
+    batch_size: int
+) -> Dict[str, Any]:
+    """Publish MESSAGE_COUNT messages and time how long one consumer takes to drain them."""
+    manager = RedisStreamsManager(redis_client, {
+        'batch_size': batch_size,
+        'block_timeout': 100,
+        'claim_idle_ms': 0
+    })
+    await manager._create_stream_and_groups(
+        StreamType.TASK_PRIORITY, manager.stream_configs[StreamType.TASK_PRIORITY]
+    )
+    
+    pipe = redis_client.pipeline(transaction=False)
+    for i in range(MESSAGE_COUNT):
+        pipe.xadd(StreamType.TASK_PRIORITY.value, {'seq': i, 'priority': 2})
+    await pipe.execute()
+    
+    start_time = time.perf_counter()
+    await manager.start_consumer(
+        StreamType.TASK_PRIORITY,
+        ConsumerGroup.TASK_PROCESSORS,
+        f"bench-{uuid4().hex[:8]}",
+        handler,
+        concurrency=concurrency
+    )
+    
+    while manager.stream_metrics['messages_consumed'] < MESSAGE_COUNT:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start_time
+    
+    for info in list(manager.active_consumers.values()):
+        await manager.stop_consumer(info['stream_type'], info['consumer_group'], info['consumer_name'])
+    
+    pending = await redis_client.xpending(
+        StreamType.TASK_PRIORITY.value, ConsumerGroup.TASK_PROCESSORS.value
+    )
+    
+    return {
+        'elapsed_seconds': elapsed,
+        'messages_per_second': MESSAGE_COUNT / elapsed,
+        'pending': pending['pending'],
+        'metrics': manager.stream_metrics
+    }
+
+
+class TestRedisStreamsThroughput:
+    """Consumer throughput benchmarks against a local Redis."""
+    
+    @pytest.mark.performance
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_batched_consumer_outperforms_serial(self, redis_client):
+        """Concurrent async handlers with pipelined XACK beat the serial executor path."""
+        def sync_handler(message: Dict[str, Any]) -> bool:
+            time.sleep(0.0005)  # simulated blocking work
+            return True
+        
+        async def async_handler(message: Dict[str, Any]) -> bool:
+            await asyncio.sleep(0.0005)  # simulated non-blocking I/O
+            return True
+        
+        serial = await _run_consumer(redis_client, sync_handler, concurrency=1, batch_size=10)
+        await redis_client.flushdb()
+        batched = await _run_consumer(redis_client, async_handler, concurrency=64, batch_size=200)
+        
+        print(f"\nserial:  {serial['messages_per_second']:.0f} msg/s")
+        print(f"batched: {batched['messages_per_second']:.0f} msg/s")
+        
+        assert serial['pending'] == 0
+        assert batched['pending'] == 0
+        assert batched['messages_per_second'] > serial['messages_per_second'] * 2
+        
+        throughput = batched['metrics']['stream_throughput'][StreamType.TASK_PRIORITY.value]
+        assert throughput['messages'] == MESSAGE_COUNT
+        assert throughput['average_batch_size'] > 10
+    
+    @pytest.mark.performance
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_failed_messages_are_dead_lettered_in_batch(self, redis_client):
+        """Failed messages land in the dead letter queue and are not left pending."""
+        async def failing_handler(message: Dict[str, Any]) -> bool:
+            return int(message['fields']['seq']) % 10 != 0
+        
+        result = await _run_consumer(redis_client, failing_handler, concurrency=16, batch_size=100)
+        
+        assert result['pending'] == 0
+        assert result['metrics']['messages_failed'] == MESSAGE_COUNT // 10
+        assert await redis_client.xlen("pitces:dead_letter_queue") == MESSAGE_COUNT // 10
+    
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_stale_pending_entries_are_reclaimed(self, redis_client):
+        """Entries left pending by a dead consumer are recovered through XAUTOCLAIM."""
+        manager = RedisStreamsManager(redis_client, {
+            'block_timeout': 100,
+            'claim_idle_ms': 1,
+            'claim_interval': 0
+        })
+        stream = StreamType.TASK_PRIORITY
+        group = ConsumerGroup.TASK_PROCESSORS
+        await manager._create_stream_and_groups(stream, manager.stream_configs[stream])
+        
+        for i in range(20):
+            await redis_client.xadd(stream.value, {'seq': i})
+        
+        # A consumer that reads and then dies without acknowledging
+        await redis_client.xreadgroup(group.value, "crashed", {stream.value: '>'}, count=20)
+        await asyncio.sleep(0.01)
+        
+        handled = []
+        
+        async def handler(message: Dict[str, Any]) -> bool:
+            handled.append(message['message_id'])
+            return True
+        
+        await manager.start_consumer(stream, group, "survivor", handler, concurrency=4)
+        for _ in range(100):
+            if len(handled) >= 20:
+                break
+            await asyncio.sleep(0.02)
+        await manager.stop_consumer(stream, group, "survivor")
+        
+        assert len(set(handled)) == 20
+        assert manager.stream_metrics['messages_reclaimed'] >= 20
+        pending = await redis_client.xpending(stream.value, group.value)
+        assert pending['pending'] == 0
+
+
+async def _run_publisher(redis_client: aioredis.Redis, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Fan out MESSAGE_COUNT priority events from PUBLISH_CONCURRENCY publishers and collect metrics."""
+    manager = RedisStreamsManager(redis_client, config)
+    
+    async def publisher(offset: int):
+        for i in range(offset, MESSAGE_COUNT, PUBLISH_CONCURRENCY):
+            await manager.publish_system_event_message(
+                'task_priority_changed',
+                {'task_id': str(uuid4()), 'seq': i, 'old_priority': 'MEDIUM', 'new_priority': 'HIGH'},
+                severity='ERROR'
+            )
+    
+    start_time = time.perf_counter()
+    await asyncio.gather(*(publisher(offset) for offset in range(PUBLISH_CONCURRENCY)))
+    elapsed = time.perf_counter() - start_time
+    
+    stream_metrics = manager.get_publish_metrics()['streams'][StreamType.SYSTEM_EVENTS.value]
+    return {
+        'messages_per_second': MESSAGE_COUNT / elapsed,
+        'bytes_per_message': stream_metrics['bytes_per_message'],
+        'average_batch_size': stream_metrics['average_batch_size'],
+        'round_trips': stream_metrics['batches'],
+        'manager': manager
+    }
+
+
+class TestRedisStreamsPublisher:
+    """Publisher batching and payload encoding benchmarks against a local Redis."""
+    
+    @pytest.mark.performance
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_batched_publishing_throughput(self, redis_client):
+        """Pipelined XADD batches replace one round-trip per message; throughput is reported."""
+        individual = await _run_publisher(redis_client, {})
+        await redis_client.flushdb()
+        batched = await _run_publisher(redis_client, {'publish_batching': True, 'publish_linger_ms': 2})
+        
+        print(f"\nindividual: {individual['messages_per_second']:.0f} msg/s")
+        print(f"batched:    {batched['messages_per_second']:.0f} msg/s "
+              f"(avg batch {batched['average_batch_size']:.0f})")
+        
+        assert await redis_client.xlen(StreamType.SYSTEM_EVENTS.value) == MESSAGE_COUNT
+        assert individual['round_trips'] == MESSAGE_COUNT
+        assert batched['round_trips'] <= MESSAGE_COUNT // 10
+    
+    @pytest.mark.performance
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_msgpack_payloads_are_smaller_and_decode_transparently(self, redis_client):
+        """Binary payloads shrink bytes per message and consumers decode them transparently."""
+        pytest.importorskip("msgpack")
+        
+        json_run = await _run_publisher(redis_client, {'publish_batching': True})
+        await redis_client.flushdb()
+        binary_run = await _run_publisher(redis_client, {
+            'publish_batching': True,
+            'payload_encoding': PayloadEncoding.MSGPACK.value
+        })
+        
+        print(f"\njson:    {json_run['bytes_per_message']:.0f} bytes/msg")
+        print(f"msgpack: {binary_run['bytes_per_message']:.0f} bytes/msg")
+        
+        assert binary_run['bytes_per_message'] < json_run['bytes_per_message']
+        
+        manager = binary_run['manager']
+        entries = await manager.stream_client.xrange(StreamType.SYSTEM_EVENTS.value, count=1)
+        fields = manager._decode_fields(entries[0][1])
+        assert fields['message_type'] == 'system_event'
+        assert json.loads(fields['event_data'])['new_priority'] == 'HIGH'
+        assert isinstance(fields['timestamp'], str)
+    
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_both_encodings_decode_to_the_same_fields(self, redis_client):
+        """Handlers see identical fields whichever encoding the publisher used."""
+        pytest.importorskip("msgpack")
+        message = {
+            'message_type': 'system_event',
+            'event_data': {'task_id': uuid4(), 'at': datetime(2025, 1, 2, 3, 4, 5, 678901), 'tags': ['a', 'b']},
+            'priority': 2,
+            'score': 0.25,
+            'message_id': uuid4(),
+            'published_at': datetime(2025, 1, 2, 3, 4, 5, 678901)
+        }
+        
+        decoded = []
+        for encoding in PayloadEncoding:
+            manager = RedisStreamsManager(redis_client, {'payload_encoding': encoding.value})
+            stream = f"parity:{encoding.value}"
+            await manager.stream_client.xadd(stream, manager._encode_message(message))
+            entries = await manager.stream_client.xrange(stream)
+            decoded.append(manager._decode_fields(entries[0][1]))
+        
+        assert decoded[0] == decoded[1]
+        assert decoded[0]['published_at'] == '2025-01-02T03:04:05.678901'
+        assert json.loads(decoded[0]['event_data'])['task_id'] == str(message['event_data']['task_id'])
+    
+    @pytest.mark.redis
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_buffered_messages(self, redis_client):
+        """Messages still waiting in a batch buffer are published on shutdown."""
+        manager = RedisStreamsManager(redis_client, {
+            'publish_batching': True, 'publish_linger_ms': 60000, 'publish_max_batch': 8
+        })
+        
+        publishes = [
+            asyncio.create_task(manager.publish_system_event_message('tick', {'seq': i}))
+            for i in range(20)
+        ]
+        await asyncio.sleep(0.05)
+        await manager.shutdown()
+        
+        assert all(await asyncio.gather(*publishes))
+        assert await redis_client.xlen(StreamType.SYSTEM_EVENTS.value) == 20
+        assert not manager._publish_send_tasks
@@ -0,0 +1,149 @@
+"""
+Tokenizer Throughput Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Measures documents per second of AdvancedTokenizer.batch_tokenize across
+1, 4 and 8 spaCy worker processes against the per-text tokenize loop, and
+checks that the batch and regex paths agree with single-text tokenization.
+Skips when the optional emoji package or the Hugging Face tokenizer is not
+available.
+"""
+
+import pytest
+import os
+import time
+from typing import List
+
+pytest.importorskip("emoji")
+pytest.importorskip("transformers")
+
+from nlds.nlp.advanced_tokenizer import AdvancedTokenizer, LanguageCode, TokenType
+
+
+DOCUMENT_COUNT = 2000
+MAX_PROCESSES = 8
+
+# Small enough that the corpus fills one batch per worker at MAX_PROCESSES
+PIPE_BATCH_SIZE = DOCUMENT_COUNT // MAX_PROCESSES
+
+SAMPLE_TEXTS = [
+    "Create a new development squad agent for the payment workflow.",
+    "Analyze market trends for renewable energy and generate a report by 2024-01-15.",
+    "Contact support@jaegis.ai or follow @jaegis #automation for release notes.",
+    "Deploy the monitoring pipeline at https://status.jaegis.ai with 99.9% uptime!",
+    "Validate the security configuration, then optimize the database queries.",
+]
+
+
+def _corpus(count: int = DOCUMENT_COUNT) -> List[str]:
+    return [f"{SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)]} Request {i}." for i in range(count)]
+
+
+def _docs_per_second(tokenize, texts: List[str]) -> float:
+    start_time = time.perf_counter()
+    results = tokenize(texts)
+    elapsed = time.perf_counter() - start_time
+    assert len(results) == len(texts)
+    return len(texts) / elapsed
+
+
+@pytest.fixture(scope="module")
+def tokenizer():
+    try:
+        return AdvancedTokenizer()
+    except OSError as e:
+        pytest.skip(f"Tokenizer models not available: {e}")
+
+
+class TestTokenizerThroughput:
+    """Batch tokenization throughput benchmarks."""
+    
+    @pytest.mark.performance
+    @pytest.mark.parametrize("n_process", [1, 4, MAX_PROCESSES])
+    def test_batch_throughput_by_process_count(self, tokenizer, n_process, monkeypatch):
+        """Documents per second of nlp.pipe batches with 1, 4 and 8 worker processes."""
+        if (os.cpu_count() or 1) < n_process:
+            pytest.skip(f"Needs {n_process} cores")
+        
+        texts = _corpus()
+        
+        # Record the worker count batch_tokenize actually hands to nlp.pipe
+        started_processes = []
+        pipe_processes = tokenizer._pipe_processes
+        
+        def recording_pipe_processes(text_count, batch_size, requested):
+            started_processes.append(pipe_processes(text_count, batch_size, requested))
+            return started_processes[-1]
+        
+        monkeypatch.setattr(tokenizer, "_pipe_processes", recording_pipe_processes)
+        
+        loop_rate = _docs_per_second(
+            lambda batch: [tokenizer.tokenize(text, LanguageCode.ENGLISH) for text in batch], texts
+        )
+        batch_rate = _docs_per_second(
+            lambda batch: tokenizer.batch_tokenize(
+                batch, LanguageCode.ENGLISH, batch_size=PIPE_BATCH_SIZE, n_process=n_process
+            ), texts
+        )
+        
+        print(f"\nn_process={n_process}: loop {loop_rate:.0f} docs/s, batch {batch_rate:.0f} docs/s")
+        
+        assert started_processes == [n_process]
+        assert batch_rate > loop_rate
+    
+    @pytest.mark.performance
+    def test_regex_path_throughput(self, tokenizer):
+        """The single-regex path is faster than spaCy for type-only tokenization."""
+        texts = _corpus()
+        
+        spacy_rate = _docs_per_second(
+            lambda batch: tokenizer.batch_tokenize(batch, LanguageCode.ENGLISH), texts
+        )
+        regex_rate = _docs_per_second(
+            lambda batch: tokenizer.batch_tokenize(batch, LanguageCode.ENGLISH, use_spacy=False), texts
+        )
+        
+        print(f"\nspaCy pipe: {spacy_rate:.0f} docs/s, regex: {regex_rate:.0f} docs/s")
+        
+        assert regex_rate > spacy_rate
+
+
+class TestBatchTokenization:
+    """Batch results match single-text tokenization."""
+    
+    def test_batch_matches_single_text_tokenization(self, tokenizer):
+        """Tokens, types and sentences equal those of tokenize() in input order."""
+        texts = SAMPLE_TEXTS + ["Crear un nuevo agente para el equipo de desarrollo."]
+        
+        batch_results = tokenizer.batch_tokenize(texts)
+        
+        for text, batch_result in zip(texts, batch_results):
+            single_result = tokenizer.tokenize(text)
+            assert batch_result.detected_language == single_result.detected_language
+            assert batch_result.sentences == single_result.sentences
+            assert [(t.text, t.token_type, t.start_pos) for t in batch_result.tokens] == \
+                [(t.text, t.token_type, t.start_pos) for t in single_result.tokens]
+    
+    def test_regex_tokenizer_classifies_special_tokens(self, tokenizer):
+        """The single-regex path keeps URLs, emails, mentions and numbers whole."""
+        result = tokenizer.fast_tokenize(SAMPLE_TEXTS[2] + " " + SAMPLE_TEXTS[3], LanguageCode.ENGLISH)
+        types = {token.text: token.token_type for token in result.tokens}
+        
+        assert types["support@jaegis.ai"] == TokenType.EMAIL
+        assert types["@jaegis"] == TokenType.MENTION
+        assert types["#automation"] == TokenType.HASHTAG
+        assert types["https://status.jaegis.ai"] == TokenType.URL
+        assert types["99.9"] == TokenType.NUMBER
+        assert types["Deploy"] == TokenType.WORD
+        assert types["!"] == TokenType.PUNCTUATION
+        assert len(result.sentences) == 2
+    
+    def test_token_types_are_cached_by_surface_form(self, tokenizer):
+        """Repeated surface forms are classified once."""
+        tokenizer.cached_token_type.cache_clear()
+        
+        tokenizer.batch_tokenize(["the agent and the task"] * 50, LanguageCode.ENGLISH)
+        
+        info = tokenizer.cached_token_type.cache_info()
+        assert info.misses == 4
+        assert info.hits == 50 * 5 - 4
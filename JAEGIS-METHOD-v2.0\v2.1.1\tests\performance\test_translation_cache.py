@@ -0,0 +1,175 @@
+"""
+Translation Cache Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Measures TranslationOptimizationEngine cache inserts at 100k entries against
+the previous sum-and-sort size accounting, and checks that the segmented LRU
+keeps its running byte total, protects reused entries and serializes each
+value once for both tiers.
+"""
+
+import pytest
+import pickle
+import time
+from datetime import datetime
+from typing import Dict
+
+import fakeredis
+
+from nlds.translation.translation_optimizer import (
+    TranslationOptimizationEngine,
+    SegmentedLRUCache,
+    CacheEntry
+)
+
+
+ENTRY_COUNT = 100_000
+
+VALUE = {"command": "/jaegis-create development-squad", "mode": 3, "confidence": 0.92}
+
+
+def _entry(key: str, size: int = 100, ttl_seconds: int = 3600) -> CacheEntry:
+    now = datetime.utcnow()
+    return CacheEntry(key, VALUE, now, now, 1, ttl_seconds, size)
+
+
+def _put(cache: SegmentedLRUCache, entry: CacheEntry) -> None:
+    cache.put(entry.key, entry, entry.size_bytes, entry.ttl_seconds)
+
+
+def _legacy_store(cache: Dict[str, CacheEntry], entry: CacheEntry, max_bytes: int) -> None:
+    """Previous store_in_cache accounting: sum every entry, sort to evict 25%."""
+    if sum(e.size_bytes for e in cache.values()) + entry.size_bytes > max_bytes:
+        now = datetime.utcnow()
+        scores = sorted(
+            cache.items(),
+            key=lambda item: item[1].access_count / max((now - item[1].last_accessed).total_seconds() / 3600, 0.1)
+        )
+        for key, _ in scores[:max(1, len(scores) // 4)]:
+            del cache[key]
+    cache[entry.key] = entry
+
+
+@pytest.fixture
+def engine():
+    engine = TranslationOptimizationEngine()
+    yield engine
+    engine.cleanup_resources()
+
+
+class TestTranslationCacheThroughput:
+    """Cache insert benchmarks at 100k entries."""
+    
+    @pytest.mark.performance
+    def test_inserts_stay_flat_at_100k_entries(self, engine):
+        """Inserts into a full 100k-entry cache cost the same as into an empty one."""
+        engine.memory_cache.resize(ENTRY_COUNT * 100)
+        keys = [f"translation:{i}" for i in range(2 * ENTRY_COUNT)]
+        
+        def insert_rate(batch) -> float:
+            start_time = time.perf_counter()
+            for key in batch:
+                engine._store_in_memory(key, VALUE, 100, 3600)
+            return len(batch) / (time.perf_counter() - start_time)
+        
+        empty_rate = insert_rate(keys[:10_000])
+        insert_rate(keys[10_000:ENTRY_COUNT])
+        full_rate = insert_rate(keys[ENTRY_COUNT:ENTRY_COUNT + 10_000])
+        
+        print(f"\nempty cache: {empty_rate:.0f} inserts/s, 100k entries: {full_rate:.0f} inserts/s")
+        
+        assert len(engine.memory_cache) == ENTRY_COUNT
+        assert engine.memory_cache.bytes_used == ENTRY_COUNT * 100
+        assert full_rate > empty_rate / 3
+    
+    @pytest.mark.performance
+    def test_faster_than_sum_and_sort_accounting(self, engine):
+        """Running byte totals beat re-summing a 100k-entry cache on every insert."""
+        legacy_cache = {f"translation:{i}": _entry(f"translation:{i}") for i in range(ENTRY_COUNT)}
+        engine.memory_cache.resize(ENTRY_COUNT * 100)
+        for i in range(ENTRY_COUNT):
+            engine._store_in_memory(f"translation:{i}", VALUE, 100, 3600)
+        new_keys = [f"new:{i}" for i in range(200)]
+        
+        start_time = time.perf_counter()
+        for key in new_keys:
+            _legacy_store(legacy_cache, _entry(key), ENTRY_COUNT * 100)
+        legacy_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        for key in new_keys:
+            engine._store_in_memory(key, VALUE, 100, 3600)
+        segmented_time = time.perf_counter() - start_time
+        
+        print(f"\n200 inserts at 100k entries: sum-and-sort {legacy_time * 1000:.1f} ms, "
+              f"segmented LRU {segmented_time * 1000:.2f} ms")
+        
+        assert segmented_time * 100 < legacy_time
+        assert engine.memory_cache.statistics["evictions"] == len(new_keys)
+
+
+class TestSegmentedLRUCache:
+    """Segmented LRU bookkeeping and single serialization."""
+    
+    def test_byte_total_tracks_puts_replacements_and_evictions(self):
+        """bytes_used always equals the sum of resident entry sizes."""
+        cache = SegmentedLRUCache(max_bytes=1000)
+        for i in range(12):
+            _put(cache, _entry(f"k{i}", size=100))
+        _put(cache, _entry("k11", size=250))
+        cache.get("k5")
+        
+        resident = list(cache.probation.values()) + list(cache.protected.values())
+        assert cache.bytes_used == sum(size for _, size, _ in resident) <= 1000
+        assert cache.protected_bytes == sum(size for _, size, _ in cache.protected.values())
+        assert "k0" not in cache and "k11" in cache
+    
+    def test_reused_entries_survive_a_scan(self):
+        """Entries hit twice are protected from a burst of one-off inserts."""
+        cache = SegmentedLRUCache(max_bytes=1000)
+        for key in ("hot1", "hot2"):
+            _put(cache, _entry(key))
+            cache.get(key)
+        
+        for i in range(50):
+            _put(cache, _entry(f"scan{i}"))
+        
+        assert "hot1" in cache.protected and "hot2" in cache.protected
+        assert cache.statistics["promotions"] == 2
+        assert len(cache) == 10
+    
+    def test_expired_entries_are_dropped_on_access(self):
+        """Entries past their TTL are misses and release their bytes."""
+        cache = SegmentedLRUCache(max_bytes=1000)
+        _put(cache, _entry("stale", ttl_seconds=0))
+        
+        assert cache.get("stale") is None
+        assert cache.bytes_used == 0
+        assert cache.statistics["expirations"] == 1
+    
+    def test_value_is_pickled_once_for_both_tiers(self, engine, monkeypatch):
+        """store_in_cache serializes once and sends those bytes to Redis."""
+        engine.redis_client = fakeredis.FakeRedis()
+        calls = []
+        original_dumps = pickle.dumps
+        monkeypatch.setattr(pickle, "dumps", lambda *args, **kwargs: calls.append(args) or original_dumps(*args, **kwargs))
+        
+        engine.store_in_cache("translation:1", VALUE)
+        
+        payload = engine.redis_client.get("translation:1")
+        assert len(calls) == 1
+        assert engine.memory_cache.bytes_used == len(payload)
+        assert pickle.loads(payload) == VALUE
+    
+    def test_redis_hit_is_promoted_without_rewriting_redis(self, engine):
+        """A Redis hit fills the memory tier and leaves the Redis TTL alone."""
+        engine.redis_client = fakeredis.FakeRedis()
+        engine.store_in_cache("translation:1", VALUE, ttl_seconds=3600)
+        engine.memory_cache.clear()
+        
+        assert engine.get_from_cache("translation:1") == VALUE
+        assert engine.get_from_cache("translation:1") == VALUE
+        
+        assert engine.redis_client.ttl("translation:1") > 300
+        assert engine.cache_stats["hits"] == 2
+        assert "translation:1" in engine.memory_cache
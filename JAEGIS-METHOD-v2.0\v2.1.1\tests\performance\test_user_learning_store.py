@@ -0,0 +1,350 @@
+"""
+User Learning Store Benchmarks for N.L.D.S.
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Columnar UserLearningStore at 1M users: per-observation update cost against
+history length, incremental pattern recognition against recomputing over the
+observation window, delta-based batched saves, and reload of the replayed
+segments into UserLearningEngine instances sharing one store.
+"""
+
+import pytest
+import asyncio
+import json
+import os
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from nlds.cognitive.user_learning import (
+    UserLearningEngine, UserLearningStore, LearningStoreLockedError, BehaviorPattern, AdaptationType,
+    BEHAVIOR_TYPES, FEATURE_NAMES
+)
+from nlds.processing.emotional_analyzer import UserState
+
+
+USER_COUNT = 1_000_000
+
+
+def _analysis_results(rng: random.Random):
+    """Duck-typed cognitive, decision, emotional and inference results."""
+    cognitive_state = SimpleNamespace(
+        cognitive_load=rng.random(), working_memory_load=rng.random(), confidence_level=rng.random(),
+        fatigue_level=rng.random(), motivation_level=rng.random()
+    )
+    decision_result = SimpleNamespace(
+        confidence=rng.random(), decision_quality_score=rng.random(), bounded_rationality_score=rng.random(),
+        human_likeness_score=rng.random(), processing_time_ms=rng.uniform(200, 9000)
+    )
+    emotional_result = SimpleNamespace(
+        emotional_intelligence_score=rng.random(),
+        emotional_context=SimpleNamespace(
+            urgency_level=rng.random(),
+            sentiment_analysis=SimpleNamespace(polarity_score=rng.uniform(-1, 1)),
+            empathy_triggers=["trigger"] * rng.randint(0, 4),
+            user_state=rng.choice(list(UserState))
+        )
+    )
+    inference_result = SimpleNamespace(
+        inference_confidence=rng.random(), completeness_score=rng.random(), actionability_score=rng.random(),
+        implicit_intents=["intent"] * rng.randint(0, 5), semantic_gaps=["gap"] * rng.randint(0, 4)
+    )
+    return cognitive_state, decision_result, emotional_result, inference_result
+
+
+def _legacy_patterns(observations, min_observations: int = 5):
+    """Previous recognition: recount over the last 20 observations."""
+    if len(observations) < min_observations:
+        return {}
+    recent = observations[-20:]
+    shares = {
+        BehaviorPattern.ANALYTICAL_THINKER: sum(obs.behavior_type == "analytical_thorough" for obs in recent),
+        BehaviorPattern.QUICK_DECISION_MAKER: sum(obs.behavior_type == "quick_decisive" for obs in recent),
+        BehaviorPattern.DETAIL_ORIENTED: sum(obs.features["cognitive_load"] > 0.6 and
+                                             obs.features["processing_time"] > 3.0 for obs in recent),
+        BehaviorPattern.INNOVATION_SEEKING: sum(obs.features["implicit_intents_count"] > 2 for obs in recent)
+    }
+    thresholds = {BehaviorPattern.ANALYTICAL_THINKER: 0.4, BehaviorPattern.QUICK_DECISION_MAKER: 0.4,
+                  BehaviorPattern.DETAIL_ORIENTED: 0.3, BehaviorPattern.INNOVATION_SEEKING: 0.3}
+    return {pattern: count / len(recent) for pattern, count in shares.items()
+            if count / len(recent) > thresholds[pattern]}
+
+
+def _batch(rng: np.random.Generator, rows: np.ndarray):
+    count = len(rows)
+    return dict(
+        rows=rows,
+        behavior_codes=rng.integers(0, len(BEHAVIOR_TYPES), count),
+        indicator_flags=rng.integers(0, 16, count),
+        confidences=rng.random(count, dtype=np.float32),
+        features=rng.random((count, len(FEATURE_NAMES)), dtype=np.float32),
+        timestamps=np.full(count, time.time())
+    )
+
+
+def _segment_bytes(store) -> int:
+    return sum(os.path.getsize(os.path.join(store.storage_path, name)) for name in os.listdir(store.storage_path))
+
+
+class TestMillionUsers:
+    """Store behaviour at 1M users."""
+    
+    @pytest.mark.performance
+    def test_million_user_updates_and_delta_saves(self, tmp_path):
+        """Per-observation cost is flat in history length and saves write only deltas."""
+        store = UserLearningStore(str(tmp_path / "store"), flush_batch_size=10_000_000)
+        rng = np.random.default_rng(1)
+        
+        start_time = time.perf_counter()
+        rows = store.register_users([f"user-{index}" for index in range(USER_COUNT)])
+        register_s = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        store.append_observations(**_batch(rng, rows))
+        batch_s = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        store.flush()
+        full_flush_s = time.perf_counter() - start_time
+        full_bytes = _segment_bytes(store)
+        
+        # A long history for one user, then single updates on fresh and long-history users
+        heavy_row = int(rows[0])
+        store.append_observations(**_batch(rng, np.full(5000, heavy_row)))
+        features = [0.5] * len(FEATURE_NAMES)
+        
+        def single_updates(target_rows):
+            start = time.perf_counter()
+            for row in target_rows:
+                store.append_observation(int(row), 1, 5, 0.8, features, 0.0)
+                store.window_counts(int(row))
+            return (time.perf_counter() - start) / len(target_rows) * 1e6
+        
+        fresh_us = single_updates(rng.choice(rows[1:], 10_000, replace=False))
+        heavy_us = single_updates([heavy_row] * 10_000)
+        
+        start_time = time.perf_counter()
+        store.flush()
+        delta_flush_ms = (time.perf_counter() - start_time) * 1000
+        delta_bytes = store.get_statistics()["bytes_written"] - full_bytes
+        
+        print(f"\n{USER_COUNT} users: register {register_s:.2f} s, batch observe {batch_s:.2f} s, "
+              f"columns {store.get_statistics()['column_bytes'] / 1e6:.0f} MB; "
+              f"single update {fresh_us:.1f} us (1 prior) vs {heavy_us:.1f} us (5000+ prior); "
+              f"full flush {full_flush_s:.2f} s / {full_bytes / 1e6:.0f} MB, "
+              f"delta flush of 10k users {delta_flush_ms:.1f} ms / {delta_bytes / 1e6:.2f} MB")
+        
+        assert store.observation_count(heavy_row) == 15001
+        assert store.window_counts(heavy_row)[1] == store.pattern_window
+        assert heavy_us < fresh_us * 3
+        assert delta_bytes < full_bytes / 20
+        assert store.get_statistics()["persisted_observations"] == USER_COUNT + 25000
+
+
+class TestIncrementalPatterns:
+    """Running window aggregates against full recomputation."""
+    
+    def test_engine_patterns_match_window_recount(self, tmp_path):
+        """Incremental recognition agrees with recounting the last 20 observations."""
+        store = UserLearningStore(str(tmp_path / "store"))
+        rng = random.Random(4)
+        engines = [UserLearningEngine(f"user-{index}", store=store) for index in range(3)]
+        histories = {engine.user_id: [] for engine in engines}
+        
+        for _ in range(150):
+            engine = rng.choice(engines)
+            observation = engine.observe_behavior(*_analysis_results(rng), {"channel": "chat"})
+            histories[engine.user_id].append(observation)
+            
+            expected = _legacy_patterns(histories[engine.user_id])
+            recognized = engine.recognize_behavior_patterns()
+            
+            assert set(recognized) == set(expected)
+            for pattern, share in expected.items():
+                assert engine.pattern_confidence[pattern] == pytest.approx(share)
+        
+        assert sum(engine.observations_count for engine in engines) == 150
+    
+    def test_batched_appends_match_single_appends(self, tmp_path):
+        """Vectorized appends with repeated users equal appending one by one."""
+        rng = np.random.default_rng(9)
+        batch = _batch(rng, rng.integers(0, 50, 2000))
+        
+        batched = UserLearningStore(str(tmp_path / "batched"))
+        single = UserLearningStore(str(tmp_path / "single"))
+        batched.register_users([f"user-{index}" for index in range(50)])
+        single.register_users([f"user-{index}" for index in range(50)])
+        
+        batched.append_observations(**batch)
+        for index in range(2000):
+            single.append_observation(
+                int(batch["rows"][index]), int(batch["behavior_codes"][index]), int(batch["indicator_flags"][index]),
+                float(batch["confidences"][index]), batch["features"][index], float(batch["timestamps"][index])
+            )
+        
+        for name in ("window_counts", "window_flags", "window_behaviors", "window_position", "observation_count"):
+            assert np.array_equal(batched.columns[name], single.columns[name]), name
+
+
+class TestDeltaPersistence:
+    """Batched delta saves and reload."""
+    
+    def test_learn_and_adapt_saves_in_batches(self, tmp_path):
+        """Learning cycles flush once per batch of observations."""
+        store = UserLearningStore(str(tmp_path / "store"), flush_batch_size=4, flush_interval_seconds=3600)
+        engine = UserLearningEngine("user-1", store=store)
+        rng = random.Random(2)
+        
+        async def cycles():
+            for _ in range(10):
+                await engine.learn_and_adapt(*_analysis_results(rng), {"channel": "chat"}, feedback=0.5)
+        
+        asyncio.run(cycles())
+        
+        assert store.get_statistics()["segments"] == 2
+        assert store.pending_observations == 2
+    
+    def test_reload_restores_state_and_continues_incrementally(self, tmp_path):
+        """Replayed segments restore preferences, patterns, windows and strategies."""
+        path = str(tmp_path / "store")
+        store = UserLearningStore(path, flush_batch_size=1)
+        rng = random.Random(6)
+        engines = [UserLearningEngine(f"user-{index}", store=store) for index in range(4)]
+        
+        async def cycles():
+            for _ in range(60):
+                await rng.choice(engines).learn_and_adapt(*_analysis_results(rng), {"channel": "chat"})
+        
+        asyncio.run(cycles())
+        store.close()
+        
+        reloaded = UserLearningStore(path)
+        for engine in engines:
+            copy = UserLearningEngine(engine.user_id, store=reloaded)
+            assert copy.user_preferences == engine.user_preferences
+            assert copy.behavior_patterns == engine.behavior_patterns
+            assert copy.observations_count == engine.observations_count
+            assert set(copy.adaptation_strategies) == set(engine.adaptation_strategies)
+            assert store.recent_behaviors(engine.user_row, 20) == reloaded.recent_behaviors(copy.user_row, 20)
+        
+        segments = reloaded.get_statistics()["segments"]
+        reloaded.compact()
+        reloaded.close()
+        compacted = UserLearningStore(path)
+        
+        assert segments > 1 and compacted.get_statistics()["segments"] == 1
+        assert compacted.persisted_observations == 60
+        assert len(compacted.load_observations()["user_ids"]) == 60
+    
+    def test_close_flushes_pending_changes(self, tmp_path):
+        """Changes below the flush batch size survive close and reopen."""
+        path = str(tmp_path / "store")
+        store = UserLearningStore(path, flush_batch_size=1000, flush_interval_seconds=3600)
+        engine = UserLearningEngine("user-1", store=store)
+        engine.observe_behavior(*_analysis_results(random.Random(1)), {"channel": "chat"})
+        assert store.get_statistics()["segments"] == 0
+        
+        store.close()
+        
+        assert UserLearningStore(path).observation_count(0) == 1
+    
+    def test_second_writer_on_a_path_is_refused(self, tmp_path):
+        """Only one open store may write to a storage path."""
+        path = str(tmp_path / "store")
+        store = UserLearningStore(path)
+        
+        with pytest.raises(LearningStoreLockedError):
+            UserLearningStore(path)
+        
+        store.close()
+        UserLearningStore(path).close()
+    
+    def test_default_store_held_elsewhere_falls_back_to_a_worker_path(self, tmp_path):
+        """Engines on a default store another process holds write to a worker directory."""
+        users_path = tmp_path / "users"
+        holder = UserLearningStore(str(users_path / "learning_store"))
+        
+        engine = UserLearningEngine("bob", storage_path=str(users_path / "bob"))
+        engine.observe_behavior(*_analysis_results(random.Random(4)), {"channel": "chat"})
+        fallback = engine.store
+        fallback.close()
+        holder.close()
+        
+        assert fallback.storage_path == str(users_path / "learning_store" / "worker-1")
+        assert "bob" not in UserLearningStore(str(users_path / "learning_store"))
+        assert UserLearningStore(fallback.storage_path).observation_count(0) == 1
+    
+    def test_segments_are_compacted_past_the_threshold(self, tmp_path):
+        """Flushing past the segment threshold folds the segments into one."""
+        path = str(tmp_path / "store")
+        store = UserLearningStore(path, flush_batch_size=1, compact_segment_count=4)
+        rng = np.random.default_rng(5)
+        rows = store.register_users([f"user-{index}" for index in range(10)])
+        for _ in range(10):
+            store.append_observations(**_batch(rng, rows))
+            store.flush()
+        
+        statistics = store.get_statistics()
+        store.close()
+        reopened = UserLearningStore(path)
+        
+        assert statistics["compactions"] == 2
+        assert statistics["segments"] == 2
+        assert reopened.persisted_observations == 100
+        assert reopened.delta_segments == 1
+        reopened.close()
+    
+    def test_interrupted_compaction_is_not_replayed_twice(self, tmp_path):
+        """Segments left behind by a compaction that crashed before removing them are dropped."""
+        path = str(tmp_path / "store")
+        store = UserLearningStore(path, flush_batch_size=1)
+        rng = np.random.default_rng(3)
+        rows = store.register_users([f"user-{index}" for index in range(10)])
+        for _ in range(3):
+            store.append_observations(**_batch(rng, rows))
+            store.flush()
+        
+        old_segments = {name: open(os.path.join(path, name), "rb").read()
+                        for name in os.listdir(path) if name.startswith("segment-")}
+        store.compact()
+        store.close()
+        for name, data in old_segments.items():
+            with open(os.path.join(path, name), "wb") as f:
+                f.write(data)
+        
+        reopened = UserLearningStore(path)
+        
+        assert reopened.persisted_observations == 30
+        assert reopened.observation_count(int(rows[0])) == 3
+        assert reopened.get_statistics()["segments"] == 1
+        reopened.close()
+    
+    def test_legacy_json_is_migrated(self, tmp_path):
+        """A user missing from the store is imported from its legacy JSON file."""
+        storage_path = str(tmp_path / "users" / "user-legacy")
+        os.makedirs(os.path.dirname(storage_path))
+        with open(f"{storage_path}_learning.json", "w") as f:
+            json.dump({
+                "user_id": "user-legacy",
+                "preferences": {"interaction_pace": {
+                    "preference_type": "interaction_pace", "preference_value": "slow", "confidence": 0.7,
+                    "evidence_count": 3, "last_updated": "2025-01-02T03:04:05", "stability_score": 0.9,
+                    "context_dependent": True, "metadata": {}
+                }},
+                "behavior_patterns": ["BehaviorPattern.ANALYTICAL_THINKER"],
+                "adaptation_strategies": {"interaction_pace_0": {
+                    "adaptation_type": "AdaptationType.INTERACTION_PACE", "strategy_description": "slow down",
+                    "parameters": {"pace": "slow"}, "effectiveness_score": 0.7, "usage_count": 1,
+                    "last_used": "2025-01-02T03:04:05", "context_conditions": ["urgency_dependent"]
+                }}
+            }, f)
+        
+        engine = UserLearningEngine("user-legacy", storage_path=storage_path,
+                                    store=UserLearningStore(str(tmp_path / "store")))
+        
+        assert engine.user_preferences["interaction_pace"].preference_value == "slow"
+        assert engine.user_preferences["interaction_pace"].evidence_count == 3
+        assert engine.behavior_patterns == {BehaviorPattern.ANALYTICAL_THINKER}
+        assert engine.adaptation_strategies["interaction_pace_0"].adaptation_type == AdaptationType.INTERACTION_PACE
@@ -382,6 +382,24 @@ class TestRateLimiting:
         # Should deny additional requests
         assert not limiter.is_allowed()
     
+    def test_sliding_window_limiter_weights_previous_window(self):
+        """Test that the previous window's count decays as the window slides."""
+        from nlds.api.rate_limiting import SlidingWindowLimiter
+        
+        limiter = SlidingWindowLimiter(window_size=60, max_requests=10)
+        
+        with patch("nlds.api.rate_limiting.time.time", return_value=6000.0):
+            for i in range(10):
+                assert limiter.is_allowed()
+            assert not limiter.is_allowed()
+        
+        # A quarter into the next window, 75% of the previous count still applies
+        with patch("nlds.api.rate_limiting.time.time", return_value=6075.0):
+            assert limiter.get_status()["requests_in_window"] == 8
+            for i in range(3):
+                assert limiter.is_allowed()
+            assert not limiter.is_allowed()
+    
     def test_rate_limit_extraction(self):
         """Test extraction of rate limit identifiers."""
         engine = RateLimitingEngine()
@@ -0,0 +1,167 @@
+"""
+Unit Tests for P.I.T.C.E.S. Enhanced Caching Layer
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for the in-process L1 tier, single-flight loading and the
+write-back queue of the enhanced caching layer.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+from datetime import timedelta
+from uuid import uuid4
+
+from pitces.core.enhanced_caching_layer import EnhancedCachingLayer, SegmentedLRUCache
+
+
+class TestSegmentedLRUCache:
+    """Test cases for SegmentedLRUCache."""
+    
+    def test_second_hit_promotes_to_protected(self):
+        """Test that an entry moves to the protected segment on its second hit."""
+        cache = SegmentedLRUCache(max_bytes=1000, max_entries=10)
+        cache.put("a", {"v": 1}, size=10, ttl_seconds=60)
+        
+        assert "a" in cache.probation
+        assert cache.get("a") == {"v": 1}
+        assert "a" in cache.protected
+        assert "a" not in cache.probation
+    
+    def test_eviction_respects_byte_budget(self):
+        """Test that inserts evict probation entries once the byte budget is exceeded."""
+        cache = SegmentedLRUCache(max_bytes=100, max_entries=100)
+        cache.put("hot", "x", size=40, ttl_seconds=60)
+        cache.get("hot")
+        cache.put("cold", "y", size=40, ttl_seconds=60)
+        
+        evicted = cache.put("new", "z", size=40, ttl_seconds=60)
+        
+        assert [key for key, _ in evicted] == ["cold"]
+        assert "hot" in cache
+        assert cache.bytes_used == 80
+    
+    def test_admission_check_rejects_cold_candidates(self):
+        """Test that a cold key cannot displace a more frequently used one."""
+        cache = SegmentedLRUCache(max_bytes=1000, max_entries=1, track_frequency=True)
+        cache.put("popular", "x", size=10, ttl_seconds=60)
+        for _ in range(3):
+            cache.get("popular")
+        
+        assert cache.put("rare", "y", size=10, ttl_seconds=60, admission_check=True) is None
+        assert "popular" in cache
+    
+    def test_rejected_refresh_keeps_cached_value(self):
+        """Test that a refresh refused by the admission check leaves the old value cached."""
+        cache = SegmentedLRUCache(max_bytes=1000, max_entries=2, track_frequency=True)
+        cache.put("popular", "x", size=10, ttl_seconds=60)
+        for _ in range(3):
+            cache.get("popular")
+        cache.put("rare", "old", size=10, ttl_seconds=60)
+        
+        assert cache.put("rare", "new", size=995, ttl_seconds=60, admission_check=True) is None
+        assert cache.get("rare") == "old"
+        assert cache.bytes_used == 20
+        
+        assert cache.put("rare", "newer", size=10, ttl_seconds=60, admission_check=True) == []
+        assert cache.get("rare") == "newer"
+        assert len(cache) == 2
+    
+    def test_oversized_value_drops_cached_value(self):
+        """Test that a value larger than the budget evicts the old value instead of leaving it stale."""
+        cache = SegmentedLRUCache(max_bytes=100, max_entries=10)
+        cache.put("a", "old", size=10, ttl_seconds=60)
+        cache.get("a")
+        
+        assert cache.put("a", "new", size=101, ttl_seconds=60) is None
+        assert cache.get("a") is None
+        assert cache.bytes_used == 0
+        assert cache.protected_bytes == 0
+    
+    def test_expired_entries_are_not_returned(self):
+        """Test that expired entries miss and are removed."""
+        cache = SegmentedLRUCache(max_bytes=1000, max_entries=10)
+        cache.put("a", "x", size=10, ttl_seconds=0)
+        
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestEnhancedCachingLayer:
+    """Test cases for EnhancedCachingLayer tiering."""
+    
+    @pytest.fixture
+    def vector_engine(self):
+        """Vector engine with an empty Redis tier."""
+        pipeline = Mock()
+        pipeline.execute = AsyncMock(return_value=[])
+        
+        engine = Mock()
+        engine.async_redis_client = Mock()
+        engine.async_redis_client.hgetall = AsyncMock(return_value={})
+        engine.async_redis_client.pipeline = Mock(return_value=pipeline)
+        return engine
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, vector_engine):
+        """Test that concurrent misses for one key hit L2 and the vector engine once."""
+        async def slow_load(task_id):
+            await asyncio.sleep(0.01)
+            return {"task_id": str(task_id)}
+        
+        vector_engine.retrieve_task_context_vector = AsyncMock(side_effect=slow_load)
+        caching_layer = EnhancedCachingLayer(vector_engine)
+        task_id = uuid4()
+        
+        results = await asyncio.gather(*(
+            caching_layer.get_task_context_cached(task_id) for _ in range(20)
+        ))
+        
+        assert all(result == {"task_id": str(task_id)} for result in results)
+        assert vector_engine.retrieve_task_context_vector.await_count == 1
+        assert vector_engine.async_redis_client.hgetall.await_count == 1
+        
+        # The loaded context is now served from L1
+        assert await caching_layer.get_task_context_cached(task_id) == {"task_id": str(task_id)}
+        metrics = caching_layer.get_cache_metrics()
+        assert metrics['levels']['l1_memory']['hits'] == 1
+        assert metrics['single_flight_waits'] == 19
+    
+    @pytest.mark.asyncio
+    async def test_write_back_entries_flush_in_one_pipeline(self, vector_engine):
+        """Test that dirty write-back entries reach L2 on flush, not on write."""
+        caching_layer = EnhancedCachingLayer(vector_engine)
+        
+        for i in range(5):
+            await caching_layer._write_back_cache(f"task_context:{i}", {"i": i}, timedelta(hours=1))
+        
+        assert vector_engine.async_redis_client.pipeline.call_count == 0
+        assert await caching_layer.flush_write_back() == 5
+        assert vector_engine.async_redis_client.pipeline.call_count == 1
+        assert caching_layer.get_cache_metrics()['write_back_pending'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_oversized_writes_do_not_leave_stale_l1_copies(self, vector_engine):
+        """Test that a value too large for L1 replaces the old L1 copy in both write strategies."""
+        caching_layer = EnhancedCachingLayer(vector_engine, {"l1_max_bytes": 100})
+        
+        for write in (caching_layer._write_through_cache, caching_layer._write_back_cache):
+            await write("task_context:1", {"v": "old"}, timedelta(hours=1))
+            await write("task_context:1", {"v": "x" * 200}, timedelta(hours=1))
+            
+            assert caching_layer.l1_cache.get("task_context:1") is None
+            assert "task_context:1" not in caching_layer.consistency_tracker
+        
+        assert vector_engine.async_redis_client.pipeline.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_is_scheduled_only_with_a_loader(self, vector_engine):
+        """Test that refresh-ahead entries without a registered loader are not scheduled."""
+        caching_layer = EnhancedCachingLayer(vector_engine)
+        
+        await caching_layer._refresh_ahead_cache("gap_analysis:3:0.5:low", {"gaps": []}, timedelta(hours=1))
+        assert caching_layer.get_cache_metrics()['refresh_ahead_scheduled'] == 0
+        
+        caching_layer.register_refresh_loader("gap_analysis", AsyncMock(return_value={"gaps": []}))
+        await caching_layer._refresh_ahead_cache("gap_analysis:3:0.5:low", {"gaps": []}, timedelta(hours=1))
+        assert caching_layer.get_cache_metrics()['refresh_ahead_scheduled'] == 1
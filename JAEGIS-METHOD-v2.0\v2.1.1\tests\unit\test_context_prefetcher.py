@@ -0,0 +1,135 @@
+"""
+Unit Tests for P.I.T.C.E.S. Context Prefetcher
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for resume prediction and the bounded warm cache of the
+context prefetcher.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock
+
+from pitces.core.context_prefetcher import ContextPrefetcher
+from pitces.core.preemption_manager import PreemptionManager
+from pitces.core.triage_system import TriageSystem
+from pitces.core.models import Task, Priority
+
+
+def _make_tasks(*names_and_priorities):
+    return [Task(name=name, priority=priority) for name, priority in names_and_priorities]
+
+
+class TestResumePrediction:
+    """Test cases for ContextPrefetcher.predict_resume_order."""
+    
+    @pytest.fixture
+    def scheduler(self):
+        """Preemption manager and triage system without persistence."""
+        return PreemptionManager(Mock()), TriageSystem()
+    
+    def test_dependency_of_queued_task_resumes_first(self, scheduler):
+        """Test that a paused task needed by the next queued task is predicted first."""
+        preemption_manager, triage_system = scheduler
+        critical, needed, queued = _make_tasks(
+            ("critical", Priority.CRITICAL), ("needed", Priority.LOW), ("queued", Priority.HIGH)
+        )
+        preemption_manager.paused_tasks[critical.id] = critical
+        preemption_manager.paused_tasks[needed.id] = needed
+        preemption_manager.add_task_dependency(queued.id, needed.id)
+        triage_system.queues[Priority.HIGH].append(queued)
+        
+        prefetcher = ContextPrefetcher(Mock())
+        prefetcher.attach(preemption_manager, triage_system)
+        
+        assert prefetcher.predict_resume_order() == [needed.id, critical.id]
+    
+    def test_blocked_tasks_are_predicted_last(self, scheduler):
+        """Test that a paused task waiting on another paused task is ranked behind it."""
+        preemption_manager, triage_system = scheduler
+        blocked, blocker = _make_tasks(("blocked", Priority.CRITICAL), ("blocker", Priority.LOW))
+        preemption_manager.paused_tasks[blocked.id] = blocked
+        preemption_manager.paused_tasks[blocker.id] = blocker
+        preemption_manager.add_task_dependency(blocked.id, blocker.id)
+        
+        prefetcher = ContextPrefetcher(Mock())
+        prefetcher.attach(preemption_manager, triage_system)
+        
+        assert prefetcher.predict_resume_order() == [blocker.id, blocked.id]
+
+
+class TestWarmCache:
+    """Test cases for the prefetch warm cache."""
+    
+    @pytest.mark.asyncio
+    async def test_prefetched_context_is_a_hit_once(self):
+        """Test that a prefetched context is served once and counted as a hit."""
+        async def loader(task_id):
+            await asyncio.sleep(0.01)
+            return {'id': str(task_id)}
+        
+        task = Task(name="resumable")
+        prefetcher = ContextPrefetcher(loader)
+        
+        assert await prefetcher.prefetch([task.id]) == {task.id: True}
+        assert prefetcher.take(task.id) == {'id': str(task.id)}
+        assert prefetcher.take(task.id) is None
+        
+        metrics = prefetcher.get_metrics()
+        assert metrics['prefetch_hits'] == 1
+        assert metrics['prefetch_misses'] == 1
+        assert metrics['prefetch_hit_rate'] == 50.0
+        assert metrics['resume_latency_saved_seconds'] >= 0.01
+    
+    @pytest.mark.asyncio
+    async def test_warm_cache_stays_within_entry_limit(self):
+        """Test that the oldest prefetched contexts are evicted past the entry limit."""
+        async def loader(task_id):
+            return {'id': str(task_id)}
+        
+        tasks = [Task(name=f"task-{i}") for i in range(5)]
+        prefetcher = ContextPrefetcher(loader, {'prefetch_max_entries': 3})
+        
+        await prefetcher.prefetch([task.id for task in tasks])
+        
+        assert list(prefetcher.warm_cache) == [task.id for task in tasks[2:]]
+        assert prefetcher.get_metrics()['warm_cache_evictions'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_drops_stale_context(self):
+        """Test that a context saved while its prefetch is in flight is not cached."""
+        started, release = asyncio.Event(), asyncio.Event()
+        
+        async def loader(task_id):
+            started.set()
+            await release.wait()
+            return {'id': str(task_id), 'version': 1}
+        
+        task = Task(name="saved-mid-load")
+        prefetcher = ContextPrefetcher(loader)
+        
+        pending = asyncio.ensure_future(prefetcher.prefetch([task.id]))
+        await started.wait()
+        prefetcher.invalidate(task.id)
+        release.set()
+        
+        assert await pending == {task.id: False}
+        assert prefetcher.take(task.id) is None
+        assert prefetcher.get_metrics()['stale_prefetches_dropped'] == 1
+        assert prefetcher.generations == {}
+    
+    @pytest.mark.asyncio
+    async def test_invalidations_do_not_accumulate(self):
+        """Test that saves of many tasks leave no per-task state once loads settle."""
+        async def loader(task_id):
+            return {'id': str(task_id)}
+        
+        tasks = [Task(name=f"saved-{i}") for i in range(100)]
+        prefetcher = ContextPrefetcher(loader)
+        
+        for task in tasks:
+            prefetcher.invalidate(task.id)
+        
+        assert prefetcher.generations == {}
+        assert await prefetcher.prefetch([tasks[0].id]) == {tasks[0].id: True}
+        assert prefetcher.generations == {}
@@ -0,0 +1,261 @@
+"""
+Unit Tests for N.L.D.S. Embedding Service
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for micro-batching, the bounded LRU, the shared disk cache and
+matrix similarity of the embedding service, using a small local stand-in
+encoder in place of a transformer model.
+"""
+
+import pytest
+import asyncio
+import hashlib
+from typing import List
+
+import numpy as np
+
+from nlds.nlp.embedding_service import (
+    EmbeddingService, ConceptIndex, DiskVectorCache, content_digest, normalize_rows, top_k_indices
+)
+
+
+DIMENSION = 16
+
+
+class StandInEncoder:
+    """Deterministic bag-of-words encoder that records every encode call."""
+    
+    def __init__(self):
+        self.calls: List[List[str]] = []
+    
+    def encode(self, texts: List[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), DIMENSION), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                digest = hashlib.md5(word.encode()).digest()
+                vectors[row, digest[0] % DIMENSION] += 1.0
+        return vectors
+    
+
+
+@pytest.fixture
+def encoder():
+    return StandInEncoder()
+
+
+CONCEPTS = {
+    "operations": ["create", "update", "delete", "analyze", "deploy"],
+    "entities": ["agent", "task", "workflow"],
+    "domains": ["development", "testing", "monitoring", "security"]
+}
+
+
+class TestEmbeddingService:
+    """Test cases for EmbeddingService."""
+    
+    def test_embed_many_encodes_unique_texts_once(self, encoder):
+        """Test that duplicates in a batch and repeat requests are served from cache."""
+        service = EmbeddingService(encoder.encode, "stand-in")
+        
+        vectors = service.embed_many(["create agent", "deploy workflow", "create agent"])
+        service.embed_many(["deploy workflow"])
+        
+        assert vectors.shape == (3, DIMENSION)
+        assert np.array_equal(vectors[0], vectors[2])
+        assert encoder.calls == [["create agent", "deploy workflow"]]
+        assert service.get_statistics()["memory_hits"] == 1
+    
+    def test_memory_cache_is_bounded_lru(self, encoder):
+        """Test that the least recently used vector is evicted first."""
+        service = EmbeddingService(encoder.encode, "stand-in", cache_size=2)
+        
+        service.embed_many(["alpha", "beta"])
+        service.embed("alpha")
+        service.embed("gamma")
+        encoder.calls.clear()
+        
+        service.embed_many(["alpha", "gamma", "beta"])
+        
+        assert service.get_statistics()["memory_entries"] == 2
+        assert encoder.calls == [["beta"]]
+    
+    def test_large_batches_are_chunked(self, encoder):
+        """Test that one request never exceeds max_batch_size per encode call."""
+        service = EmbeddingService(encoder.encode, "stand-in", max_batch_size=8)
+        
+        service.embed_many([f"task {i}" for i in range(20)])
+        
+        assert [len(call) for call in encoder.calls] == [8, 8, 4]
+    
+    def test_disk_cache_is_shared_between_workers(self, encoder, tmp_path):
+        """Test that a second worker reads vectors encoded by the first from disk."""
+        first = EmbeddingService(encoder.encode, "stand-in/model", cache_dir=str(tmp_path), disk_capacity=64)
+        expected = first.embed_many(["analyze market trends", "generate report"])
+        
+        second_encoder = StandInEncoder()
+        second = EmbeddingService(
+            second_encoder.encode, "stand-in/model",
+            dimension=DIMENSION, cache_dir=str(tmp_path), disk_capacity=64
+        )
+        actual = second.embed_many(["generate report", "analyze market trends"])
+        
+        assert second_encoder.calls == []
+        assert np.array_equal(actual, expected[::-1])
+        assert second.get_statistics()["disk_hits"] == 2
+        
+        first.close()
+        second.close()
+    
+    def test_disk_read_overlapping_a_write_is_a_miss(self, tmp_path):
+        """Test that a read racing a write to its slot never returns another text's vector."""
+        cache = DiskVectorCache(str(tmp_path), "stand-in/model", DIMENSION, capacity=1)
+        first, second = content_digest("analyze market trends"), content_digest("generate report")
+        cache.put_many([first], np.ones((1, DIMENSION), dtype=np.float32))
+        
+        class OverwriteOnRead:
+            """Vector map that lets another worker overwrite the slot just before the copy."""
+            
+            def __init__(self, vectors):
+                self.vectors = vectors
+            
+            def __getitem__(self, slot):
+                cache.vectors = self.vectors
+                cache.put_many([second], np.full((1, DIMENSION), 2.0, dtype=np.float32))
+                return self.vectors[slot]
+        
+        cache.vectors = OverwriteOnRead(cache.vectors)
+        assert cache.get(first) is None
+        
+        # A slot in the middle of a write reads as a miss too
+        cache.sequences[0] += 1
+        assert cache.get(second) is None
+        cache.sequences[0] += 1
+        assert np.array_equal(cache.get(second), np.full(DIMENSION, 2.0, dtype=np.float32))
+        
+        cache.close()
+    
+    def test_similarity_matrix_matches_pairwise_cosine(self, encoder):
+        """Test that the matrix product equals per-pair cosine similarity."""
+        service = EmbeddingService(encoder.encode, "stand-in")
+        texts = ["create agent", "create new agent", "monitor pipeline", "agent"]
+        
+        matrix = service.similarity_matrix(texts)
+        vectors = encoder.encode(texts)
+        
+        for i in range(len(texts)):
+            for j in range(len(texts)):
+                expected = np.dot(vectors[i], vectors[j]) / (
+                    np.linalg.norm(vectors[i]) * np.linalg.norm(vectors[j])
+                )
+                assert matrix[i, j] == pytest.approx(expected, abs=1e-6)
+    
+    def test_normalize_rows_keeps_zero_rows(self):
+        """Test that all-zero vectors do not produce NaNs."""
+        normalized = normalize_rows(np.array([[3.0, 4.0], [0.0, 0.0]]))
+        
+        assert np.allclose(normalized, [[0.6, 0.8], [0.0, 0.0]])
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_micro_batched(self, encoder):
+        """Test that concurrent async requests share one encode call."""
+        service = EmbeddingService(encoder.encode, "stand-in", max_wait_ms=20)
+        texts = [f"request {i}" for i in range(10)]
+        
+        vectors = await asyncio.gather(*(service.aembed(text) for text in texts))
+        
+        assert len(encoder.calls) == 1
+        assert sorted(encoder.calls[0]) == sorted(texts)
+        assert np.array_equal(np.stack(vectors), service.embed_many(texts))
+        assert service.get_statistics()["async_batches"] == 1
+        
+        service.close()
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_is_flushed_without_waiting(self, encoder):
+        """Test that a batch reaching max_batch_size is encoded immediately."""
+        service = EmbeddingService(encoder.encode, "stand-in", max_batch_size=4, max_wait_ms=10000)
+        
+        vectors = await asyncio.wait_for(
+            asyncio.gather(*(service.aembed(f"text {i}") for i in range(4))), timeout=1.0
+        )
+        
+        assert len(vectors) == 4
+        assert len(encoder.calls) == 1
+        
+        service.close()
+    
+    @pytest.mark.asyncio
+    async def test_encoder_errors_reach_every_waiter(self):
+        """Test that a failed batch raises in every awaiting request."""
+        def failing_encode(texts):
+            raise RuntimeError("model unavailable")
+        
+        service = EmbeddingService(failing_encode, "stand-in", max_wait_ms=5)
+        
+        results = await asyncio.gather(
+            service.aembed("one"), service.aembed("two"), return_exceptions=True
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        
+        service.close()
+
+
+class TestConceptIndex:
+    """Test cases for ConceptIndex."""
+    
+    def test_top_k_indices_matches_full_sort(self):
+        """Test that argpartition top-k equals the head of a full descending sort."""
+        scores = np.random.default_rng(7).random((20, 50))
+        
+        top = top_k_indices(scores, 5)
+        
+        assert np.array_equal(top, np.argsort(-scores, axis=1)[:, :5])
+        assert top_k_indices(scores[0], 80).shape == (50,)
+    
+    def test_category_matrices_are_normalized_float32_views(self, encoder):
+        """Test that each category is a unit-row block of one float32 matrix."""
+        index = ConceptIndex.build(CONCEPTS, EmbeddingService(encoder.encode, "stand-in"))
+        
+        entities = index.category_matrix("entities")
+        
+        assert entities.dtype == np.float32
+        assert entities.shape == (3, DIMENSION)
+        assert np.shares_memory(entities, index.matrix)
+        assert np.allclose(np.linalg.norm(entities, axis=1), 1.0)
+        assert len(encoder.calls) == 1
+    
+    def test_rank_scores_many_texts_at_once(self, encoder):
+        """Test that batch ranking equals per-concept cosine similarity."""
+        service = EmbeddingService(encoder.encode, "stand-in")
+        index = ConceptIndex.build(CONCEPTS, service)
+        texts = ["deploy agent workflow", "security testing"]
+        
+        ranked = index.rank(service.embed_many(texts), top_k=2)
+        
+        assert len(ranked) == 2
+        for text, result in zip(texts, ranked):
+            expected = {concept: service.similarity(text, concept) for concept in CONCEPTS["domains"]}
+            assert result["full_scores"]["domains"] == pytest.approx(expected, abs=1e-6)
+            assert len(result["top_concepts"]) == 2
+            assert all(len(scores) == 2 for scores in result["category_scores"].values())
+            
+            best = max(expected, key=expected.get)
+            assert list(result["category_scores"]["domains"])[0] == best
+    
+    def test_persisted_index_skips_encoding(self, encoder, tmp_path):
+        """Test that a second startup loads the matrix instead of re-embedding."""
+        first = ConceptIndex.build(CONCEPTS, EmbeddingService(encoder.encode, "stand-in"), str(tmp_path))
+        
+        second_encoder = StandInEncoder()
+        second = ConceptIndex.build(CONCEPTS, EmbeddingService(second_encoder.encode, "stand-in"), str(tmp_path))
+        
+        assert second_encoder.calls == []
+        assert np.array_equal(second.matrix, first.matrix)
+        
+        # Editing the concept lists invalidates the persisted matrix
+        edited = dict(CONCEPTS, entities=["agent", "task", "workflow", "pipeline"])
+        ConceptIndex.build(edited, EmbeddingService(second_encoder.encode, "stand-in"), str(tmp_path))
+        
+        assert len(second_encoder.calls) == 1
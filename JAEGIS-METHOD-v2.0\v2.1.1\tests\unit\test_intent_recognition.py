@@ -0,0 +1,216 @@
+"""
+Unit Tests for N.L.D.S. Intent Recognition
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for batch intent recognition: the vectorized feature matrix
+matches per-text extraction, each model runs once per batch, ensemble scores
+match the single-text path and concurrent async requests share one batch.
+"""
+
+import pytest
+import asyncio
+from typing import List
+
+import numpy as np
+
+from nlds.nlp.intent_recognizer import IntentRecognitionEngine, IntentCategory
+from nlds.nlp.tokenizer import Token, TokenType, TokenizationResult
+from nlds.nlp.semantic_analyzer import SemanticAnalysisResult
+
+
+TEXTS = [
+    "Create a new agent for the development squad now!",
+    "What is the status of the deployment task?",
+    "/jaegis mode-3 activate squad",
+    "Please analyze the quarterly report",
+    "",
+]
+
+
+def _tokenize(text: str) -> TokenizationResult:
+    tokens = []
+    position = 0
+    for word in text.split():
+        if word.startswith("/"):
+            token_type = TokenType.JAEGIS_COMMAND
+        elif "squad" in word or "agent" in word:
+            token_type = TokenType.JAEGIS_ENTITY
+        elif word.rstrip("!?").isdigit():
+            token_type = TokenType.NUMBER
+        else:
+            token_type = TokenType.WORD
+        start = text.index(word, position)
+        position = start + len(word)
+        tokens.append(Token(word, token_type, start, position, word.lower()))
+    
+    return TokenizationResult(
+        tokens=tokens,
+        original_text=text,
+        language="en",
+        processing_time_ms=1.5,
+        token_count=len(tokens),
+        character_count=len(text),
+        metadata={"language_confidence": 0.9, "special_tokens_count": 1}
+    )
+
+
+def _analyze(text: str) -> SemanticAnalysisResult:
+    return SemanticAnalysisResult(
+        text=text,
+        embeddings=None,
+        concepts=[{"concept": "agent"}] * (len(text) % 4),
+        relations=[],
+        semantic_similarity={"squads": {"development": 0.4, "quality": 0.2}},
+        domain_relevance={"development": 0.7, "testing": 0.1},
+        processing_time_ms=12.0,
+        confidence_score=0.8,
+        metadata={}
+    )
+
+
+def _inputs(texts: List[str]):
+    return list(texts), [_tokenize(text) for text in texts], [_analyze(text) for text in texts]
+
+
+@pytest.fixture
+def engine():
+    engine = IntentRecognitionEngine(max_wait_ms=20)
+    yield engine
+    engine.close()
+
+
+def _fit_classifiers(engine: IntentRecognitionEngine):
+    """Fit the scikit-learn models on a subset of the intent labels."""
+    rng = np.random.default_rng(3)
+    labels = [IntentCategory.CREATE, IntentCategory.QUESTION, IntentCategory.SQUAD_ACTIVATION, IntentCategory.ANALYZE]
+    features = rng.random((40, engine.FEATURE_SIZE)).astype(np.float32)
+    targets = [labels[i % len(labels)].value for i in range(40)]
+    engine.models["random_forest"].fit(features, targets)
+    engine.models["logistic_regression"].fit(features, targets)
+
+
+class CallCounter:
+    """Wraps a callable and counts its calls."""
+    
+    def __init__(self, function):
+        self.function = function
+        self.calls = 0
+    
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.function(*args, **kwargs)
+
+
+class TestBatchIntentRecognition:
+    """Test cases for IntentRecognitionEngine batch recognition."""
+    
+    def test_feature_matrix_matches_per_text_extraction(self, engine):
+        """Test that each matrix row equals extract_features for that text."""
+        texts, tokenizations, semantics = _inputs(TEXTS)
+        
+        matrix = engine.extract_features_batch(texts, tokenizations, semantics)
+        
+        assert matrix.shape == (len(texts), engine.FEATURE_SIZE)
+        assert matrix.dtype == np.float32
+        for row, text, tokenization, semantic in zip(matrix, texts, tokenizations, semantics):
+            np.testing.assert_allclose(row, engine.extract_features(text, tokenization, semantic), rtol=1e-6)
+    
+    def test_unfitted_classifiers_match_single_text_ensemble(self, engine):
+        """Test that batch predictions equal _ensemble_predict with pattern fallbacks."""
+        texts, tokenizations, semantics = _inputs(TEXTS)
+        matrix = engine.extract_features_batch(texts, tokenizations, semantics)
+        
+        predictions = engine.predict_intents_batch(matrix)
+        
+        for row, prediction in zip(matrix, predictions):
+            expected = engine._ensemble_predict(row)
+            assert prediction.intent == expected.intent
+            assert prediction.confidence == pytest.approx(expected.confidence, abs=1e-6)
+            assert prediction.probability_distribution == pytest.approx(expected.probability_distribution, abs=1e-6)
+            assert prediction.features["models_used"] == expected.features["models_used"]
+    
+    def test_each_model_runs_once_per_batch(self, engine):
+        """Test that a batch makes one forward pass and one predict_proba per classifier."""
+        _fit_classifiers(engine)
+        forward = CallCounter(engine.models["neural_net"].forward)
+        engine.models["neural_net"].forward = forward
+        counters = {}
+        for name in ("random_forest", "logistic_regression"):
+            counters[name] = CallCounter(engine.models[name].predict_proba)
+            engine.models[name].predict_proba = counters[name]
+        
+        texts, tokenizations, semantics = _inputs(TEXTS * 20)
+        results = engine.recognize_intents_batch(texts, tokenizations, semantics)
+        
+        assert len(results) == len(texts)
+        assert forward.calls == 1
+        assert all(counter.calls == 1 for counter in counters.values())
+        assert engine.batch_statistics["batches"] == 1
+    
+    def test_fitted_classifier_columns_follow_intent_order(self, engine):
+        """Test that predict_proba columns are mapped through classes_ to intent columns."""
+        _fit_classifiers(engine)
+        texts, tokenizations, semantics = _inputs(TEXTS)
+        matrix = engine.extract_features_batch(texts, tokenizations, semantics)
+        model = engine.models["logistic_regression"]
+        
+        probabilities = engine._sklearn_probabilities(matrix, "logistic_regression")
+        
+        expected = model.predict_proba(matrix)
+        for column, label in enumerate(model.classes_):
+            np.testing.assert_allclose(probabilities[:, engine.intent_columns[label]], expected[:, column])
+        assert probabilities.sum(axis=1) == pytest.approx(np.ones(len(texts)))
+    
+    def test_batch_results_match_single_text_recognition(self, engine):
+        """Test that recognize_intents_batch agrees with recognize_intent per text."""
+        texts, tokenizations, semantics = _inputs(TEXTS)
+        contexts = [None, {"user_context": {"role": "admin"}}, None, None, None]
+        
+        results = engine.recognize_intents_batch(texts, tokenizations, semantics, contexts)
+        
+        for result, text, tokenization, semantic, context in zip(results, texts, tokenizations, semantics, contexts):
+            expected = asyncio.run(engine.recognize_intent(text, tokenization, semantic, context))
+            assert result.text == text
+            assert result.primary_intent.intent == expected.primary_intent.intent
+            assert [a.intent for a in result.alternative_intents] == [a.intent for a in expected.alternative_intents]
+            assert result.context_factors == expected.context_factors
+            assert result.jaegis_mapping == pytest.approx(expected.jaegis_mapping)
+            assert result.metadata["batch_size"] == len(texts)
+    
+    def test_mismatched_inputs_are_rejected(self, engine):
+        """Test that inputs of different lengths raise ValueError."""
+        texts, tokenizations, semantics = _inputs(TEXTS)
+        
+        with pytest.raises(ValueError):
+            engine.recognize_intents_batch(texts, tokenizations[:-1], semantics)
+        assert engine.recognize_intents_batch([], [], []) == []
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_micro_batched(self, engine):
+        """Test that concurrent async requests share one batch."""
+        texts, tokenizations, semantics = _inputs(TEXTS * 4)
+        
+        results = await asyncio.gather(*(
+            engine.arecognize_intent(text, tokenization, semantic)
+            for text, tokenization, semantic in zip(texts, tokenizations, semantics)
+        ))
+        
+        assert [result.text for result in results] == texts
+        assert engine.batch_statistics["async_batches"] == 1
+        assert all(result.metadata["batch_size"] == len(texts) for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_is_flushed_without_waiting(self):
+        """Test that a batch reaching max_batch_size is recognized immediately."""
+        engine = IntentRecognitionEngine(max_batch_size=4, max_wait_ms=10000)
+        texts, tokenizations, semantics = _inputs(TEXTS[:4])
+        
+        results = await asyncio.wait_for(asyncio.gather(*(
+            engine.arecognize_intent(text, tokenization, semantic)
+            for text, tokenization, semantic in zip(texts, tokenizations, semantics)
+        )), timeout=1.0)
+        
+        assert len(results) == 4
+        assert engine.batch_statistics["async_batches"] == 1
+        
+        engine.close()
@@ -0,0 +1,136 @@
+"""
+Unit Tests for N.L.D.S. Language Detection
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for the cost-ordered detection cascade of LanguageDetector: cheap
+stages short-circuit the model-based detectors, results are memoized and
+per-stage counters add up.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from nlds.nlp.language_detector import LanguageDetector, SupportedLanguage
+
+
+STOPWORDS = {
+    "en": {"the", "a", "and", "of", "to", "for", "is", "by", "this", "with"},
+    "es": {"el", "la", "de", "y", "a", "los", "para", "por", "con", "es"},
+    "fr": {"le", "la", "de", "et", "les", "pour", "par", "avec", "est", "a"},
+}
+
+
+@pytest.fixture
+def detector():
+    """Detector with fixed stopword lists and stand-in model detectors."""
+    detector = LanguageDetector()
+    detector.stopwords_cache = {lang: set(words) for lang, words in STOPWORDS.items()}
+    detector._build_stopword_bitmap()
+    
+    detector.detect_with_fasttext = Mock(return_value=("unknown", 0.0))
+    detector.detect_with_polyglot = Mock(return_value=("unknown", 0.0))
+    detector.detect_with_langdetect = Mock(return_value=("unknown", 0.0, []))
+    return detector
+
+
+def _model_calls(detector: LanguageDetector) -> int:
+    return (detector.detect_with_fasttext.call_count
+            + detector.detect_with_polyglot.call_count
+            + detector.detect_with_langdetect.call_count)
+
+
+class TestDetectionCascade:
+    """Test cases for LanguageDetector.ensemble_detection."""
+    
+    @pytest.mark.parametrize("text,language", [
+        ("Привет, как у тебя дела сегодня?", SupportedLanguage.RUSSIAN),
+        ("今日はいい天気ですね", SupportedLanguage.JAPANESE),
+        ("안녕하세요 반갑습니다", SupportedLanguage.KOREAN),
+    ])
+    def test_script_stage_resolves_non_latin_text(self, detector, text, language):
+        """Test that unambiguous scripts skip every model-based detector."""
+        result = detector.ensemble_detection(text)
+        
+        assert result.detected_language == language
+        assert result.processing_method == "script"
+        assert _model_calls(detector) == 0
+    
+    @pytest.mark.parametrize("text,language", [
+        ("Send the summary of the quarterly report to the finance team by this Friday", SupportedLanguage.ENGLISH),
+        ("Los informes y el resumen para el equipo de ventas", SupportedLanguage.SPANISH),
+    ])
+    def test_stopword_stage_resolves_clear_text(self, detector, text, language):
+        """Test that a dominant stopword language skips the model-based detectors."""
+        result = detector.ensemble_detection(text)
+        
+        assert result.detected_language == language
+        assert result.processing_method == "stopwords"
+        assert _model_calls(detector) == 0
+    
+    def test_first_confident_model_ends_the_cascade(self, detector):
+        """Test that detectors after a confident one are not called."""
+        detector.detect_with_fasttext.return_value = ("de", 0.97)
+        
+        result = detector.ensemble_detection("Guten Morgen zusammen")
+        
+        assert result.detected_language == SupportedLanguage.GERMAN
+        assert result.processing_method == "fasttext"
+        detector.detect_with_polyglot.assert_not_called()
+        detector.detect_with_langdetect.assert_not_called()
+    
+    def test_weighted_vote_when_no_stage_is_confident(self, detector):
+        """Test that uncertain detections are combined by weighted voting."""
+        detector.detect_with_fasttext.return_value = ("it", 0.6)
+        detector.detect_with_polyglot.return_value = ("es", 0.5)
+        detector.detect_with_langdetect.return_value = ("it", 0.7, [("es", 0.2)])
+        
+        result = detector.ensemble_detection("Buongiorno ragazzi")
+        
+        assert result.detected_language == SupportedLanguage.ITALIAN
+        assert result.processing_method == "ensemble"
+        assert result.alternative_languages[0][0] == SupportedLanguage.SPANISH
+        assert _model_calls(detector) == 3
+    
+    def test_results_are_memoized_on_normalized_prefix(self, detector):
+        """Test that case and whitespace variants hit the cache."""
+        detector.detect_with_fasttext.return_value = ("de", 0.97)
+        
+        first = detector.ensemble_detection("Guten Morgen zusammen")
+        second = detector.ensemble_detection("  guten   MORGEN zusammen ")
+        
+        assert second.detected_language == first.detected_language
+        assert second.metadata["cache_hit"] is True
+        assert detector.detect_with_fasttext.call_count == 1
+    
+    def test_cascade_statistics_account_for_every_request(self, detector):
+        """Test that each request is resolved by exactly one stage."""
+        texts = [
+            "Привет, как у тебя дела сегодня?",
+            "Send the summary of the quarterly report to the finance team by this Friday",
+            "Buongiorno ragazzi",
+            "/jaegis-mode create development-squad agent",
+            "Buongiorno ragazzi",
+        ]
+        for text in texts:
+            detector.ensemble_detection(text)
+        
+        statistics = detector.get_cascade_statistics()
+        stages = statistics["stages"]
+        
+        assert statistics["requests"] == len(texts)
+        assert sum(stage["resolved"] for stage in stages.values()) == len(texts)
+        assert stages["cache"]["resolved"] == 1
+        assert stages["jaegis_context"]["resolved"] == 1
+        assert stages["script"]["resolved"] == 1
+        assert stages["stopwords"]["resolved"] == 1
+        assert stages["fasttext"]["calls"] == 1
+    
+    def test_stopword_bitmap_matches_set_lookup(self, detector):
+        """Test that bitmap scoring equals per-language set membership counts."""
+        words = "la reunión de los equipos es para el lunes y a las diez".split()
+        
+        scores = dict(detector._score_stopwords(words))
+        
+        for lang, stopwords in STOPWORDS.items():
+            expected = sum(1 for word in words if word in stopwords) / len(words)
+            assert scores[lang] == pytest.approx(expected)
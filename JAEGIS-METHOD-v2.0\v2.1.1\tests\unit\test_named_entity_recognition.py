@@ -0,0 +1,153 @@
+"""
+Unit Tests for N.L.D.S. Named Entity Recognition
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for NERProcessor: the compiled rule automaton finds gazetteer and
+pattern entities in one scan, overlaps are resolved by an interval sweep and
+the spaCy and transformer stages only run when rule coverage is insufficient.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock
+
+from nlds.nlp.ner_processor import NERProcessor, EntityMention, EntityType
+from nlds.nlp.tokenizer import Token, TokenType, TokenizationResult
+
+
+def _tokenization(text: str, tokens=()) -> TokenizationResult:
+    return TokenizationResult(
+        tokens=list(tokens),
+        original_text=text,
+        language="en",
+        processing_time_ms=1.0,
+        token_count=len(tokens),
+        character_count=len(text),
+        metadata={}
+    )
+
+
+def _mention(start: int, end: int, confidence: float, entity_type=EntityType.UNKNOWN) -> EntityMention:
+    return EntityMention("x" * (end - start), entity_type, start, end, confidence)
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """Processor with stand-in spaCy and transformer stages."""
+    monkeypatch.setattr(NERProcessor, "_initialize_models", lambda self: None)
+    processor = NERProcessor()
+    
+    processor.extract_spacy_entities = Mock(return_value=[])
+    processor.extract_transformer_entities = Mock(return_value=[])
+    return processor
+
+
+class TestRuleAutomaton:
+    """Test cases for the single-scan rule automaton."""
+    
+    def test_single_scan_finds_gazetteer_and_pattern_entities(self, processor):
+        """Test that one scan returns JAEGIS vocabulary and regex mentions."""
+        text = "Deploy development-squad in mode-3, mail ops@jaegis.ai and open https://jaegis.ai/status by 2024-01-15"
+        
+        entities = {entity.text: entity for entity in processor.extract_rule_entities(text)}
+        
+        assert entities["development-squad"].entity_type == EntityType.SQUAD_NAME
+        assert entities["development-squad"].metadata["extraction_method"] == "jaegis_vocabulary"
+        assert entities["mode-3"].entity_type == EntityType.MODE_NUMBER
+        assert entities["ops@jaegis.ai"].entity_type == EntityType.EMAIL
+        assert entities["https://jaegis.ai/status"].entity_type == EntityType.URL
+        assert entities["2024-01-15"].entity_type == EntityType.DATE
+        assert entities["Deploy"].entity_type == EntityType.COMMAND_NAME
+    
+    def test_longest_gazetteer_term_wins(self, processor):
+        """Test that a longer vocabulary term beats its prefix at the same position."""
+        entities = processor.extract_rule_entities("switch to agent-creator-mode")
+        
+        assert [(e.text, e.entity_type) for e in entities] == [("agent-creator-mode", EntityType.MODE_NUMBER)]
+    
+    def test_configuration_keys_are_case_sensitive(self, processor):
+        """Test that only upper-case identifiers are configuration keys."""
+        entities = processor.extract_rule_entities("set API_TIMEOUT for the gateway")
+        
+        assert [(e.text, e.entity_type) for e in entities] == [("API_TIMEOUT", EntityType.CONFIGURATION_KEY)]
+    
+    def test_pattern_entities_are_normalized(self, processor):
+        """Test that pattern mentions keep normalization and confidence rules."""
+        entities = processor.extract_pattern_entities("ping the dev-service owner, an admin")
+        
+        by_type = {entity.entity_type: entity for entity in entities}
+        assert by_type[EntityType.SERVICE_NAME].text == "dev-service"
+        assert by_type[EntityType.USER_ROLE].normalized_value == "administrator"
+        assert by_type[EntityType.USER_ROLE].confidence == 0.7
+
+
+class TestMergeAndGating:
+    """Test cases for interval merging and model stage gating."""
+    
+    def test_sweep_keeps_highest_confidence_of_overlaps(self, processor):
+        """Test that overlapping mentions reduce to non-overlapping best ones."""
+        merged = processor.merge_entities([
+            [_mention(0, 10, 0.7), _mention(20, 25, 0.9)],
+            [_mention(2, 6, 0.95), _mention(8, 12, 0.8), _mention(22, 30, 0.6)],
+            [_mention(40, 45, 0.5)]
+        ])
+        
+        assert [(e.start_pos, e.end_pos) for e in merged] == [(2, 6), (8, 12), (20, 25), (40, 45)]
+    
+    def test_ties_keep_the_earlier_list(self, processor):
+        """Test that equal-confidence overlaps keep the first extraction method."""
+        first = _mention(0, 5, 0.8, EntityType.SQUAD_NAME)
+        second = _mention(0, 5, 0.8, EntityType.ORGANIZATION)
+        
+        assert processor.merge_entities([[first], [second]]) == [first]
+    
+    def test_model_stages_skipped_when_rules_cover_candidates(self, processor):
+        """Test that fully rule-covered text never reaches spaCy or the transformer."""
+        text = "/jaegis-create Development-squad in mode-3"
+        
+        result = asyncio.run(processor.recognize_entities(text, _tokenization(text)))
+        
+        processor.extract_spacy_entities.assert_not_called()
+        processor.extract_transformer_entities.assert_not_called()
+        assert result.metadata["extraction_methods"] == ["rules", "tokens"]
+        assert result.metadata["rule_coverage"] == 1.0
+        assert {e.entity_type for e in result.jaegis_entities} == {
+            EntityType.COMMAND_NAME, EntityType.SQUAD_NAME, EntityType.MODE_NUMBER
+        }
+    
+    def test_model_stages_run_for_uncovered_names(self, processor):
+        """Test that capitalized words outside rule mentions trigger the model stages."""
+        text = "Send the report to Maria Lopez at Acme before 10:30 am"
+        processor.extract_spacy_entities.return_value = [
+            EntityMention("Maria Lopez", EntityType.PERSON, 19, 30, 0.8),
+            EntityMention("Acme", EntityType.ORGANIZATION, 34, 38, 0.8)
+        ]
+        
+        result = asyncio.run(processor.recognize_entities(text, _tokenization(text)))
+        
+        processor.extract_spacy_entities.assert_called_once_with(text)
+        processor.extract_transformer_entities.assert_called_once_with(text)
+        assert result.metadata["rule_coverage"] == 0.0
+        assert {e.text: e.entity_type for e in result.entities} == {
+            "Maria Lopez": EntityType.PERSON,
+            "Acme": EntityType.ORGANIZATION,
+            "10:30 am": EntityType.TIME
+        }
+    
+    def test_stage_statistics_record_latency_and_skips(self, processor):
+        """Test that every stage that ran is counted and timed."""
+        token = Token("/squad-deploy", TokenType.JAEGIS_COMMAND, 0, 13, "/squad-deploy")
+        texts = ["/squad-deploy backup-squad", "Ask Maria about it"]
+        
+        for text in texts:
+            asyncio.run(processor.recognize_entities(text, _tokenization(text, [token] if text.startswith("/") else [])))
+        
+        statistics = processor.get_stage_statistics()
+        stages = statistics["stages"]
+        
+        assert statistics["requests"] == 2
+        assert statistics["model_stages_skipped"] == 1
+        assert stages["rules"]["calls"] == stages["tokens"]["calls"] == stages["merge"]["calls"] == 2
+        assert stages["spacy"]["calls"] == stages["transformer"]["calls"] == 1
+        assert stages["tokens"]["entities"] == 1
+        assert all(stage["avg_time_ms"] >= 0.0 for stage in stages.values())
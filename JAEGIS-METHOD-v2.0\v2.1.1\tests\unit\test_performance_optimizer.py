@@ -0,0 +1,218 @@
+"""
+Unit Tests for N.L.D.S. Performance Optimizer
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for the tiered NLP result cache (in-process L1 in front of
+Redis, compressed payloads, model-version invalidation) and for optimization
+rules that resize the worker pool and caches from measured metrics.
+"""
+
+import pytest
+import asyncio
+import pickle
+import threading
+from unittest.mock import Mock
+
+import fakeredis
+
+from nlds.optimization.performance_optimizer import PerformanceOptimizer, NLPResultCache
+
+
+ANALYSIS = {
+    "intent": "create",
+    "entities": [{"text": "development-squad", "type": "SQUAD_NAME"}],
+    "confidence": 0.92
+}
+
+LARGE_ANALYSIS = {
+    "tokens": [{"text": f"token{i}", "type": "word", "start": i * 7} for i in range(200)]
+}
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _optimizer(server) -> PerformanceOptimizer:
+    optimizer = PerformanceOptimizer(fakeredis.FakeRedis(server=server), auto_start=False)
+    optimizer.config["optimization_settle_seconds"] = 0
+    return optimizer
+
+
+class TestNLPResultCache:
+    """Test cases for NLPResultCache."""
+    
+    def test_lru_eviction_respects_byte_budget(self):
+        """Test that the least recently used entries go first once bytes run out."""
+        cache = NLPResultCache(max_bytes=100)
+        cache.put("a", 1, size=40, ttl_seconds=60)
+        cache.put("b", 2, size=40, ttl_seconds=60)
+        cache.get("a")
+        
+        cache.put("c", 3, size=40, ttl_seconds=60)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.current_bytes == 80
+        assert cache.statistics["evictions"] == 1
+    
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are dropped on access."""
+        cache = NLPResultCache(max_bytes=100)
+        cache.put("a", 1, size=10, ttl_seconds=0)
+        
+        assert cache.get("a") is None
+        assert cache.statistics["expirations"] == 1
+        assert cache.current_bytes == 0
+
+
+class TestTieredNLPCache:
+    """Test cases for the L1 + Redis NLP result cache."""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_reads_are_served_from_l1(self, server):
+        """Test that a cached result is returned without touching Redis."""
+        optimizer = _optimizer(server)
+        await optimizer.cache_nlp_result("Create a development squad", ANALYSIS)
+        optimizer.redis_client.get = Mock(wraps=optimizer.redis_client.get)
+        
+        result = await optimizer.get_cached_nlp_result("  Create a   development squad\n")
+        
+        assert result == ANALYSIS
+        optimizer.redis_client.get.assert_not_called()
+        assert optimizer.get_cache_statistics()["l1_hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_promoted_to_l1(self, server):
+        """Test that a second worker reads Redis once, then its own L1."""
+        writer = _optimizer(server)
+        await writer.cache_nlp_result("Analyze market trends", ANALYSIS)
+        
+        reader = _optimizer(server)
+        first = await reader.get_cached_nlp_result("Analyze market trends")
+        second = await reader.get_cached_nlp_result("Analyze market trends")
+        
+        statistics = reader.get_cache_statistics()
+        assert first == second == ANALYSIS
+        assert statistics["l2_hits"] == 1
+        assert statistics["l1_hits"] == 1
+        assert statistics["hit_ratio"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_large_payloads_are_compressed(self, server):
+        """Test that payloads above the threshold are stored zlib-compressed."""
+        optimizer = _optimizer(server)
+        await optimizer.cache_nlp_result("short text", ANALYSIS)
+        await optimizer.cache_nlp_result("long text", LARGE_ANALYSIS)
+        
+        small = optimizer.redis_client.get(optimizer.nlp_cache_key("short text"))
+        large = optimizer.redis_client.get(optimizer.nlp_cache_key("long text"))
+        
+        assert small[:2] == b"j-"
+        assert large[:2] == b"jz"
+        assert optimizer.get_cache_statistics()["compression_ratio"] < 0.5
+        assert optimizer._decode_result(large)[0] == LARGE_ANALYSIS
+    
+    @pytest.mark.asyncio
+    async def test_redis_payloads_are_never_unpickled(self, server):
+        """Test that profiles round-trip as JSON and pickled payloads in Redis are misses."""
+        optimizer = _optimizer(server)
+        profile = {"user_id": "u1", "preferences": {"mode": 3}}
+        await optimizer.cache_nlp_result("u1", profile, cache_type="user_profiles")
+        optimizer.l1_cache.clear()
+        
+        assert await optimizer.get_cached_nlp_result("u1", cache_type="user_profiles") == profile
+        
+        key = optimizer.nlp_cache_key("u2", "user_profiles")
+        optimizer.redis_client.setex(key, 60, b"p-" + pickle.dumps({"user_id": "u2"}))
+        assert await optimizer.get_cached_nlp_result("u2", cache_type="user_profiles") is None
+    
+    @pytest.mark.asyncio
+    async def test_promoted_entries_are_sized_like_writes(self, server):
+        """Test that L1 bytes count the uncompressed size whether written or promoted."""
+        writer = _optimizer(server)
+        await writer.cache_nlp_result("long text", LARGE_ANALYSIS)
+        
+        reader = _optimizer(server)
+        await reader.get_cached_nlp_result("long text")
+        
+        assert reader.l1_cache.current_bytes == writer.l1_cache.current_bytes
+        assert reader.l1_cache.current_bytes == writer.get_cache_statistics()["bytes_before_compression"]
+    
+    @pytest.mark.asyncio
+    async def test_model_reload_invalidates_results(self, server):
+        """Test that results of the previous model version are no longer served."""
+        optimizer = _optimizer(server)
+        await optimizer.cache_nlp_result("Deploy the monitoring pipeline", ANALYSIS)
+        
+        dropped = optimizer.invalidate_model("nlp_analysis", "2024.2")
+        
+        assert dropped == 1
+        assert await optimizer.get_cached_nlp_result("Deploy the monitoring pipeline") is None
+        assert optimizer.nlp_cache_key("x").startswith("nlp_analysis:2024.2:")
+        assert optimizer.invalidate_model("nlp_analysis", "2024.2") == 0
+
+
+class TestOptimizationActions:
+    """Test cases for optimization rules driven by measured metrics."""
+    
+    @pytest.mark.asyncio
+    async def test_queue_depth_rule_grows_worker_pool(self, server, monkeypatch):
+        """Test that a measured backlog triggers a worker pool resize."""
+        monkeypatch.setattr("psutil.cpu_percent", lambda interval=None: 30.0)
+        optimizer = _optimizer(server)
+        release = threading.Event()
+        
+        backlog = [asyncio.ensure_future(optimizer.run_in_worker(release.wait)) for _ in range(150)]
+        await asyncio.sleep(0.05)
+        
+        results = await optimizer.optimize_performance()
+        applied = {result.rule_applied for result in results}
+        release.set()
+        await asyncio.gather(*backlog)
+        
+        assert "high_queue_depth" in applied
+        assert optimizer.worker_count > optimizer.config["min_worker_threads"]
+        assert optimizer.worker_pool._max_workers == optimizer.worker_count
+        assert await optimizer._get_queue_depth() == 0
+    
+    @pytest.mark.asyncio
+    async def test_saturated_cpu_does_not_add_workers(self, server):
+        """Test that worker threads are not increased while the CPU is saturated."""
+        optimizer = _optimizer(server)
+        optimizer.resize_worker_pool(8)
+        metrics = Mock(queue_depth=200, cpu_usage_percent=95.0)
+        
+        await optimizer._increase_worker_threads(metrics)
+        await optimizer._enable_request_throttling(metrics)
+        
+        assert optimizer.worker_count == 6
+    
+    @pytest.mark.asyncio
+    async def test_cache_actions_resize_l1(self, server):
+        """Test that caching rules grow the L1 and memory pressure shrinks it."""
+        optimizer = _optimizer(server)
+        initial = optimizer.l1_cache.max_bytes
+        
+        await optimizer._enable_aggressive_caching(Mock(response_time_ms=900))
+        grown = optimizer.l1_cache.max_bytes
+        await optimizer._trigger_garbage_collection(Mock())
+        
+        assert grown == int(initial * 1.8)
+        assert optimizer.l1_cache.max_bytes == grown // 2
+    
+    @pytest.mark.asyncio
+    async def test_measured_latency_drives_metrics(self, server, monkeypatch):
+        """Test that response time and hit ratio come from recorded work."""
+        monkeypatch.setattr("psutil.cpu_percent", lambda interval=None: 50.0)
+        optimizer = _optimizer(server)
+        for duration in (100.0, 300.0):
+            optimizer.record_request(duration)
+        await optimizer.get_cached_nlp_result("never cached")
+        
+        metrics = await optimizer.collect_performance_metrics()
+        
+        assert metrics.response_time_ms == 200.0
+        assert metrics.cache_hit_ratio == 0.0
+        assert metrics.cpu_usage_percent == 50.0
@@ -0,0 +1,246 @@
+"""
+Unit Tests for N.L.D.S. Pipeline Stage Graph
+JAEGIS Enhanced Agent System v2.2 - Tier 0 Component
+
+Unit tests for dependency-aware pipeline execution: independent stages run
+concurrently, results are passed by reference, stage results are cached by
+input hash and every stage's latency is recorded.
+"""
+
+import pytest
+import os
+import time
+import asyncio
+import threading
+from unittest.mock import Mock
+
+from nlds.nlp.document_parser import SharedDocumentParser
+from nlds.translation.translation_optimizer import (
+    TranslationOptimizationEngine,
+    PipelineStage,
+    StageExecutor,
+    StageGraph,
+    EngineMethodCall,
+    build_component_graph
+)
+
+
+def _word_count(text: str) -> dict:
+    return {"words": len(text.split()), "pid": os.getpid()}
+
+
+class EchoEngine:
+    """Engine with an async analysis method, counting constructions."""
+    
+    instances = 0
+    
+    def __init__(self):
+        EchoEngine.instances += 1
+    
+    async def analyze(self, text: str) -> str:
+        return text.upper()
+
+
+class ParsingEngine:
+    """Engine accepting a shared document parser."""
+    
+    def __init__(self, document_parser=None):
+        self.document_parser = document_parser
+    
+    def analyze(self, text: str):
+        return self.document_parser
+
+
+def _sleeping(result, seconds: float = 0.2):
+    def stage(**kwargs):
+        time.sleep(seconds)
+        return result
+    return Mock(side_effect=stage)
+
+
+@pytest.fixture
+def engine():
+    engine = TranslationOptimizationEngine()
+    yield engine
+    engine.cleanup_resources()
+
+
+def _dimensional_graph():
+    logical = _sleeping({"logical": True})
+    emotional = _sleeping({"emotional": True})
+    creative = Mock(side_effect=lambda text, logical_result: {"creative": logical_result})
+    synthesis = Mock(side_effect=lambda logical_result, emotional_result, creative_result: [
+        logical_result, emotional_result, creative_result
+    ])
+    graph = StageGraph([
+        PipelineStage("synthesis_result", synthesis, ["logical_result", "emotional_result", "creative_result"]),
+        PipelineStage("logical_result", logical, ["text"], StageExecutor.THREAD),
+        PipelineStage("emotional_result", emotional, ["text"], StageExecutor.THREAD),
+        PipelineStage("creative_result", creative, ["text", "logical_result"])
+    ])
+    return graph, (logical, emotional, creative, synthesis)
+
+
+class TestStageGraph:
+    """Test cases for StageGraph declaration."""
+    
+    def test_order_follows_dependencies(self):
+        """Test that stages are ordered after their dependencies and inputs are inferred."""
+        graph, _ = _dimensional_graph()
+        
+        position = {name: index for index, name in enumerate(graph.order)}
+        assert position["logical_result"] < position["creative_result"] < position["synthesis_result"]
+        assert position["emotional_result"] < position["synthesis_result"]
+        assert graph.inputs == {"text"}
+    
+    def test_cycles_and_duplicates_are_rejected(self):
+        """Test that invalid graphs raise ValueError at construction."""
+        with pytest.raises(ValueError, match="cycle"):
+            StageGraph([PipelineStage("a", Mock(), ["b"]), PipelineStage("b", Mock(), ["a"])])
+        with pytest.raises(ValueError, match="Duplicate"):
+            StageGraph([PipelineStage("a", Mock()), PipelineStage("a", Mock())])
+
+
+class TestStageGraphExecution:
+    """Test cases for TranslationOptimizationEngine.execute_stage_graph."""
+    
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self, engine):
+        """Test that logical and emotional analysis overlap and results pass by reference."""
+        graph, (logical, emotional, creative, synthesis) = _dimensional_graph()
+        
+        result = await engine.execute_stage_graph(graph, {"text": "deploy the squad"})
+        
+        synthesized = result.results["synthesis_result"]
+        assert result.total_time_ms < 350
+        assert synthesized[0] is result.results["logical_result"]
+        assert synthesized[2]["creative"] is result.results["logical_result"]
+        assert set(result.stage_times_ms) == set(graph.order)
+        assert result.stage_times_ms["logical_result"] >= 200
+        assert len(engine.component_benchmarks["emotional_result"]) == 1
+    
+    @pytest.mark.asyncio
+    async def test_stage_results_are_cached_by_input_hash(self, engine):
+        """Test that a repeated request is served from the stage cache."""
+        graph, stages = _dimensional_graph()
+        
+        await engine.execute_stage_graph(graph, {"text": "deploy the squad"})
+        repeat = await engine.execute_stage_graph(graph, {"text": "deploy the squad"})
+        await engine.execute_stage_graph(graph, {"text": "deploy the agent"})
+        
+        assert sorted(repeat.cached_stages) == sorted(graph.order)
+        assert repeat.metadata["stages_run"] == 0
+        assert all(stage.call_count == 2 for stage in stages)
+    
+    @pytest.mark.asyncio
+    async def test_cached_output_skips_upstream_stages(self, engine):
+        """Test that a cached downstream stage does not resolve its dependencies."""
+        graph, (logical, emotional, creative, synthesis) = _dimensional_graph()
+        await engine.execute_stage_graph(graph, {"text": "deploy the squad"})
+        engine.memory_cache.pop(next(key for key in list(engine.memory_cache.probation) if "logical_result" in key))
+        
+        result = await engine.execute_stage_graph(graph, {"text": "deploy the squad"}, outputs=["synthesis_result"])
+        
+        assert result.cached_stages == ["synthesis_result"]
+        assert logical.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_missing_inputs_and_failures_raise(self, engine):
+        """Test that missing inputs and failing stages surface as exceptions."""
+        graph = StageGraph([PipelineStage("broken", Mock(side_effect=RuntimeError("boom")), ["text"])])
+        
+        with pytest.raises(ValueError, match="Missing pipeline inputs"):
+            await engine.execute_stage_graph(graph, {})
+        with pytest.raises(RuntimeError, match="boom"):
+            await engine.execute_stage_graph(graph, {"text": "x"})
+    
+    @pytest.mark.asyncio
+    async def test_process_stages_run_in_worker_processes(self, engine):
+        """Test that CPU-bound stages execute in the process pool."""
+        graph = StageGraph([
+            PipelineStage("counts", _word_count, ["text"], StageExecutor.PROCESS, cacheable=False)
+        ])
+        
+        result = await engine.execute_stage_graph(graph, {"text": "create a development squad"})
+        
+        assert result.results["counts"]["words"] == 4
+        assert result.results["counts"]["pid"] != os.getpid()
+    
+    @pytest.mark.asyncio
+    async def test_engine_method_calls_reuse_one_engine(self, engine):
+        """Test that async engine methods run on any executor with one engine per process."""
+        EchoEngine.instances = 0
+        call = EngineMethodCall(EchoEngine, "analyze")
+        graph = StageGraph([
+            PipelineStage("inline", call, ["text"], cacheable=False),
+            PipelineStage("threaded", call, ["text"], StageExecutor.THREAD, cacheable=False)
+        ])
+        
+        result = await engine.execute_stage_graph(graph, {"text": "mode-3"})
+        
+        assert result.results == {"inline": "MODE-3", "threaded": "MODE-3"}
+        assert EchoEngine.instances == 1
+    
+    def test_engine_method_calls_share_the_document_parser(self, monkeypatch):
+        """Test that engines built for the graph get the process-wide document parser."""
+        shared_parser = Mock()
+        monkeypatch.setattr(SharedDocumentParser, "_shared_instance", shared_parser)
+        
+        call = EngineMethodCall(ParsingEngine, "analyze", share_document_parser=True)
+        
+        assert call(text="mode-3") is shared_parser
+        assert EngineMethodCall(EchoEngine, "analyze").share_document_parser is False
+
+
+class TestTranslationPipelineGraph:
+    """Test cases for running translation components through the stage graph."""
+    
+    def test_component_graph_orders_sequential_components(self):
+        """Test that parallel components only need the text and synthesis follows everything."""
+        graph = build_component_graph({
+            "dimensional_synthesis": Mock(),
+            "logical_analysis": Mock(),
+            "semantic_analysis": Mock(),
+            "command_generation": Mock()
+        }, ["logical_analysis", "semantic_analysis"])
+        
+        assert graph.stages["logical_analysis"].dependencies == ["text"]
+        assert graph.stages["dimensional_synthesis"].dependencies == ["text", "logical_analysis", "semantic_analysis"]
+        assert graph.order.index("dimensional_synthesis") < graph.order.index("command_generation")
+    
+    @pytest.mark.asyncio
+    async def test_optimize_translation_overlaps_parallel_components(self, engine):
+        """Test that independent components run concurrently and synthesis sees their results."""
+        logical = _sleeping({"logical": True})
+        semantic = _sleeping({"semantic": True})
+        processing_functions = {
+            "logical_analysis": lambda text: logical(text=text),
+            "semantic_analysis": lambda text: semantic(text=text),
+            "dimensional_synthesis": lambda text, results: sorted(results)
+        }
+        
+        result = await engine.optimize_translation("deploy the squad", processing_functions)
+        repeat = await engine.optimize_translation("Deploy the  squad", processing_functions)
+        
+        assert result.performance_metrics.total_time_ms < 350
+        assert result.performance_metrics.component_times["dimensional_synthesis"] < 100
+        assert "intelligent_caching" in repeat.optimization_strategies_applied
+        assert logical.call_count == semantic.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_redis_cache_io_runs_off_the_event_loop(self, engine):
+        """Test that stage cache reads and writes reach Redis from worker threads."""
+        loop_thread = threading.current_thread()
+        redis_threads = []
+        
+        def record(*args):
+            redis_threads.append(threading.current_thread())
+        
+        engine.redis_client = Mock(get=Mock(side_effect=lambda key: record() or None), setex=Mock(side_effect=record))
+        graph, _ = _dimensional_graph()
+        
+        await engine.execute_stage_graph(graph, {"text": "deploy the squad"})
+        
+        assert engine.redis_client.get.call_count == len(graph.order)
+        assert engine.redis_client.setex.call_count == len(graph.order)
+        assert loop_thread not in redis_threads